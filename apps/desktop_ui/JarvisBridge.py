@@ -45,6 +45,7 @@ class JarvisBridge(QObject):
         try:
             from core.nlu.intents import IntentClassifier, IntentType
             from core.nlu.router import CommandRouter
+            from core.nlu.speculative import SpeculativeIntentResolver
             from core.skills.information import InformationSkills
             from core.skills.system import SystemSkills
             from core.skills.reminders import ReminderSkills
@@ -76,11 +77,16 @@ class JarvisBridge(QObject):
             for intent_type in reminder_intents:
                 self.router.register_handler(intent_type, self.reminder_skills.handle_intent)
             
+            # Partials start likely commands before the user finishes
+            self.router.register_warmup(IntentType.GET_SYSTEM_INFO, self.info_skills.warm_up)
+            self.speculator = SpeculativeIntentResolver(self.classifier, self.router)
+            
             logger.info("Jarvis backend initialized")
         except Exception as e:
             logger.error(f"Failed to initialize Jarvis: {e}")
             self.classifier = None
             self.router = None
+            self.speculator = None
     
     # Properties for QML binding
     @Property(float, notify=audioAmplitudeChanged)
@@ -130,12 +136,13 @@ class JarvisBridge(QObject):
         self.statusText = "Processing..."
         
         try:
-            # Classify intent
-            intent = self.classifier.classify(command)
-            
-            # Route to handler
+            # Classify intent(s) - one utterance may hold several commands
             import asyncio
-            result = asyncio.run(self.router.route(intent))
+            intents = self.classifier.classify_multi(command)
+            intent = intents[0]
+            
+            # Route to handler(s), reusing work started on partials
+            result = asyncio.run(self.speculator.route_many(intents))
             
             # Add to activity history
             activity = {
@@ -164,6 +171,8 @@ class JarvisBridge(QObject):
         logger.info("Voice activated")
         self.orbState = "listening"
         self.statusText = "Listening..."
+        if self.speculator:
+            self.speculator.reset()
         # TODO: Connect to audio pipeline
     
     @Slot()
@@ -183,6 +192,11 @@ class JarvisBridge(QObject):
         """Update partial transcript from STT."""
         self._partial_transcript = text
         self.partialTranscriptChanged.emit(text)
+        if self.speculator:
+            try:
+                self.speculator.on_partial(text)
+            except Exception as e:
+                logger.error(f"Partial classification error: {e}")
     
     @Slot(str)
     def updateCommittedTranscript(self, text: str):
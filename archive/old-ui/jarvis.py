@@ -130,6 +130,11 @@ class JarvisAssistant:
             ]
             for intent_type in calendar_intents:
                 self.command_router.register_handler(intent_type, self.calendar_skills.handle_intent)
+            self.command_router.register_warmup(
+                IntentType.LIST_EVENTS,
+                self.calendar_skills.warm_up,
+                self.calendar_skills.discard_warm_up
+            )
         
         # Initialize memory if enabled
         if self.config.get('memory', {}).get('enabled'):
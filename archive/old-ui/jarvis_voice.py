@@ -94,10 +94,7 @@ class JarvisVoice:
         self.pipeline = AudioPipeline(
             stt_mode=config.get("stt", {}).get("mode", "offline"),
             wake_word_config=config.get("wake_word", {}),
-            stt_config=config.get("stt", {}).get(
-                "offline" if config.get("stt", {}).get("mode") == "offline" else "cloud",
-                {}
-            ),
+            stt_config=config.get("stt", {}),
             on_transcript=self.on_transcript,
             on_state_change=self.on_state_change
         )
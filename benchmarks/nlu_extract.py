@@ -0,0 +1,113 @@
+"""
+Entity extraction benchmark.
+
+Compares the original extractor (a regex compiled-or-cached per call,
+every extractor on every utterance) with the precompiled extractor,
+both extracting everything and following the per-intent extraction plan
+IntentClassifier uses. Phrases are the ones from tests/test_nlu.py.
+Usage:
+
+    python benchmarks/nlu_extract.py --repeats 500
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from loguru import logger
+
+from core.nlu.entity_extractor import EntityExtractor
+from core.nlu.intents import IntentClassifier, IntentType
+from core.nlu.matcher import PatternMatcher
+from tests.entity_reference import ReferenceEntityExtractor
+
+
+PHRASES = [
+    # Intent classification cases
+    "turn up the volume", "increase volume", "louder", "volume down", "quieter",
+    "set volume to 50", "mute", "unmute", "open chrome", "launch visual studio",
+    "close notepad", "focus on chrome", "switch to firefox", "remind me to call mom",
+    "set a timer for 5 minutes", "set alarm for 7am", "list reminders",
+    "create event tomorrow at 3pm", "schedule meeting with bob", "show my calendar",
+    "what time is it", "what's the date", "check battery", "system info",
+    "search for python tutorials", "google machine learning", "help", "stop", "thank you",
+    # Entity extraction cases
+    "set volume to 75 percent", "remind me in 5 minutes", "set timer for 2 hours",
+    "meeting tomorrow at 3pm", "alarm at 7:30 am", "send email to john@example.com",
+    "go to https://google.com",
+]
+
+
+def time_us(fn: Callable[[str], object], phrases: List[str], repeats: int) -> np.ndarray:
+    """Per-call latency in microseconds."""
+    timings = []
+    for _ in range(repeats):
+        for text in phrases:
+            start_time = time.perf_counter()
+            fn(text)
+            timings.append((time.perf_counter() - start_time) * 1e6)
+    return np.array(timings)
+
+
+def summarize(timings: np.ndarray) -> Dict[str, float]:
+    """Latency percentiles."""
+    return {
+        "p50_us": float(np.percentile(timings, 50)),
+        "p95_us": float(np.percentile(timings, 95)),
+        "mean_us": float(timings.mean()),
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Entity extraction benchmark")
+    parser.add_argument("--repeats", type=int, default=500)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    reference = ReferenceEntityExtractor()
+    extractor = EntityExtractor()
+
+    # Plan per phrase, as IntentClassifier._extract_entities would pick it
+    matcher = PatternMatcher(IntentClassifier._init_patterns(None))
+    plans = {}
+    for text in PHRASES:
+        intent_type = matcher.best(text.lower().strip())[0] or IntentType.UNKNOWN
+        plans[text] = IntentClassifier.EXTRACTION_PLAN.get(intent_type)
+
+    def planned(text):
+        plan = plans[text]
+        return extractor.extract_all(text, kinds=plan) if plan else {}
+
+    timings = {
+        "reference": time_us(reference.extract_all, PHRASES, args.repeats),
+        "precompiled": time_us(extractor.extract_all, PHRASES, args.repeats),
+        "planned": time_us(planned, PHRASES, args.repeats),
+    }
+    results = {name: summarize(t) for name, t in timings.items()}
+    for name in ("precompiled", "planned"):
+        results[name]["speedup"] = float(timings["reference"].mean() / timings[name].mean())
+
+    for name, row in results.items():
+        logger.info(
+            f"{name:>11}: p50 {row['p50_us']:6.1f}us | p95 {row['p95_us']:6.1f}us | "
+            f"mean {row['mean_us']:6.1f}us"
+            + (f" | {row['speedup']:.1f}x faster" if "speedup" in row else "")
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
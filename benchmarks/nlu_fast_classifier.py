@@ -0,0 +1,164 @@
+"""
+Fast intent classifier benchmark.
+
+Trains the hashed n-gram classifier from the pattern table and example
+corpus, then compares top-1 accuracy and latency of the pattern matcher
+alone (the current classifier), the fast model alone and the hybrid
+(patterns, with the fast model deciding low-confidence cases) on the
+tests/test_nlu.py cases plus held-out rephrasings that appear in
+neither patterns nor examples. Usage:
+
+    python benchmarks/nlu_fast_classifier.py --output fast.json
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import spacy
+from loguru import logger
+
+from core.nlu.fast_classifier import FastIntentClassifier
+from core.nlu.intents import IntentClassifier, IntentType
+
+
+T = IntentType
+
+TEST_NLU_CASES = [
+    ("turn up the volume", T.VOLUME_UP), ("increase volume", T.VOLUME_UP), ("louder", T.VOLUME_UP),
+    ("volume down", T.VOLUME_DOWN), ("quieter", T.VOLUME_DOWN), ("set volume to 50", T.VOLUME_SET),
+    ("mute", T.MUTE), ("unmute", T.UNMUTE), ("open chrome", T.OPEN_APP),
+    ("launch visual studio", T.OPEN_APP), ("close notepad", T.CLOSE_APP),
+    ("focus on chrome", T.FOCUS_WINDOW), ("switch to firefox", T.FOCUS_WINDOW),
+    ("remind me to call mom", T.CREATE_REMINDER), ("set a timer for 5 minutes", T.SET_TIMER),
+    ("set alarm for 7am", T.SET_ALARM), ("list reminders", T.LIST_REMINDERS),
+    ("create event tomorrow at 3pm", T.CREATE_EVENT), ("schedule meeting with bob", T.CREATE_EVENT),
+    ("show my calendar", T.LIST_EVENTS), ("what time is it", T.GET_TIME),
+    ("what's the date", T.GET_DATE), ("check battery", T.GET_BATTERY),
+    ("system info", T.GET_SYSTEM_INFO), ("search for python tutorials", T.SEARCH_WEB),
+    ("google machine learning", T.SEARCH_WEB), ("help", T.HELP), ("stop", T.STOP),
+    ("thank you", T.THANK_YOU),
+]
+
+# Near-miss phrasings in neither the patterns nor the example corpus
+HELD_OUT = [
+    ("could you make the music a bit louder", T.VOLUME_UP), ("sound up", T.VOLUME_UP),
+    ("turn the volume up", T.VOLUME_UP), ("can you lower the sound", T.VOLUME_DOWN),
+    ("make it a little quieter please", T.VOLUME_DOWN), ("turn the volume down a bit", T.VOLUME_DOWN),
+    ("put the sound on 25", T.VOLUME_SET), ("mute the audio please", T.MUTE),
+    ("fire up the terminal", T.OPEN_APP), ("please open up slack", T.OPEN_APP),
+    ("shut down spotify", T.CLOSE_APP), ("close the calculator app", T.CLOSE_APP),
+    ("minimize the browser window", T.MINIMIZE_WINDOW), ("make chrome full screen", T.MAXIMIZE_WINDOW),
+    ("remind me to take out the trash", T.CREATE_REMINDER), ("set me a reminder for noon", T.CREATE_REMINDER),
+    ("which reminders do i have", T.LIST_REMINDERS), ("start a timer for 8 minutes", T.SET_TIMER),
+    ("ten minute timer please", T.SET_TIMER), ("wake me up at seven", T.SET_ALARM),
+    ("set up a call with john on monday", T.CREATE_EVENT), ("what's on my schedule today", T.LIST_EVENTS),
+    ("cancel tomorrow's meeting", T.CANCEL_EVENT), ("search online for pizza places", T.SEARCH_WEB),
+    ("look up flights to tokyo", T.SEARCH_WEB), ("who is albert einstein", T.ASK_QUESTION),
+    ("what time is it right now", T.GET_TIME), ("got the time jarvis", T.GET_TIME),
+    ("what's the date today jarvis", T.GET_DATE), ("will it rain tomorrow", T.GET_WEATHER),
+    ("how's the weather outside", T.GET_WEATHER), ("remember that the keys are in the drawer", T.REMEMBER_FACT),
+    ("what did i tell you about the keys", T.RECALL_FACT), ("how much battery is left", T.GET_BATTERY),
+    ("battery status please", T.GET_BATTERY), ("how is the system doing", T.GET_SYSTEM_INFO),
+    ("play the next song", T.NEXT_TRACK), ("skip this one", T.NEXT_TRACK),
+    ("pause the song", T.PAUSE_MEDIA), ("play some jazz music", T.PLAY_MEDIA),
+    ("go back to the previous song", T.PREVIOUS_TRACK), ("what can you help me with", T.HELP),
+    ("thanks so much", T.THANK_YOU), ("cancel it", T.CANCEL),
+    # ASR near misses
+    ("turn up the volum", T.VOLUME_UP), ("remind me too call dad", T.CREATE_REMINDER),
+    ("wats the time", T.GET_TIME), ("chek the battery", T.GET_BATTERY),
+]
+
+
+def evaluate(predict: Callable[[str], Tuple[IntentType, float]], cases: List[Tuple[str, IntentType]]) -> Dict:
+    """Accuracy and latency of one predictor."""
+    correct, timings = 0, []
+    for _ in range(20):
+        for text, _ in cases:
+            start_time = time.perf_counter()
+            predict(text)
+            timings.append((time.perf_counter() - start_time) * 1e6)
+    for text, expected in cases:
+        correct += predict(text)[0] == expected
+    timings = np.array(timings)
+    return {
+        "accuracy": correct / len(cases),
+        "p50_us": float(np.percentile(timings, 50)),
+        "p95_us": float(np.percentile(timings, 95)),
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Fast intent classifier benchmark")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    # Pattern classifier without a spaCy model (intent resolution never
+    # touches it)
+    classifier = IntentClassifier(
+        custom_patterns="", cache_size=0, fast_classifier=False, nlp=spacy.blank("en")
+    )
+
+    start_time = time.perf_counter()
+    model = FastIntentClassifier.train(classifier.training_examples())
+    train_s = time.perf_counter() - start_time
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "fast_intent.npz"
+        model.save(str(path))
+        start_time = time.perf_counter()
+        model = FastIntentClassifier.load(str(path))
+        load_ms = (time.perf_counter() - start_time) * 1000
+        artifact_kb = path.stat().st_size / 1024
+    classifier.fast_classifier = model
+
+    def patterns(text):
+        return classifier._match_intent(text.lower().strip())
+
+    def fast(text):
+        label, probability = model.predict(text.lower().strip())
+        return IntentType(label), probability
+
+    def hybrid(text):
+        text_lower = text.lower().strip()
+        return classifier._resolve_intent(text_lower, *classifier._match_intent(text_lower))
+
+    results = {
+        "train_s": train_s,
+        "load_ms": load_ms,
+        "artifact_kb": artifact_kb,
+    }
+    for set_name, cases in (("test_nlu", TEST_NLU_CASES), ("held_out", HELD_OUT)):
+        results[set_name] = {
+            name: evaluate(predict, cases)
+            for name, predict in (("patterns", patterns), ("fast", fast), ("hybrid", hybrid))
+        }
+
+    logger.info(
+        f"Trained in {train_s:.1f}s | artifact {artifact_kb:.0f} KB | loads in {load_ms:.1f}ms"
+    )
+    for set_name in ("test_nlu", "held_out"):
+        for name, row in results[set_name].items():
+            logger.info(
+                f"{set_name:>8} {name:>8}: accuracy {row['accuracy']:6.1%} | "
+                f"p50 {row['p50_us']:6.1f}us | p95 {row['p95_us']:6.1f}us"
+            )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
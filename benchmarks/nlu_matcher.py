@@ -0,0 +1,113 @@
+"""
+Intent pattern matcher benchmark.
+
+Compares the original per-pattern substring scan with the Aho-Corasick
+automaton on the built-in pattern table and on a table grown to a
+multiple of its size with synthetic phrasings. Usage:
+
+    python benchmarks/nlu_matcher.py --scale 10
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from loguru import logger
+
+from core.nlu.intents import IntentClassifier
+from core.nlu.matcher import PatternMatcher, linear_match
+
+
+PHRASES = [
+    "turn up the volume", "set volume to 50", "open chrome", "close notepad",
+    "remind me to call mom at 5pm", "set a timer for 5 minutes", "what time is it",
+    "what's the date", "check battery", "system info", "search for python tutorials",
+    "play some music", "schedule meeting with bob tomorrow", "how's the weather today",
+    "can you tell me what the weather will be like this weekend in seattle",
+]
+
+PREFIXES = ["please", "jarvis", "hey", "could you", "can you", "now", "quickly", "just", "kindly"]
+
+
+def scale_patterns(patterns: Dict, scale: int, seed: int = 0) -> Dict:
+    """Grow each intent's pattern list to scale x its size."""
+    rng = random.Random(seed)
+    scaled = {}
+    for intent, intent_patterns in patterns.items():
+        grown = list(intent_patterns)
+        for pattern in intent_patterns:
+            for prefix in rng.sample(PREFIXES, scale - 1):
+                grown.append(f"{prefix} {pattern}")
+        scaled[intent] = grown
+    return scaled
+
+
+def time_ms(fn, phrases: List[str], repeats: int) -> np.ndarray:
+    """Per-call latency in milliseconds."""
+    timings = []
+    for _ in range(repeats):
+        for text in phrases:
+            start_time = time.perf_counter()
+            fn(text)
+            timings.append((time.perf_counter() - start_time) * 1000)
+    return np.array(timings)
+
+
+def run(patterns: Dict, repeats: int) -> Dict[str, float]:
+    """Benchmark both matchers on one pattern table."""
+    build_start = time.perf_counter()
+    matcher = PatternMatcher(patterns)
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    for text in PHRASES:
+        assert matcher.best(text) == linear_match(patterns, text), text
+
+    linear = time_ms(lambda t: linear_match(patterns, t), PHRASES, repeats)
+    automaton = time_ms(matcher.best, PHRASES, repeats)
+    return {
+        "patterns": sum(len(p) for p in patterns.values()),
+        "build_ms": build_ms,
+        "linear_p50_us": float(np.percentile(linear, 50) * 1000),
+        "automaton_p50_us": float(np.percentile(automaton, 50) * 1000),
+        "speedup": float(linear.mean() / automaton.mean()),
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Intent pattern matcher benchmark")
+    parser.add_argument("--scale", type=int, default=10, help="Pattern table multiple")
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    patterns = IntentClassifier._init_patterns(None)
+    results = {
+        "1x": run(patterns, args.repeats),
+        f"{args.scale}x": run(scale_patterns(patterns, args.scale), args.repeats),
+    }
+
+    for name, row in results.items():
+        logger.info(
+            f"{name:>4}: {row['patterns']:5d} patterns | linear {row['linear_p50_us']:7.1f}us | "
+            f"automaton {row['automaton_p50_us']:6.1f}us | {row['speedup']:.1f}x faster "
+            f"(built in {row['build_ms']:.1f}ms)"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
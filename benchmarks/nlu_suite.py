@@ -0,0 +1,163 @@
+"""
+NLU benchmark suite with regression gates.
+
+Generates a labelled corpus from the intent pattern table (paraphrase
+templates plus entity slots, see core/nlu/evaluation.py), then measures
+top-1 intent accuracy, entity accuracy and p50/p95/p99 latency of
+classify(), _match_intent() and EntityExtractor.extract_all(), plus how
+matching latency grows with the pattern table. The run fails (exit
+code 1) when accuracy or p50/p95 latency fall behind the stored
+baseline by more than the tolerances. Usage:
+
+    python benchmarks/nlu_suite.py
+    python benchmarks/nlu_suite.py --update-baseline
+    python benchmarks/nlu_suite.py --spacy-model en_core_web_sm --output nlu.json
+
+Latency baselines are machine-specific: refresh them with
+--update-baseline on the machine that runs the gate.
+"""
+
+import sys
+import json
+import random
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import spacy
+from loguru import logger
+
+from core.nlu.evaluation import Tolerances, build_corpus, compare, latency, score
+from core.nlu.intents import IntentClassifier, IntentType
+
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "nlu_suite.json"
+
+PREFIXES = ["please", "jarvis", "hey", "could you", "can you", "now", "quickly", "just", "kindly"]
+
+
+def scale_patterns(patterns: Dict[IntentType, List[str]], scale: int, seed: int = 0) -> Dict:
+    """Grow each intent's pattern list to scale x its size."""
+    rng = random.Random(seed)
+    return {
+        intent: list(intent_patterns) + [
+            f"{prefix} {pattern}"
+            for pattern in intent_patterns
+            for prefix in rng.sample(PREFIXES, scale - 1)
+        ]
+        for intent, intent_patterns in patterns.items()
+    }
+
+
+def make_classifier(spacy_model: str, tmp: str) -> IntentClassifier:
+    """Classifier with the built-in patterns and no utterance cache."""
+    if spacy_model == "blank":
+        spacy.blank("en").to_disk(tmp)
+        spacy_model = tmp
+    return IntentClassifier(spacy_model, custom_patterns="", cache_size=0)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="NLU benchmark suite")
+    parser.add_argument("--spacy-model", default="blank",
+                        help="spaCy model for classify() ('blank' skips NER)")
+    parser.add_argument("--repeats", type=int, default=3, help="Timing passes over the corpus")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed passes before timing")
+    parser.add_argument("--scales", default="1,4,9", help="Pattern table multiples to time matching at")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--accuracy-tolerance", type=float, default=Tolerances.accuracy,
+                        help="Max absolute accuracy drop")
+    parser.add_argument("--latency-tolerance", type=float, default=Tolerances.latency,
+                        help="Max relative latency increase (1.0 = twice as slow)")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        classifier = make_classifier(args.spacy_model, tmp)
+        corpus = build_corpus(classifier.patterns)
+        texts = [utterance.text for utterance in corpus]
+        extractor = classifier.entity_extractor
+
+        results = {
+            "spacy_model": args.spacy_model,
+            "patterns": sum(len(patterns) for patterns in classifier.patterns.values()),
+            "accuracy": score(classifier, corpus),
+            "latency": {
+                "classify": latency(classifier.classify, texts, args.repeats, args.warmup),
+                "match_intent": latency(
+                    lambda text: classifier._match_intent(text.lower()), texts, args.repeats, args.warmup
+                ),
+                "extract_all": latency(extractor.extract_all, texts, args.repeats, args.warmup),
+            },
+            "scaling": {},
+        }
+
+        original = classifier.patterns
+        for scale in (int(value) for value in args.scales.split(",")):
+            classifier.patterns = scale_patterns(original, scale)
+            classifier.matcher  # Build the automaton outside the timings
+            results["scaling"][str(scale)] = {
+                "patterns": sum(len(patterns) for patterns in classifier.patterns.values()),
+                **latency(lambda text: classifier._match_intent(text.lower()), texts, args.repeats, args.warmup),
+            }
+        classifier.patterns = original
+
+    accuracy = results["accuracy"]
+    logger.info(
+        f"{accuracy['utterances']} utterances from {results['patterns']} patterns | "
+        f"intent top-1 {accuracy['intent_top1']:.2%} | entities {accuracy['entities']:.2%}"
+    )
+    for text, expected, predicted in accuracy["errors"][:10]:
+        logger.info(f"  '{text}': expected {expected}, got {predicted}")
+    for stage, stats in results["latency"].items():
+        logger.info(
+            f"{stage:>14}: p50 {stats['p50_us']:7.1f}us | p95 {stats['p95_us']:7.1f}us | "
+            f"p99 {stats['p99_us']:7.1f}us"
+        )
+    for scale, stats in results["scaling"].items():
+        logger.info(
+            f"{'match x' + scale:>14}: {stats['patterns']:5d} patterns | "
+            f"p50 {stats['p50_us']:7.1f}us | p95 {stats['p95_us']:7.1f}us"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2))
+        logger.info(f"Baseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        logger.warning(f"No baseline at {args.baseline} - run with --update-baseline")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("spacy_model") != args.spacy_model:
+        logger.warning(
+            f"Baseline used spaCy model '{baseline.get('spacy_model')}' - only accuracy is compared"
+        )
+    regressions = compare(
+        results,
+        baseline,
+        Tolerances(accuracy=args.accuracy_tolerance, latency=args.latency_tolerance),
+    )
+    for regression in regressions:
+        logger.error(f"Regression: {regression}")
+    if regressions:
+        sys.exit(1)
+    logger.info("No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
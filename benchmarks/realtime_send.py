@@ -0,0 +1,85 @@
+"""
+Realtime STT send-path benchmark.
+
+Streams synthetic 16 kHz capture frames through RealtimeAudioSender to
+the local stand-in server and reports conversion cost, throughput and
+per-message send latency. No network access or API key needed. Usage:
+
+    python benchmarks/realtime_send.py --seconds 60 --frame-ms 100
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from loguru import logger
+
+from core.audio.stt_realtime_sender import RealtimeAudioSender
+from core.audio.stt_realtime_standin import RealtimeStandInServer
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Realtime STT send-path benchmark")
+    parser.add_argument("--seconds", type=float, default=60.0, help="Audio to stream")
+    parser.add_argument("--capture-ms", type=int, default=30, help="Capture frame length")
+    parser.add_argument("--frame-ms", type=int, default=100, help="Audio per message")
+    parser.add_argument("--realtime", action="store_true", help="Pace pushes like a microphone")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    server = RealtimeStandInServer()
+    server.start()
+    sender = RealtimeAudioSender(
+        server.url, frame_ms=args.frame_ms, max_buffer_s=args.seconds + 1,
+        metrics_prefix="bench.realtime",
+    )
+    sender.start()
+
+    frame = int(16000 * args.capture_ms / 1000)
+    rng = np.random.default_rng(0)
+    audio = (0.1 * rng.standard_normal(int(16000 * args.seconds))).astype(np.float32)
+
+    push_s = 0.0
+    start_time = time.perf_counter()
+    for i in range(0, len(audio), frame):
+        t0 = time.perf_counter()
+        sender.push(audio[i:i + frame])
+        push_s += time.perf_counter() - t0
+        if args.realtime:
+            time.sleep(max(0.0, start_time + (i + frame) / 16000 - time.perf_counter()))
+    sender.commit()
+
+    expected = len(audio) * 24000 // 16000 * 2
+    while server.appended_bytes < expected - 4 and time.perf_counter() - start_time < args.seconds + 30:
+        time.sleep(0.005)
+    elapsed = time.perf_counter() - start_time
+
+    stats = sender.get_statistics()
+    results = {
+        "audio_s": args.seconds,
+        "messages": stats["frames_sent"],
+        "wire_mb": stats["bytes_sent"] / 1e6,
+        "push_us_per_frame": push_s / max(1, len(audio) // frame) * 1e6,
+        "x_realtime": args.seconds / elapsed,
+        "send_latency_ms": stats["send_latency_ms"],
+    }
+    sender.stop()
+    server.stop()
+
+    logger.info(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+STT command-biasing benchmark.
+
+Measures word error rate and latency on a command corpus with and
+without command-vocabulary biasing, for one or more model sizes.
+
+The corpus is a JSONL manifest, one utterance per line:
+
+    {"audio": "clips/volume_up_01.wav", "text": "turn up the volume"}
+
+Audio paths are relative to the manifest. Usage:
+
+    python benchmarks/stt_biasing.py corpus/commands.jsonl --models tiny base small
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import spacy
+from loguru import logger
+
+from core.audio.stt_eval import load_corpus, word_errors
+from core.audio.stt_faster_whisper import create_faster_whisper
+from core.config import get_config
+from core.nlu.intents import IntentClassifier
+from core.nlu.vocabulary import build_command_vocabulary
+
+
+def load_classifier(tmp: str) -> IntentClassifier:
+    """IntentClassifier, on a blank spaCy pipeline if the model is missing."""
+    try:
+        return IntentClassifier()
+    except OSError:
+        logger.warning("spaCy model missing - using a blank pipeline")
+        spacy.blank("en").to_disk(tmp)
+        return IntentClassifier(tmp)
+
+
+def run_config(stt, corpus) -> Dict[str, float]:
+    """Transcribe the corpus once and score it."""
+    errors = 0
+    words = 0
+    latencies = []
+
+    for audio, reference in corpus:
+        start_time = time.perf_counter()
+        hypothesis = stt.transcribe(audio, 16000)
+        latencies.append((time.perf_counter() - start_time) * 1000)
+
+        e, n = word_errors(reference, hypothesis)
+        errors += e
+        words += n
+
+    return {
+        "wer": errors / max(words, 1),
+        "latency_p50_ms": float(np.percentile(latencies, 50)),
+        "latency_p95_ms": float(np.percentile(latencies, 95)),
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="STT command-biasing benchmark")
+    parser.add_argument("manifest", type=Path, help="JSONL corpus manifest")
+    parser.add_argument("--models", nargs="+", default=["tiny", "base", "small"])
+    parser.add_argument("--mode", choices=["prompt", "hotwords"],
+                        help="Biasing mode (default: stt.biasing.mode)")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    corpus = load_corpus(args.manifest)
+    logger.info(f"Loaded {len(corpus)} utterances from {args.manifest}")
+
+    biasing = get_config().get("stt.biasing", {})
+    mode = args.mode or biasing.get("mode", "prompt")
+    with tempfile.TemporaryDirectory() as tmp:
+        vocabulary = build_command_vocabulary(
+            load_classifier(tmp),
+            app_names=biasing.get("app_names"),
+            max_prompt_chars=biasing.get("max_prompt_chars", 400),
+            max_hotwords=biasing.get("max_hotwords", 50),
+        )
+    logger.info(f"Prompt: {vocabulary.get_prompt()[:80]}...")
+
+    results = []
+    for model_size in args.models:
+        stt = create_faster_whisper(model_size=model_size, device=args.device)
+        if stt is None:
+            logger.error(f"Could not load model: {model_size}")
+            continue
+
+        # Warm-up so the first timed utterance doesn't pay for lazy init
+        stt.transcribe(corpus[0][0], 16000)
+
+        for biased in (False, True):
+            stt.set_vocabulary(vocabulary if biased else None, mode)
+            scores = run_config(stt, corpus)
+            results.append({"model": model_size, "biased": biased, **scores})
+
+    logger.info("")
+    logger.info("=" * 60)
+    logger.info(f"{'Model':<8}{'Biased':<8}{'WER':>8}{'p50 ms':>10}{'p95 ms':>10}")
+    for r in results:
+        logger.info(
+            f"{r['model']:<8}{'yes' if r['biased'] else 'no':<8}"
+            f"{r['wer']:>8.1%}{r['latency_p50_ms']:>10.0f}{r['latency_p95_ms']:>10.0f}"
+        )
+    logger.info("=" * 60)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        logger.info(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ from .wakeword import WakeWordDetector
 from .audio_pipeline import AudioPipeline, PipelineState
 from .stt_offline import WhisperSTT
 from .stt_realtime import RealtimeSTT
+from .stt_realtime_sender import RealtimeAudioSender
 from .stt_faster_whisper import FasterWhisperSTT, create_faster_whisper
 from .stt_backend import STTBackendManager, STTBackendType, create_stt_backend_manager
 from .audio_buffer import AudioRingBuffer, VadGatedAudioBuffer
@@ -19,6 +20,11 @@ from .stt_partial import (
     PartialResult,
     create_partial_streamer,
 )
+from .stt_scheduler import LatestWinsScheduler
+from .stt_worker_pool import STTWorkerPool, STTJob, QueuePolicy
+from .endpointing import AdaptiveEndpointer, EndpointReason
+from .stt_longform import LongFormTranscriber, LongFormResult
+from .stt_incremental import IncrementalDecoder
 from .barge_in import (
     BargeInDetector,
     TTSBargeInManager,
@@ -32,6 +38,7 @@ __all__ = [
     "PipelineState",
     "WhisperSTT",
     "RealtimeSTT",
+    "RealtimeAudioSender",
     "FasterWhisperSTT",
     "create_faster_whisper",
     "STTBackendManager",
@@ -48,6 +55,15 @@ __all__ = [
     "FasterWhisperPartialStreamer",
     "PartialResult",
     "create_partial_streamer",
+    "LatestWinsScheduler",
+    "STTWorkerPool",
+    "STTJob",
+    "QueuePolicy",
+    "AdaptiveEndpointer",
+    "EndpointReason",
+    "LongFormTranscriber",
+    "LongFormResult",
+    "IncrementalDecoder",
     "BargeInDetector",
     "TTSBargeInManager",
     "create_barge_in_detector",
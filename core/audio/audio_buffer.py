@@ -6,7 +6,7 @@ This reduces latency and CPU usage by skipping silence.
 """
 
 import sys
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, Tuple
 import numpy as np
 from collections import deque
 from loguru import logger
@@ -191,6 +191,121 @@ class AudioRingBuffer:
         self.total_samples_skipped = 0
 
 
+class SpeechSegmentTracker:
+    """
+    Tracks where speech occurs within a captured utterance.
+    
+    Fed one flag per audio frame (from VAD or an energy gate), it keeps
+    voiced regions as sample offsets so the STT stage can skip silence
+    without running its own VAD again.
+    """
+    
+    def __init__(self, sample_rate: int = 16000, merge_gap_ms: int = 300):
+        """
+        Initialize tracker.
+        
+        Args:
+            sample_rate: Audio sample rate in Hz
+            merge_gap_ms: Pauses shorter than this join adjacent segments
+        """
+        self.sample_rate = sample_rate
+        self.merge_gap_samples = int(sample_rate * merge_gap_ms / 1000)
+        self.reset()
+    
+    def reset(self):
+        """Forget all frames."""
+        self.total_samples = 0
+        self.segments: List[Tuple[int, int]] = []
+    
+    def add_frame(self, num_samples: int, is_speech: bool):
+        """
+        Record the next frame.
+        
+        Args:
+            num_samples: Frame length in samples
+            is_speech: Whether the frame contains speech
+        """
+        start = self.total_samples
+        self.total_samples += num_samples
+        
+        if not is_speech:
+            return
+        
+        if self.segments and start - self.segments[-1][1] <= self.merge_gap_samples:
+            # Extend the current segment across a short pause
+            self.segments[-1] = (self.segments[-1][0], self.total_samples)
+        else:
+            self.segments.append((start, self.total_samples))
+    
+    def has_speech(self) -> bool:
+        """Check if any voiced frame was seen."""
+        return bool(self.segments)
+    
+    def get_segments(self) -> List[Tuple[int, int]]:
+        """
+        Get voiced regions.
+        
+        Returns:
+            List of (start, end) sample offsets
+        """
+        return list(self.segments)
+
+
+def collect_speech(
+    audio: np.ndarray,
+    segments: List[Tuple[int, int]],
+    sample_rate: int = 16000,
+    pad_ms: int = 200,
+) -> Tuple[np.ndarray, List[Tuple[int, int]]]:
+    """
+    Keep only the (padded) speech segments of an utterance.
+    
+    Leading and trailing silence is dropped; long pauses between segments
+    are shortened to twice the padding.
+    
+    Args:
+        audio: Utterance samples
+        segments: Voiced (start, end) sample offsets within audio
+        sample_rate: Audio sample rate in Hz
+        pad_ms: Silence kept around each segment
+        
+    Returns:
+        Tuple of (compacted audio, segment offsets within it)
+    """
+    if not segments:
+        return audio[:0], []
+    
+    pad = int(sample_rate * pad_ms / 1000)
+    
+    # Pad and merge overlapping regions
+    regions: List[List[int]] = []
+    for start, end in sorted(segments):
+        start = max(0, start - pad)
+        end = min(len(audio), end + pad)
+        if start >= end:
+            continue
+        if regions and start <= regions[-1][1]:
+            regions[-1][1] = max(regions[-1][1], end)
+        else:
+            regions.append([start, end])
+    
+    if not regions:
+        return audio[:0], []
+    
+    if len(regions) == 1:
+        # Common case: one utterance - a view, no copy
+        start, end = regions[0]
+        return audio[start:end], [(0, end - start)]
+    
+    compacted = np.concatenate([audio[start:end] for start, end in regions])
+    offsets = []
+    position = 0
+    for start, end in regions:
+        offsets.append((position, position + end - start))
+        position += end - start
+    return compacted, offsets
+
+
 class VadGatedAudioBuffer:
     """
     Combined VAD + Audio Buffer for efficient speech detection and recording.
@@ -240,6 +355,10 @@ class VadGatedAudioBuffer:
         )
         self.silence_samples_count = 0
         
+        # Voiced regions of the current utterance (sample offsets)
+        self.segment_tracker = SpeechSegmentTracker(sample_rate=sample_rate)
+        self.last_speech_segments: List[Tuple[int, int]] = []
+        
         # Callbacks
         self.on_speech_complete: Optional[Callable[[np.ndarray], None]] = None
         
@@ -260,17 +379,25 @@ class VadGatedAudioBuffer:
         is_speaking, speech_prob = self.vad.process_chunk(audio_chunk)
         
         if is_speaking:
-            # Speech detected - add to pre-speech buffer and main buffer
+            if not self.waiting_for_speech_end:
+                # Utterance starts after the pre-speech padding
+                self.segment_tracker.reset()
+                self.segment_tracker.add_frame(len(self.pre_speech_samples), False)
+            
+            # Speech detected - add to main buffer
             for sample in audio_chunk:
-                self.pre_speech_samples.append(sample)
                 self.buffer.buffer.append(sample)
+            self.segment_tracker.add_frame(len(audio_chunk), True)
             
-            self.waiting_for_speech_end = False
+            self.waiting_for_speech_end = True
             self.silence_samples_count = 0
         else:
             # Silence
             if self.waiting_for_speech_end:
                 # We're waiting for post-speech buffer to fill
+                for sample in audio_chunk:
+                    self.buffer.buffer.append(sample)
+                self.segment_tracker.add_frame(len(audio_chunk), False)
                 self.silence_samples_count += len(audio_chunk)
                 
                 if self.silence_samples_count >= self.speech_end_samples:
@@ -285,24 +412,36 @@ class VadGatedAudioBuffer:
     
     def _trigger_speech_complete(self):
         """Trigger speech complete callback with buffered audio."""
+        # Get complete audio (pre-speech + buffer)
+        complete_audio = np.concatenate([
+            np.array(self.pre_speech_samples, dtype=np.float32),
+            self.buffer.get_buffer()
+        ])
+        
+        # Where the VAD heard speech, so STT can skip its own VAD pass.
+        # Shift by whatever the ring buffer dropped on overflow.
+        dropped = self.segment_tracker.total_samples - len(complete_audio)
+        self.last_speech_segments = [
+            (max(0, start - dropped), end - dropped)
+            for start, end in self.segment_tracker.get_segments()
+            if end > dropped
+        ]
+        
         if self.on_speech_complete:
-            # Get complete audio (pre-speech + buffer)
-            complete_audio = np.concatenate([
-                np.array(self.pre_speech_samples, dtype=np.float32),
-                self.buffer.get_buffer()
-            ])
-            
             # Trigger callback
             self.on_speech_complete(complete_audio)
-            
-            # Clear buffers
-            self.buffer.clear()
-            self.pre_speech_samples.clear()
+        
+        # Clear buffers
+        self.buffer.clear()
+        self.pre_speech_samples.clear()
     
     def set_speech_complete_callback(self, callback: Callable[[np.ndarray], None]):
         """
         Set callback for when speech is complete.
         
+        The voiced regions of the audio passed to the callback are
+        available as last_speech_segments while it runs.
+        
         Args:
             callback: Function to call with complete audio array
         """
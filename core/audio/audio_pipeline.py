@@ -4,8 +4,10 @@ Coordinates the full voice input flow.
 """
 
 import asyncio
+import sys
 import threading
-from typing import Optional, Callable, List
+from pathlib import Path
+from typing import Optional, Callable, List, Dict, Tuple
 from enum import Enum
 import numpy as np
 from loguru import logger
@@ -13,7 +15,17 @@ from loguru import logger
 from .capture import AudioCapture
 from .wakeword import WakeWordDetector
 from .stt_offline import WhisperSTT
-from .stt_realtime import RealtimeSTT
+from .stt_realtime_sender import RealtimeAudioSender
+from .audio_buffer import SpeechSegmentTracker, collect_speech
+from .stt_worker_pool import STTWorkerPool, STTJob
+from .stt_partial import PartialResultStreamer, PartialResult
+from .endpointing import AdaptiveEndpointer
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.metrics import get_metrics_collector
+from core.warmup import ModelWarmup
+from core.models.registry import get_model_registry
 
 
 class PipelineState(Enum):
@@ -43,7 +55,11 @@ class AudioPipeline:
         wake_word_config: Optional[dict] = None,
         stt_config: Optional[dict] = None,
         on_transcript: Optional[Callable[[str], None]] = None,
-        on_state_change: Optional[Callable[[PipelineState], None]] = None
+        on_state_change: Optional[Callable[[PipelineState], None]] = None,
+        vad=None,
+        partial_stt=None,
+        intent_classifier=None,
+        speculative_resolver=None
     ):
         """
         Initialize audio pipeline.
@@ -51,9 +67,21 @@ class AudioPipeline:
         Args:
             stt_mode: 'offline' (whisper.cpp) or 'cloud' (OpenAI Realtime)
             wake_word_config: Wake word detector configuration
-            stt_config: STT configuration
+            stt_config: The "stt" config section: "queue" and
+                "endpointing" configure the STT worker pool and the
+                AdaptiveEndpointer, the "offline"/"cloud" entry (or, if
+                absent, the section itself) the STT backend
             on_transcript: Callback when transcript ready
             on_state_change: Callback when pipeline state changes
+            vad: VAD instance (SileroVAD or compatible) used instead of the
+                RMS silence threshold (optional)
+            partial_stt: STT backend for streaming partials while the user
+                speaks; partials let endpointing wait longer after
+                "set a timer for..." and commit early on complete commands
+            intent_classifier: IntentClassifier used to judge partials
+            speculative_resolver: SpeculativeIntentResolver that judges
+                partials instead and starts stable intents early; the
+                transcript consumer settles it with resolve()
         """
         self.stt_mode = stt_mode
         self.on_transcript = on_transcript
@@ -67,18 +95,52 @@ class AudioPipeline:
         self.audio_capture: Optional[AudioCapture] = None
         self.wake_word_detector: Optional[WakeWordDetector] = None
         self.stt_offline: Optional[WhisperSTT] = None
-        self.stt_cloud: Optional[RealtimeSTT] = None
+        self.stt_cloud: Optional[RealtimeAudioSender] = None
         
         # Configuration
         self.wake_word_config = wake_word_config or {}
         self.stt_config = stt_config or {}
+        self.backend_config = self.stt_config.get(stt_mode, self.stt_config)
         
         # Speech capture buffer (after wake word)
         self.speech_buffer: List[np.ndarray] = []
         self.capturing_speech = False
-        self.speech_timeout = 3.0  # seconds of silence before processing
-        self.silence_threshold = 0.01  # RMS threshold for silence detection
-        self.silence_duration = 0.0
+        self.silence_threshold = 0.01  # RMS level treated as 50% speech without VAD
+        
+        # End-of-utterance detection (VAD probabilities + partial hints)
+        self.endpointer = AdaptiveEndpointer(**self.stt_config.get("endpointing", {}))
+        self._endpoint_lock = threading.Lock()  # Audio, partial and STT threads
+        self._speech_ended_at: Dict[int, Optional[float]] = {}  # By STT job id
+        
+        # Streaming partials (optional) feed the endpointer
+        self.intent_classifier = intent_classifier
+        self.speculative_resolver = speculative_resolver
+        self.partial_streamer: Optional[PartialResultStreamer] = None
+        if partial_stt is not None:
+            self.partial_streamer = PartialResultStreamer(partial_stt)
+            self.partial_streamer.set_callbacks(on_partial_result=self._on_partial)
+        
+        # Voiced regions of the captured speech - only these reach STT
+        self.vad = vad
+        self.segment_tracker = SpeechSegmentTracker(sample_rate=16000)
+        self.speech_pad_ms = 200  # Silence kept around each voiced region
+        self.metrics = get_metrics_collector()
+        
+        # Background warm-up of STT/VAD (started in start())
+        self.warmup = ModelWarmup()
+        
+        # Bounded STT job queue - utterances spoken over a slow decode
+        # wait (or are dropped/merged) instead of piling up threads
+        queue_config = self.stt_config.get("queue", {})
+        self.stt_pool = STTWorkerPool(
+            transcribe_fn=self._transcribe,
+            on_result=self._deliver_transcript,
+            on_idle=self._on_stt_idle,
+            num_workers=queue_config.get("workers", 1),
+            max_queue=queue_config.get("max_queue", 2),
+            policy=queue_config.get("policy", "drop_oldest"),
+        )
+        self._state_lock = threading.RLock()
         
         logger.info(f"AudioPipeline initialized: mode={stt_mode}")
 
@@ -89,16 +151,19 @@ class AudioPipeline:
         Args:
             new_state: New state
         """
-        if self.state != new_state:
+        with self._state_lock:
+            if self.state == new_state:
+                return
             old_state = self.state
             self.state = new_state
-            logger.info(f"Pipeline state: {old_state.value} → {new_state.value}")
-            
-            if self.on_state_change:
-                try:
-                    self.on_state_change(new_state)
-                except Exception as e:
-                    logger.error(f"Error in state change callback: {e}")
+        
+        logger.info(f"Pipeline state: {old_state.value} → {new_state.value}")
+        
+        if self.on_state_change:
+            try:
+                self.on_state_change(new_state)
+            except Exception as e:
+                logger.error(f"Error in state change callback: {e}")
 
     def _on_wake_word_detected(self, keyword_index: int) -> None:
         """
@@ -108,14 +173,25 @@ class AudioPipeline:
             keyword_index: Index of detected keyword
         """
         logger.info("Wake word detected!")
-        self._set_state(PipelineState.WAKE_WORD_DETECTED)
         
-        # Start capturing speech
-        self.capturing_speech = True
-        self.speech_buffer.clear()
-        self.silence_duration = 0.0
-        
-        self._set_state(PipelineState.PROCESSING_SPEECH)
+        # Locked so a finishing transcription can't flip us back to LISTENING
+        with self._state_lock:
+            self._set_state(PipelineState.WAKE_WORD_DETECTED)
+            
+            # Start capturing speech
+            self.capturing_speech = True
+            self.speech_buffer.clear()
+            self.segment_tracker.reset()
+            with self._endpoint_lock:
+                self.endpointer.reset()
+            if self.vad:
+                self.vad.reset()
+            if self.partial_streamer:
+                self.partial_streamer.start_streaming()
+            if self.speculative_resolver:
+                self.speculative_resolver.reset()
+            
+            self._set_state(PipelineState.PROCESSING_SPEECH)
 
     def _on_audio_frame(self, audio_data: np.ndarray) -> None:
         """
@@ -145,81 +221,182 @@ class AudioPipeline:
         if self.capturing_speech:
             self.speech_buffer.append(audio_data.copy())
             
-            # Check for silence
-            rms = float(np.sqrt(np.mean(audio_data ** 2)))
+            if self.partial_streamer:
+                self.partial_streamer.add_audio_chunk(audio_data)
             
-            if rms < self.silence_threshold:
-                self.silence_duration += len(audio_data) / 16000.0  # assuming 16kHz
-            else:
-                self.silence_duration = 0.0
+            # Check for end of utterance
+            probability = self._speech_probability(audio_data)
+            with self._endpoint_lock:
+                reason = self.endpointer.process_frame(probability, len(audio_data))
+                in_speech = self.endpointer.in_speech
+            self.segment_tracker.add_frame(len(audio_data), in_speech)
             
-            # If enough silence, process speech
-            if self.silence_duration >= self.speech_timeout:
-                logger.info("Speech capture complete (silence detected)")
+            if reason:
+                logger.info(f"Speech capture complete ({reason.value})")
                 self._process_speech()
 
+    def _speech_probability(self, audio_data: np.ndarray) -> float:
+        """
+        Estimate the probability that a frame contains speech.
+        
+        Args:
+            audio_data: Audio frame
+            
+        Returns:
+            VAD speech probability, or an RMS-based estimate without VAD
+        """
+        if self.vad:
+            try:
+                _, probability = self.vad.process_chunk(audio_data)
+                return probability
+            except Exception as e:
+                logger.error(f"VAD error, falling back to RMS: {e}")
+        
+        rms = float(np.sqrt(np.mean(audio_data ** 2)))
+        return min(1.0, 0.5 * rms / self.silence_threshold)
+
+    def _on_partial(self, result: PartialResult) -> None:
+        """
+        Pass a streaming partial to the endpointer (partial worker thread).
+        
+        Args:
+            result: Partial transcription
+        """
+        confidence, is_command = 0.0, False
+        if self.speculative_resolver or self.intent_classifier:
+            try:
+                if self.speculative_resolver:
+                    intent = self.speculative_resolver.on_partial(result.text)
+                else:
+                    intent = self.intent_classifier.classify(result.text)
+                confidence = intent.confidence
+                is_command = intent.type.value != "unknown"
+            except Exception as e:
+                logger.error(f"Error classifying partial: {e}")
+        
+        with self._endpoint_lock:
+            self.endpointer.on_partial(result.text, confidence, is_command, result.audio_ms)
+
     def _process_speech(self) -> None:
         """Process captured speech through STT."""
-        if not self.speech_buffer:
+        if self.partial_streamer:
+            # The final decode supersedes any partial in flight
+            self.partial_streamer.cancel()
+        
+        if not self.speech_buffer or not self.segment_tracker.has_speech():
             logger.warning("No speech to process")
+            self.speech_buffer.clear()
             self.capturing_speech = False
-            self._set_state(PipelineState.LISTENING)
+            if self.stt_pool.is_idle():
+                self._on_stt_idle()
             return
         
-        # Concatenate speech buffer
-        speech_audio = np.concatenate(self.speech_buffer)
+        # Concatenate speech buffer, keeping only the voiced regions
+        # (drops the trailing endpointing silence before decoding)
+        captured_audio = np.concatenate(self.speech_buffer)
+        speech_audio, speech_segments = collect_speech(
+            captured_audio,
+            self.segment_tracker.get_segments(),
+            sample_rate=16000,
+            pad_ms=self.speech_pad_ms,
+        )
         self.speech_buffer.clear()
         self.capturing_speech = False
         
-        logger.info(f"Processing {len(speech_audio)} samples...")
+        trimmed_ms = (len(captured_audio) - len(speech_audio)) / 16.0
+        self.metrics.record_value("stt.trimmed_audio_ms", trimmed_ms)
+        
+        logger.info(
+            f"Processing {len(speech_audio)} samples "
+            f"({trimmed_ms:.0f}ms of silence trimmed)..."
+        )
         
-        # Run STT in separate thread to not block audio
-        threading.Thread(
-            target=self._run_stt,
-            args=(speech_audio,),
-            daemon=True
-        ).start()
+        # Queue for the STT worker pool so audio capture isn't blocked;
+        # the segments let the backend skip its own VAD pass
+        job = self.stt_pool.submit(speech_audio, speech_segments)
+        if job is not None:
+            with self._endpoint_lock:
+                self._speech_ended_at[job.job_id] = self.endpointer.speech_ended_at
+        elif self.stt_pool.is_idle():
+            self._on_stt_idle()
 
-    def _run_stt(self, audio_data: np.ndarray) -> None:
+    def _transcribe(
+        self,
+        audio_data: np.ndarray,
+        should_cancel,
+        speech_segments: Optional[List[Tuple[int, int]]] = None
+    ) -> str:
         """
-        Run STT on audio data.
+        Run STT on audio data (called from the worker pool).
         
         Args:
             audio_data: Audio samples
-        """
-        try:
-            if self.stt_mode == "offline":
-                # Offline STT
-                if not self.stt_offline:
-                    logger.error("Offline STT not initialized")
-                    return
-                
-                transcript = self.stt_offline.transcribe(audio_data, sample_rate=16000)
-            else:
-                # Cloud STT (synchronous wrapper for now)
-                if not self.stt_cloud:
-                    logger.error("Cloud STT not initialized")
-                    return
-                
-                # For Realtime API, we'd use streaming
-                # This is a simplified version
-                transcript = "Cloud STT not fully implemented yet"
+            should_cancel: Returns True once the job was cancelled
+            speech_segments: Voiced (start, end) sample offsets within
+                audio_data (passed on to backends that accept them)
             
-            if transcript:
-                logger.info(f"Transcript: {transcript}")
-                
-                # Call user callback
-                if self.on_transcript:
-                    try:
-                        self.on_transcript(transcript)
-                    except Exception as e:
-                        logger.error(f"Error in transcript callback: {e}")
+        Returns:
+            Transcribed text
+        """
+        if self.stt_mode == "offline":
+            # Offline STT (still loading if this is the first utterance)
+            if not self.stt_offline:
+                self.stt_offline = self.warmup.get("stt", timeout=None)
+            if not self.stt_offline:
+                raise RuntimeError("Offline STT not initialized")
             
-        except Exception as e:
-            logger.error(f"STT error: {e}")
+            options = {}
+            if getattr(self.stt_offline, "supports_cancellation", False):
+                options["should_cancel"] = should_cancel
+            if speech_segments is not None and getattr(
+                self.stt_offline, "supports_speech_segments", False
+            ):
+                options["speech_segments"] = speech_segments
+            return self.stt_offline.transcribe(audio_data, sample_rate=16000, **options)
+        
+        # Cloud STT: stream the utterance and wait for its transcript
+        if not self.stt_cloud:
+            raise RuntimeError("Cloud STT not initialized")
+        
+        return self.stt_cloud.transcribe(
+            audio_data, timeout=self.backend_config.get("timeout_s", 10.0)
+        )
+
+    def _deliver_transcript(self, job: STTJob) -> None:
+        """
+        Handle a finished STT job (called in utterance order).
+        
+        Args:
+            job: Finished job
+        """
+        if job.error:
+            logger.error(f"STT error: {job.error}")
             self._set_state(PipelineState.ERROR)
-        finally:
-            self._set_state(PipelineState.LISTENING)
+            return
+        
+        with self._endpoint_lock:
+            self.endpointer.record_transcript(self._speech_ended_at.pop(job.job_id, None))
+        
+        transcript = job.transcript
+        if transcript:
+            logger.info(f"Transcript: {transcript}")
+            
+            # Call user callback
+            if self.on_transcript:
+                try:
+                    self.on_transcript(transcript)
+                except Exception as e:
+                    logger.error(f"Error in transcript callback: {e}")
+            
+            self.warmup.mark_first_command()
+
+    def _on_stt_idle(self) -> None:
+        """Return to LISTENING once all queued speech is transcribed."""
+        with self._endpoint_lock:
+            self._speech_ended_at.clear()  # Entries of cancelled/dropped jobs
+        with self._state_lock:
+            if not self.capturing_speech and self.running:
+                self._set_state(PipelineState.LISTENING)
 
     def start(self) -> None:
         """Start the audio pipeline."""
@@ -248,25 +425,48 @@ class AudioPipeline:
             
             # Initialize STT
             if self.stt_mode == "offline":
-                model_path = self.stt_config.get("model_path", "models/ggml-base.en.bin")
-                whisper_bin = self.stt_config.get("binary_path", "whisper-cpp/main")
+                model_path = self.backend_config.get(
+                    "model_path", str(get_model_registry().path("whisper-cpp-base.en"))
+                )
+                whisper_bin = self.backend_config.get("binary_path", "whisper-cpp/main")
                 
-                self.stt_offline = WhisperSTT(
-                    model_path=model_path,
-                    whisper_bin=whisper_bin
+                # Loaded (and warmed) in the background while we wait
+                # for the wake word; _transcribe waits for it if needed
+                self.warmup.add(
+                    "stt",
+                    lambda: WhisperSTT(model_path=model_path, whisper_bin=whisper_bin)
                 )
-                logger.info("Offline STT initialized")
             else:
-                api_key = self.stt_config.get("api_key")
-                if api_key:
-                    self.stt_cloud = RealtimeSTT(
-                        api_key=api_key,
-                        on_transcript=self.on_transcript
+                api_key = self.backend_config.get("api_key")
+                url = self.backend_config.get("url", "wss://api.openai.com/v1/realtime")
+                local = not url.startswith("wss://api.openai.com")  # e.g. the stand-in server
+                if api_key or local:
+                    # Utterances are committed by the endpointer, so the
+                    # server's own turn detection is switched off
+                    self.stt_cloud = RealtimeAudioSender(
+                        url=url,
+                        api_key=api_key or "",
+                        model=None if local else self.backend_config.get("model"),
+                        frame_ms=self.backend_config.get("frame_ms", 100),
+                        session={
+                            "input_audio_format": "pcm16",
+                            "input_audio_transcription": {"model": "whisper-1"},
+                            "turn_detection": None,
+                        },
                     )
+                    if not self.stt_cloud.start():
+                        logger.warning("Cloud STT not connected yet - audio is buffered until it is")
                     logger.info("Cloud STT initialized")
                 else:
                     logger.warning("No OpenAI API key provided")
             
+            self.stt_pool.start()
+            
+            # Warm models while we wait for the wake word
+            if self.vad:
+                self.warmup.add("vad", lambda: self.vad)
+            self.warmup.start()
+            
             # Initialize audio capture
             self.audio_capture = AudioCapture(
                 sample_rate=16000,
@@ -301,6 +501,13 @@ class AudioPipeline:
         if self.audio_capture:
             self.audio_capture.stop()
         
+        # Cancel outstanding transcriptions
+        if self.partial_streamer:
+            self.partial_streamer.cancel()
+        self.stt_pool.stop()
+        if self.stt_cloud:
+            self.stt_cloud.stop()
+        
         # Cleanup wake word detector
         if self.wake_word_detector:
             self.wake_word_detector.delete()
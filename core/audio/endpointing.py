@@ -0,0 +1,256 @@
+"""
+Adaptive End-of-Utterance Detection
+
+Decides when the user has finished speaking from VAD speech
+probabilities, streaming partial transcripts and a short base timeout,
+instead of waiting out a fixed stretch of low-energy audio.
+"""
+
+import sys
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Optional, Dict, Any
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.metrics import get_metrics_collector
+
+
+# Words a command rarely ends on - a partial ending in one of these
+# is probably mid-sentence ("set a timer for", "open", "turn the volume to")
+TRAILING_WORDS = {
+    "a", "an", "the", "and", "or", "but", "to", "for", "of", "with", "in",
+    "on", "at", "by", "from", "about", "into", "my", "your", "this", "that",
+    "is", "are", "what's", "what", "how", "set", "open", "close", "play",
+    "search", "remind", "me", "call", "tell", "turn", "switch", "start",
+    "launch", "find", "show", "um", "uh", "er",
+}
+
+
+def sounds_incomplete(text: str) -> bool:
+    """
+    Check whether a partial transcript looks cut off mid-command.
+
+    Args:
+        text: Partial transcript
+
+    Returns:
+        True if the text ends on a connective, article, bare verb or filler
+    """
+    text = text.strip().lower()
+    if not text or text.endswith((",", "-", "...")):
+        return True
+    words = text.rstrip(".!?").split()
+    return not words or words[-1] in TRAILING_WORDS
+
+
+class EndpointReason(Enum):
+    """Why an utterance was ended."""
+    SILENCE = "silence"            # Trailing silence reached the timeout
+    EARLY_COMMIT = "early_commit"  # Partial already forms a complete command
+    NO_SPEECH = "no_speech"        # Nothing was said after the wake word
+    MAX_DURATION = "max_duration"  # Utterance hit the length cap
+
+
+class AdaptiveEndpointer:
+    """
+    VAD-driven endpointer with partial-transcript hints.
+
+    Features:
+    - Speech/silence from VAD probabilities with hysteresis
+    - Short base silence timeout, stretched when the latest partial
+      sounds incomplete
+    - Early commit when the latest partial is a complete, high-confidence
+      command
+    - Hard cap on utterance length (noisy rooms never go silent)
+    - Speech-end-to-commit and speech-end-to-transcript latency metrics
+    """
+
+    def __init__(
+        self,
+        base_timeout_ms: int = 600,
+        extended_timeout_ms: int = 1500,
+        early_commit_ms: int = 200,
+        early_commit_confidence: float = 0.8,
+        no_speech_timeout_ms: int = 3000,
+        max_utterance_s: float = 12.0,
+        speech_threshold: float = 0.5,
+        silence_threshold: float = 0.35,
+        sample_rate: int = 16000,
+        metrics_prefix: str = "endpoint",
+    ):
+        """
+        Initialize endpointer.
+
+        Args:
+            base_timeout_ms: Trailing silence that ends an utterance
+            extended_timeout_ms: Trailing silence after an incomplete-sounding partial
+            early_commit_ms: Trailing silence after a complete command partial
+            early_commit_confidence: Minimum intent confidence for early commit
+            no_speech_timeout_ms: Give up if no speech starts within this time
+            max_utterance_s: Maximum utterance length
+            speech_threshold: Probability at which a frame counts as speech
+            silence_threshold: Probability below which speech is over
+                (between the two, the previous state is kept)
+            sample_rate: Audio sample rate
+            metrics_prefix: Prefix for reported metric names
+        """
+        self.base_timeout_ms = base_timeout_ms
+        self.extended_timeout_ms = extended_timeout_ms
+        self.early_commit_ms = early_commit_ms
+        self.early_commit_confidence = early_commit_confidence
+        self.no_speech_timeout_ms = no_speech_timeout_ms
+        self.max_utterance_ms = max_utterance_s * 1000
+        self.speech_threshold = speech_threshold
+        self.silence_threshold = silence_threshold
+        self.sample_rate = sample_rate
+        self.metrics_prefix = metrics_prefix
+        self.metrics = get_metrics_collector()
+
+        self.reset()
+
+    def reset(self):
+        """Start a new utterance."""
+        self.in_speech = False
+        self.heard_speech = False
+        self.elapsed_ms = 0.0
+        self.silence_ms = 0.0
+        self.speech_ended_at: Optional[float] = None
+        self.speech_end_ms = 0.0  # Utterance position of the last voiced frame
+        self.partial_text = ""
+        self.partial_audio_ms: Optional[float] = None
+        self.partial_incomplete = False
+        self.partial_complete = False
+
+    def on_partial(
+        self,
+        text: str,
+        confidence: float = 0.0,
+        is_command: bool = False,
+        audio_ms: Optional[float] = None,
+    ):
+        """
+        Update with the latest streaming partial transcript.
+
+        Args:
+            text: Partial transcript
+            confidence: Intent confidence for the partial
+            is_command: Whether the partial classifies as a known intent
+            audio_ms: Length of audio the partial was decoded from (a
+                partial that stops short of the last speech can't commit early)
+        """
+        self.partial_text = text
+        self.partial_audio_ms = audio_ms
+        self.partial_incomplete = sounds_incomplete(text)
+        self.partial_complete = (
+            is_command
+            and confidence >= self.early_commit_confidence
+            and not self.partial_incomplete
+        )
+
+    @property
+    def can_commit_early(self) -> bool:
+        """Whether the latest partial is a complete command covering all speech."""
+        if not self.partial_complete:
+            return False
+        return self.partial_audio_ms is None or self.partial_audio_ms >= self.speech_end_ms
+
+    @property
+    def timeout_ms(self) -> float:
+        """Trailing silence currently needed to end the utterance."""
+        if self.can_commit_early:
+            return self.early_commit_ms
+        if self.partial_incomplete:
+            return self.extended_timeout_ms
+        return self.base_timeout_ms
+
+    def process_frame(self, speech_prob: float, num_samples: int) -> Optional[EndpointReason]:
+        """
+        Process one audio frame.
+
+        Args:
+            speech_prob: VAD speech probability for the frame (0.0-1.0)
+            num_samples: Frame length in samples
+
+        Returns:
+            Reason the utterance ended, or None to keep capturing
+        """
+        frame_ms = num_samples * 1000 / self.sample_rate
+        self.elapsed_ms += frame_ms
+
+        if speech_prob >= self.speech_threshold:
+            self.in_speech = True
+        elif speech_prob < self.silence_threshold:
+            self.in_speech = False
+
+        if self.in_speech:
+            self.heard_speech = True
+            self.silence_ms = 0.0
+            self.speech_ended_at = time.perf_counter()
+            self.speech_end_ms = self.elapsed_ms
+        else:
+            self.silence_ms += frame_ms
+
+        if not self.heard_speech:
+            if self.elapsed_ms >= self.no_speech_timeout_ms:
+                return self._finish(EndpointReason.NO_SPEECH)
+            return None
+
+        if self.elapsed_ms >= self.max_utterance_ms:
+            return self._finish(EndpointReason.MAX_DURATION)
+
+        if self.silence_ms >= self.timeout_ms:
+            reason = EndpointReason.EARLY_COMMIT if self.can_commit_early else EndpointReason.SILENCE
+            return self._finish(reason)
+
+        return None
+
+    def _finish(self, reason: EndpointReason) -> EndpointReason:
+        """Record the endpoint decision."""
+        self.metrics.increment(f"{self.metrics_prefix}.{reason.value}")
+        if self.speech_ended_at is not None:
+            self.metrics.record_value(
+                f"{self.metrics_prefix}.speech_end_to_commit_ms",
+                (time.perf_counter() - self.speech_ended_at) * 1000
+            )
+        logger.debug(
+            f"Endpoint: {reason.value} after {self.silence_ms:.0f}ms silence "
+            f"(partial: '{self.partial_text[:40]}')"
+        )
+        return reason
+
+    def record_transcript(self, speech_ended_at: Optional[float]):
+        """
+        Record end-of-speech to transcript latency.
+
+        Args:
+            speech_ended_at: speech_ended_at of the utterance when it was
+                committed (perf_counter time)
+        """
+        if speech_ended_at is None:
+            return
+        latency_ms = (time.perf_counter() - speech_ended_at) * 1000
+        self.metrics.record_value(f"{self.metrics_prefix}.speech_end_to_transcript_ms", latency_ms)
+        logger.info(f"End of speech to transcript: {latency_ms:.0f}ms")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get endpointing statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            "reasons": {
+                reason.value: self.metrics.get_counter(f"{self.metrics_prefix}.{reason.value}")
+                for reason in EndpointReason
+            },
+            "speech_end_to_commit_ms": self.metrics.get_value_stats(
+                f"{self.metrics_prefix}.speech_end_to_commit_ms"
+            ),
+            "speech_end_to_transcript_ms": self.metrics.get_value_stats(
+                f"{self.metrics_prefix}.speech_end_to_transcript_ms"
+            ),
+        }
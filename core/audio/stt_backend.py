@@ -6,8 +6,12 @@ Supports multiple STT providers (whisper.cpp, faster-whisper, OpenAI, etc.)
 """
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Union
+from threading import Lock, Thread
+from typing import Callable, Dict, Iterator, List, Optional, Union
+import time
 import numpy as np
 from loguru import logger
 
@@ -20,6 +24,58 @@ class STTBackendType(Enum):
     CLOUD_STT = "cloud_stt"
 
 
+@dataclass
+class BatchTranscription:
+    """
+    Result for one clip of a batch transcription.
+    
+    Attributes:
+        index: Position of the clip in the input list
+        text: Transcribed text
+        duration_s: Clip duration in seconds
+        elapsed_ms: Processing time attributed to this clip
+    """
+    index: int
+    text: str
+    duration_s: float
+    elapsed_ms: float
+
+
+def transcribe_sequentially(
+    transcribe_fn: Callable[..., str],
+    audio_list: List[np.ndarray],
+    sample_rate: int = 16000,
+    **kwargs
+) -> List[BatchTranscription]:
+    """
+    Transcribe clips one after another, timing each one.
+    
+    Args:
+        transcribe_fn: Single-clip transcription function
+        audio_list: Audio clips as numpy arrays
+        sample_rate: Sample rate in Hz
+        **kwargs: Extra arguments for transcribe_fn
+        
+    Returns:
+        Results in input order
+    """
+    results = []
+    for index, audio_data in enumerate(audio_list):
+        start_time = time.perf_counter()
+        try:
+            text = transcribe_fn(audio_data, sample_rate, **kwargs)
+        except Exception as e:
+            logger.error(f"Transcription of batch item {index} failed: {e}")
+            text = ""
+        results.append(BatchTranscription(
+            index=index,
+            text=text or "",
+            duration_s=len(audio_data) / sample_rate,
+            elapsed_ms=(time.perf_counter() - start_time) * 1000,
+        ))
+    return results
+
+
 class STTBackend(ABC):
     """
     Abstract base class for STT backends.
@@ -64,6 +120,30 @@ class STTBackend(ABC):
         """
         pass
     
+    def transcribe_batch(
+        self,
+        audio_list: List[np.ndarray],
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+    ) -> List[BatchTranscription]:
+        """
+        Transcribe many clips (bulk/offline jobs).
+        
+        Backends override this with batched or parallel inference;
+        the default transcribes clips one at a time.
+        
+        Args:
+            audio_list: Audio clips as numpy arrays
+            sample_rate: Sample rate in Hz
+            language: Language code (or None for auto-detect)
+            
+        Returns:
+            Results in input order with per-item timing
+        """
+        return transcribe_sequentially(
+            self.transcribe, audio_list, sample_rate, language=language
+        )
+    
     @abstractmethod
     def get_backend_info(self) -> dict:
         """Get backend information."""
@@ -78,11 +158,18 @@ class STTBackend(ABC):
 class STTBackendManager:
     """
     Manages multiple STT backends and allows hot-swapping.
+    
+    Switching loads and warms the new backend on a background thread
+    while the current one keeps serving; the swap itself is a pointer
+    exchange, and the old backend is released once the transcriptions
+    still using it have finished.
     """
     
     def __init__(
         self,
         default_backend: STTBackendType = STTBackendType.FASTER_WHISPER,
+        policy: str = "single",
+        race: Optional[dict] = None,
         **backend_config
     ):
         """
@@ -90,79 +177,337 @@ class STTBackendManager:
         
         Args:
             default_backend: Default backend type to use
+            policy: "single" (one backend) or "race" (fast vs accurate
+                backend with a deadline, see enable_racing)
+            race: Arguments for enable_racing when policy is "race"
+                (the stt.race config section)
             **backend_config: Configuration for specific backends
         """
         self.default_backend_type = default_backend
         self.backend_config = backend_config
         self.current_backend: Optional[STTBackend] = None
         self.available_backends: dict[str, STTBackendType] = {}
+        self.vocabulary = None  # Command vocabulary applied to every backend
+        self.bias_mode: Optional[str] = None
+        self.policy = "single"
         
-        # Initialize backend
+        # Hot-swap state: in-flight transcriptions per backend (by id) and
+        # swapped-out backends waiting for them to finish
+        self._backend_lock = Lock()
+        self._in_flight: Dict[int, int] = {}
+        self._retired: List[STTBackend] = []
+        self._switch_thread: Optional[Thread] = None
+        self.pending_backend_type: Optional[STTBackendType] = None
+        self.switches = 0
+        self.failed_switches = 0
+        
+        # Initialize backend(s)
+        if policy == "race" and self.enable_racing(**(race or {})):
+            return
         self._initialize_backend(default_backend)
     
+    def _create_backend(
+        self,
+        backend_type: STTBackendType,
+        config: Optional[dict] = None
+    ) -> Optional[STTBackend]:
+        """
+        Create a backend instance.
+        
+        Args:
+            backend_type: Backend type
+            config: Backend configuration (default: backend_config entry)
+            
+        Returns:
+            Backend instance or None if unknown/failed
+        """
+        if config is None:
+            config = self.backend_config.get(backend_type.value, {})
+        
+        if backend_type == STTBackendType.FASTER_WHISPER:
+            from .stt_faster_whisper import create_faster_whisper
+            return create_faster_whisper(**config)
+            
+        elif backend_type == STTBackendType.WHISPER_CPP:
+            from .stt_offline import WhisperSTT
+            return WhisperSTT(**config)
+            
+        elif backend_type == STTBackendType.OPENAI_REALTIME:
+            from .stt_realtime import RealtimeSTT
+            return RealtimeSTT(**config)
+        
+        logger.error(f"Unknown backend type: {backend_type}")
+        return None
+    
     def _initialize_backend(self, backend_type: STTBackendType):
-        """Initialize a specific backend."""
+        """Initialize a specific backend (blocking, used at startup)."""
         logger.info(f"Initializing STT backend: {backend_type.value}")
         
         try:
-            if backend_type == STTBackendType.FASTER_WHISPER:
-                from .stt_faster_whisper import create_faster_whisper
-                config = self.backend_config.get('faster_whisper', {})
-                self.current_backend = create_faster_whisper(**config)
-                
-            elif backend_type == STTBackendType.WHISPER_CPP:
-                from .stt_offline import WhisperSTT
-                config = self.backend_config.get('whisper_cpp', {})
-                self.current_backend = WhisperSTT(**config)
-                
-            elif backend_type == STTBackendType.OPENAI_REALTIME:
-                from .stt_realtime import RealtimeSTT
-                config = self.backend_config.get('openai_realtime', {})
-                self.current_backend = RealtimeSTT(**config)
-                
-            else:
-                logger.error(f"Unknown backend type: {backend_type}")
-                self.current_backend = None
-            
-            if self.current_backend and self.current_backend.is_available():
-                logger.info(f"STT backend initialized: {backend_type.value}")
-                self.available_backends[backend_type.value] = backend_type
-            else:
-                logger.warning(f"STT backend not available: {backend_type.value}")
-                self.current_backend = None
-                
+            backend = self._create_backend(backend_type)
         except Exception as e:
             logger.error(f"Failed to initialize STT backend: {e}")
-            self.current_backend = None
+            backend = None
+        
+        if backend is not None and backend.is_available():
+            logger.info(f"STT backend initialized: {backend_type.value}")
+            self.available_backends[backend_type.value] = backend_type
+        else:
+            logger.warning(f"STT backend not available: {backend_type.value}")
+            backend = None
+        
+        self._swap(backend, policy="single")
+    
+    def _swap(self, backend: Optional[STTBackend], policy: str = "single"):
+        """
+        Atomically make a backend current and retire the previous one.
+        
+        Args:
+            backend: New current backend (None to clear)
+            policy: "single" or "race"
+        """
+        if backend is not None and hasattr(backend, 'set_vocabulary'):
+            backend.set_vocabulary(self.vocabulary, self.bias_mode)
+        
+        with self._backend_lock:
+            old_backend = self.current_backend
+            self.current_backend = backend
+            self.policy = policy
+            if old_backend is not None and old_backend is not backend:
+                self._retired.append(old_backend)
+        
+        self._release_retired()
+    
+    @contextmanager
+    def _use_backend(self) -> Iterator[Optional[STTBackend]]:
+        """
+        Borrow the current backend for one transcription.
+        
+        A backend swapped out while borrowed is released only after
+        every borrower has returned it.
+        """
+        with self._backend_lock:
+            backend = self.current_backend
+            if backend is not None:
+                self._in_flight[id(backend)] = self._in_flight.get(id(backend), 0) + 1
+        
+        try:
+            yield backend
+        finally:
+            if backend is not None:
+                with self._backend_lock:
+                    remaining = self._in_flight[id(backend)] - 1
+                    if remaining:
+                        self._in_flight[id(backend)] = remaining
+                    else:
+                        del self._in_flight[id(backend)]
+                self._release_retired()
+    
+    def _release_retired(self):
+        """Release swapped-out backends that no transcription is using."""
+        with self._backend_lock:
+            idle = [b for b in self._retired if id(b) not in self._in_flight]
+            self._retired = [b for b in self._retired if id(b) in self._in_flight]
+        
+        for backend in idle:
+            # Racing backends own worker threads; other models are freed
+            # with their last reference
+            if hasattr(backend, 'shutdown'):
+                try:
+                    backend.shutdown()
+                except Exception as e:
+                    logger.warning(f"Failed to shut down STT backend: {e}")
+            logger.info(f"Released STT backend: {type(backend).__name__}")
+    
+    def _warm_up(self, backend: STTBackend):
+        """
+        Run a warm-up inference on a freshly loaded backend.
+        
+        Raises:
+            Exception: If the backend cannot transcribe
+        """
+        if hasattr(backend, 'warmup'):
+            # Backends report (rather than raise) warm-up failures
+            if not backend.warmup():
+                raise RuntimeError("warm-up failed")
+        else:
+            backend.transcribe(np.zeros(16000, dtype=np.float32), 16000)
+
+    def enable_racing(
+        self,
+        fast: Optional[dict] = None,
+        accurate: Optional[dict] = None,
+        deadline_ms: float = 1200.0
+    ) -> bool:
+        """
+        Race a fast backend against an accurate one on every request.
+        
+        The accurate transcript is used when it arrives within the
+        deadline; otherwise (or if it fails) the fast one is returned.
+        
+        Args:
+            fast: Fast backend spec, e.g. {"backend": "faster_whisper",
+                "model_size": "tiny"} (default: faster-whisper tiny)
+            accurate: Accurate backend spec (default: faster-whisper base)
+            deadline_ms: Deadline for the accurate backend
+            
+        Returns:
+            True if racing was enabled
+        """
+        from .stt_race import RacingSTTBackend
+        
+        fast = dict(fast or {"backend": "faster_whisper", "model_size": "tiny"})
+        accurate = dict(accurate or {"backend": "faster_whisper", "model_size": "base"})
+        
+        backends = []
+        for spec in (fast, accurate):
+            try:
+                backend_type = STTBackendType(spec.pop("backend", "faster_whisper"))
+                label = backend_type.value
+                if "model_size" in spec:
+                    label += f":{spec['model_size']}"
+                backend = self._create_backend(backend_type, spec)
+            except Exception as e:
+                logger.error(f"Failed to create racing backend: {e}")
+                backend = None
+            
+            if backend is None or not backend.is_available():
+                logger.warning("STT racing not available, using a single backend")
+                return False
+            backends.append((backend, label))
+        
+        (fast_backend, fast_name), (accurate_backend, accurate_name) = backends
+        if fast_name == accurate_name:
+            fast_name, accurate_name = f"fast:{fast_name}", f"accurate:{accurate_name}"
+        
+        racer = RacingSTTBackend(
+            fast_backend,
+            accurate_backend,
+            deadline_ms=deadline_ms,
+            fast_name=fast_name,
+            accurate_name=accurate_name,
+        )
+        self._swap(racer, policy="race")
+        logger.info(f"STT racing enabled: {fast_name} vs {accurate_name}")
+        return True
+    
+    def set_vocabulary(self, vocabulary, bias_mode: Optional[str] = None):
+        """
+        Bias the current (and any future) backend towards known commands.
+        
+        Args:
+            vocabulary: CommandVocabulary instance (or None to disable)
+            bias_mode: Biasing mode for backends that support several
+                (None = backend default)
+        """
+        self.vocabulary = vocabulary
+        self.bias_mode = bias_mode
+        self._apply_vocabulary()
+    
+    def _apply_vocabulary(self):
+        """Pass the vocabulary to the current backend if it supports biasing."""
+        if self.current_backend is None:
+            return
+        
+        if hasattr(self.current_backend, 'set_vocabulary'):
+            self.current_backend.set_vocabulary(self.vocabulary, self.bias_mode)
+        elif self.vocabulary is not None:
+            logger.debug("Current STT backend does not support biasing")
     
-    def switch_backend(self, backend_type: STTBackendType) -> bool:
+    def switch_backend(
+        self,
+        backend_type: STTBackendType,
+        wait: bool = False,
+        timeout: Optional[float] = None,
+    ) -> bool:
         """
-        Switch to a different backend.
+        Switch to a different backend without interrupting transcription.
+        
+        The new backend is loaded and warmed up on a background thread
+        while the current one keeps serving; it becomes current only if
+        the warm-up inference succeeds.
         
         Args:
             backend_type: Backend type to switch to
+            wait: Block until the switch has finished
+            timeout: Maximum time to wait (with wait=True)
             
         Returns:
-            True if switch successful, False otherwise
+            True if the switch was started (or, with wait=True, completed)
         """
         logger.info(f"Switching STT backend to: {backend_type.value}")
         
         # Check if already using this backend
-        if (self.current_backend and 
+        if (self.current_backend and self.policy == "single" and
             backend_type == self.default_backend_type):
             logger.info("Already using this backend")
             return True
         
-        # Initialize new backend
-        self._initialize_backend(backend_type)
+        with self._backend_lock:
+            if self._switch_thread is not None and self._switch_thread.is_alive():
+                logger.warning(
+                    f"STT backend switch to {self.pending_backend_type.value} "
+                    "already in progress"
+                )
+                return False
+            self.pending_backend_type = backend_type
+            self._switch_thread = Thread(
+                target=self._load_and_swap,
+                args=(backend_type,),
+                name="stt-backend-switch",
+                daemon=True,
+            )
+            self._switch_thread.start()
         
-        if self.current_backend and self.current_backend.is_available():
-            self.default_backend_type = backend_type
-            logger.info(f"Switched to backend: {backend_type.value}")
+        if not wait:
             return True
-        else:
-            logger.error(f"Failed to switch to backend: {backend_type.value}")
+        
+        if not self.wait_for_switch(timeout):
             return False
+        return self.current_backend is not None and self.default_backend_type == backend_type
+    
+    def _load_and_swap(self, backend_type: STTBackendType):
+        """Load, warm up and swap in a backend (switch thread)."""
+        start_time = time.perf_counter()
+        try:
+            backend = self._create_backend(backend_type)
+            if backend is None or not backend.is_available():
+                raise RuntimeError("backend not available")
+            self._warm_up(backend)
+        except Exception as e:
+            logger.error(f"Failed to switch to backend {backend_type.value}: {e}")
+            self.failed_switches += 1
+            self.pending_backend_type = None
+            return
+        
+        self.available_backends[backend_type.value] = backend_type
+        self._swap(backend, policy="single")
+        self.default_backend_type = backend_type
+        self.switches += 1
+        self.pending_backend_type = None
+        logger.info(
+            f"Switched to backend: {backend_type.value} "
+            f"(loaded in {(time.perf_counter() - start_time) * 1000:.0f}ms)"
+        )
+    
+    def is_switching(self) -> bool:
+        """Check if a backend switch is in progress."""
+        return self._switch_thread is not None and self._switch_thread.is_alive()
+    
+    def wait_for_switch(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for an in-progress backend switch.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if no switch is in progress any more
+        """
+        thread = self._switch_thread
+        if thread is not None:
+            thread.join(timeout)
+        return not self.is_switching()
     
     def transcribe(
         self,
@@ -181,19 +526,62 @@ class STTBackendManager:
         Returns:
             Transcribed text
         """
-        if not self.current_backend:
-            logger.error("No STT backend available")
-            return ""
+        with self._use_backend() as backend:
+            if not backend:
+                logger.error("No STT backend available")
+                return ""
+            
+            try:
+                return backend.transcribe(
+                    audio_data,
+                    sample_rate,
+                    language
+                )
+            except Exception as e:
+                logger.error(f"Transcription failed: {e}")
+                return ""
+    
+    def transcribe_batch(
+        self,
+        audio_list: List[np.ndarray],
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+    ) -> List[BatchTranscription]:
+        """
+        Transcribe many clips using current backend.
         
-        try:
-            return self.current_backend.transcribe(
-                audio_data,
-                sample_rate,
-                language
-            )
-        except Exception as e:
-            logger.error(f"Transcription failed: {e}")
-            return ""
+        Uses the backend's batched/parallel implementation when it has
+        one, otherwise transcribes clips one at a time.
+        
+        Args:
+            audio_list: Audio clips as numpy arrays
+            sample_rate: Sample rate in Hz
+            language: Language code
+            
+        Returns:
+            Results in input order with per-item timing
+        """
+        with self._use_backend() as backend:
+            if not backend:
+                logger.error("No STT backend available")
+                return [
+                    BatchTranscription(i, "", len(audio) / sample_rate, 0.0)
+                    for i, audio in enumerate(audio_list)
+                ]
+            
+            if hasattr(backend, "transcribe_batch"):
+                try:
+                    return backend.transcribe_batch(
+                        audio_list,
+                        sample_rate,
+                        language
+                    )
+                except Exception as e:
+                    logger.error(f"Batch transcription failed: {e}")
+        
+        return transcribe_sequentially(
+            self.transcribe, audio_list, sample_rate, language=language
+        )
     
     def transcribe_stream(
         self,
@@ -210,17 +598,18 @@ class STTBackendManager:
         Returns:
             Transcribed text or None
         """
-        if not self.current_backend:
-            return None
-        
-        try:
-            return self.current_backend.transcribe_stream(
-                audio_chunk,
-                sample_rate
-            )
-        except Exception as e:
-            logger.error(f"Stream transcription failed: {e}")
-            return None
+        with self._use_backend() as backend:
+            if not backend:
+                return None
+            
+            try:
+                return backend.transcribe_stream(
+                    audio_chunk,
+                    sample_rate
+                )
+            except Exception as e:
+                logger.error(f"Stream transcription failed: {e}")
+                return None
     
     def get_backend_info(self) -> dict:
         """Get current backend information."""
@@ -232,6 +621,14 @@ class STTBackendManager:
         
         info = self.current_backend.get_backend_info()
         info["type"] = self.default_backend_type.value
+        info["policy"] = self.policy
+        info["switching"] = self.is_switching()
+        if self.pending_backend_type is not None:
+            info["pending"] = self.pending_backend_type.value
+        info["switches"] = self.switches
+        info["failed_switches"] = self.failed_switches
+        if hasattr(self.current_backend, 'get_race_stats'):
+            info["race"] = self.current_backend.get_race_stats()
         return info
     
     def list_available_backends(self) -> list[str]:
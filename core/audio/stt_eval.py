@@ -0,0 +1,100 @@
+"""
+STT evaluation helpers.
+
+Word error rate scoring and JSONL corpus loading shared by the STT
+benchmarks and the on-machine tuner.
+
+A corpus manifest has one utterance per line, with audio paths relative
+to the manifest:
+
+    {"audio": "clips/volume_up_01.wav", "text": "turn up the volume"}
+"""
+
+import json
+from pathlib import Path
+from typing import List, Tuple
+import numpy as np
+import soundfile as sf
+
+
+def normalize_words(text: str) -> List[str]:
+    """Lowercase and strip punctuation for scoring."""
+    kept = "".join(c if c.isalnum() or c in " '" else " " for c in text.lower())
+    return kept.split()
+
+
+def word_errors(reference: str, hypothesis: str) -> Tuple[int, int]:
+    """
+    Word-level edit distance.
+    
+    Args:
+        reference: Reference transcript
+        hypothesis: Recognized transcript
+        
+    Returns:
+        Tuple of (edit distance, reference word count)
+    """
+    ref = normalize_words(reference)
+    hyp = normalize_words(hypothesis)
+    
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, 1):
+            current[j] = min(
+                previous[j] + 1,         # deletion
+                current[j - 1] + 1,      # insertion
+                previous[j - 1] + (ref_word != hyp_word),  # substitution
+            )
+        previous = current
+    
+    return previous[-1], len(ref)
+
+
+def word_error_rate(references: List[str], hypotheses: List[str]) -> float:
+    """
+    Corpus-level word error rate.
+    
+    Args:
+        references: Reference transcripts
+        hypotheses: Recognized transcripts (same order)
+        
+    Returns:
+        Total edits / total reference words
+    """
+    errors = 0
+    words = 0
+    for reference, hypothesis in zip(references, hypotheses):
+        e, n = word_errors(reference, hypothesis)
+        errors += e
+        words += n
+    return errors / max(words, 1)
+
+
+def load_corpus(manifest: Path, sample_rate: int = 16000) -> List[Tuple[np.ndarray, str]]:
+    """
+    Load (audio, reference) pairs from a JSONL manifest.
+    
+    Args:
+        manifest: Path to the manifest file
+        sample_rate: Required sample rate
+        
+    Returns:
+        List of (mono float32 audio, reference text)
+    """
+    manifest = Path(manifest)
+    corpus = []
+    with open(manifest, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            audio, file_rate = sf.read(manifest.parent / entry["audio"], dtype="float32")
+            if audio.ndim > 1:
+                audio = audio.mean(axis=1)
+            if file_rate != sample_rate:
+                raise ValueError(
+                    f"{entry['audio']}: expected {sample_rate} Hz audio, got {file_rate}"
+                )
+            corpus.append((audio, entry["text"]))
+    return corpus
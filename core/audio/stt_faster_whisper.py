@@ -6,10 +6,17 @@ providing 2-4× speedups with quantization support.
 """
 
 import sys
-from typing import Optional, Tuple
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
 import numpy as np
 from loguru import logger
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.metrics import get_metrics_collector
+from core.models.registry import get_model_registry
+
 try:
     from faster_whisper import WhisperModel
     FASTER_WHISPER_AVAILABLE = True
@@ -19,6 +26,13 @@ except ImportError:
         "faster-whisper not available. Install: pip install faster-whisper"
     )
 
+try:
+    # Batched inference was added in faster-whisper 1.1
+    from faster_whisper import BatchedInferencePipeline
+    BATCHED_INFERENCE_AVAILABLE = True
+except ImportError:
+    BATCHED_INFERENCE_AVAILABLE = False
+
 
 class FasterWhisperSTT:
     """
@@ -29,8 +43,19 @@ class FasterWhisperSTT:
     - 8-bit quantization support
     - Auto device selection (CPU/GPU)
     - Multiple model sizes (tiny/base/small/medium/large)
+    - Batched inference for bulk transcription
+    - Adaptive decoding (greedy first, beam search only when needed)
+    - Command-vocabulary biasing (prompt or hotwords)
     """
     
+    # transcribe() accepts should_cancel (checked between segments)
+    supports_cancellation = True
+    # ...and speech_segments from an upstream VAD
+    supports_speech_segments = True
+    
+    # Whisper decodes at most 30 s of audio per window
+    MAX_BATCH_CLIP_S = 30.0
+    
     # Available models and their specs
     MODELS = {
         "tiny": {"size": "39M", "speed": "very fast", "accuracy": "good"},
@@ -45,10 +70,21 @@ class FasterWhisperSTT:
         model_size: str = "base",
         device: str = "auto",
         compute_type: str = "int8",
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        model_dir: Optional[str] = None,
+        local_files_only: bool = True,
         language: Optional[str] = "en",
         beam_size: int = 5,
         best_of: int = 5,
         vad_filter: bool = True,
+        trust_upstream_vad: bool = False,
+        adaptive_decode: bool = False,
+        fallback_log_prob_threshold: float = -1.0,
+        fallback_no_speech_threshold: float = 0.6,
+        fallback_compression_ratio_threshold: float = 2.4,
+        vocabulary=None,
+        bias_mode: str = "prompt",
     ):
         """
         Initialize Faster Whisper STT.
@@ -57,10 +93,30 @@ class FasterWhisperSTT:
             model_size: Model size ("tiny", "base", "small", "medium", "large")
             device: Device ("cpu", "cuda", or convert "auto")
             compute_type: Compute type ("int8", "int8_float16", "float16", "float32")
+            cpu_threads: CPU threads per decode (0 = CTranslate2 default)
+            num_workers: Parallel decodes the model can serve (>1 only
+                helps when transcribe is called from several threads)
+            model_dir: Converted model directory (default: the model
+                registry's faster-whisper-<size>, else the Hugging Face cache)
+            local_files_only: Never download the model at load time
+                (fetch it with: python -m core.models.registry fetch)
             language: Language code (or None for auto-detect)
             beam_size: Beam search width
             best_of: Number of candidates to consider
             vad_filter: Use internal VAD filtering
+            trust_upstream_vad: Audio is already VAD-gated by the caller -
+                skip the internal VAD pass
+            adaptive_decode: Decode greedily first and re-run with the
+                configured beam only when a segment looks unreliable
+            fallback_log_prob_threshold: Beam fallback if a segment's
+                avg_logprob is below this
+            fallback_no_speech_threshold: Beam fallback if a segment's
+                no_speech_prob is above this
+            fallback_compression_ratio_threshold: Beam fallback if a
+                segment's compression ratio is above this
+            vocabulary: CommandVocabulary used to bias decoding (optional)
+            bias_mode: How the vocabulary is passed to the model:
+                "prompt" (initial_prompt) or "hotwords"
         """
         if not FASTER_WHISPER_AVAILABLE:
             raise ImportError(
@@ -79,6 +135,24 @@ class FasterWhisperSTT:
         self.beam_size = beam_size
         self.best_of = best_of
         self.vad_filter = vad_filter
+        self.trust_upstream_vad = trust_upstream_vad
+        self._batched_pipeline = None
+        
+        # Adaptive decoding
+        self.adaptive_decode = adaptive_decode
+        self.fallback_log_prob_threshold = fallback_log_prob_threshold
+        self.fallback_no_speech_threshold = fallback_no_speech_threshold
+        self.fallback_compression_ratio_threshold = fallback_compression_ratio_threshold
+        self.metrics = get_metrics_collector()
+        self._beam_ms_per_second: Optional[float] = None  # Measured beam cost
+        
+        # Command-vocabulary biasing
+        if bias_mode not in ("prompt", "hotwords"):
+            raise ValueError(
+                f"Invalid bias_mode: {bias_mode}. Choose from: ['prompt', 'hotwords']"
+            )
+        self.vocabulary = vocabulary
+        self.bias_mode = bias_mode
         
         # Auto-select device
         if device == "auto":
@@ -86,23 +160,39 @@ class FasterWhisperSTT:
         
         self.device = device
         self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.num_workers = num_workers
         
         # Load model
         logger.info(
             f"Loading faster-whisper model: {model_size} "
-            f"(device: {device}, compute: {compute_type})"
+            f"(device: {device}, compute: {compute_type}, "
+            f"threads: {cpu_threads or 'auto'}, workers: {num_workers})"
         )
         
+        # Prefer the verified registry copy; fall back to the HF cache by name
+        if model_dir is None:
+            registry_path = get_model_registry().find(f"faster-whisper-{model_size}")
+            model_dir = str(registry_path) if registry_path else None
+        self.model_dir = model_dir
+        
         try:
             self.model = WhisperModel(
-                model_size,
+                model_dir or model_size,
+                local_files_only=local_files_only,
                 device=device,
                 compute_type=compute_type,
-                num_workers=1,
+                cpu_threads=cpu_threads,
+                num_workers=num_workers,
             )
             logger.info("faster-whisper model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load faster-whisper model: {e}")
+            if local_files_only and model_dir is None:
+                logger.error(
+                    f"Model not installed - run: "
+                    f"python -m core.models.registry fetch faster-whisper-{model_size}"
+                )
             raise
     
     def _auto_select_device(self) -> str:
@@ -118,11 +208,42 @@ class FasterWhisperSTT:
         except ImportError:
             return "cpu"
     
+    def warmup(self, duration_s: float = 1.0) -> bool:
+        """
+        Run a short silent inference.
+        
+        The first decode pays for lazy allocations and cold caches; doing
+        it at startup keeps that cost off the first real command. The
+        decode uses the configured beam, so its time also seeds the beam
+        cost estimate adaptive decoding reports savings against.
+        
+        Args:
+            duration_s: Length of the silent clip
+            
+        Returns:
+            True if the model decoded successfully
+        """
+        try:
+            start_time = time.perf_counter()
+            self._decode(
+                np.zeros(int(16000 * duration_s), dtype=np.float32),
+                beam_size=self.beam_size,
+                best_of=self.best_of,
+                vad_filter=False,  # VAD would drop the silence and skip decoding
+            )
+            self._update_beam_rate((time.perf_counter() - start_time) * 1000, duration_s)
+        except Exception as e:
+            logger.warning(f"faster-whisper warm-up failed: {e}")
+            return False
+        return True
+    
     def transcribe(
         self,
         audio_data: np.ndarray,
         sample_rate: int = 16000,
         language: Optional[str] = None,
+        speech_segments: Optional[List[Tuple[int, int]]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None,
     ) -> str:
         """
         Transcribe audio to text.
@@ -131,6 +252,11 @@ class FasterWhisperSTT:
             audio_data: Audio samples as numpy array (16kHz, float32)
             sample_rate: Sample rate (should be 16000)
             language: Language code (or None to auto-detect)
+            speech_segments: Voiced (start, end) sample offsets from an
+                upstream VAD. Only these regions are decoded and the
+                internal VAD is skipped.
+            should_cancel: Returns True once the result is no longer
+                wanted; decoding stops at the next segment boundary
             
         Returns:
             Transcribed text
@@ -138,25 +264,37 @@ class FasterWhisperSTT:
         if audio_data is None or len(audio_data) == 0:
             return ""
         
+        options = {}
+        if should_cancel is not None:
+            options["should_cancel"] = should_cancel
+        if speech_segments is not None:
+            from .audio_buffer import collect_speech
+            
+            audio_data, _ = collect_speech(audio_data, speech_segments, sample_rate)
+            options["vad_filter"] = False
+            if len(audio_data) == 0:
+                return ""
+        
         try:
-            # Use provided language or fall back to instance language
-            transcribe_language = language or self.language
+            if self.adaptive_decode:
+                segments, info = self._decode_adaptive(
+                    audio_data, language, sample_rate, **options
+                )
+            else:
+                segments, info = self._decode(
+                    audio_data,
+                    language,
+                    beam_size=self.beam_size,
+                    best_of=self.best_of,
+                    **options
+                )
             
-            # Run transcription
-            segments, info = self.model.transcribe(
-                audio_data,
-                language=transcribe_language,
-                beam_size=self.beam_size,
-                best_of=self.best_of,
-                vad_filter=self.vad_filter,
-            )
+            if should_cancel is not None and should_cancel():
+                logger.debug("Transcription cancelled")
+                return ""
             
             # Combine segments
-            text_parts = []
-            for segment in segments:
-                text_parts.append(segment.text)
-            
-            transcript = " ".join(text_parts).strip()
+            transcript = " ".join(segment.text for segment in segments).strip()
             
             # Log info for debugging
             logger.debug(
@@ -171,6 +309,338 @@ class FasterWhisperSTT:
             logger.error(f"Transcription failed: {e}")
             return ""
     
+    def _decode(
+        self,
+        audio_data: np.ndarray,
+        language: Optional[str] = None,
+        should_cancel: Optional[Callable[[], bool]] = None,
+        **options
+    ) -> Tuple[list, object]:
+        """
+        Run the model and collect all segments.
+        
+        Args:
+            audio_data: Audio samples (16kHz, float32)
+            language: Language code (or None for instance language)
+            should_cancel: Stop collecting segments once this returns True
+            **options: Decoding options passed to WhisperModel.transcribe
+            
+        Returns:
+            Tuple of (segments list, transcription info)
+        """
+        options.setdefault("vad_filter", self.vad_filter and not self.trust_upstream_vad)
+        for key, value in self._bias_options().items():
+            options.setdefault(key, value)
+        
+        segments, info = self.model.transcribe(
+            audio_data,
+            language=language or self.language,
+            **options
+        )
+        
+        # Segments are generated lazily - decoding happens here
+        if should_cancel is None:
+            return list(segments), info
+        
+        collected = []
+        for segment in segments:
+            collected.append(segment)
+            if should_cancel():
+                break
+        return collected, info
+    
+    def _decode_adaptive(
+        self,
+        audio_data: np.ndarray,
+        language: Optional[str] = None,
+        sample_rate: int = 16000,
+        **options
+    ) -> Tuple[list, object]:
+        """
+        Greedy decode with beam-search fallback.
+        
+        The greedy pass uses a single temperature so faster-whisper does
+        not run its own sampling fallback; our thresholds decide instead.
+        
+        Args:
+            audio_data: Audio samples (16kHz, float32)
+            language: Language code (or None for instance language)
+            sample_rate: Sample rate
+            **options: Extra decoding options for both passes
+            
+        Returns:
+            Tuple of (segments list, transcription info)
+        """
+        audio_seconds = len(audio_data) / sample_rate
+        
+        start_time = time.perf_counter()
+        segments, info = self._decode(
+            audio_data,
+            language,
+            beam_size=1,
+            best_of=1,
+            temperature=0.0,
+            **options
+        )
+        greedy_ms = (time.perf_counter() - start_time) * 1000
+        
+        self.metrics.increment("stt.adaptive.decodes")
+        reason = self._fallback_reason(segments)
+        
+        if reason is None:
+            # Saving = what a beam decode would have cost (measured rate;
+            # unknown until a warm-up or fallback has timed a beam decode)
+            if self._beam_ms_per_second is not None:
+                estimated_beam_ms = self._beam_ms_per_second * audio_seconds
+                self.metrics.record_value(
+                    "stt.adaptive.latency_saved_ms",
+                    estimated_beam_ms - greedy_ms
+                )
+            return segments, info
+        
+        should_cancel = options.get("should_cancel")
+        if should_cancel is not None and should_cancel():
+            return segments, info
+        
+        logger.debug(f"Greedy decode unreliable ({reason}), re-running with beam search")
+        self.metrics.increment("stt.adaptive.fallbacks")
+        self.metrics.increment(f"stt.adaptive.fallbacks.{reason}")
+        
+        start_time = time.perf_counter()
+        segments, info = self._decode(
+            audio_data,
+            language,
+            beam_size=self.beam_size,
+            best_of=self.best_of,
+            **options
+        )
+        self._update_beam_rate((time.perf_counter() - start_time) * 1000, audio_seconds)
+        
+        # The wasted greedy pass is what the fallback cost
+        self.metrics.record_value("stt.adaptive.fallback_cost_ms", greedy_ms)
+        
+        return segments, info
+    
+    def _update_beam_rate(self, beam_ms: float, audio_seconds: float):
+        """Track beam decode cost per audio second (moving average)."""
+        if audio_seconds <= 0:
+            return
+        rate = beam_ms / audio_seconds
+        if self._beam_ms_per_second is None:
+            self._beam_ms_per_second = rate
+        else:
+            self._beam_ms_per_second = 0.8 * self._beam_ms_per_second + 0.2 * rate
+    
+    def _fallback_reason(self, segments: list) -> Optional[str]:
+        """
+        Check greedy segments against the fallback thresholds.
+        
+        Args:
+            segments: Decoded segments
+            
+        Returns:
+            Name of the first threshold crossed, or None if all segments pass
+        """
+        for segment in segments:
+            if segment.avg_logprob < self.fallback_log_prob_threshold:
+                return "avg_logprob"
+            if segment.no_speech_prob > self.fallback_no_speech_threshold:
+                return "no_speech_prob"
+            if segment.compression_ratio > self.fallback_compression_ratio_threshold:
+                return "compression_ratio"
+        return None
+    
+    def set_vocabulary(self, vocabulary, bias_mode: Optional[str] = None):
+        """
+        Set (or clear) the command vocabulary used to bias decoding.
+        
+        Args:
+            vocabulary: CommandVocabulary instance (or None to disable)
+            bias_mode: "prompt" or "hotwords" (None = keep current)
+        """
+        if bias_mode is not None:
+            if bias_mode not in ("prompt", "hotwords"):
+                raise ValueError(
+                    f"Invalid bias_mode: {bias_mode}. Choose from: ['prompt', 'hotwords']"
+                )
+            self.bias_mode = bias_mode
+        self.vocabulary = vocabulary
+        
+        # Build the prompt now so the first decode doesn't pay for it
+        self._bias_options()
+        logger.info(
+            f"STT biasing {'enabled' if vocabulary else 'disabled'} "
+            f"(mode: {self.bias_mode})"
+        )
+    
+    def _bias_options(self) -> dict:
+        """Decoding options for the current vocabulary (rebuilt only on change)."""
+        if self.vocabulary is None:
+            return {}
+        
+        if self.bias_mode == "hotwords":
+            hotwords = self.vocabulary.get_hotwords()
+            return {"hotwords": hotwords} if hotwords else {}
+        
+        prompt = self.vocabulary.get_prompt()
+        return {"initial_prompt": prompt} if prompt else {}
+    
+    def get_adaptive_stats(self) -> dict:
+        """
+        Get adaptive decoding statistics.
+        
+        Returns:
+            Dictionary with decode count, fallback count and rate (also
+            per reason), latency saved (ms) by greedy decodes and the
+            cost (ms) of greedy passes that fell back
+        """
+        decodes = self.metrics.get_counter("stt.adaptive.decodes")
+        fallbacks = self.metrics.get_counter("stt.adaptive.fallbacks")
+        return {
+            "decodes": decodes,
+            "fallbacks": fallbacks,
+            "fallback_rate": fallbacks / decodes if decodes else 0.0,
+            "fallback_reasons": {
+                reason: self.metrics.get_counter(f"stt.adaptive.fallbacks.{reason}")
+                for reason in ("avg_logprob", "no_speech_prob", "compression_ratio")
+            },
+            "latency_saved_ms": self.metrics.get_value_stats(
+                "stt.adaptive.latency_saved_ms"
+            ),
+            "fallback_cost_ms": self.metrics.get_value_stats(
+                "stt.adaptive.fallback_cost_ms"
+            ),
+        }
+    
+    def transcribe_batch(
+        self,
+        audio_list: List[np.ndarray],
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        batch_size: int = 8,
+    ) -> list:
+        """
+        Transcribe many clips with batched inference.
+        
+        Clips are sorted by length and grouped into buckets of similar
+        duration, so each batch decodes a similar number of tokens.
+        Each bucket is concatenated and decoded in one batched call,
+        using clip timestamps to keep the clips apart.
+        
+        Args:
+            audio_list: Audio clips (16kHz, float32)
+            sample_rate: Sample rate (should be 16000)
+            language: Language code (or None for instance language)
+            batch_size: Number of clips decoded together
+            
+        Returns:
+            List of BatchTranscription in input order
+        """
+        from .stt_backend import BatchTranscription, transcribe_sequentially
+        
+        if not BATCHED_INFERENCE_AVAILABLE:
+            logger.warning(
+                "Batched inference needs faster-whisper>=1.1, "
+                "transcribing sequentially"
+            )
+            return transcribe_sequentially(
+                self.transcribe, audio_list, sample_rate, language=language
+            )
+        
+        if self._batched_pipeline is None:
+            self._batched_pipeline = BatchedInferencePipeline(model=self.model)
+        
+        results: List[Optional[BatchTranscription]] = [None] * len(audio_list)
+        
+        # Length bucketing: short clips together, long clips together
+        max_samples = int(self.MAX_BATCH_CLIP_S * sample_rate)
+        batchable = []
+        for index, audio_data in enumerate(audio_list):
+            if 0 < len(audio_data) <= max_samples:
+                batchable.append(index)
+            else:
+                # Empty or longer than one window - regular decode
+                start_time = time.perf_counter()
+                results[index] = BatchTranscription(
+                    index=index,
+                    text=self.transcribe(audio_data, sample_rate, language),
+                    duration_s=len(audio_data) / sample_rate,
+                    elapsed_ms=(time.perf_counter() - start_time) * 1000,
+                )
+        
+        batchable.sort(key=lambda i: len(audio_list[i]))
+        
+        for start in range(0, len(batchable), batch_size):
+            bucket = batchable[start:start + batch_size]
+            texts, elapsed_ms = self._transcribe_bucket(
+                [audio_list[i] for i in bucket],
+                sample_rate,
+                language,
+            )
+            
+            # Attribute bucket time to clips by duration
+            bucket_samples = sum(len(audio_list[i]) for i in bucket)
+            for index, text in zip(bucket, texts):
+                n_samples = len(audio_list[index])
+                results[index] = BatchTranscription(
+                    index=index,
+                    text=text,
+                    duration_s=n_samples / sample_rate,
+                    elapsed_ms=elapsed_ms * n_samples / bucket_samples,
+                )
+        
+        return results
+    
+    def _transcribe_bucket(
+        self,
+        clips: List[np.ndarray],
+        sample_rate: int,
+        language: Optional[str],
+    ) -> Tuple[List[str], float]:
+        """
+        Decode a bucket of clips in one batched call.
+        
+        Args:
+            clips: Audio clips, each at most MAX_BATCH_CLIP_S long
+            sample_rate: Sample rate
+            language: Language code
+            
+        Returns:
+            Tuple of (texts in clip order, elapsed ms)
+        """
+        start_time = time.perf_counter()
+        
+        audio_data = np.concatenate(clips).astype(np.float32, copy=False)
+        bounds = np.cumsum([0] + [len(clip) for clip in clips]) / sample_rate
+        clip_timestamps = [
+            {"start": float(bounds[i]), "end": float(bounds[i + 1])}
+            for i in range(len(clips))
+        ]
+        
+        texts = [[] for _ in clips]
+        try:
+            segments, _ = self._batched_pipeline.transcribe(
+                audio_data,
+                language=language or self.language,
+                beam_size=self.beam_size,
+                batch_size=len(clips),
+                vad_filter=False,
+                clip_timestamps=clip_timestamps,
+                **self._bias_options(),
+            )
+            
+            for segment in segments:
+                # Assign segment to the clip containing its midpoint
+                midpoint = (segment.start + segment.end) / 2
+                clip_index = int(np.searchsorted(bounds, midpoint, side="right")) - 1
+                clip_index = min(max(clip_index, 0), len(clips) - 1)
+                texts[clip_index].append(segment.text)
+        except Exception as e:
+            logger.error(f"Batched transcription failed: {e}")
+        
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        return [" ".join(parts).strip() for parts in texts], elapsed_ms
+    
     def transcribe_stream(
         self,
         audio_chunk: np.ndarray,
@@ -198,13 +668,26 @@ class FasterWhisperSTT:
         
         return self.transcribe(audio_chunk, sample_rate)
     
+    def get_backend_info(self) -> dict:
+        """Get backend information."""
+        return {
+            "backend": "faster_whisper",
+            **self.get_model_info(),
+            "available": self.is_available(),
+        }
+    
     def get_model_info(self) -> dict:
         """Get model information."""
         return {
             "model_size": self.model_size,
+            "model_dir": self.model_dir,
             "device": self.device,
             "compute_type": self.compute_type,
+            "cpu_threads": self.cpu_threads,
+            "num_workers": self.num_workers,
             "language": self.language,
+            "adaptive_decode": self.adaptive_decode,
+            "biasing": self.bias_mode if self.vocabulary else None,
             **self.MODELS.get(self.model_size, {}),
         }
     
@@ -0,0 +1,240 @@
+"""
+Incremental Push-to-Talk Decoding
+
+Decodes audio while the push-to-talk key is still held and commits
+words once consecutive decodes agree on them, so that after release
+only the short uncommitted tail has to be transcribed.
+"""
+
+import sys
+import time
+from pathlib import Path
+from threading import Thread, Event, Lock
+from typing import Optional, Callable, List, Dict, Any
+import numpy as np
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.audio.stt_words import TimedWord, normalize_word, trim_text_overlap
+from core.metrics import get_metrics_collector
+
+
+def agreed_prefix(previous: List[TimedWord], current: List[TimedWord]) -> int:
+    """
+    Length of the common word prefix of two hypotheses.
+
+    Args:
+        previous: Words from the previous decode
+        current: Words from the latest decode
+
+    Returns:
+        Number of leading words both decodes agree on
+    """
+    count = 0
+    for a, b in zip(previous, current):
+        if normalize_word(a.text) != normalize_word(b.text):
+            break
+        count += 1
+    return count
+
+
+class IncrementalDecoder:
+    """
+    Streaming decoder for push-to-talk.
+
+    Features:
+    - Decodes the uncommitted audio every interval while recording
+    - Commits words two consecutive decodes agree on (and that end
+      at least holdback_ms before the newest audio), then drops their
+      audio from the buffer
+    - Force-commits when the uncommitted audio grows too long, keeping
+      every decode (and the one after release) bounded
+    - Committed text is passed as the prompt for the next decode
+    - Release-to-text latency and tail length metrics
+    """
+
+    def __init__(
+        self,
+        decode_fn: Callable[[np.ndarray, str], List[TimedWord]],
+        sample_rate: int = 16000,
+        interval_ms: int = 500,
+        min_decode_ms: int = 1000,
+        holdback_ms: int = 500,
+        max_uncommitted_s: float = 6.0,
+        metrics_prefix: str = "stt.incremental",
+    ):
+        """
+        Initialize incremental decoder.
+
+        Args:
+            decode_fn: Called with (audio, prompt), returns words with
+                timestamps relative to the start of audio
+            sample_rate: Audio sample rate
+            interval_ms: Time between decodes while recording
+            min_decode_ms: Uncommitted audio needed before decoding
+            holdback_ms: Words ending this close to the newest audio are
+                never committed (they may still change)
+            max_uncommitted_s: Commit without agreement beyond this much
+                uncommitted audio
+            metrics_prefix: Prefix for reported metric names
+        """
+        self.decode_fn = decode_fn
+        self.sample_rate = sample_rate
+        self.interval_ms = interval_ms
+        self.min_decode_samples = int(sample_rate * min_decode_ms / 1000)
+        self.holdback_s = holdback_ms / 1000
+        self.max_uncommitted_s = max_uncommitted_s
+        self.metrics_prefix = metrics_prefix
+        self.metrics = get_metrics_collector()
+
+        self._lock = Lock()  # Guards the incoming chunks
+        self._thread: Optional[Thread] = None
+        self._stop_event = Event()
+
+        self.reset()
+
+    def reset(self):
+        """Start a new utterance."""
+        self._chunks: List[np.ndarray] = []
+        self._buffer = np.zeros(0, dtype=np.float32)
+        self._buffer_start_s = 0.0  # Absolute time of _buffer[0]
+        self.committed: List[TimedWord] = []
+        self._hypothesis: List[TimedWord] = []
+        self.decodes = 0
+
+    def add_audio(self, chunk: np.ndarray):
+        """
+        Append recorded audio (cheap; safe to call from the audio callback).
+
+        Args:
+            chunk: Audio samples
+        """
+        with self._lock:
+            self._chunks.append(np.asarray(chunk, dtype=np.float32).reshape(-1))
+
+    def start(self):
+        """Start decoding in the background."""
+        self.reset()
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run, name="stt-incremental", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Decode loop while recording."""
+        while not self._stop_event.wait(self.interval_ms / 1000):
+            self._collect()
+            if len(self._buffer) < self.min_decode_samples:
+                continue
+            try:
+                self._decode_pass()
+            except Exception as e:
+                logger.error(f"Incremental decode failed: {e}")
+
+    def _collect(self):
+        """Move new chunks into the decode buffer."""
+        with self._lock:
+            chunks, self._chunks = self._chunks, []
+        if chunks:
+            self._buffer = np.concatenate([self._buffer] + chunks)
+
+    @property
+    def committed_text(self) -> str:
+        """Text committed so far."""
+        return " ".join(word.text.strip() for word in self.committed).strip()
+
+    def _decode(self) -> List[TimedWord]:
+        """Decode the buffer, returning words with absolute timestamps."""
+        words = self.decode_fn(self._buffer, self.committed_text[-200:])
+        self.decodes += 1
+        return [
+            TimedWord(w.start + self._buffer_start_s, w.end + self._buffer_start_s, w.text)
+            for w in words
+            if w.text.strip()
+        ]
+
+    def _decode_pass(self):
+        """Decode the uncommitted audio and commit stable words."""
+        words = self._decode()
+        buffer_end_s = self._buffer_start_s + len(self._buffer) / self.sample_rate
+        stable_until = buffer_end_s - self.holdback_s
+
+        count = agreed_prefix(self._hypothesis, words)
+        if buffer_end_s - self._buffer_start_s > self.max_uncommitted_s:
+            count = max(count, len(words) - 1)  # Too long to wait for agreement
+        while count and words[count - 1].end > stable_until:
+            count -= 1
+
+        if count:
+            self.committed.extend(words[:count])
+            self._trim(words[count - 1].end)
+            logger.debug(f"Committed: '{self.committed_text}'")
+        self._hypothesis = words[count:]
+
+    def _trim(self, until_s: float):
+        """Drop committed audio from the front of the buffer."""
+        drop = int((until_s - self._buffer_start_s) * self.sample_rate)
+        drop = min(max(drop, 0), len(self._buffer))
+        self._buffer = self._buffer[drop:]
+        self._buffer_start_s += drop / self.sample_rate
+
+    def finish(self) -> str:
+        """
+        Stop decoding and transcribe the remaining tail.
+
+        Call after the last audio has been added (key released).
+
+        Returns:
+            Full transcript
+
+        Raises:
+            Exception: If the tail decode fails (the committed words alone
+                would silently drop the end of the utterance)
+        """
+        released_at = time.perf_counter()
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        self._collect()
+        tail_s = len(self._buffer) / self.sample_rate
+        tail = ""
+        if len(self._buffer):
+            tail = " ".join(w.text.strip() for w in self._decode()).strip()
+
+        committed = self.committed_text
+        text = " ".join(
+            part for part in (committed, trim_text_overlap(committed, tail, max_words=2)) if part
+        )
+
+        latency_ms = (time.perf_counter() - released_at) * 1000
+        self.metrics.record_value(f"{self.metrics_prefix}.release_to_text_ms", latency_ms)
+        self.metrics.record_value(f"{self.metrics_prefix}.tail_ms", tail_s * 1000)
+        logger.info(
+            f"Release to text: {latency_ms:.0f}ms ({tail_s * 1000:.0f}ms tail, "
+            f"{len(self.committed)} words committed early)"
+        )
+        return text
+
+    def cancel(self):
+        """Stop decoding and discard the utterance."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.reset()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get decoding statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            "release_to_text_ms": self.metrics.get_value_stats(
+                f"{self.metrics_prefix}.release_to_text_ms"
+            ),
+            "tail_ms": self.metrics.get_value_stats(f"{self.metrics_prefix}.tail_ms"),
+        }
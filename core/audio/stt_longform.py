@@ -0,0 +1,405 @@
+"""
+Long-Form Transcription
+
+Transcribes long recordings (dictation, meetings) by splitting them at
+VAD silences, decoding the chunks in a process pool and stitching the
+results back together by word timestamps.
+
+Usage:
+
+    python -m core.audio.stt_longform recording.wav --model base --workers 4
+"""
+
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, List, Tuple, Dict, Any
+import numpy as np
+from loguru import logger
+
+from .audio_buffer import SpeechSegmentTracker
+from .stt_words import TimedWord
+
+try:
+    from faster_whisper.vad import get_speech_timestamps, VadOptions
+    FW_VAD_AVAILABLE = True
+except ImportError:
+    FW_VAD_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.metrics import get_metrics_collector
+from core.models.registry import get_model_registry
+
+
+@dataclass
+class LongFormResult:
+    """Result of a long-form transcription."""
+
+    text: str
+    words: List[TimedWord] = field(default_factory=list)
+    chunks: List[Tuple[int, int]] = field(default_factory=list)
+    audio_s: float = 0.0
+    elapsed_s: float = 0.0
+
+    @property
+    def rtf(self) -> float:
+        """Real-time factor (processing time / audio duration)."""
+        return self.elapsed_s / self.audio_s if self.audio_s else 0.0
+
+
+def detect_speech(
+    audio: np.ndarray,
+    sample_rate: int = 16000,
+    min_silence_ms: int = 500,
+) -> List[Tuple[int, int]]:
+    """
+    Find voiced regions of a recording.
+
+    Uses the Silero model bundled with faster-whisper, falling back to
+    an energy detector with a noise floor estimated from the recording.
+
+    Args:
+        audio: Mono float32 audio
+        sample_rate: Sample rate (16 kHz for Silero)
+        min_silence_ms: Pauses shorter than this stay inside a region
+
+    Returns:
+        List of (start, end) sample ranges
+    """
+    if FW_VAD_AVAILABLE and sample_rate == 16000:
+        timestamps = get_speech_timestamps(
+            audio,
+            VadOptions(min_silence_duration_ms=min_silence_ms, speech_pad_ms=200),
+        )
+        return [(ts["start"], ts["end"]) for ts in timestamps]
+
+    frame = int(sample_rate * 0.03)
+    frames = len(audio) // frame
+    if frames == 0:
+        return []
+
+    rms = np.sqrt(np.mean(audio[:frames * frame].reshape(frames, frame) ** 2, axis=1))
+    threshold = max(3 * float(np.percentile(rms, 20)), 0.005)
+
+    tracker = SpeechSegmentTracker(sample_rate=sample_rate, merge_gap_ms=min_silence_ms)
+    for level in rms:
+        tracker.add_frame(frame, bool(level >= threshold))
+    return tracker.get_segments()
+
+
+def plan_chunks(
+    speech: List[Tuple[int, int]],
+    sample_rate: int = 16000,
+    max_chunk_s: float = 30.0,
+    overlap_s: float = 1.0,
+) -> List[Tuple[int, int]]:
+    """
+    Group voiced regions into decode chunks.
+
+    Regions are packed into chunks of at most max_chunk_s, cutting only
+    at silences. A single region longer than that (no pause to cut at)
+    is split into windows overlapping by overlap_s.
+
+    Args:
+        speech: Voiced (start, end) sample ranges, in order
+        sample_rate: Sample rate
+        max_chunk_s: Maximum chunk length (Whisper decodes 30 s windows)
+        overlap_s: Overlap between forced splits
+
+    Returns:
+        List of (start, end) sample ranges to decode
+    """
+    max_len = int(max_chunk_s * sample_rate)
+    overlap = int(overlap_s * sample_rate)
+
+    pieces = []
+    for start, end in speech:
+        while end - start > max_len:
+            pieces.append((start, start + max_len))
+            start += max_len - overlap
+        pieces.append((start, end))
+
+    chunks: List[Tuple[int, int]] = []
+    for start, end in pieces:
+        if chunks and end - chunks[-1][0] <= max_len:
+            chunks[-1] = (chunks[-1][0], end)
+        else:
+            chunks.append((start, end))
+    return chunks
+
+
+def merge_chunk_words(
+    chunks: List[Tuple[int, int]],
+    chunk_words: List[List[TimedWord]],
+    sample_rate: int = 16000,
+) -> List[TimedWord]:
+    """
+    Merge per-chunk words, resolving overlaps by timestamp.
+
+    Where two chunks overlap, words centred before the middle of the
+    overlap come from the earlier chunk and the rest from the later one.
+
+    Args:
+        chunks: Decoded (start, end) sample ranges, in order
+        chunk_words: Words per chunk with absolute timestamps
+
+    Returns:
+        Merged words in time order
+    """
+    merged = []
+    for i, words in enumerate(chunk_words):
+        low, high = float("-inf"), float("inf")
+        if i > 0 and chunks[i][0] < chunks[i - 1][1]:
+            low = (chunks[i][0] + chunks[i - 1][1]) / 2 / sample_rate
+        if i + 1 < len(chunks) and chunks[i + 1][0] < chunks[i][1]:
+            high = (chunks[i + 1][0] + chunks[i][1]) / 2 / sample_rate
+        merged.extend(word for word in words if low <= word.center < high)
+    return merged
+
+
+# Per-process model (set by _init_worker in each pool process)
+_worker_model = None
+_worker_options: Dict[str, Any] = {}
+
+
+def _init_worker(model: str, device: str, compute_type: str, cpu_threads: int, options: dict):
+    """Load the model once per pool process."""
+    global _worker_model, _worker_options
+    from faster_whisper import WhisperModel
+
+    _worker_model = WhisperModel(
+        model,
+        local_files_only=True,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+    )
+    _worker_options = options
+
+
+def _transcribe_chunk(job: Tuple[int, np.ndarray, float]) -> Tuple[int, List[TimedWord]]:
+    """Decode one chunk in a pool process."""
+    index, audio, offset_s = job
+    segments, _ = _worker_model.transcribe(
+        audio,
+        word_timestamps=True,
+        vad_filter=False,  # Chunks are already cut at VAD silences
+        condition_on_previous_text=False,
+        **_worker_options,
+    )
+    words = [
+        TimedWord(offset_s + word.start, offset_s + word.end, word.word)
+        for segment in segments
+        for word in (segment.words or [])
+    ]
+    return index, words
+
+
+def default_workers() -> int:
+    """One worker per physical core."""
+    cores = psutil.cpu_count(logical=False) if PSUTIL_AVAILABLE else None
+    return cores or os.cpu_count() or 1
+
+
+class LongFormTranscriber:
+    """
+    Parallel long-form transcriber.
+
+    Features:
+    - Chunks cut at VAD silences rather than fixed windows
+    - One single-threaded model per process, so throughput scales with cores
+    - Word-timestamp merge of overlapping forced splits
+    - Real-time factor metrics
+    """
+
+    def __init__(
+        self,
+        model_size: str = "base",
+        device: str = "cpu",
+        compute_type: str = "int8",
+        workers: Optional[int] = None,
+        language: Optional[str] = "en",
+        beam_size: int = 5,
+        max_chunk_s: float = 30.0,
+        overlap_s: float = 1.0,
+        min_silence_ms: int = 500,
+    ):
+        """
+        Initialize long-form transcriber.
+
+        Args:
+            model_size: faster-whisper model size
+            device: Device ("cpu" or "cuda")
+            compute_type: Compute type
+            workers: Decode processes (default: physical cores)
+            language: Language code (or None for auto-detect per chunk)
+            beam_size: Beam search width
+            max_chunk_s: Maximum chunk length
+            overlap_s: Overlap when a region has to be split without a pause
+            min_silence_ms: Minimum pause to cut at
+        """
+        self.model_size = model_size
+        self.device = device
+        self.compute_type = compute_type
+        self.workers = workers or default_workers()
+        self.language = language
+        self.beam_size = beam_size
+        self.max_chunk_s = max_chunk_s
+        self.overlap_s = overlap_s
+        self.min_silence_ms = min_silence_ms
+        self.metrics = get_metrics_collector()
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        logger.info(
+            f"LongFormTranscriber: {model_size} ({compute_type}), "
+            f"{self.workers} workers"
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the process pool on first use (models load once per process)."""
+        if self._executor is None:
+            registry_path = get_model_registry().find(f"faster-whisper-{self.model_size}")
+            
+            # Spawn: forking a process with CTranslate2 threads running is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(
+                    str(registry_path) if registry_path else self.model_size,
+                    self.device,
+                    self.compute_type,
+                    1,  # One thread per process; parallelism comes from processes
+                    {"language": self.language, "beam_size": self.beam_size},
+                ),
+            )
+        return self._executor
+
+    def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> LongFormResult:
+        """
+        Transcribe a long recording.
+
+        Args:
+            audio: Mono float32 audio
+            sample_rate: Sample rate (must be 16 kHz)
+
+        Returns:
+            LongFormResult with text, word timings and timing stats
+        """
+        if sample_rate != 16000:
+            raise ValueError(f"Long-form transcription needs 16 kHz audio, got {sample_rate}")
+
+        start_time = time.perf_counter()
+        audio_s = len(audio) / sample_rate
+
+        speech = detect_speech(audio, sample_rate, self.min_silence_ms)
+        chunks = plan_chunks(speech, sample_rate, self.max_chunk_s, self.overlap_s)
+        logger.info(
+            f"Long-form: {audio_s:.0f}s audio, {len(speech)} speech regions, "
+            f"{len(chunks)} chunks"
+        )
+
+        jobs = [
+            (i, audio[start:end], start / sample_rate)
+            for i, (start, end) in enumerate(chunks)
+        ]
+        # Longest chunks first so no worker is left with a big one at the end
+        jobs.sort(key=lambda job: len(job[1]), reverse=True)
+
+        chunk_words: List[List[TimedWord]] = [[] for _ in chunks]
+        if jobs:
+            for index, words in self._get_executor().map(_transcribe_chunk, jobs):
+                chunk_words[index] = words
+
+        words = merge_chunk_words(chunks, chunk_words, sample_rate)
+        result = LongFormResult(
+            text="".join(word.text for word in words).strip(),
+            words=words,
+            chunks=chunks,
+            audio_s=audio_s,
+            elapsed_s=time.perf_counter() - start_time,
+        )
+
+        self.metrics.record_value("stt.longform.rtf", result.rtf)
+        self.metrics.increment("stt.longform.chunks", len(chunks))
+        logger.info(
+            f"Long-form done in {result.elapsed_s:.1f}s (RTF {result.rtf:.3f}, "
+            f"{len(words)} words)"
+        )
+        return result
+
+    def transcribe_file(self, path: str) -> LongFormResult:
+        """
+        Transcribe an audio file (any rate; resampled to 16 kHz).
+
+        Args:
+            path: Audio file path
+
+        Returns:
+            LongFormResult
+        """
+        import soundfile as sf
+        from scipy.signal import resample_poly
+
+        audio, sample_rate = sf.read(path, dtype="float32")
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+        if sample_rate != 16000:
+            divisor = np.gcd(int(sample_rate), 16000)
+            audio = resample_poly(audio, 16000 // divisor, int(sample_rate) // divisor).astype(np.float32)
+        return self.transcribe(audio, 16000)
+
+    def close(self):
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Long-form transcription")
+    parser.add_argument("audio", help="Audio file")
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--workers", type=int, help="Decode processes (default: physical cores)")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--output", type=Path, help="Write the transcript here")
+    args = parser.parse_args()
+
+    with LongFormTranscriber(
+        model_size=args.model,
+        compute_type=args.compute_type,
+        workers=args.workers,
+        language=args.language,
+    ) as transcriber:
+        result = transcriber.transcribe_file(args.audio)
+
+    if args.output:
+        args.output.write_text(result.text, encoding="utf-8")
+        logger.info(f"Transcript written to {args.output}")
+    else:
+        print(result.text)
+
+
+if __name__ == "__main__":
+    main()
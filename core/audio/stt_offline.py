@@ -6,11 +6,16 @@ Fast local speech recognition without cloud dependencies.
 import subprocess
 import tempfile
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+import numpy as np
 import soundfile as sf
 from loguru import logger
 
+from .stt_words import trim_text_overlap
+
 
 class WhisperSTT:
     """
@@ -23,7 +28,8 @@ class WhisperSTT:
         model_path: str = "models/ggml-base.en.bin",
         whisper_bin: str = "whisper-cpp/main",
         language: str = "en",
-        num_threads: int = 4
+        num_threads: int = 4,
+        vocabulary=None
     ):
         """
         Initialize Whisper STT.
@@ -33,11 +39,13 @@ class WhisperSTT:
             whisper_bin: Path to whisper.cpp binary
             language: Language code
             num_threads: Number of CPU threads
+            vocabulary: CommandVocabulary passed as --prompt (optional)
         """
         self.model_path = Path(model_path)
         self.whisper_bin = Path(whisper_bin)
         self.language = language
         self.num_threads = num_threads
+        self.vocabulary = vocabulary
         
         # Verify paths exist
         if not self.model_path.exists():
@@ -50,17 +58,36 @@ class WhisperSTT:
             f"lang={language}, threads={num_threads}"
         )
 
-    def transcribe(self, audio_data, sample_rate: int = 16000) -> str:
+    def transcribe(
+        self,
+        audio_data,
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        num_threads: Optional[int] = None
+    ) -> str:
         """
         Transcribe audio data to text.
         
         Args:
             audio_data: Audio samples (numpy array)
             sample_rate: Sample rate of audio
+            language: Language code (default: instance language)
+            num_threads: CPU threads for this run (default: instance setting)
             
         Returns:
             Transcribed text
         """
+        return self._transcribe_wav(audio_data, sample_rate, language, num_threads)
+
+    def _transcribe_wav(
+        self,
+        audio_data,
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        num_threads: Optional[int] = None,
+        check: bool = False
+    ) -> str:
+        """Write audio to a temporary WAV file and run whisper.cpp on it."""
         # Create temporary WAV file
         with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
             tmp_path = tmp_file.name
@@ -70,19 +97,97 @@ class WhisperSTT:
             sf.write(tmp_path, audio_data, sample_rate)
             
             # Run whisper.cpp
-            result = self._run_whisper(tmp_path)
+            result = self._run_whisper(tmp_path, language, num_threads, check=check)
             return result
         finally:
             # Clean up
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
 
-    def _run_whisper(self, audio_file: str) -> str:
+    def warmup(self, duration_s: float = 1.0) -> bool:
+        """
+        Run a short silent inference to pull the model into the page cache.
+        
+        Args:
+            duration_s: Length of the silent clip
+            
+        Returns:
+            True if whisper.cpp ran successfully
+        """
+        try:
+            self._transcribe_wav(
+                np.zeros(int(16000 * duration_s), dtype=np.float32), 16000, check=True
+            )
+        except Exception as e:
+            logger.warning(f"whisper.cpp warm-up failed: {e}")
+            return False
+        return True
+
+    def transcribe_batch(
+        self,
+        audio_list: list,
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        max_workers: Optional[int] = None
+    ) -> list:
+        """
+        Transcribe many clips with parallel whisper.cpp processes.
+        
+        Args:
+            audio_list: Audio clips (numpy arrays)
+            sample_rate: Sample rate of audio
+            language: Language code (default: instance language)
+            max_workers: Parallel whisper.cpp processes
+                (default: CPU cores / threads per process)
+            
+        Returns:
+            List of BatchTranscription in input order
+        """
+        from .stt_backend import BatchTranscription
+        
+        cpu_count = os.cpu_count() or 1
+        if max_workers is None:
+            max_workers = max(1, cpu_count // self.num_threads)
+        max_workers = max(1, min(max_workers, len(audio_list) or 1))
+        
+        # Share the cores between workers instead of oversubscribing
+        threads_per_job = max(1, min(self.num_threads, cpu_count // max_workers))
+        
+        def run_job(index: int) -> BatchTranscription:
+            audio_data = audio_list[index]
+            start_time = time.perf_counter()
+            text = self.transcribe(audio_data, sample_rate, language, threads_per_job)
+            return BatchTranscription(
+                index=index,
+                text=text,
+                duration_s=len(audio_data) / sample_rate,
+                elapsed_ms=(time.perf_counter() - start_time) * 1000,
+            )
+        
+        logger.info(
+            f"Transcribing {len(audio_list)} clips with {max_workers} "
+            f"whisper.cpp workers ({threads_per_job} threads each)"
+        )
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map() yields in input order
+            return list(executor.map(run_job, range(len(audio_list))))
+
+    def _run_whisper(
+        self,
+        audio_file: str,
+        language: Optional[str] = None,
+        num_threads: Optional[int] = None,
+        check: bool = False
+    ) -> str:
         """
         Run whisper.cpp binary on audio file.
         
         Args:
             audio_file: Path to audio file
+            language: Language code (default: instance language)
+            num_threads: CPU threads (default: instance setting)
+            check: Raise on failure instead of returning ""
             
         Returns:
             Transcribed text
@@ -92,12 +197,18 @@ class WhisperSTT:
                 str(self.whisper_bin),
                 "-m", str(self.model_path),
                 "-f", audio_file,
-                "-l", self.language,
-                "-t", str(self.num_threads),
+                "-l", language or self.language,
+                "-t", str(num_threads or self.num_threads),
                 "--no-timestamps",
                 "--output-txt"
             ]
             
+            # Bias decoding towards known commands
+            if self.vocabulary is not None:
+                prompt = self.vocabulary.get_prompt()
+                if prompt:
+                    cmd += ["--prompt", prompt]
+            
             result = subprocess.run(
                 cmd,
                 capture_output=True,
@@ -105,19 +216,23 @@ class WhisperSTT:
                 timeout=30
             )
             
-            if result.returncode != 0:
-                logger.error(f"Whisper error: {result.stderr}")
-                return ""
+            if result.returncode == 0:
+                # Parse output
+                output = result.stdout.strip()
+                return self._parse_output(output)
             
-            # Parse output
-            output = result.stdout.strip()
-            return self._parse_output(output)
-        except subprocess.TimeoutExpired:
+            logger.error(f"Whisper error: {result.stderr}")
+            error = RuntimeError(f"whisper.cpp exited with code {result.returncode}")
+        except subprocess.TimeoutExpired as e:
             logger.error("Whisper transcription timed out")
-            return ""
+            error = e
         except Exception as e:
             logger.error(f"Error running whisper: {e}")
-            return ""
+            error = e
+        
+        if check:
+            raise error
+        return ""
 
     def _parse_output(self, output: str) -> str:
         """
@@ -137,6 +252,47 @@ class WhisperSTT:
         ]
         return ' '.join(text_lines)
 
+    def transcribe_stream(self, audio_chunk, sample_rate: int = 16000) -> Optional[str]:
+        """
+        Transcribe a single audio chunk (streaming mode).
+        
+        Args:
+            audio_chunk: Audio chunk (numpy array)
+            sample_rate: Sample rate of audio
+            
+        Returns:
+            Transcribed text or None if empty
+        """
+        return self.transcribe(audio_chunk, sample_rate) or None
+
+    def set_vocabulary(self, vocabulary, bias_mode: Optional[str] = None):
+        """
+        Set (or clear) the command vocabulary used to bias decoding.
+        
+        Args:
+            vocabulary: CommandVocabulary instance (or None to disable)
+            bias_mode: Ignored - whisper.cpp only supports a prompt
+        """
+        self.vocabulary = vocabulary
+        if vocabulary is not None:
+            vocabulary.get_prompt()  # Build now, not on the first decode
+        logger.info(f"STT biasing {'enabled' if vocabulary else 'disabled'} (mode: prompt)")
+
+    def get_backend_info(self) -> dict:
+        """Get backend information."""
+        return {
+            "backend": "whisper_cpp",
+            "model_path": str(self.model_path),
+            "language": self.language,
+            "num_threads": self.num_threads,
+            "biasing": "prompt" if self.vocabulary else None,
+            "available": self.is_available(),
+        }
+
+    def is_available(self) -> bool:
+        """Check if whisper.cpp binary and model are present."""
+        return self.whisper_bin.exists() and self.model_path.exists()
+
     @staticmethod
     def download_model(model_name: str = "base.en", models_dir: str = "models") -> bool:
         """
@@ -195,16 +351,28 @@ class StreamingWhisperSTT:
             sample_rate: Sample rate
             
         Returns:
-            List of transcriptions
+            List of transcriptions (overlapping words removed, so they
+            can be joined with spaces)
         """
         chunk_size = int(self.chunk_duration * sample_rate)
-        step_size = int(chunk_size * (1 - self.overlap))
+        step_size = max(1, int(chunk_size * (1 - self.overlap)))
+        
+        if len(audio_buffer) == 0:
+            return []
+        
+        # Window starts, plus one more for any tail the last full window misses
+        starts = list(range(0, max(len(audio_buffer) - chunk_size, 0) + 1, step_size))
+        if starts[-1] + chunk_size < len(audio_buffer):
+            starts.append(starts[-1] + step_size)
         
         transcripts = []
         
-        for i in range(0, len(audio_buffer) - chunk_size, step_size):
+        for i in starts:
             chunk = audio_buffer[i:i + chunk_size]
             transcript = self.whisper.transcribe(chunk, sample_rate)
+            if transcript and transcripts:
+                # Windows overlap - drop words already in the previous transcript
+                transcript = trim_text_overlap(" ".join(transcripts), transcript)
             if transcript:
                 transcripts.append(transcript)
         
@@ -7,7 +7,7 @@ Streams partial transcription results from STT backends and updates UI in real-t
 import sys
 from pathlib import Path
 from typing import Optional, Callable, List, Dict, Any
-from threading import Thread, Event
+from threading import Event
 import numpy as np
 from loguru import logger
 from dataclasses import dataclass
@@ -16,6 +16,7 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from core.audio.stt_faster_whisper import FasterWhisperSTT
+from core.audio.stt_scheduler import LatestWinsScheduler
 
 
 @dataclass
@@ -27,6 +28,7 @@ class PartialResult:
     timestamp: float
     confidence: float = 0.0
     language: Optional[str] = None
+    audio_ms: float = 0.0  # Length of audio the text was decoded from
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -36,6 +38,7 @@ class PartialResult:
             "timestamp": self.timestamp,
             "confidence": self.confidence,
             "language": self.language,
+            "audio_ms": self.audio_ms,
         }
 
 
@@ -48,6 +51,7 @@ class PartialResultStreamer:
     - Final result commitment
     - UI update callbacks
     - Cancellation support
+    - Latest-wins scheduling (newest audio is always decoded next)
     """
     
     def __init__(
@@ -55,6 +59,8 @@ class PartialResultStreamer:
         stt_backend,
         chunk_duration_ms: int = 500,
         min_chunk_duration_ms: int = 250,
+        partial_interval_ms: int = 300,
+        max_lag_ms: Optional[int] = None,
     ):
         """
         Initialize partial result streamer.
@@ -63,6 +69,9 @@ class PartialResultStreamer:
             stt_backend: STT backend instance (must support streaming)
             chunk_duration_ms: Duration of audio chunks to process (ms)
             min_chunk_duration_ms: Minimum chunk duration before processing (ms)
+            partial_interval_ms: Target cadence between partial decodes (ms)
+            max_lag_ms: Cancel an in-flight partial once newer audio is this
+                far ahead of it (None = let in-flight decodes finish)
         """
         self.stt_backend = stt_backend
         self.chunk_duration_ms = chunk_duration_ms
@@ -76,8 +85,13 @@ class PartialResultStreamer:
         self.final_results: List[PartialResult] = []
         
         # Threading
-        self.processing_thread: Optional[Thread] = None
         self.stop_event = Event()
+        self.scheduler = LatestWinsScheduler(
+            decode_fn=self._transcribe_chunk,
+            partial_interval_ms=partial_interval_ms,
+            max_lag_ms=max_lag_ms,
+            sample_rate=self.sample_rate,
+        )
         
         # Callbacks
         self.on_partial_result: Optional[Callable[[PartialResult], None]] = None
@@ -133,6 +147,7 @@ class PartialResultStreamer:
         self.current_result = None
         self.final_results.clear()
         self.stop_event.clear()
+        self.scheduler.start()
     
     def stop_streaming(self, finalize: bool = True) -> Optional[PartialResult]:
         """
@@ -151,45 +166,54 @@ class PartialResultStreamer:
         self.is_streaming = False
         self.stop_event.set()
         
+        # Partials are moot once the final decode runs
+        self.scheduler.cancel()
+        self.scheduler.stop()
+        
         final_result = None
         
         if finalize and self.audio_buffer:
             # Process remaining audio
             final_result = self._process_final()
         
-        # Wait for processing thread
-        if self.processing_thread and self.processing_thread.is_alive():
-            self.processing_thread.join(timeout=2.0)
-        
         return final_result
     
     def cancel(self):
-        """Cancel streaming immediately."""
+        """
+        Cancel streaming immediately.
+        
+        Does not wait for a partial decode in flight (safe to call from
+        the audio callback); its result is discarded when it finishes.
+        """
         logger.info("Canceling partial result streaming")
         self.is_streaming = False
         self.stop_event.set()
+        self.scheduler.cancel()
+        self.scheduler.stop(wait=False)
         self.audio_buffer.clear()
         self.current_result = None
     
     def _process_buffer(self):
-        """Process audio buffer and generate partial result."""
+        """Submit newest buffer snapshot for a partial decode."""
         if not self.audio_buffer or self.stop_event.is_set():
             return
         
-        # Combine chunks
+        # Combine chunks (replaces any snapshot still waiting for the worker)
         audio_data = np.concatenate(self.audio_buffer)
-        
-        # Spawn processing thread if not running
-        if self.processing_thread is None or not self.processing_thread.is_alive():
-            self.processing_thread = Thread(
-                target=self._transcribe_chunk,
-                args=(audio_data.copy(),),
-                daemon=True,
-            )
-            self.processing_thread.start()
+        self.scheduler.submit(audio_data)
     
-    def _transcribe_chunk(self, audio_data: np.ndarray):
-        """Transcribe audio chunk in background thread."""
+    def _transcribe_chunk(
+        self,
+        audio_data: np.ndarray,
+        should_cancel: Optional[Callable[[], bool]] = None,
+    ):
+        """
+        Transcribe audio chunk in the scheduler's worker thread.
+        
+        Args:
+            audio_data: Buffer snapshot to decode
+            should_cancel: Returns True once this decode is stale
+        """
         try:
             # Transcribe using backend
             text = self.stt_backend.transcribe(
@@ -197,7 +221,7 @@ class PartialResultStreamer:
                 sample_rate=self.sample_rate,
             )
             
-            if self.stop_event.is_set():
+            if self.stop_event.is_set() or (should_cancel and should_cancel()):
                 return
             
             if text and text.strip():
@@ -207,6 +231,7 @@ class PartialResultStreamer:
                     is_final=False,
                     timestamp=datetime.now().timestamp(),
                     confidence=0.0,  # STT backends may not provide confidence
+                    audio_ms=len(audio_data) * 1000 / self.sample_rate,
                 )
                 
                 self.current_result = result
@@ -247,6 +272,7 @@ class PartialResultStreamer:
                     is_final=True,
                     timestamp=datetime.now().timestamp(),
                     confidence=0.0,
+                    audio_ms=len(audio_data) * 1000 / self.sample_rate,
                 )
                 
                 self.final_results.append(result)
@@ -284,6 +310,8 @@ class FasterWhisperPartialStreamer(PartialResultStreamer):
         device: str = "auto",
         compute_type: str = "int8",
         chunk_duration_ms: int = 500,
+        partial_interval_ms: int = 300,
+        max_lag_ms: Optional[int] = None,
     ):
         """
         Initialize faster-whisper partial streamer.
@@ -293,6 +321,8 @@ class FasterWhisperPartialStreamer(PartialResultStreamer):
             device: Device (cpu/cuda/auto)
             compute_type: Compute type
             chunk_duration_ms: Chunk duration
+            partial_interval_ms: Target cadence between partial decodes (ms)
+            max_lag_ms: Cancel in-flight partials lagging this far behind
         """
         stt = FasterWhisperSTT(
             model_size=model_size,
@@ -303,10 +333,21 @@ class FasterWhisperPartialStreamer(PartialResultStreamer):
         super().__init__(
             stt_backend=stt,
             chunk_duration_ms=chunk_duration_ms,
+            partial_interval_ms=partial_interval_ms,
+            max_lag_ms=max_lag_ms,
         )
     
-    def _transcribe_chunk(self, audio_data: np.ndarray):
+    def _transcribe_chunk(
+        self,
+        audio_data: np.ndarray,
+        should_cancel: Optional[Callable[[], bool]] = None,
+    ):
         """Transcribe using faster-whisper with segment iteration."""
+        def cancelled() -> bool:
+            return self.stop_event.is_set() or (
+                should_cancel is not None and should_cancel()
+            )
+        
         try:
             # Use faster-whisper's segment iteration for partial results
             segments, info = self.stt_backend.model.transcribe(
@@ -316,15 +357,16 @@ class FasterWhisperPartialStreamer(PartialResultStreamer):
                 best_of=self.stt_backend.best_of,
             )
             
-            if self.stop_event.is_set():
+            if cancelled():
                 return
             
             partial_text = ""
             
             # Collect segments as they come
             for segment in segments:
-                if self.stop_event.is_set():
-                    break
+                # Abandon stale decodes between segments
+                if cancelled():
+                    return
                 
                 partial_text += segment.text
                 
@@ -334,6 +376,7 @@ class FasterWhisperPartialStreamer(PartialResultStreamer):
                     is_final=False,
                     timestamp=datetime.now().timestamp(),
                     confidence=getattr(segment, 'avg_logprob', 0.0),
+                    audio_ms=getattr(segment, 'end', 0.0) * 1000,
                 )
                 
                 self.current_result = result
@@ -346,13 +389,14 @@ class FasterWhisperPartialStreamer(PartialResultStreamer):
                         logger.error(f"Error in on_partial_result callback: {e}")
             
             # Finalize if we got complete text
-            if partial_text.strip() and not self.stop_event.is_set():
+            if partial_text.strip() and not cancelled():
                 final_result = PartialResult(
                     text=partial_text.strip(),
                     is_final=True,
                     timestamp=datetime.now().timestamp(),
                     confidence=getattr(info, 'language_probability', 0.0),
                     language=info.language if hasattr(info, 'language') else None,
+                    audio_ms=len(audio_data) * 1000 / self.sample_rate,
                 )
                 
                 self.final_results.append(final_result)
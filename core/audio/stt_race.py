@@ -0,0 +1,261 @@
+"""
+Deadline-Based STT Backend Racing
+
+Runs a fast and an accurate STT backend concurrently and returns the
+accurate transcript only when it arrives within a deadline.
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from pathlib import Path
+from threading import Event
+from typing import Optional, Dict, Any
+import numpy as np
+from loguru import logger
+
+from .stt_backend import STTBackend
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.metrics import get_metrics_collector
+
+
+class RacingSTTBackend(STTBackend):
+    """
+    Races a fast backend against an accurate one.
+
+    Policy:
+    - Accurate result arrives before the deadline -> accurate wins
+      (unless both transcripts agree, in which case fast is credited)
+    - Accurate misses the deadline, fails or is empty -> fast result
+    - Losers are cancelled where the backend supports it
+    """
+
+    def __init__(
+        self,
+        fast: STTBackend,
+        accurate: STTBackend,
+        deadline_ms: float = 1200.0,
+        fast_name: str = "fast",
+        accurate_name: str = "accurate",
+    ):
+        """
+        Initialize racing backend.
+
+        Args:
+            fast: Low-latency backend (e.g. faster-whisper tiny)
+            accurate: Slower, more accurate backend (e.g. base or whisper.cpp)
+            deadline_ms: How long to wait for the accurate backend,
+                measured from the start of the request
+            fast_name: Label used in metrics
+            accurate_name: Label used in metrics
+        """
+        self.fast = fast
+        self.accurate = accurate
+        self.deadline_ms = deadline_ms
+        self.fast_name = fast_name
+        self.accurate_name = accurate_name
+        self.metrics = get_metrics_collector()
+
+        # One lane per contestant, so an abandoned accurate decode that
+        # can't be interrupted never delays the next fast decode
+        self.fast_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt-race-fast")
+        self.accurate_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt-race-accurate")
+
+        logger.info(
+            f"RacingSTTBackend: {fast_name} vs {accurate_name} "
+            f"(deadline: {deadline_ms:.0f}ms)"
+        )
+
+    def _submit(
+        self,
+        executor: ThreadPoolExecutor,
+        backend: STTBackend,
+        name: str,
+        cancel_event: Event,
+        audio_data: np.ndarray,
+        sample_rate: int,
+        language: Optional[str],
+    ) -> Future:
+        """Start one contestant, timing it and passing cancellation if supported."""
+        def run() -> str:
+            start_time = time.perf_counter()
+            if getattr(backend, "supports_cancellation", False):
+                text = backend.transcribe(
+                    audio_data, sample_rate, language,
+                    should_cancel=cancel_event.is_set,
+                )
+            else:
+                text = backend.transcribe(audio_data, sample_rate, language)
+
+            if not cancel_event.is_set():
+                self.metrics.record_value(
+                    f"stt.race.{name}.latency_ms",
+                    (time.perf_counter() - start_time) * 1000
+                )
+            return text or ""
+
+        return executor.submit(run)
+
+    @staticmethod
+    def _result(future: Future) -> str:
+        """Get a finished contestant's text ("" on failure)."""
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"STT race contestant failed: {e}")
+            return ""
+
+    @staticmethod
+    def _agree(a: str, b: str) -> bool:
+        """Compare transcripts ignoring case and punctuation."""
+        def norm(text: str) -> str:
+            return " ".join(
+                "".join(c for c in text.lower() if c.isalnum() or c.isspace()).split()
+            )
+        return norm(a) == norm(b)
+
+    def _cancel(self, future: Future, cancel_event: Event):
+        """Abandon a contestant (queued jobs are dropped, running ones signalled)."""
+        cancel_event.set()
+        future.cancel()
+
+    def transcribe(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+    ) -> str:
+        """
+        Transcribe with both backends and pick a result by deadline.
+
+        Args:
+            audio_data: Audio samples as numpy array
+            sample_rate: Sample rate in Hz
+            language: Language code
+
+        Returns:
+            Transcribed text
+        """
+        start_time = time.perf_counter()
+        deadline = start_time + self.deadline_ms / 1000
+        self.metrics.increment("stt.race.races")
+
+        fast_cancel = Event()
+        accurate_cancel = Event()
+        fast_future = self._submit(
+            self.fast_executor, self.fast, self.fast_name,
+            fast_cancel, audio_data, sample_rate, language
+        )
+        accurate_future = self._submit(
+            self.accurate_executor, self.accurate, self.accurate_name,
+            accurate_cancel, audio_data, sample_rate, language
+        )
+
+        # Wait for the accurate backend until the deadline, or until both are done
+        pending = {fast_future, accurate_future}
+        while not accurate_future.done():
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            _, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+
+        if accurate_future.done():
+            accurate_text = self._result(accurate_future)
+
+            if accurate_text:
+                self.metrics.increment(f"stt.race.{self.accurate_name}.deadline_hits")
+
+                if fast_future.done() and self._agree(self._result(fast_future), accurate_text):
+                    # Both agree - the fast backend would have been enough
+                    return self._finish(self.fast_name, self._result(fast_future), start_time)
+
+                self._cancel(fast_future, fast_cancel)
+                return self._finish(self.accurate_name, accurate_text, start_time)
+
+            self.metrics.increment(f"stt.race.{self.accurate_name}.failures")
+        else:
+            self.metrics.increment(f"stt.race.{self.accurate_name}.deadline_misses")
+            self._cancel(accurate_future, accurate_cancel)
+
+        # Fall back to the fast backend (wait for it if it's still running)
+        fast_text = self._result(fast_future)
+        if not fast_text:
+            self.metrics.increment(f"stt.race.{self.fast_name}.failures")
+        return self._finish(self.fast_name, fast_text, start_time)
+
+    def _finish(self, winner: str, text: str, start_time: float) -> str:
+        """Record the winner and overall latency."""
+        self.metrics.increment(f"stt.race.{winner}.wins")
+        self.metrics.record_value(
+            "stt.race.latency_ms", (time.perf_counter() - start_time) * 1000
+        )
+        logger.debug(f"STT race won by {winner}: '{text[:50]}'")
+        return text
+
+    def transcribe_stream(
+        self,
+        audio_chunk: np.ndarray,
+        sample_rate: int = 16000,
+    ) -> Optional[str]:
+        """Streaming uses the fast backend only (partials need low latency)."""
+        return self.fast.transcribe_stream(audio_chunk, sample_rate)
+
+    def set_vocabulary(self, vocabulary, bias_mode: Optional[str] = None):
+        """
+        Pass the command vocabulary to both contestants where supported.
+        
+        Args:
+            vocabulary: CommandVocabulary instance (or None to disable)
+            bias_mode: Biasing mode for backends that support several
+        """
+        for backend in (self.fast, self.accurate):
+            if hasattr(backend, "set_vocabulary"):
+                backend.set_vocabulary(vocabulary, bias_mode)
+
+    def get_race_stats(self) -> Dict[str, Any]:
+        """
+        Get win rates and deadline statistics per backend.
+
+        Returns:
+            Dictionary with statistics
+        """
+        races = self.metrics.get_counter("stt.race.races")
+        stats: Dict[str, Any] = {"races": races, "deadline_ms": self.deadline_ms}
+
+        for name in (self.fast_name, self.accurate_name):
+            wins = self.metrics.get_counter(f"stt.race.{name}.wins")
+            stats[name] = {
+                "wins": wins,
+                "win_rate": wins / races if races else 0.0,
+                "failures": self.metrics.get_counter(f"stt.race.{name}.failures"),
+                "latency_ms": self.metrics.get_value_stats(f"stt.race.{name}.latency_ms"),
+            }
+
+        stats[self.accurate_name]["deadline_hits"] = self.metrics.get_counter(
+            f"stt.race.{self.accurate_name}.deadline_hits"
+        )
+        stats[self.accurate_name]["deadline_misses"] = self.metrics.get_counter(
+            f"stt.race.{self.accurate_name}.deadline_misses"
+        )
+        return stats
+
+    def get_backend_info(self) -> dict:
+        """Get backend information."""
+        return {
+            "backend": "race",
+            "fast": self.fast_name,
+            "accurate": self.accurate_name,
+            "deadline_ms": self.deadline_ms,
+            "available": self.is_available(),
+        }
+
+    def is_available(self) -> bool:
+        """Available if the fast backend is (accurate is optional)."""
+        return self.fast.is_available()
+
+    def shutdown(self):
+        """Stop the worker pool without waiting for abandoned decodes."""
+        self.fast_executor.shutdown(wait=False, cancel_futures=True)
+        self.accurate_executor.shutdown(wait=False, cancel_futures=True)
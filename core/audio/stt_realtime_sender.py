@@ -0,0 +1,461 @@
+"""
+Streaming Audio Sender for the Realtime STT API
+
+Converts pipeline audio (16 kHz float32) to the API's 24 kHz PCM16 in
+reusable buffers, coalesces it into ~100 ms append messages and sends
+them from a background asyncio loop with reconnect-and-resume.
+"""
+
+import sys
+import json
+import time
+import base64
+import asyncio
+from collections import deque
+from pathlib import Path
+from threading import Thread, Event, Lock
+from typing import Optional, Callable, Deque, Dict, Any, List, Tuple
+import numpy as np
+import websockets
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.metrics import get_metrics_collector
+
+
+TRANSCRIPT_EVENT = "conversation.item.input_audio_transcription.completed"
+
+
+class PCM16Resampler:
+    """
+    Streaming linear-interpolation resampler to PCM16.
+
+    Keeps the last input sample and the fractional read position
+    between chunks, so chunk boundaries are seamless, and writes into
+    buffers that are only reallocated when a larger chunk arrives.
+    """
+
+    def __init__(self, input_rate: int = 16000, output_rate: int = 24000):
+        """
+        Initialize resampler.
+
+        Args:
+            input_rate: Sample rate of incoming audio
+            output_rate: Sample rate of the PCM16 output
+        """
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+        self.step = input_rate / output_rate
+        self._work = np.zeros(0, dtype=np.float32)      # [last sample, chunk...]
+        self._positions = np.zeros(0, dtype=np.float64)
+        self._out = np.zeros(0, dtype=np.float32)
+        self._pcm = np.zeros(0, dtype=np.int16)
+        self.reset()
+
+    def reset(self):
+        """Forget the previous chunk (start of a new stream)."""
+        self._last = 0.0
+        self._phase = 1.0  # Position in the work buffer of the next output sample
+
+    def _reserve(self, n: int, count: int):
+        """Grow the work buffers for n input and count output samples."""
+        if len(self._work) < n + 1:
+            self._work = np.zeros(n + 1, dtype=np.float32)
+        if len(self._out) < count:
+            self._positions = np.arange(count, dtype=np.float64)
+            self._out = np.zeros(count, dtype=np.float32)
+            self._pcm = np.zeros(count, dtype=np.int16)
+
+    def process(self, audio: np.ndarray) -> memoryview:
+        """
+        Resample one chunk.
+
+        Args:
+            audio: Float samples in [-1, 1] at input_rate
+
+        Returns:
+            PCM16 little-endian bytes (a view into an internal buffer,
+            valid until the next call)
+        """
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        n = len(audio)
+        count = int((n - self._phase) / self.step) + 1 if self._phase <= n else 0
+        self._reserve(n, count)
+        if count == 0:
+            self._phase -= n
+            if n:
+                self._last = float(audio[-1])
+            return memoryview(b"")
+
+        # Work buffer holds the previous chunk's last sample at index 0
+        work = self._work[:n + 1]
+        work[0] = self._last
+        work[1:] = audio
+
+        positions = self._positions[:count] * self.step + self._phase
+        index = positions.astype(np.int64)
+        frac = (positions - index).astype(np.float32)
+        upper = np.minimum(index + 1, n)
+
+        out = self._out[:count]
+        np.subtract(work[upper], work[index], out=out)
+        out *= frac
+        out += work[index]
+
+        self._phase += count * self.step - n
+        self._last = float(work[n])
+
+        np.clip(out, -1.0, 1.0, out=out)
+        out *= 32767.0
+        pcm = self._pcm[:count]
+        np.copyto(pcm, out, casting="unsafe")
+        if sys.byteorder != "little":
+            pcm.byteswap(inplace=True)
+        return memoryview(pcm).cast("B")
+
+
+class RealtimeAudioSender:
+    """
+    Background streaming client for the Realtime API's audio input.
+
+    Features:
+    - In-process 16 kHz float32 -> 24 kHz PCM16 conversion
+    - Frames coalesced into ~100 ms input_audio_buffer.append messages
+    - Runs its own asyncio loop on a background thread; push() never
+      blocks the audio callback
+    - Reconnects with backoff and resumes: the session is reconfigured
+      and the uncommitted part of the utterance is replayed
+    - Bounded outbox (oldest audio dropped when offline too long)
+    - Send latency, frame and reconnect metrics
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str = "",
+        model: Optional[str] = None,
+        input_rate: int = 16000,
+        output_rate: int = 24000,
+        frame_ms: int = 100,
+        max_buffer_s: float = 30.0,
+        session: Optional[Dict[str, Any]] = None,
+        on_message: Optional[Callable[[Dict[str, Any]], None]] = None,
+        reconnect_delays: Tuple[float, ...] = (0.1, 0.5, 1.0, 2.0, 5.0),
+        metrics_prefix: str = "stt.cloud",
+    ):
+        """
+        Initialize sender.
+
+        Args:
+            url: WebSocket URL (e.g. wss://api.openai.com/v1/realtime)
+            api_key: API key sent as a bearer token (empty for local servers)
+            model: Model query parameter (None to leave the URL as is)
+            input_rate: Sample rate of pushed audio
+            output_rate: Sample rate expected by the service
+            frame_ms: Audio per append message
+            max_buffer_s: Audio kept for replay/while disconnected
+            session: session.update payload sent on every (re)connect
+            on_message: Called on the loop thread with each server event
+            reconnect_delays: Backoff schedule (the last delay repeats)
+            metrics_prefix: Prefix for reported metric names
+        """
+        self.url = f"{url}?model={model}" if model else url
+        self.headers = {"Authorization": f"Bearer {api_key}", "OpenAI-Beta": "realtime=v1"} if api_key else {}
+        self.session = session
+        self.on_message = on_message
+        self.reconnect_delays = reconnect_delays
+        self.metrics_prefix = metrics_prefix
+        self.metrics = get_metrics_collector()
+
+        # Conversion state (caller thread, guarded by _convert_lock)
+        self._convert_lock = Lock()
+        self.resampler = PCM16Resampler(input_rate, output_rate)
+        self.frame_bytes = int(output_rate * frame_ms / 1000) * 2
+        self._frame = bytearray(self.frame_bytes)
+        self._frame_fill = 0
+        self.max_frames = max(1, int(max_buffer_s * 1000 / frame_ms))
+
+        # Loop-side state
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[Thread] = None
+        self._ready = Event()
+        self._running = False
+        self._outbox: Deque[Tuple[str, str, float]] = deque()  # (kind, message, enqueued at)
+        self._uncommitted: List[str] = []  # Audio sent since the last commit
+        self._wakeup: Optional[asyncio.Event] = None
+        self._ws = None
+        self._was_connected = False
+        self.connected = Event()
+
+        # Transcript waiting (see transcribe())
+        self._transcribe_lock = Lock()
+        self._transcripts: Deque[str] = deque()
+        self._transcript_ready = Event()
+
+        # Statistics
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.frames_dropped = 0
+        self.reconnects = 0
+
+    def start(self, timeout: float = 5.0) -> bool:
+        """
+        Start the background loop and connect.
+
+        Args:
+            timeout: Time to wait for the first connection
+
+        Returns:
+            True if connected within the timeout (sending starts
+            regardless, audio is buffered until the connection is up)
+        """
+        if self._running:
+            return self.connected.is_set()
+
+        self._running = True
+        self._ready.clear()
+        self._thread = Thread(target=self._run_loop, name="stt-cloud-sender", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self.connected.wait(timeout)
+
+    def stop(self, timeout: float = 2.0):
+        """
+        Send what is queued, close the connection and stop the loop.
+
+        Args:
+            timeout: Time to wait for the outbox to drain
+        """
+        if not self._running:
+            return
+
+        deadline = time.perf_counter() + timeout
+        while self._outbox and self.connected.is_set() and time.perf_counter() < deadline:
+            time.sleep(0.01)
+
+        self._running = False
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run_loop(self):
+        """Background thread: run the connection loop."""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._wakeup = asyncio.Event()
+        self._ready.set()
+        try:
+            self._loop.run_until_complete(self._connection_loop())
+        finally:
+            self._loop.close()
+
+    async def _open(self):
+        """Open a WebSocket connection (current and legacy websockets APIs)."""
+        if not self.headers:
+            return await websockets.connect(self.url, max_size=None)
+        try:
+            return await websockets.connect(self.url, additional_headers=self.headers, max_size=None)
+        except TypeError:
+            return await websockets.connect(self.url, extra_headers=self.headers, max_size=None)
+
+    async def _connection_loop(self):
+        """Connect, resume, send and receive until stopped."""
+        attempt = 0
+        while self._running:
+            try:
+                self._ws = await self._open()
+            except Exception as e:
+                delay = self.reconnect_delays[min(attempt, len(self.reconnect_delays) - 1)]
+                attempt += 1
+                logger.warning(f"Realtime connection failed ({e}), retrying in {delay}s")
+                await self._sleep(delay)
+                continue
+
+            if self._was_connected:
+                self.reconnects += 1
+                self.metrics.increment(f"{self.metrics_prefix}.reconnects")
+            attempt = 0
+            self._was_connected = True
+
+            try:
+                await self._resume()
+                self.connected.set()
+                logger.info(f"Realtime audio connection open ({len(self._uncommitted)} frames replayed)")
+                receiver = asyncio.ensure_future(self._receive())
+                try:
+                    await self._send_loop(receiver)
+                finally:
+                    receiver.cancel()
+            except websockets.exceptions.ConnectionClosed as e:
+                logger.warning(f"Realtime connection closed: {e}")
+            except Exception as e:
+                logger.error(f"Realtime sender error: {e}")
+            finally:
+                self.connected.clear()
+                await self._ws.close()
+                self._ws = None
+
+    async def _sleep(self, delay: float):
+        """Sleep, waking early on stop()."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _resume(self):
+        """Reconfigure the session and replay uncommitted audio."""
+        if self.session:
+            await self._ws.send(json.dumps({"type": "session.update", "session": self.session}))
+        for message in self._uncommitted:
+            await self._ws.send(message)
+
+    async def _send_loop(self, receiver: asyncio.Future):
+        """Send queued messages until stopped or disconnected."""
+        while self._running:
+            while self._outbox:
+                kind, message, enqueued_at = self._outbox[0]
+                await self._ws.send(message)
+                self._outbox.popleft()  # Only once sent; a failed send is retried after resume
+                self._sent(kind, message, enqueued_at)
+
+            if receiver.done():
+                receiver.result()  # Raises ConnectionClosed
+                return
+
+            self._wakeup.clear()
+            waiter = asyncio.ensure_future(self._wakeup.wait())
+            await asyncio.wait({waiter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            waiter.cancel()
+
+    def _sent(self, kind: str, message: str, enqueued_at: float):
+        """Book-keeping after a message was sent."""
+        if kind == "append":
+            self._uncommitted.append(message)
+            if len(self._uncommitted) > self.max_frames:
+                del self._uncommitted[0]
+            self.frames_sent += 1
+            self.bytes_sent += len(message)
+            self.metrics.record_value(
+                f"{self.metrics_prefix}.send_latency_ms",
+                (time.perf_counter() - enqueued_at) * 1000
+            )
+        elif kind == "commit":
+            self._uncommitted.clear()
+
+    async def _receive(self):
+        """Dispatch server events."""
+        async for raw in self._ws:
+            try:
+                message = json.loads(raw)
+            except ValueError:
+                continue
+
+            if message.get("type") == TRANSCRIPT_EVENT:
+                self._transcripts.append(message.get("transcript", ""))
+                self._transcript_ready.set()
+            elif message.get("type") == "error":
+                logger.error(f"Realtime API error: {message.get('error')}")
+
+            if self.on_message:
+                try:
+                    self.on_message(message)
+                except Exception as e:
+                    logger.error(f"Error in realtime message callback: {e}")
+
+    def _enqueue(self, kind: str, message: str):
+        """Queue a message (loop thread)."""
+        self._outbox.append((kind, message, time.perf_counter()))
+        if len(self._outbox) > self.max_frames and self._outbox[0][0] == "append":
+            self._outbox.popleft()
+            self.frames_dropped += 1
+            self.metrics.increment(f"{self.metrics_prefix}.frames_dropped")
+        self._wakeup.set()
+
+    def _post(self, kind: str, message: str):
+        """Hand a message to the loop thread."""
+        if not self._running:
+            raise RuntimeError("Realtime sender not started")
+        self._loop.call_soon_threadsafe(self._enqueue, kind, message)
+
+    def _post_audio(self, pcm: bytes):
+        """Queue an input_audio_buffer.append message."""
+        audio_b64 = base64.b64encode(pcm).decode("ascii")
+        self._post("append", '{"type": "input_audio_buffer.append", "audio": "%s"}' % audio_b64)
+
+    def push(self, audio: np.ndarray):
+        """
+        Queue audio for sending.
+
+        Safe to call from the audio callback: converts in place and hands
+        complete frames to the loop thread without waiting for the network.
+
+        Args:
+            audio: Float32 samples at input_rate
+        """
+        with self._convert_lock:
+            pcm = self.resampler.process(audio)
+            offset = 0
+            while offset < len(pcm):
+                take = min(self.frame_bytes - self._frame_fill, len(pcm) - offset)
+                self._frame[self._frame_fill:self._frame_fill + take] = pcm[offset:offset + take]
+                self._frame_fill += take
+                offset += take
+                if self._frame_fill == self.frame_bytes:
+                    self._post_audio(self._frame)
+                    self._frame_fill = 0
+
+    def flush(self):
+        """Send a partially filled frame."""
+        with self._convert_lock:
+            if self._frame_fill:
+                self._post_audio(self._frame[:self._frame_fill])
+                self._frame_fill = 0
+
+    def commit(self):
+        """End the utterance: flush and commit the server's input buffer."""
+        self.flush()
+        with self._convert_lock:
+            self.resampler.reset()
+        self._post("commit", '{"type": "input_audio_buffer.commit"}')
+
+    def transcribe(self, audio: np.ndarray, timeout: float = 10.0) -> str:
+        """
+        Send a whole utterance and wait for its transcript.
+
+        Args:
+            audio: Float32 samples at input_rate
+            timeout: Time to wait for the transcript
+
+        Returns:
+            Transcript
+
+        Raises:
+            TimeoutError: If no transcript arrived in time
+        """
+        with self._transcribe_lock:
+            self._transcripts.clear()
+            self._transcript_ready.clear()
+            self.push(audio)
+            self.commit()
+            if not self._transcript_ready.wait(timeout):
+                raise TimeoutError("No transcript from Realtime API")
+            return self._transcripts.popleft()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get sender statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            "connected": self.connected.is_set(),
+            "frames_sent": self.frames_sent,
+            "bytes_sent": self.bytes_sent,
+            "frames_dropped": self.frames_dropped,
+            "reconnects": self.reconnects,
+            "queued": len(self._outbox),
+            "send_latency_ms": self.metrics.get_value_stats(f"{self.metrics_prefix}.send_latency_ms"),
+        }
@@ -0,0 +1,182 @@
+"""
+Local Stand-in for the Realtime STT API
+
+A small WebSocket server speaking the audio-input subset of the
+Realtime protocol (session.update, input_audio_buffer.append/commit),
+so the send path can be tested and benchmarked without the real
+service. Usage:
+
+    python -m core.audio.stt_realtime_standin --port 8765
+"""
+
+import sys
+import json
+import time
+import base64
+import asyncio
+import argparse
+from pathlib import Path
+from threading import Thread, Event
+from typing import Optional, Callable, Dict, Any, List
+import websockets
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.audio.stt_realtime_sender import TRANSCRIPT_EVENT
+
+
+def describe_audio(pcm: bytes, sample_rate: int = 24000) -> str:
+    """Default stand-in 'transcript': the committed audio length."""
+    return f"{len(pcm) / 2 / sample_rate * 1000:.0f} ms of audio"
+
+
+class RealtimeStandInServer:
+    """
+    In-process Realtime API stand-in.
+
+    Features:
+    - Accumulates appended PCM16 audio per connection and answers each
+      commit with committed + transcription events
+    - Records arrival times of every append (for send-path latency)
+    - drop_connections() to exercise client reconnects
+    - Runs on its own asyncio loop thread
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        sample_rate: int = 24000,
+        transcribe_fn: Callable[[bytes], str] = describe_audio,
+    ):
+        """
+        Initialize stand-in server.
+
+        Args:
+            host: Interface to listen on
+            port: Port (0 picks a free one)
+            sample_rate: Expected PCM16 sample rate
+            transcribe_fn: Produces the transcript for committed PCM16 audio
+        """
+        self.host = host
+        self.port = port
+        self.sample_rate = sample_rate
+        self.transcribe_fn = transcribe_fn
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[Thread] = None
+        self._server = None
+        self._stop: Optional[asyncio.Event] = None
+        self._ready = Event()
+        self._connections: set = set()
+
+        # Observations
+        self.connections = 0
+        self.sessions: List[Dict[str, Any]] = []
+        self.append_times: List[float] = []
+        self.appended_bytes = 0
+        self.commits: List[bytes] = []
+
+    @property
+    def url(self) -> str:
+        """WebSocket URL of the running server."""
+        return f"ws://{self.host}:{self.port}"
+
+    def start(self):
+        """Start serving in the background."""
+        self._thread = Thread(target=self._run, name="realtime-standin", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        logger.info(f"Realtime stand-in listening on {self.url}")
+
+    def stop(self):
+        """Stop the server."""
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join(timeout=2.0)
+        self._loop = None
+
+    def drop_connections(self):
+        """Close every client connection (the server keeps running)."""
+        async def close_all():
+            for ws in list(self._connections):
+                await ws.close(code=1012, reason="stand-in restart")
+
+        asyncio.run_coroutine_threadsafe(close_all(), self._loop).result(timeout=2.0)
+
+    def _run(self):
+        """Server thread."""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._serve())
+        self._loop.close()
+
+    async def _serve(self):
+        """Serve until stopped."""
+        self._stop = asyncio.Event()
+        async with websockets.serve(self._handle, self.host, self.port, max_size=None) as server:
+            self.port = next(iter(server.sockets)).getsockname()[1]
+            self._ready.set()
+            await self._stop.wait()
+
+    async def _handle(self, ws, path=None):
+        """Handle one client connection."""
+        self.connections += 1
+        self._connections.add(ws)
+        pcm = bytearray()
+        try:
+            async for raw in ws:
+                message = json.loads(raw)
+                msg_type = message.get("type")
+
+                if msg_type == "input_audio_buffer.append":
+                    self.append_times.append(time.perf_counter())
+                    chunk = base64.b64decode(message["audio"])
+                    self.appended_bytes += len(chunk)
+                    pcm.extend(chunk)
+
+                elif msg_type == "input_audio_buffer.commit":
+                    audio = bytes(pcm)
+                    pcm.clear()
+                    self.commits.append(audio)
+                    await ws.send(json.dumps({"type": "input_audio_buffer.committed"}))
+                    await ws.send(json.dumps({
+                        "type": TRANSCRIPT_EVENT,
+                        "transcript": self.transcribe_fn(audio),
+                    }))
+
+                elif msg_type == "session.update":
+                    self.sessions.append(message.get("session", {}))
+                    await ws.send(json.dumps({"type": "session.updated"}))
+
+                else:
+                    await ws.send(json.dumps({
+                        "type": "error",
+                        "error": {"message": f"Unsupported event: {msg_type}"},
+                    }))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            self._connections.discard(ws)
+
+
+def main():
+    """Run the stand-in server in the foreground."""
+    parser = argparse.ArgumentParser(description="Local Realtime STT stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = RealtimeStandInServer(args.host, args.port)
+    server.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
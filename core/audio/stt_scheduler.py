@@ -0,0 +1,247 @@
+"""
+Latest-Wins Partial Transcription Scheduler
+
+Coalesces partial-transcription requests so that only the newest audio
+snapshot is decoded when the worker frees up, paced to a target cadence.
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Callable, Dict, Any
+from threading import Thread, Condition
+from dataclasses import dataclass
+import numpy as np
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.metrics import get_metrics_collector
+
+
+@dataclass
+class DecodeRequest:
+    """A buffered audio snapshot waiting to be decoded."""
+
+    audio: np.ndarray
+    generation: int
+    submitted_at: float
+    coalesced: int = 0  # Older requests this one replaced
+
+
+class LatestWinsScheduler:
+    """
+    Single-worker decode scheduler with latest-wins coalescing.
+
+    Features:
+    - At most one pending request (newer snapshots replace older ones)
+    - Target cadence between decode starts
+    - Cancellation of stale in-flight decodes
+    - Queue depth, skipped request and latency metrics
+    """
+
+    def __init__(
+        self,
+        decode_fn: Callable[[np.ndarray, Callable[[], bool]], None],
+        partial_interval_ms: int = 300,
+        max_lag_ms: Optional[int] = None,
+        sample_rate: int = 16000,
+        metrics_prefix: str = "stt.partial",
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            decode_fn: Called with (audio, should_cancel); should_cancel()
+                returns True once the decode's result is no longer wanted
+            partial_interval_ms: Target interval between decode starts (ms)
+            max_lag_ms: Cancel an in-flight decode once newer pending audio is
+                this much longer than the audio being decoded (None = never)
+            sample_rate: Audio sample rate (used for lag computation)
+            metrics_prefix: Prefix for reported metric names
+        """
+        self.decode_fn = decode_fn
+        self.partial_interval_ms = partial_interval_ms
+        self.max_lag_ms = max_lag_ms
+        self.sample_rate = sample_rate
+        self.metrics_prefix = metrics_prefix
+        self.metrics = get_metrics_collector()
+
+        # State (guarded by condition)
+        self._cond = Condition()
+        self._pending: Optional[DecodeRequest] = None
+        self._in_flight: Optional[DecodeRequest] = None
+        self._generation = 0
+        self._running = False
+        self._last_start = 0.0
+        self._worker: Optional[Thread] = None
+        self._epoch = 0  # Bumped by stop(); a worker exits once it changes
+
+        # Statistics
+        self.submitted = 0
+        self.skipped = 0
+        self.cancelled = 0
+        self.decoded = 0
+
+    def start(self):
+        """Start the worker thread."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._pending = None
+            self._last_start = 0.0
+            epoch = self._epoch
+
+        self._worker = Thread(target=self._run, args=(epoch,), daemon=True)
+        self._worker.start()
+
+    def stop(self, timeout: float = 2.0, wait: bool = True):
+        """
+        Stop the worker, dropping any pending request.
+
+        Args:
+            timeout: Time to wait for an in-flight decode to finish
+            wait: Wait for the worker at all; without waiting, a decode
+                in flight finishes in the background and its worker then
+                exits, even if the scheduler was started again meanwhile
+        """
+        with self._cond:
+            self._running = False
+            self._pending = None
+            self._epoch += 1
+            self._cond.notify_all()
+
+        if wait and self._worker and self._worker.is_alive():
+            self._worker.join(timeout=timeout)
+        self._worker = None
+
+    def submit(self, audio: np.ndarray):
+        """
+        Submit a new audio snapshot, replacing any pending one.
+
+        Args:
+            audio: Complete buffer snapshot to decode
+        """
+        with self._cond:
+            if not self._running:
+                return
+
+            self.submitted += 1
+            coalesced = 0
+            if self._pending is not None:
+                # Older snapshot never got a worker - newest wins
+                coalesced = self._pending.coalesced + 1
+                self.skipped += 1
+                self.metrics.increment(f"{self.metrics_prefix}.skipped")
+
+            self._pending = DecodeRequest(
+                audio=audio,
+                generation=self._generation,
+                submitted_at=time.perf_counter(),
+                coalesced=coalesced,
+            )
+            self.metrics.increment(f"{self.metrics_prefix}.requests")
+            self._cond.notify_all()
+
+    def cancel(self):
+        """Cancel the pending request and any in-flight decode."""
+        with self._cond:
+            if self._pending is not None:
+                # In-flight decodes are counted by the worker when it notices
+                self.cancelled += 1
+                self.metrics.increment(f"{self.metrics_prefix}.cancelled")
+            self._generation += 1
+            self._pending = None
+            self._cond.notify_all()
+
+    def is_busy(self) -> bool:
+        """Check if a decode is pending or in flight."""
+        with self._cond:
+            return self._pending is not None or self._in_flight is not None
+
+    def _is_stale(self, request: DecodeRequest) -> bool:
+        """Check whether an in-flight request should be abandoned."""
+        with self._cond:
+            if not self._running or request.generation != self._generation:
+                return True
+
+            if self.max_lag_ms is None or self._pending is None:
+                return False
+
+            lag_samples = len(self._pending.audio) - len(request.audio)
+            return lag_samples * 1000 / self.sample_rate >= self.max_lag_ms
+
+    def _run(self, epoch: int):
+        """Worker loop: wait for cadence, take newest request, decode."""
+        interval = self.partial_interval_ms / 1000.0
+
+        while True:
+            with self._cond:
+                while self._running and self._epoch == epoch and self._pending is None:
+                    self._cond.wait()
+
+                if not self._running or self._epoch != epoch:
+                    return
+
+                # Hold off until the cadence allows another decode;
+                # newer snapshots keep replacing the pending one meanwhile
+                wait = self._last_start + interval - time.perf_counter()
+                if wait > 0:
+                    self._cond.wait(timeout=wait)
+                    continue
+
+                request = self._pending
+                self._pending = None
+                self._in_flight = request
+                self._last_start = time.perf_counter()
+
+            # Depth = requests that were waiting for this worker slot
+            self.metrics.record_value(
+                f"{self.metrics_prefix}.queue_depth", request.coalesced + 1
+            )
+
+            cancelled = False
+
+            def should_cancel() -> bool:
+                # Latch: once a decode is abandoned it stays abandoned
+                nonlocal cancelled
+                if not cancelled:
+                    cancelled = self._is_stale(request)
+                return cancelled
+
+            try:
+                self.decode_fn(request.audio, should_cancel)
+            except Exception as e:
+                logger.error(f"Error in scheduled decode: {e}")
+
+            with self._cond:
+                if self._in_flight is request:
+                    self._in_flight = None
+
+            if cancelled:
+                self.cancelled += 1
+                self.metrics.increment(f"{self.metrics_prefix}.cancelled")
+            else:
+                self.decoded += 1
+                latency_ms = (time.perf_counter() - request.submitted_at) * 1000
+                self.metrics.record_value(
+                    f"{self.metrics_prefix}.latency_ms", latency_ms
+                )
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        return {
+            "submitted": self.submitted,
+            "skipped": self.skipped,
+            "cancelled": self.cancelled,
+            "decoded": self.decoded,
+            "pending": self._pending is not None,
+            "in_flight": self._in_flight is not None,
+            "partial_interval_ms": self.partial_interval_ms,
+        }
@@ -0,0 +1,519 @@
+"""
+On-machine STT Auto-Tuner
+
+Benchmarks the installed faster-whisper models on a reference clip set
+and writes the best configuration into the `stt.faster_whisper` section
+of config/settings.yaml.
+
+Each candidate (model size x compute type x CPU threads x workers) runs
+in its own subprocess so peak RSS is measured per configuration. The
+most accurate configuration whose p95 latency meets the target wins;
+ties go to the faster one.
+
+Usage:
+
+    python -m core.audio.stt_tuner --record          # record the reference clips once
+    python -m core.audio.stt_tuner --latency-target-ms 800
+    python -m core.audio.stt_tuner --dry-run         # benchmark without writing config
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import itertools
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+import numpy as np
+from loguru import logger
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+DEFAULT_MANIFEST = ROOT / "benchmarks" / "reference_clips" / "manifest.jsonl"
+DEFAULT_PROMPTS = ROOT / "benchmarks" / "reference_clips" / "prompts.txt"
+
+# Compute types worth trying per device (fastest first)
+COMPUTE_TYPES = {
+    "cpu": ["int8", "int8_float32", "float32"],
+    "cuda": ["int8_float16", "float16"],
+}
+
+SAMPLE_RATE = 16000
+
+
+@dataclass
+class TuningResult:
+    """Benchmark result for one configuration."""
+
+    model_size: str
+    compute_type: str
+    cpu_threads: int
+    num_workers: int
+    device: str = "cpu"
+    wer: float = 1.0
+    rtf: float = 0.0
+    latency_p50_ms: float = 0.0
+    latency_p95_ms: float = 0.0
+    load_ms: float = 0.0
+    peak_rss_mb: float = 0.0
+    error: Optional[str] = None
+
+    def config(self) -> Dict[str, Any]:
+        """Settings for the `stt.faster_whisper` config section."""
+        return {
+            "model_size": self.model_size,
+            "device": self.device,
+            "compute_type": self.compute_type,
+            "cpu_threads": self.cpu_threads,
+            "num_workers": self.num_workers,
+        }
+
+
+def installed_models() -> List[str]:
+    """
+    Find model sizes already present in the local model cache.
+
+    Returns:
+        Model sizes usable without a download
+    """
+    from faster_whisper.utils import download_model
+    from core.audio.stt_faster_whisper import FasterWhisperSTT
+    from core.models.registry import get_model_registry
+
+    registry = get_model_registry()
+    models = []
+    for model_size in FasterWhisperSTT.MODELS:
+        if registry.is_installed(f"faster-whisper-{model_size}"):
+            models.append(model_size)
+            continue
+        try:
+            download_model(model_size, local_files_only=True)
+            models.append(model_size)
+        except Exception:
+            continue
+    return models
+
+
+def thread_options() -> List[int]:
+    """
+    CPU thread counts to try: half and all physical cores.
+
+    Returns:
+        Sorted distinct thread counts
+    """
+    physical = None
+    if PSUTIL_AVAILABLE:
+        physical = psutil.cpu_count(logical=False)
+    physical = physical or os.cpu_count() or 1
+    return sorted({max(1, physical // 2), physical})
+
+
+def candidate_configs(
+    models: List[str],
+    device: str = "cpu",
+    threads: Optional[List[int]] = None,
+    workers: Optional[List[int]] = None,
+) -> List[TuningResult]:
+    """
+    Build the configuration grid.
+
+    Args:
+        models: Model sizes to try
+        device: "cpu" or "cuda"
+        threads: CPU thread counts (default: thread_options())
+        workers: Worker counts (default: [1, 2])
+
+    Returns:
+        Unmeasured TuningResult per configuration
+    """
+    threads = threads or thread_options()
+    workers = workers or [1, 2]
+    return [
+        TuningResult(
+            model_size=model_size,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers,
+            device=device,
+        )
+        for model_size, compute_type, cpu_threads, num_workers in itertools.product(
+            models, COMPUTE_TYPES[device], threads, workers
+        )
+    ]
+
+
+def select_config(
+    results: List[TuningResult],
+    latency_target_ms: float,
+) -> Optional[TuningResult]:
+    """
+    Pick the most accurate configuration that meets the latency target.
+
+    If nothing meets the target, the fastest configuration is returned.
+
+    Args:
+        results: Measured configurations
+        latency_target_ms: p95 latency budget per utterance
+
+    Returns:
+        Selected configuration, or None if every run failed
+    """
+    measured = [r for r in results if r.error is None]
+    if not measured:
+        return None
+
+    eligible = [r for r in measured if r.latency_p95_ms <= latency_target_ms]
+    if not eligible:
+        logger.warning(
+            f"No configuration meets {latency_target_ms:.0f}ms - using the fastest"
+        )
+        return min(measured, key=lambda r: r.latency_p95_ms)
+
+    # Round WER so measurement noise doesn't beat a real latency win
+    return min(eligible, key=lambda r: (round(r.wer, 3), r.latency_p95_ms, r.peak_rss_mb))
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KB, macOS bytes
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        if PSUTIL_AVAILABLE:
+            return getattr(psutil.Process().memory_info(), "peak_wset", 0) / (1024 * 1024)
+        return 0.0
+
+
+def run_config(config: TuningResult, manifest: Path) -> TuningResult:
+    """
+    Measure one configuration in the current process.
+
+    With several workers, clips are decoded concurrently, which is how
+    the model is used when partials and final decodes overlap.
+
+    Args:
+        config: Configuration to measure
+        manifest: Reference clip manifest
+
+    Returns:
+        The configuration with measurements filled in
+    """
+    from core.audio.stt_eval import load_corpus, word_error_rate
+    from core.audio.stt_faster_whisper import FasterWhisperSTT
+
+    corpus = load_corpus(manifest, SAMPLE_RATE)
+
+    start_time = time.perf_counter()
+    stt = FasterWhisperSTT(
+        model_size=config.model_size,
+        device=config.device,
+        compute_type=config.compute_type,
+        cpu_threads=config.cpu_threads,
+        num_workers=config.num_workers,
+        adaptive_decode=False,
+    )
+    if not stt.warmup():
+        raise RuntimeError("warm-up decode failed")
+    config.load_ms = (time.perf_counter() - start_time) * 1000
+
+    def decode(audio: np.ndarray):
+        decode_start = time.perf_counter()
+        text = stt.transcribe(audio, SAMPLE_RATE)
+        return text, (time.perf_counter() - decode_start) * 1000
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=config.num_workers) as executor:
+        outputs = list(executor.map(decode, [audio for audio, _ in corpus]))
+    wall_s = time.perf_counter() - start_time
+
+    latencies = [latency for _, latency in outputs]
+    audio_s = sum(len(audio) for audio, _ in corpus) / SAMPLE_RATE
+
+    config.wer = word_error_rate([text for _, text in corpus], [text for text, _ in outputs])
+    config.rtf = wall_s / max(audio_s, 1e-6)
+    config.latency_p50_ms = float(np.percentile(latencies, 50))
+    config.latency_p95_ms = float(np.percentile(latencies, 95))
+    config.peak_rss_mb = _peak_rss_mb()
+    return config
+
+
+def benchmark_config(
+    config: TuningResult,
+    manifest: Path,
+    timeout_s: float = 900.0,
+) -> TuningResult:
+    """
+    Measure one configuration in a fresh subprocess.
+
+    Args:
+        config: Configuration to measure
+        manifest: Reference clip manifest
+        timeout_s: Give up on the configuration after this long
+
+    Returns:
+        Measured configuration (error set on failure)
+    """
+    command = [
+        sys.executable, "-m", "core.audio.stt_tuner",
+        "--worker", json.dumps(asdict(config)),
+        "--manifest", str(manifest),
+    ]
+    try:
+        completed = subprocess.run(
+            command, cwd=ROOT, capture_output=True, text=True, timeout=timeout_s
+        )
+    except subprocess.TimeoutExpired:
+        config.error = f"timed out after {timeout_s:.0f}s"
+        return config
+
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode != 0 or not lines:
+        stderr = completed.stderr.strip().splitlines()
+        config.error = stderr[-1] if stderr else f"exit code {completed.returncode}"
+        return config
+
+    return TuningResult(**json.loads(lines[-1]))
+
+
+def patch_yaml_section(text: str, section: List[str], values: Dict[str, Any]) -> str:
+    """
+    Set keys of a nested YAML mapping in place.
+
+    Only the lines of the given keys change, so comments, ordering and
+    the rest of the file are kept. Missing keys are appended to the
+    section.
+
+    Args:
+        text: YAML document
+        section: Path to the mapping, e.g. ["stt", "faster_whisper"]
+        values: Scalar values to set
+
+    Returns:
+        Updated YAML document
+
+    Raises:
+        KeyError: If the section does not exist
+    """
+    lines = text.splitlines(keepends=True)
+
+    def indent(line: str) -> int:
+        return len(line) - len(line.lstrip(" "))
+
+    def is_content(line: str) -> bool:
+        return bool(line.strip()) and not line.lstrip().startswith("#")
+
+    # Narrow [start, end) down to the body of each mapping on the path
+    start, end, parent_indent = 0, len(lines), -1
+    for name in section:
+        for i in range(start, end):
+            line = lines[i]
+            if (
+                is_content(line)
+                and indent(line) > parent_indent
+                and line.strip().split("#")[0].strip() == f"{name}:"
+            ):
+                parent_indent = indent(line)
+                start = i + 1
+                break
+        else:
+            raise KeyError(".".join(section))
+        for i in range(start, end):
+            if is_content(lines[i]) and indent(lines[i]) <= parent_indent:
+                end = i
+                break
+
+    body = [i for i in range(start, end) if is_content(lines[i])]
+    key_indent = indent(lines[body[0]]) if body else parent_indent + 2
+
+    for key, value in values.items():
+        scalar = json.dumps(value)  # JSON scalars are valid YAML
+        for i in body:
+            line = lines[i]
+            if indent(line) == key_indent and line.strip().startswith(f"{key}:"):
+                comment = line.rstrip("\n").partition("#")[2] if "#" in line else ""
+                lines[i] = " " * key_indent + f"{key}: {scalar}"
+                lines[i] += f"  #{comment}\n" if comment else "\n"
+                break
+        else:
+            insert_at = body[-1] + 1 if body else start
+            if insert_at > 0 and not lines[insert_at - 1].endswith("\n"):
+                lines[insert_at - 1] += "\n"
+            lines.insert(insert_at, " " * key_indent + f"{key}: {scalar}\n")
+            body = [i + 1 if i >= insert_at else i for i in body] + [insert_at]
+
+    return "".join(lines)
+
+
+def write_config(result: TuningResult, config_path: Optional[str] = None):
+    """
+    Write the selected configuration to the `stt.faster_whisper` section.
+
+    Only those keys are rewritten; the rest of the file, including its
+    comments, is left as it is.
+
+    Args:
+        result: Selected configuration
+        config_path: Settings file (default: config/settings.yaml)
+    """
+    path = Path(config_path) if config_path else ROOT / "config" / "settings.yaml"
+    if not path.exists():
+        from core.config.config_manager import ConfigManager
+
+        ConfigManager(str(path))  # Writes the defaults
+    text = path.read_text(encoding="utf-8")
+    path.write_text(
+        patch_yaml_section(text, ["stt", "faster_whisper"], result.config()),
+        encoding="utf-8",
+    )
+
+
+def record_reference_clips(
+    prompts_file: Path = DEFAULT_PROMPTS,
+    manifest: Path = DEFAULT_MANIFEST,
+    seconds_per_prompt: float = 4.0,
+):
+    """
+    Record the reference clip set by reading each prompt aloud.
+
+    Args:
+        prompts_file: One command per line
+        manifest: Manifest to write (clips go next to it)
+        seconds_per_prompt: Recording length per prompt
+    """
+    import sounddevice as sd
+    import soundfile as sf
+
+    prompts = [
+        line.strip() for line in prompts_file.read_text(encoding="utf-8").splitlines()
+        if line.strip() and not line.startswith("#")
+    ]
+    clips_dir = manifest.parent / "clips"
+    clips_dir.mkdir(parents=True, exist_ok=True)
+
+    entries = []
+    for i, prompt in enumerate(prompts, 1):
+        input(f"[{i}/{len(prompts)}] Press Enter, then say: \"{prompt}\"")
+        audio = sd.rec(
+            int(seconds_per_prompt * SAMPLE_RATE),
+            samplerate=SAMPLE_RATE,
+            channels=1,
+            dtype="float32",
+        )
+        sd.wait()
+
+        clip = clips_dir / f"{i:03d}.wav"
+        sf.write(clip, audio, SAMPLE_RATE)
+        entries.append({"audio": f"clips/{clip.name}", "text": prompt})
+
+    with open(manifest, "w", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+    logger.info(f"Recorded {len(entries)} clips to {manifest}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Tune faster-whisper for this machine")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST,
+                        help="Reference clip manifest (JSONL)")
+    parser.add_argument("--latency-target-ms", type=float, default=1000.0,
+                        help="p95 latency budget per utterance")
+    parser.add_argument("--device", choices=["cpu", "cuda"], default="cpu")
+    parser.add_argument("--models", nargs="+", help="Model sizes (default: all installed)")
+    parser.add_argument("--threads", nargs="+", type=int, help="CPU thread counts to try")
+    parser.add_argument("--workers", nargs="+", type=int, help="Worker counts to try")
+    parser.add_argument("--config", help="Settings file to update")
+    parser.add_argument("--dry-run", action="store_true", help="Don't write the config")
+    parser.add_argument("--output", type=Path, help="Write all results as JSON")
+    parser.add_argument("--record", action="store_true", help="Record the reference clips")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    if args.worker:
+        # Subprocess mode: measure one configuration, print JSON on stdout
+        logger.remove()
+        logger.add(sys.stderr, level="WARNING")
+        result = run_config(TuningResult(**json.loads(args.worker)), args.manifest)
+        print(json.dumps(asdict(result)))
+        return
+
+    if args.record:
+        record_reference_clips(manifest=args.manifest)
+        return
+
+    if not args.manifest.exists():
+        logger.error(
+            f"Reference clips not found: {args.manifest} "
+            f"(run with --record to create them)"
+        )
+        sys.exit(1)
+
+    models = args.models or installed_models()
+    if not models:
+        logger.error("No faster-whisper models installed")
+        sys.exit(1)
+
+    candidates = candidate_configs(models, args.device, args.threads, args.workers)
+    logger.info(
+        f"Benchmarking {len(candidates)} configurations "
+        f"(models: {', '.join(models)}, target: {args.latency_target_ms:.0f}ms)"
+    )
+
+    results = []
+    for i, candidate in enumerate(candidates, 1):
+        result = benchmark_config(candidate, args.manifest)
+        results.append(result)
+        label = (
+            f"{result.model_size}/{result.compute_type}/"
+            f"t{result.cpu_threads}/w{result.num_workers}"
+        )
+        if result.error:
+            logger.warning(f"[{i}/{len(candidates)}] {label}: {result.error}")
+        else:
+            logger.info(
+                f"[{i}/{len(candidates)}] {label}: WER {result.wer:.1%}, "
+                f"RTF {result.rtf:.2f}, p95 {result.latency_p95_ms:.0f}ms, "
+                f"RSS {result.peak_rss_mb:.0f}MB"
+            )
+
+    if args.output:
+        args.output.write_text(json.dumps([asdict(r) for r in results], indent=2))
+        logger.info(f"Results written to {args.output}")
+
+    best = select_config(results, args.latency_target_ms)
+    if best is None:
+        logger.error("Every configuration failed")
+        sys.exit(1)
+
+    logger.info("")
+    logger.info("=" * 60)
+    logger.info(f"Selected: {best.config()}")
+    logger.info(
+        f"WER {best.wer:.1%}, p95 {best.latency_p95_ms:.0f}ms, "
+        f"RTF {best.rtf:.2f}, RSS {best.peak_rss_mb:.0f}MB"
+    )
+    logger.info("=" * 60)
+
+    if not args.dry_run:
+        write_config(best, args.config)
+        logger.info("Saved to stt.faster_whisper in settings")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Transcript Word Utilities
+
+Word-level types and helpers shared by the transcribers that stitch
+overlapping decodes together (long-form, incremental and streaming).
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class TimedWord:
+    """A recognized word with absolute timestamps (seconds)."""
+
+    start: float
+    end: float
+    text: str
+
+    @property
+    def center(self) -> float:
+        return (self.start + self.end) / 2
+
+
+def normalize_word(word: str) -> str:
+    """Lowercase a word and strip punctuation for comparisons."""
+    return "".join(c for c in word.lower() if c.isalnum())
+
+
+def trim_text_overlap(previous: str, current: str, max_words: int = 12) -> str:
+    """
+    Drop the start of a transcript that repeats the end of the previous one.
+
+    For transcripts of overlapping windows without word timestamps.
+
+    Args:
+        previous: Transcript of the earlier window
+        current: Transcript of the later window
+        max_words: Longest overlap to look for
+
+    Returns:
+        current without the repeated words
+    """
+    prev_words = [normalize_word(w) for w in previous.split()]
+    words = current.split()
+    cur_words = [normalize_word(w) for w in words]
+
+    for n in range(min(max_words, len(prev_words), len(cur_words)), 0, -1):
+        if prev_words[-n:] == cur_words[:n]:
+            return " ".join(words[n:])
+    return current
@@ -0,0 +1,383 @@
+"""
+Bounded STT Worker Pool
+
+Serves utterance transcription from a fixed set of worker threads with
+a bounded job queue, an explicit overflow policy, per-job cancellation
+and in-order delivery of transcripts.
+"""
+
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from threading import Thread, Condition, Event, Lock
+from typing import Optional, Callable, Deque, Dict, Any, List, Tuple
+import numpy as np
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.metrics import get_metrics_collector
+
+
+class QueuePolicy(Enum):
+    """What to do with a new utterance when the queue is full."""
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued utterance
+    REJECT = "reject"            # Refuse the new utterance
+    MERGE = "merge"              # Append it to the newest queued utterance
+
+
+class JobStatus(Enum):
+    """STT job lifecycle."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    DROPPED = "dropped"
+
+
+@dataclass
+class STTJob:
+    """An utterance waiting for (or undergoing) transcription."""
+
+    job_id: int
+    audio: np.ndarray
+    submitted_at: float
+    status: JobStatus = JobStatus.QUEUED
+    merged: int = 0  # Utterances appended to this one
+    transcript: Optional[str] = None
+    error: Optional[str] = None
+    cancel_event: Event = field(default_factory=Event)
+    speech_segments: Optional[List[Tuple[int, int]]] = None  # Voiced regions of audio
+
+    @property
+    def cancelled(self) -> bool:
+        """Check if the job was cancelled or dropped."""
+        return self.cancel_event.is_set()
+
+
+class STTWorkerPool:
+    """
+    Fixed-size STT worker pool with back-pressure.
+
+    Features:
+    - Bounded queue with drop-oldest, reject or merge overflow policy
+    - Per-job cancellation (queued jobs are removed, running decodes
+      are signalled through should_cancel)
+    - Transcripts delivered in submission order, whichever worker
+      finishes first
+    - Queue depth, wait time and drop metrics
+    """
+
+    def __init__(
+        self,
+        transcribe_fn: Callable[[np.ndarray, Callable[[], bool]], str],
+        on_result: Callable[[STTJob], None],
+        num_workers: int = 1,
+        max_queue: int = 2,
+        policy: str = "drop_oldest",
+        merge_gap_ms: int = 200,
+        sample_rate: int = 16000,
+        on_idle: Optional[Callable[[], None]] = None,
+        metrics_prefix: str = "stt.pool",
+    ):
+        """
+        Initialize worker pool.
+
+        Args:
+            transcribe_fn: Called with (audio, should_cancel), returns text;
+                jobs submitted with speech segments also pass
+                speech_segments=... as a keyword
+            on_result: Called in submission order with each finished job
+                (done or failed; cancelled and dropped jobs are skipped)
+            num_workers: Number of worker threads
+            max_queue: Maximum utterances waiting for a worker
+            policy: Overflow policy ("drop_oldest", "reject" or "merge")
+            merge_gap_ms: Silence inserted between merged utterances
+            sample_rate: Audio sample rate
+            on_idle: Called after delivery once nothing is queued or running
+            metrics_prefix: Prefix for reported metric names
+        """
+        self.transcribe_fn = transcribe_fn
+        self.on_result = on_result
+        self.on_idle = on_idle
+        self.num_workers = max(1, num_workers)
+        self.max_queue = max(1, max_queue)
+        self.policy = QueuePolicy(policy)
+        self.merge_gap = np.zeros(int(sample_rate * merge_gap_ms / 1000), dtype=np.float32)
+        self.metrics_prefix = metrics_prefix
+        self.metrics = get_metrics_collector()
+
+        # Queue and job table (guarded by condition)
+        self._cond = Condition()
+        self._queue: Deque[STTJob] = deque()
+        self._jobs: Dict[int, STTJob] = {}  # Submitted but not yet delivered
+        self._next_id = 0
+        self._running = False
+        self._workers: List[Thread] = []
+
+        # Delivery runs on one thread at a time, in job order
+        self._delivery_lock = Lock()
+        self._next_delivery = 0
+
+        # Statistics
+        self.submitted = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.merged = 0
+        self.cancelled = 0
+        self.completed = 0
+        self.failed = 0
+
+    def start(self):
+        """Start the worker threads."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+
+        self._workers = [
+            Thread(target=self._run, name=f"stt-worker-{i}", daemon=True)
+            for i in range(self.num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+        logger.info(
+            f"STT worker pool started ({self.num_workers} workers, "
+            f"queue: {self.max_queue}, policy: {self.policy.value})"
+        )
+
+    def stop(self, timeout: float = 2.0):
+        """
+        Stop the workers, cancelling queued and running jobs.
+
+        Args:
+            timeout: Time to wait for each worker to exit
+        """
+        self.cancel_all()
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+        self._workers = []
+
+    def submit(
+        self,
+        audio: np.ndarray,
+        speech_segments: Optional[List[Tuple[int, int]]] = None
+    ) -> Optional[STTJob]:
+        """
+        Queue an utterance for transcription.
+
+        Args:
+            audio: Utterance audio
+            speech_segments: Voiced (start, end) sample offsets within
+                audio, from an upstream VAD (optional)
+
+        Returns:
+            The job (possibly an existing one it was merged into), or None
+            if the pool is stopped or the utterance was rejected
+        """
+        dropped = False
+        with self._cond:
+            if not self._running:
+                return None
+
+            self.submitted += 1
+            self.metrics.increment(f"{self.metrics_prefix}.submitted")
+
+            if len(self._queue) >= self.max_queue:
+                if self.policy == QueuePolicy.REJECT:
+                    self.rejected += 1
+                    self.metrics.increment(f"{self.metrics_prefix}.rejected")
+                    logger.warning("STT queue full - utterance rejected")
+                    return None
+
+                if self.policy == QueuePolicy.MERGE:
+                    # Talking over a slow decode usually continues the same
+                    # request, so decode both utterances together
+                    job = self._queue[-1]
+                    offset = len(job.audio) + len(self.merge_gap)
+                    if job.speech_segments is not None and speech_segments is not None:
+                        job.speech_segments = job.speech_segments + [
+                            (start + offset, end + offset) for start, end in speech_segments
+                        ]
+                    else:
+                        job.speech_segments = None
+                    job.audio = np.concatenate([job.audio, self.merge_gap, audio])
+                    job.merged += 1
+                    self.merged += 1
+                    self.metrics.increment(f"{self.metrics_prefix}.merged")
+                    logger.debug(f"Merged utterance into STT job {job.job_id}")
+                    return job
+
+                oldest = self._queue.popleft()
+                self._discard(oldest, JobStatus.DROPPED)
+                dropped = True
+                self.dropped += 1
+                self.metrics.increment(f"{self.metrics_prefix}.dropped")
+                logger.warning(f"STT queue full - dropped job {oldest.job_id}")
+
+            job = STTJob(
+                job_id=self._next_id,
+                audio=audio,
+                submitted_at=time.perf_counter(),
+                speech_segments=speech_segments,
+            )
+            self._next_id += 1
+            self._jobs[job.job_id] = job
+            self._queue.append(job)
+            self.metrics.record_value(f"{self.metrics_prefix}.queue_depth", len(self._queue))
+            self._cond.notify()
+
+        if dropped:
+            self._deliver()  # Unblock results queued behind the dropped job
+        return job
+
+    def cancel(self, job: STTJob):
+        """
+        Cancel one job.
+
+        A queued job is removed; a running decode is asked to stop.
+
+        Args:
+            job: Job to cancel
+        """
+        with self._cond:
+            if job.status == JobStatus.QUEUED:
+                self._queue.remove(job)
+                self._discard(job, JobStatus.CANCELLED)
+            elif job.status == JobStatus.RUNNING:
+                job.cancel_event.set()
+            else:
+                return
+            self.cancelled += 1
+            self.metrics.increment(f"{self.metrics_prefix}.cancelled")
+
+        self._deliver()
+
+    def cancel_all(self):
+        """Cancel every queued and running job."""
+        with self._cond:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            self.cancel(job)
+
+    def _discard(self, job: STTJob, status: JobStatus):
+        """Mark a job as never to be transcribed (caller holds the lock)."""
+        job.status = status
+        job.cancel_event.set()
+
+    def pending_count(self) -> int:
+        """Number of jobs submitted but not yet delivered."""
+        with self._cond:
+            return len(self._jobs)
+
+    def is_idle(self) -> bool:
+        """Check if nothing is queued, running or awaiting delivery."""
+        return self.pending_count() == 0
+
+    def _run(self):
+        """Worker loop: take the oldest queued job and transcribe it."""
+        while True:
+            with self._cond:
+                while self._running and not self._queue:
+                    self._cond.wait()
+
+                if not self._running:
+                    return
+
+                job = self._queue.popleft()
+                job.status = JobStatus.RUNNING
+
+            self.metrics.record_value(
+                f"{self.metrics_prefix}.wait_ms",
+                (time.perf_counter() - job.submitted_at) * 1000
+            )
+
+            try:
+                if job.speech_segments is not None:
+                    text = self.transcribe_fn(
+                        job.audio, job.cancel_event.is_set, speech_segments=job.speech_segments
+                    )
+                else:
+                    text = self.transcribe_fn(job.audio, job.cancel_event.is_set)
+                with self._cond:
+                    if job.cancelled:
+                        job.status = JobStatus.CANCELLED
+                    else:
+                        job.transcript = text or ""
+                        job.status = JobStatus.DONE
+                        self.completed += 1
+            except Exception as e:
+                logger.error(f"STT job {job.job_id} failed: {e}")
+                with self._cond:
+                    job.error = str(e)
+                    job.status = JobStatus.FAILED
+                    self.failed += 1
+                self.metrics.increment(f"{self.metrics_prefix}.failed")
+
+            if job.status == JobStatus.DONE:
+                self.metrics.record_value(
+                    f"{self.metrics_prefix}.latency_ms",
+                    (time.perf_counter() - job.submitted_at) * 1000
+                )
+
+            self._deliver()
+
+    def _deliver(self):
+        """Deliver finished jobs in submission order."""
+        with self._delivery_lock:
+            while True:
+                with self._cond:
+                    job = self._jobs.get(self._next_delivery)
+                    if job is None:
+                        break  # Nothing submitted beyond this point yet
+                    if job.status in (JobStatus.QUEUED, JobStatus.RUNNING):
+                        break  # Later results wait for this one
+                    del self._jobs[job.job_id]
+                    self._next_delivery += 1
+
+                if job.status in (JobStatus.DONE, JobStatus.FAILED):
+                    try:
+                        self.on_result(job)
+                    except Exception as e:
+                        logger.error(f"Error in STT result callback: {e}")
+
+            if self.on_idle and self.is_idle():
+                try:
+                    self.on_idle()
+                except Exception as e:
+                    logger.error(f"Error in STT idle callback: {e}")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        with self._cond:
+            queued = len(self._queue)
+            running = sum(1 for job in self._jobs.values() if job.status == JobStatus.RUNNING)
+
+        return {
+            "workers": self.num_workers,
+            "max_queue": self.max_queue,
+            "policy": self.policy.value,
+            "queued": queued,
+            "running": running,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "dropped": self.dropped,
+            "merged": self.merged,
+            "cancelled": self.cancelled,
+        }
@@ -6,10 +6,15 @@ Only sends voiced frames to STT for lower latency and CPU usage.
 """
 
 import sys
+from pathlib import Path
 from typing import Optional, Callable
 import numpy as np
 from loguru import logger
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.models.registry import get_model_registry
+
 try:
     import torch
     SILERO_AVAILABLE = True
@@ -36,6 +41,7 @@ class SileroVAD:
         min_silence_duration_ms: int = 500,
         speech_pad_ms: int = 400,
         sample_rate: int = 16000,
+        repo_dir: Optional[str] = None,
     ):
         """
         Initialize Silero VAD.
@@ -47,6 +53,8 @@ class SileroVAD:
             min_silence_duration_ms: Minimum silence to trigger "stop"
             speech_pad_ms: Extra padding around speech segments
             sample_rate: Audio sample rate (Hz)
+            repo_dir: Local silero-vad repo to load from (default: the
+                model registry's copy, else the torch hub cache)
         """
         if not SILERO_AVAILABLE:
             raise ImportError(
@@ -63,13 +71,25 @@ class SileroVAD:
         # Load model using correct API
         logger.info("Loading Silero VAD model...")
         
-        # Load Silero VAD model from torch hub
+        if repo_dir is None:
+            registry_path = get_model_registry().find("silero-vad")
+            hub_cache = Path(torch.hub.get_dir()) / "snakers4_silero-vad_master"
+            if registry_path:
+                repo_dir = str(registry_path)
+            elif hub_cache.exists():
+                repo_dir = str(hub_cache)
+            else:
+                raise FileNotFoundError(
+                    "Silero VAD model not installed "
+                    "(run: python -m core.models.registry fetch silero-vad)"
+                )
+        
+        # Load from the local repo copy - never from the network
         self.model, utils = torch.hub.load(
-            repo_or_dir='snakers4/silero-vad',
+            repo_or_dir=repo_dir,
             model='silero_vad',
-            force_reload=False,
+            source='local',
             onnx=True,
-            trust_repo=True
         )
         
         # Only call eval() if it's not ONNX wrapper
@@ -187,6 +207,11 @@ class SileroVAD:
         
         return self.is_speaking, speech_prob
     
+    def warmup(self):
+        """Run one silent frame through the model, then reset state."""
+        self.process_chunk(np.zeros(512, dtype=np.float32))
+        self.reset()
+    
     def reset(self):
         """Reset VAD state."""
         self.is_speaking = False
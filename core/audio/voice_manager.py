@@ -31,6 +31,7 @@ class VoiceInputManager:
         self.is_recording = False
         self.audio_queue = queue.Queue()
         self.recording_thread: Optional[threading.Thread] = None
+        self.on_audio: Optional[Callable[[np.ndarray], None]] = None  # Live chunk listener
         
         # Lazy import to avoid dependency issues
         try:
@@ -118,7 +119,10 @@ class VoiceInputManager:
                 if status:
                     logger.warning(f"Recording status: {status}")
                 if self.is_recording:
-                    self.audio_queue.put(indata.copy())
+                    chunk = indata.copy()
+                    self.audio_queue.put(chunk)
+                    if self.on_audio:
+                        self.on_audio(chunk)
             
             with self.sd.InputStream(
                 samplerate=self.sample_rate,
@@ -217,6 +221,49 @@ class SpeechToTextManager:
         except Exception as e:
             logger.error(f"Transcription error: {e}")
             return None
+    
+    def transcribe_words(self, audio_data: np.ndarray, prompt: str = "") -> list:
+        """
+        Transcribe audio to words with timestamps.
+        
+        Args:
+            audio_data: Audio data as numpy array (16kHz)
+            prompt: Preceding text of the utterance, used as context
+        
+        Returns:
+            List of TimedWord (timestamps relative to audio start)
+        """
+        from .stt_words import TimedWord
+        
+        segments, info = self.model.transcribe(
+            audio_data.reshape(-1).astype(np.float32, copy=False),
+            language="en",
+            beam_size=5,
+            word_timestamps=True,
+            condition_on_previous_text=False,
+            initial_prompt=prompt or None,
+        )
+        return [
+            TimedWord(word.start, word.end, word.word)
+            for segment in segments
+            for word in (segment.words or [])
+        ]
+    
+    def create_incremental_decoder(self, **kwargs):
+        """
+        Create a decoder that transcribes while audio is still recorded.
+        
+        Args:
+            **kwargs: IncrementalDecoder options
+        
+        Returns:
+            IncrementalDecoder, or None if STT is not available
+        """
+        if not self.available or self.model is None:
+            return None
+        
+        from .stt_incremental import IncrementalDecoder
+        return IncrementalDecoder(self.transcribe_words, **kwargs)
 
 
 class TextToSpeechManager:
@@ -354,7 +401,8 @@ class VoiceManager:
     def __init__(
         self,
         stt_model: str = "base",
-        tts_voice: str = "en-US-AriaNeural"
+        tts_voice: str = "en-US-AriaNeural",
+        streaming: bool = True
     ):
         """
         Initialize complete voice manager.
@@ -362,12 +410,15 @@ class VoiceManager:
         Args:
             stt_model: Whisper model size for STT
             tts_voice: Voice to use for TTS
+            streaming: Decode while the push-to-talk key is held, so only
+                the last part of the utterance is decoded after release
         """
         logger.info("Initializing Voice Manager...")
         
         self.input_manager = VoiceInputManager()
         self.stt_manager = SpeechToTextManager(stt_model)
         self.tts_manager = TextToSpeechManager(tts_voice)
+        self.decoder = self.stt_manager.create_incremental_decoder() if streaming else None
         
         # Check availability
         self.voice_input_available = self.input_manager.available
@@ -378,7 +429,15 @@ class VoiceManager:
     
     def start_listening(self) -> bool:
         """Start listening for voice input."""
-        return self.input_manager.start_recording()
+        if self.decoder:
+            self.decoder.start()
+            self.input_manager.on_audio = self.decoder.add_audio
+        
+        started = self.input_manager.start_recording()
+        if not started and self.decoder:
+            self.input_manager.on_audio = None
+            self.decoder.cancel()
+        return started
     
     def stop_listening(self) -> Optional[str]:
         """
@@ -388,11 +447,28 @@ class VoiceManager:
             Transcribed text, or None if failed
         """
         audio_data = self.input_manager.stop_recording()
+        self.input_manager.on_audio = None
         
         if audio_data is None:
+            if self.decoder:
+                self.decoder.cancel()
             return None
         
-        return self.stt_manager.transcribe(audio_data)
+        if self.decoder:
+            try:
+                text = self.decoder.finish()
+                if text:
+                    logger.info(f"Transcribed: '{text}'")
+                    return text
+                logger.debug("Incremental decoder heard nothing, decoding full audio")
+            except Exception as e:
+                logger.error(f"Incremental transcription failed, decoding full audio: {e}")
+        
+        text = self.stt_manager.transcribe(audio_data)
+        if not text:
+            logger.warning("No speech detected")
+            return None
+        return text
     
     def speak(self, text: str, callback: Optional[Callable] = None) -> bool:
         """
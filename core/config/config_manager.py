@@ -85,6 +85,33 @@ class ConfigManager:
             },
             'stt': {
                 'mode': 'offline',
+                'policy': 'single',
+                'race': {
+                    'fast': {'backend': 'faster_whisper', 'model_size': 'tiny'},
+                    'accurate': {'backend': 'faster_whisper', 'model_size': 'base'},
+                    'deadline_ms': 1200
+                },
+                'endpointing': {
+                    'base_timeout_ms': 600,
+                    'extended_timeout_ms': 1500,
+                    'early_commit_ms': 200,
+                    'early_commit_confidence': 0.8,
+                    'no_speech_timeout_ms': 3000,
+                    'max_utterance_s': 12.0
+                },
+                'queue': {
+                    'workers': 1,
+                    'max_queue': 2,
+                    'policy': 'drop_oldest'
+                },
+                'faster_whisper': {
+                    'model_size': 'tiny',
+                    'device': 'auto',
+                    'compute_type': 'int8',
+                    'cpu_threads': 0,
+                    'num_workers': 1,
+                    'adaptive_decode': False
+                },
                 'offline': {
                     'model_path': 'models/ggml-base.en.bin',
                     'binary_path': 'whisper-cpp/main',
@@ -95,13 +122,29 @@ class ConfigManager:
                     'api_key': '',
                     'model': 'gpt-4o-realtime-preview-2024-10-01',
                     'voice': 'alloy',
-                    'temperature': 0.8
+                    'temperature': 0.8,
+                    'url': 'wss://api.openai.com/v1/realtime',
+                    'frame_ms': 100,
+                    'timeout_s': 10.0
+                },
+                'biasing': {
+                    'enabled': True,
+                    'mode': 'prompt',
+                    'max_prompt_chars': 400,
+                    'max_hotwords': 50,
+                    'app_names': None
                 }
             },
             'nlu': {
                 'spacy_model': 'en_core_web_sm',
                 'confidence_threshold': 0.5,
-                'custom_patterns': None
+                'custom_patterns': None,
+                'cache_size': 256,
+                'fuzzy_matching': True,
+                'fast_classifier': {
+                    'enabled': False,
+                    'model_path': 'models/nlu/fast_intent.npz'
+                }
             },
             'tts': {
                 'mode': 'edge',  # Changed to edge for cloud TTS
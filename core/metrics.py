@@ -4,9 +4,11 @@ Metrics tracking and performance monitoring.
 Tracks pipeline timings and performance metrics.
 """
 
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
 from datetime import datetime
+import threading
 import time
 from loguru import logger
 
@@ -20,6 +22,8 @@ class PipelineMetrics:
         wake_detection_time: Time to detect wake word (ms)
         stt_time: Time for speech-to-text (ms)
         nlu_time: Time for intent classification (ms)
+        nlu_stages: Breakdown of nlu_time by stage (ms), e.g.
+            {"match": 0.01, "ner": 4.2, "extract": 0.3}
         action_time: Time to execute skill (ms)
         tts_time: Time for text-to-speech (ms)
         total_time: Total pipeline time (ms)
@@ -28,6 +32,7 @@ class PipelineMetrics:
     wake_detection_time: float = 0.0
     stt_time: float = 0.0
     nlu_time: float = 0.0
+    nlu_stages: Dict[str, float] = field(default_factory=dict)
     action_time: float = 0.0
     tts_time: float = 0.0
     total_time: float = 0.0
@@ -40,6 +45,7 @@ class MetricsCollector:
     
     Features:
     - Track pipeline timings
+    - Named counters and value samples (e.g. queue depth, latencies)
     - Calculate averages
     - Generate performance reports
     """
@@ -49,6 +55,12 @@ class MetricsCollector:
         self.metrics: List[PipelineMetrics] = []
         self.max_metrics = 1000  # Keep last 1000 metrics
         
+        # Named counters and samples (components report into these)
+        self.counters: Dict[str, float] = defaultdict(float)
+        self.samples: Dict[str, Deque[float]] = {}
+        self.max_samples = 1000  # Keep last 1000 samples per name
+        self._lock = threading.Lock()
+        
         logger.info("MetricsCollector initialized")
     
     def record_metrics(self, metrics: PipelineMetrics):
@@ -64,6 +76,60 @@ class MetricsCollector:
         if len(self.metrics) > self.max_metrics:
             self.metrics = self.metrics[-self.max_metrics:]
     
+    def increment(self, name: str, amount: float = 1) -> None:
+        """
+        Increment a named counter.
+        
+        Args:
+            name: Counter name (e.g. 'stt.partial.skipped')
+            amount: Amount to add
+        """
+        with self._lock:
+            self.counters[name] += amount
+    
+    def record_value(self, name: str, value: float) -> None:
+        """
+        Record a sample for a named value (latency in ms, queue depth, ...).
+        
+        Args:
+            name: Sample name (e.g. 'stt.partial.latency_ms')
+            value: Sample value
+        """
+        with self._lock:
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=self.max_samples)
+            self.samples[name].append(float(value))
+    
+    def get_counter(self, name: str) -> float:
+        """Get the current value of a named counter (0 if never incremented)."""
+        with self._lock:
+            return self.counters.get(name, 0.0)
+    
+    def get_value_stats(self, name: str) -> Dict[str, float]:
+        """
+        Summarize the samples recorded for a name.
+        
+        Args:
+            name: Sample name
+            
+        Returns:
+            Dictionary with count, avg, p50, p95 and max (empty if no samples)
+        """
+        with self._lock:
+            values = sorted(self.samples.get(name, ()))
+        
+        if not values:
+            return {}
+        
+        count = len(values)
+        return {
+            'count': count,
+            'avg': sum(values) / count,
+            'p50': values[int(0.50 * (count - 1))],
+            'p95': values[int(0.95 * (count - 1))],
+            'max': values[-1],
+        }
+    
     def get_average_times(self) -> Dict[str, float]:
         """
         Calculate average execution times.
@@ -94,6 +160,22 @@ class MetricsCollector:
         count = len(self.metrics)
         return {k: v / count for k, v in totals.items()}
     
+    def get_nlu_stage_averages(self) -> Dict[str, float]:
+        """
+        Average time per NLU stage over commands that reported stages.
+        
+        Returns:
+            Dictionary mapping stage name to average time (ms)
+        """
+        totals: Dict[str, float] = defaultdict(float)
+        counts: Dict[str, int] = defaultdict(int)
+        for m in self.metrics:
+            for stage, elapsed in m.nlu_stages.items():
+                totals[stage] += elapsed
+                counts[stage] += 1
+        
+        return {stage: total / counts[stage] for stage, total in totals.items()}
+    
     def get_performance_report(self) -> str:
         """
         Generate a performance report.
@@ -101,7 +183,7 @@ class MetricsCollector:
         Returns:
             Formatted performance report string
         """
-        if not self.metrics:
+        if not self.metrics and not self.counters and not self.samples:
             return "No metrics collected yet."
         
         averages = self.get_average_times()
@@ -111,17 +193,41 @@ class MetricsCollector:
         report += "=" * 70 + "\n\n"
         
         report += f"Total Commands: {len(self.metrics)}\n"
-        report += f"Most Recent: {self.metrics[-1].timestamp}\n\n"
+        if self.metrics:
+            report += f"Most Recent: {self.metrics[-1].timestamp}\n"
+        report += "\n"
         
         report += "Average Pipeline Times:\n"
         report += "-" * 70 + "\n"
         report += f"  Wake Detection: {averages.get('wake', 0):.2f} ms\n"
         report += f"  Speech-to-Text: {averages.get('stt', 0):.2f} ms\n"
         report += f"  NLU Processing: {averages.get('nlu', 0):.2f} ms\n"
+        for stage, elapsed in self.get_nlu_stage_averages().items():
+            if stage != "total":
+                report += f"    {stage}: {elapsed:.2f} ms\n"
         report += f"  Skill Action:   {averages.get('action', 0):.2f} ms\n"
         report += f"  Text-to-Speech: {averages.get('tts', 0):.2f} ms\n"
         report += "-" * 70 + "\n"
         report += f"  Total Pipeline: {averages.get('total', 0):.2f} ms\n"
+        
+        if self.counters:
+            report += "\nCounters:\n"
+            report += "-" * 70 + "\n"
+            for name in sorted(self.counters):
+                report += f"  {name}: {self.counters[name]:g}\n"
+        
+        if self.samples:
+            report += "\nSamples (avg / p95 / max):\n"
+            report += "-" * 70 + "\n"
+            for name in sorted(self.samples):
+                stats = self.get_value_stats(name)
+                if stats:
+                    report += (
+                        f"  {name}: {stats['avg']:.2f} / "
+                        f"{stats['p95']:.2f} / {stats['max']:.2f} "
+                        f"(n={stats['count']})\n"
+                    )
+        
         report += "=" * 70 + "\n"
         
         return report
@@ -129,6 +235,9 @@ class MetricsCollector:
     def clear(self):
         """Clear all metrics."""
         self.metrics.clear()
+        with self._lock:
+            self.counters.clear()
+            self.samples.clear()
         logger.info("Metrics cleared")
 
 
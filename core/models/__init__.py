@@ -0,0 +1,20 @@
+"""
+Local model artifact management for Jarvis.
+Verified, offline-only model resolution.
+"""
+
+from .registry import (
+    ModelRegistry,
+    ModelSpec,
+    ModelNotFoundError,
+    ChecksumMismatchError,
+    get_model_registry,
+)
+
+__all__ = [
+    "ModelRegistry",
+    "ModelSpec",
+    "ModelNotFoundError",
+    "ChecksumMismatchError",
+    "get_model_registry",
+]
@@ -0,0 +1,455 @@
+"""
+Offline Model Registry
+
+Keeps every model artifact (faster-whisper, whisper.cpp, Piper, Silero
+VAD) in one cache directory, verifies checksums once, and warms weight
+files into the page cache with mmap.
+
+Resolving a model never touches the network - downloads only happen
+through the explicit `fetch` command:
+
+    python -m core.models.registry list
+    python -m core.models.registry fetch faster-whisper-base
+    python -m core.models.registry verify --all
+"""
+
+import os
+import sys
+import json
+import mmap
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Optional, Dict, List, Any
+from loguru import logger
+
+ROOT = Path(__file__).parent.parent.parent
+DEFAULT_CACHE_DIR = ROOT / "models"
+MANIFEST_NAME = "registry.json"
+
+HF_BASE = "https://huggingface.co"
+
+
+class ModelNotFoundError(FileNotFoundError):
+    """Model isn't in the local cache."""
+
+
+class ChecksumMismatchError(RuntimeError):
+    """Model files don't match their recorded checksums."""
+
+
+@dataclass
+class ModelSpec:
+    """
+    A known model artifact.
+
+    Attributes:
+        name: Registry name
+        kind: "faster_whisper", "whisper_cpp", "piper" or "silero_vad"
+        path: Location relative to the cache directory (file or directory)
+        source: Hugging Face repo id, download URL or torch hub repo
+        sha256: Expected checksum of a single-file artifact (optional;
+            otherwise the checksum recorded at fetch time is enforced)
+    """
+    name: str
+    kind: str
+    path: str
+    source: str
+    sha256: Optional[str] = None
+
+
+def _faster_whisper(size: str) -> ModelSpec:
+    return ModelSpec(
+        name=f"faster-whisper-{size}",
+        kind="faster_whisper",
+        path=f"faster-whisper/{size}",
+        source=size,  # Resolved to the Systran repo by faster_whisper.utils
+    )
+
+
+KNOWN_MODELS: Dict[str, ModelSpec] = {
+    spec.name: spec for spec in [
+        *(_faster_whisper(size) for size in ("tiny", "base", "small", "medium", "large")),
+        ModelSpec(
+            name="whisper-cpp-base.en",
+            kind="whisper_cpp",
+            path="ggml-base.en.bin",
+            source=f"{HF_BASE}/ggerganov/whisper.cpp/resolve/main/ggml-base.en.bin",
+        ),
+        ModelSpec(
+            name="piper-en_US-lessac-medium",
+            kind="piper",
+            path="piper/en_US-lessac-medium.onnx",
+            source=f"{HF_BASE}/rhasspy/piper-voices/resolve/main/en/en_US/lessac/medium/en_US-lessac-medium.onnx",
+        ),
+        ModelSpec(
+            name="silero-vad",
+            kind="silero_vad",
+            path="silero-vad",
+            source="snakers4/silero-vad",
+        ),
+    ]
+}
+
+
+def _sha256(path: Path) -> str:
+    """Hash a file in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ModelRegistry:
+    """
+    Local model cache with one-time verification.
+
+    Features:
+    - Fixed cache directory for all model artifacts
+    - SHA-256 checksums recorded on fetch/adoption and re-checked only
+      when a file's size or mtime changes
+    - Never downloads while resolving (fetch is explicit)
+    - mmap prefetch so repeat launches load weights from the page cache
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize registry.
+
+        Args:
+            cache_dir: Model cache directory (default: models/)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.manifest_path = self.cache_dir / MANIFEST_NAME
+        self.specs: Dict[str, ModelSpec] = dict(KNOWN_MODELS)
+        self._lock = Lock()
+        self._manifest: Dict[str, Any] = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Load recorded checksums."""
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.error(f"Failed to read model registry: {e}")
+            return {}
+
+    def _save_manifest(self):
+        """Write recorded checksums atomically."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._manifest, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.manifest_path)
+
+    def register(self, spec: ModelSpec):
+        """
+        Add or replace a model spec (e.g. another Piper voice).
+
+        Args:
+            spec: Model spec
+        """
+        self.specs[spec.name] = spec
+
+    def path(self, name: str) -> Path:
+        """
+        Get a model's location in the cache (whether or not it exists).
+
+        Args:
+            name: Registry name
+
+        Returns:
+            Absolute path
+        """
+        if name not in self.specs:
+            raise KeyError(f"Unknown model: {name}. Known: {', '.join(self.specs)}")
+        return self.cache_dir / self.specs[name].path
+
+    def _files(self, name: str) -> List[Path]:
+        """Artifact files of a model (all files for directory models)."""
+        root = self.path(name)
+        if root.is_dir():
+            return sorted(p for p in root.rglob("*") if p.is_file() and p.name != ".lock")
+        files = [root] if root.exists() else []
+        if self.specs[name].kind == "piper":
+            config = root.with_suffix(root.suffix + ".json")
+            if config.exists():
+                files.append(config)
+        return files
+
+    def is_installed(self, name: str) -> bool:
+        """
+        Check if a model's files are present in the cache.
+
+        Args:
+            name: Registry name
+
+        Returns:
+            True if present
+        """
+        return bool(self._files(name))
+
+    def verify(self, name: str, force: bool = False) -> bool:
+        """
+        Verify a model's checksums.
+
+        Files are hashed on first sight (or when their size/mtime changed)
+        and compared against the spec or the recorded checksum; unchanged
+        files are trusted without re-hashing.
+
+        Args:
+            name: Registry name
+            force: Re-hash even unchanged files
+
+        Returns:
+            True if the model is present and intact
+        """
+        files = self._files(name)
+        if not files:
+            return False
+
+        spec = self.specs[name]
+        root = self.path(name)
+        base = root if root.is_dir() else root.parent
+
+        with self._lock:
+            recorded = self._manifest.setdefault(name, {"files": {}})
+            changed = False
+
+            for file in files:
+                key = file.relative_to(base).as_posix()
+                stat = file.stat()
+                entry = recorded["files"].get(key)
+
+                if (
+                    not force and entry
+                    and entry["size"] == stat.st_size
+                    and entry["mtime_ns"] == stat.st_mtime_ns
+                ):
+                    continue
+
+                start_time = time.perf_counter()
+                digest = _sha256(file)
+                expected = entry["sha256"] if entry else None
+                if spec.sha256 and file == root:
+                    expected = spec.sha256
+
+                if expected and digest != expected:
+                    logger.error(f"Checksum mismatch for {name}: {key}")
+                    return False
+
+                recorded["files"][key] = {
+                    "sha256": digest,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                }
+                changed = True
+                logger.info(
+                    f"Verified {name}/{key} "
+                    f"({stat.st_size / 1e6:.0f}MB in {(time.perf_counter() - start_time) * 1000:.0f}ms)"
+                )
+
+            if changed:
+                recorded["verified_at"] = time.time()
+                self._save_manifest()
+
+        return True
+
+    def resolve(self, name: str, prefetch: bool = True) -> Path:
+        """
+        Get a verified model path for loading (never downloads).
+
+        Args:
+            name: Registry name
+            prefetch: Warm the weight files into the page cache
+
+        Returns:
+            Path to pass to the runtime
+
+        Raises:
+            ModelNotFoundError: Model isn't in the cache
+            ChecksumMismatchError: Model files are corrupt
+        """
+        if not self.is_installed(name):
+            raise ModelNotFoundError(
+                f"Model {name} not found in {self.cache_dir} "
+                f"(run: python -m core.models.registry fetch {name})"
+            )
+        if not self.verify(name):
+            raise ChecksumMismatchError(
+                f"Model {name} failed verification "
+                f"(re-fetch: python -m core.models.registry fetch {name})"
+            )
+        if prefetch:
+            self.prefetch(name)
+        return self.path(name)
+
+    def find(self, name: str) -> Optional[Path]:
+        """
+        Resolve a model if it's installed and intact.
+
+        Args:
+            name: Registry name
+
+        Returns:
+            Path, or None if unavailable
+        """
+        try:
+            return self.resolve(name)
+        except (ModelNotFoundError, ChecksumMismatchError, KeyError):
+            return None
+
+    def prefetch(self, name: str) -> int:
+        """
+        Map a model's files and fault their pages into the page cache.
+
+        None of the runtimes (CTranslate2, ONNX Runtime, whisper.cpp)
+        take an mmap'd buffer, so this doesn't avoid their own read;
+        it makes that read come from memory instead of disk.
+
+        Args:
+            name: Registry name
+
+        Returns:
+            Bytes touched
+        """
+        total = 0
+        for file in self._files(name):
+            size = file.stat().st_size
+            if size == 0:
+                continue
+            with open(file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                if hasattr(m, "madvise"):
+                    m.madvise(mmap.MADV_WILLNEED)
+                # One byte per page is enough to fault the whole file in
+                _ = m[::mmap.PAGESIZE]
+            total += size
+        return total
+
+    def fetch(self, name: str, force: bool = False) -> Path:
+        """
+        Download a model into the cache and record its checksums.
+
+        This is the only method that uses the network.
+
+        Args:
+            name: Registry name
+            force: Download even if already installed
+
+        Returns:
+            Model path
+        """
+        spec = self.specs[name]
+        target = self.path(name)
+
+        if self.is_installed(name) and not force:
+            logger.info(f"{name} already installed")
+        elif spec.kind == "faster_whisper":
+            from faster_whisper.utils import download_model
+            download_model(spec.source, output_dir=str(target))
+        elif spec.kind == "silero_vad":
+            import torch
+            torch.hub.load(repo_or_dir=spec.source, model="silero_vad", onnx=True, trust_repo=True)
+            owner, repo = spec.source.split("/")
+            hub_dir = Path(torch.hub.get_dir()) / f"{owner}_{repo}_master"
+            shutil.copytree(hub_dir, target, dirs_exist_ok=True)
+        else:
+            self._download(spec.source, target)
+            if spec.kind == "piper":
+                self._download(spec.source + ".json", target.with_suffix(target.suffix + ".json"))
+
+        with self._lock:
+            self._manifest.pop(name, None)
+        if not self.verify(name):
+            raise ChecksumMismatchError(f"Downloaded {name} doesn't match its expected checksum")
+        return target
+
+    @staticmethod
+    def _download(url: str, target: Path):
+        """Download a file atomically."""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Downloading {url}")
+        with tempfile.NamedTemporaryFile(dir=target.parent, delete=False) as tmp:
+            with urllib.request.urlopen(url) as response:
+                shutil.copyfileobj(response, tmp)
+        os.replace(tmp.name, target)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get install/verification status of every known model.
+
+        Returns:
+            Dictionary keyed by model name
+        """
+        status = {}
+        for name, spec in self.specs.items():
+            files = self._files(name)
+            status[name] = {
+                "kind": spec.kind,
+                "path": str(self.path(name)),
+                "installed": bool(files),
+                "size_mb": sum(f.stat().st_size for f in files) / 1e6,
+                "verified": name in self._manifest,
+            }
+        return status
+
+
+# Global instance
+_registry: Optional[ModelRegistry] = None
+
+
+def get_model_registry(cache_dir: Optional[str] = None) -> ModelRegistry:
+    """Get the global model registry instance."""
+    global _registry
+    if _registry is None:
+        _registry = ModelRegistry(cache_dir)
+    return _registry
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Manage local model artifacts")
+    parser.add_argument("command", choices=["list", "fetch", "verify"])
+    parser.add_argument("names", nargs="*", help="Model names")
+    parser.add_argument("--all", action="store_true", help="Apply to every installed model")
+    parser.add_argument("--cache-dir", help="Model cache directory")
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    registry = ModelRegistry(args.cache_dir)
+
+    if args.command == "list":
+        for name, info in registry.get_status().items():
+            state = "verified" if info["verified"] else ("installed" if info["installed"] else "-")
+            print(f"{name:<28}{info['kind']:<16}{state:<10}{info['size_mb']:>8.0f}MB")
+        return
+
+    names = args.names
+    if args.all:
+        names = [name for name in registry.specs if registry.is_installed(name)]
+
+    failed = False
+    for name in names:
+        if args.command == "fetch":
+            registry.fetch(name, force=args.force)
+        elif not registry.verify(name, force=args.force):
+            logger.error(f"{name}: missing or corrupt")
+            failed = True
+        else:
+            logger.info(f"{name}: OK")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ Handles intent detection, entity extraction, and command routing.
 from .intents import IntentClassifier, Intent, Entity, IntentType
 from .router import CommandRouter, SkillRegistry
 from .entity_extractor import EntityExtractor
+from .matcher import PatternMatcher
+from .vocabulary import CommandVocabulary, build_command_vocabulary
 
 __all__ = [
     "IntentClassifier",
@@ -14,6 +16,9 @@ __all__ = [
     "IntentType",
     "CommandRouter",
     "SkillRegistry",
-    "EntityExtractor"
+    "EntityExtractor",
+    "PatternMatcher",
+    "CommandVocabulary",
+    "build_command_vocabulary"
 ]
 
@@ -1,20 +1,79 @@
 """
 Enhanced entity extraction for more complex command parsing.
 Extracts dates, times, numbers, durations, and custom entities.
+
+All patterns are compiled once per extractor. Pattern families tried in
+priority order (times, dates) are prefiltered by one combined
+alternation, so text without any time or date costs a single scan.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from datetime import datetime, timedelta
 import re
 from loguru import logger
 
 
+class OrderedPatterns:
+    """
+    Regex family tried in priority order.
+
+    search() yields the same (type, match) pairs as calling re.search
+    with each pattern in turn, but one combined alternation (a named
+    group per pattern) finds the first candidate, so the individual
+    patterns only run when something matched.
+    """
+
+    def __init__(self, patterns: List[Tuple[str, str]]):
+        """
+        Compile a pattern family.
+        
+        Args:
+            patterns: (regex, type) pairs, highest priority first
+        """
+        self.types = [pattern_type for _, pattern_type in patterns]
+        self.compiled = [re.compile(pattern) for pattern, _ in patterns]
+        self.combined = re.compile(
+            "|".join(f"(?P<p{i}>{pattern})" for i, (pattern, _) in enumerate(patterns))
+        )
+
+    def search(self, text: str) -> Iterator[Tuple[str, "re.Match"]]:
+        """
+        Matches in priority order.
+        
+        Args:
+            text: Input text
+        
+        Yields:
+            (pattern type, match) for every pattern found in text
+        """
+        first = self.combined.search(text)
+        if first is None:
+            return
+        
+        # Nothing matched before first.start(), and the patterns ahead of
+        # the winning one failed there - they can only match further on
+        winner = int(first.lastgroup[1:])
+        start = first.start()
+        for i, pattern in enumerate(self.compiled):
+            if i < winner:
+                match = pattern.search(text, start + 1)
+            elif i == winner:
+                match = pattern.match(text, start)
+            else:
+                match = pattern.search(text)
+            if match:
+                yield self.types[i], match
+
+
 class EntityExtractor:
     """
     Enhanced entity extraction beyond spaCy's built-in capabilities.
     Handles dates, times, durations, numbers, and domain-specific entities.
     """
 
+    # extract_all() keys, in output order
+    KINDS = ("time", "date", "duration", "numbers", "percentage", "app_name", "urls", "emails")
+
     def __init__(self):
         """Initialize entity extractor."""
         # Time patterns
@@ -53,64 +112,98 @@ class EntityExtractor:
             'eighty': 80, 'ninety': 90, 'hundred': 100, 'thousand': 1000
         }
         
+        self._compile()
+        
+        self._extractors = {
+            'time': lambda text, text_lower: self._extract_time(text_lower),
+            'date': lambda text, text_lower: self._extract_date(text_lower, None),
+            'duration': lambda text, text_lower: self._extract_duration(text_lower),
+            'numbers': self._extract_numbers,
+            'percentage': lambda text, text_lower: self._extract_percentage(text_lower),
+            'app_name': lambda text, text_lower: self._extract_app_name(text_lower),
+            'urls': lambda text, text_lower: self.extract_url(text),
+            'emails': lambda text, text_lower: self.extract_email(text),
+        }
+        
         logger.debug("EntityExtractor initialized")
 
+    def _compile(self) -> None:
+        """Compile every pattern once."""
+        self._time = OrderedPatterns(self.time_patterns)
+        self._date = OrderedPatterns(self.date_patterns)
+        
+        # Durations add up, so one finditer over the alternation suffices
+        # (each match names its unit through the group it matched in)
+        self._duration = re.compile("|".join(
+            f"(?P<{unit_type}>{pattern})" for pattern, unit_type in self.duration_patterns
+        ))
+        self._duration_amount_group = {
+            unit_type: self._duration.groupindex[unit_type] + 1
+            for _, unit_type in self.duration_patterns
+        }
+        
+        self._digits = re.compile(r'\b(\d+)\b')
+        self._percentage = re.compile(r'(\d+)\s*(%|percent)')
+        self._articles = re.compile(r'\b(the|a|an)\b')
+        self._url = re.compile(r'https?://[^\s]+')
+        self._email = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
     def extract_time(self, text: str) -> Optional[Dict[str, Any]]:
         """
         Extract time from text.
         
         Args:
             text: Input text
-            
+        
         Returns:
             Dictionary with hour, minute, and datetime object
         """
-        text_lower = text.lower()
-        
-        for pattern, pattern_type in self.time_patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                if pattern_type == 'time_12h':
-                    hour = int(match.group(1))
-                    minute = int(match.group(2))
-                    am_pm = match.group(3) if len(match.groups()) > 2 else None
-                    
-                    if am_pm == 'pm' and hour < 12:
-                        hour += 12
-                    elif am_pm == 'am' and hour == 12:
-                        hour = 0
-                    
-                    return {
-                        'hour': hour,
-                        'minute': minute,
-                        'text': match.group(0),
-                        'type': 'time'
-                    }
+        return self._extract_time(text.lower())
+
+    def _extract_time(self, text_lower: str) -> Optional[Dict[str, Any]]:
+        """extract_time() on lowercased text."""
+        for pattern_type, match in self._time.search(text_lower):
+            if pattern_type == 'time_12h':
+                hour = int(match.group(1))
+                minute = int(match.group(2))
+                am_pm = match.group(3)
                 
-                elif pattern_type == 'time_simple':
-                    hour = int(match.group(1))
-                    am_pm = match.group(2)
-                    
-                    if am_pm == 'pm' and hour < 12:
-                        hour += 12
-                    elif am_pm == 'am' and hour == 12:
-                        hour = 0
-                    
-                    return {
-                        'hour': hour,
-                        'minute': 0,
-                        'text': match.group(0),
-                        'type': 'time'
-                    }
+                if am_pm == 'pm' and hour < 12:
+                    hour += 12
+                elif am_pm == 'am' and hour == 12:
+                    hour = 0
                 
-                elif pattern_type == 'time_oclock':
-                    hour = int(match.group(1))
-                    return {
-                        'hour': hour,
-                        'minute': 0,
-                        'text': match.group(0),
-                        'type': 'time'
-                    }
+                return {
+                    'hour': hour,
+                    'minute': minute,
+                    'text': match.group(0),
+                    'type': 'time'
+                }
+            
+            elif pattern_type == 'time_simple':
+                hour = int(match.group(1))
+                am_pm = match.group(2)
+                
+                if am_pm == 'pm' and hour < 12:
+                    hour += 12
+                elif am_pm == 'am' and hour == 12:
+                    hour = 0
+                
+                return {
+                    'hour': hour,
+                    'minute': 0,
+                    'text': match.group(0),
+                    'type': 'time'
+                }
+            
+            elif pattern_type == 'time_oclock':
+                hour = int(match.group(1))
+                return {
+                    'hour': hour,
+                    'minute': 0,
+                    'text': match.group(0),
+                    'type': 'time'
+                }
         
         return None
 
@@ -121,83 +214,73 @@ class EntityExtractor:
         Args:
             text: Input text
             reference_date: Reference date for relative dates
-            
+        
         Returns:
             Dictionary with date information
         """
-        if reference_date is None:
-            reference_date = datetime.now()
-        
-        text_lower = text.lower()
-        
-        for pattern, pattern_type in self.date_patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                if pattern_type == 'today':
-                    return {
-                        'date': reference_date,
-                        'text': match.group(0),
-                        'type': 'date',
-                        'relative': 'today'
-                    }
-                
-                elif pattern_type == 'tomorrow':
-                    date = reference_date + timedelta(days=1)
-                    return {
-                        'date': date,
-                        'text': match.group(0),
-                        'type': 'date',
-                        'relative': 'tomorrow'
-                    }
-                
-                elif pattern_type == 'yesterday':
-                    date = reference_date - timedelta(days=1)
-                    return {
-                        'date': date,
-                        'text': match.group(0),
-                        'type': 'date',
-                        'relative': 'yesterday'
-                    }
-                
-                elif pattern_type == 'next_weekday':
-                    weekday = match.group(1).lower()  # Fixed from group(2)
-                    date = self._get_next_weekday(reference_date, weekday)
-                    return {
-                        'date': date,
-                        'text': match.group(0),
-                        'type': 'date',
-                        'weekday': weekday
-                    }
+        return self._extract_date(text.lower(), reference_date)
+
+    def _extract_date(self, text_lower: str, reference_date: Optional[datetime]) -> Optional[Dict[str, Any]]:
+        """extract_date() on lowercased text."""
+        for pattern_type, match in self._date.search(text_lower):
+            if reference_date is None:
+                reference_date = datetime.now()
+            
+            if pattern_type == 'today':
+                return {
+                    'date': reference_date,
+                    'text': match.group(0),
+                    'type': 'date',
+                    'relative': 'today'
+                }
+            
+            elif pattern_type == 'tomorrow':
+                date = reference_date + timedelta(days=1)
+                return {
+                    'date': date,
+                    'text': match.group(0),
+                    'type': 'date',
+                    'relative': 'tomorrow'
+                }
+            
+            elif pattern_type == 'yesterday':
+                date = reference_date - timedelta(days=1)
+                return {
+                    'date': date,
+                    'text': match.group(0),
+                    'type': 'date',
+                    'relative': 'yesterday'
+                }
+            
+            elif pattern_type in ('next_weekday', 'weekday'):
+                weekday = match.group(1).lower()
+                date = self._get_next_weekday(reference_date, weekday)
+                return {
+                    'date': date,
+                    'text': match.group(0),
+                    'type': 'date',
+                    'weekday': weekday
+                }
+            
+            elif pattern_type == 'relative_date':
+                amount = int(match.group(1))
+                unit = match.group(2)
                 
-                elif pattern_type == 'weekday':
-                    weekday = match.group(1).lower()
-                    date = self._get_next_weekday(reference_date, weekday)
-                    return {
-                        'date': date,
-                        'text': match.group(0),
-                        'type': 'date',
-                        'weekday': weekday
-                    }
+                if 'day' in unit:
+                    date = reference_date + timedelta(days=amount)
+                elif 'week' in unit:
+                    date = reference_date + timedelta(weeks=amount)
+                elif 'month' in unit:
+                    date = reference_date + timedelta(days=amount * 30)
+                else:
+                    continue
                 
-                elif pattern_type == 'relative_date':
-                    amount = int(match.group(1))
-                    unit = match.group(2)
-                    
-                    if 'day' in unit:
-                        date = reference_date + timedelta(days=amount)
-                    elif 'week' in unit:
-                        date = reference_date + timedelta(weeks=amount)
-                    elif 'month' in unit:
-                        date = reference_date + timedelta(days=amount * 30)
-                    else:
-                        continue
-                    
-                    return {
-                        'date': date,
-                        'text': match.group(0),
-                        'type': 'date',
-                        'relative': f'{amount} {unit}'
-                    }
+                return {
+                    'date': date,
+                    'text': match.group(0),
+                    'type': 'date',
+                    'relative': f'{amount} {unit}'
+                }
         
         return None
 
@@ -208,7 +291,7 @@ class EntityExtractor:
         Args:
             reference_date: Starting date
             weekday: Weekday name
-            
+        
         Returns:
             Next occurrence of that weekday
         """
@@ -235,26 +318,21 @@ class EntityExtractor:
         
         Args:
             text: Input text
-            
+        
         Returns:
             Dictionary with duration in seconds
         """
-        text_lower = text.lower()
+        return self._extract_duration(text.lower())
+
+    def _extract_duration(self, text_lower: str) -> Optional[Dict[str, Any]]:
+        """extract_duration() on lowercased text."""
+        unit_seconds = {'seconds': 1, 'minutes': 60, 'hours': 3600, 'days': 86400}
         total_seconds = 0
         
-        for pattern, unit_type in self.duration_patterns:
-            matches = re.findall(pattern, text_lower)
-            for match in matches:
-                amount = int(match[0])
-                
-                if unit_type == 'seconds':
-                    total_seconds += amount
-                elif unit_type == 'minutes':
-                    total_seconds += amount * 60
-                elif unit_type == 'hours':
-                    total_seconds += amount * 3600
-                elif unit_type == 'days':
-                    total_seconds += amount * 86400
+        for match in self._duration.finditer(text_lower):
+            unit_type = match.lastgroup
+            amount = int(match.group(self._duration_amount_group[unit_type]))
+            total_seconds += amount * unit_seconds[unit_type]
         
         if total_seconds > 0:
             return {
@@ -270,15 +348,18 @@ class EntityExtractor:
         
         Args:
             text: Input text
-            
+        
         Returns:
             List of extracted numbers
         """
+        return self._extract_numbers(text, text.lower())
+
+    def _extract_numbers(self, text: str, text_lower: str) -> List[Dict[str, Any]]:
+        """extract_numbers() with the lowercased text precomputed."""
         numbers = []
         
         # Extract digit numbers
-        digit_matches = re.finditer(r'\b(\d+)\b', text)
-        for match in digit_matches:
+        for match in self._digits.finditer(text):
             numbers.append({
                 'value': int(match.group(1)),
                 'text': match.group(0),
@@ -286,16 +367,17 @@ class EntityExtractor:
                 'format': 'digit'
             })
         
-        # Extract word numbers
-        text_lower = text.lower()
-        for word, value in self.number_words.items():
-            if word in text_lower.split():
-                numbers.append({
-                    'value': value,
-                    'text': word,
-                    'type': 'number',
-                    'format': 'word'
-                })
+        # Extract word numbers (text tokenized once)
+        tokens = set(text_lower.split())
+        if tokens:
+            for word, value in self.number_words.items():
+                if word in tokens:
+                    numbers.append({
+                        'value': value,
+                        'text': word,
+                        'type': 'number',
+                        'format': 'word'
+                    })
         
         return numbers
 
@@ -305,12 +387,16 @@ class EntityExtractor:
         
         Args:
             text: Input text
-            
+        
         Returns:
             Dictionary with percentage value
         """
+        return self._extract_percentage(text.lower())
+
+    def _extract_percentage(self, text_lower: str) -> Optional[Dict[str, Any]]:
+        """extract_percentage() on lowercased text."""
         # Pattern: "50%", "50 percent", "fifty percent"
-        match = re.search(r'(\d+)\s*(%|percent)', text.lower())
+        match = self._percentage.search(text_lower)
         if match:
             return {
                 'value': int(match.group(1)),
@@ -318,15 +404,15 @@ class EntityExtractor:
                 'type': 'percentage'
             }
         
-        # Word numbers with percent
-        text_lower = text.lower()
-        for word, value in self.number_words.items():
-            if word in text_lower and 'percent' in text_lower:
-                return {
-                    'value': value,
-                    'text': f'{word} percent',
-                    'type': 'percentage'
-                }
+        # Word numbers with percent (only scanned when "percent" is there)
+        if 'percent' in text_lower:
+            for word, value in self.number_words.items():
+                if word in text_lower:
+                    return {
+                        'value': value,
+                        'text': f'{word} percent',
+                        'type': 'percentage'
+                    }
         
         return None
 
@@ -336,14 +422,17 @@ class EntityExtractor:
         
         Args:
             text: Input text
-            
+        
         Returns:
             Dictionary with app name
         """
+        return self._extract_app_name(text.lower())
+
+    def _extract_app_name(self, text_lower: str) -> Optional[Dict[str, Any]]:
+        """extract_app_name() on lowercased text."""
         # Common trigger words
         triggers = ['open', 'launch', 'start', 'run', 'focus', 'switch to', 'show']
         
-        text_lower = text.lower()
         for trigger in triggers:
             if trigger in text_lower:
                 # Extract words after trigger
@@ -351,7 +440,7 @@ class EntityExtractor:
                 if len(parts) > 1:
                     app_name = parts[1].strip()
                     # Remove common stopwords
-                    app_name = re.sub(r'\b(the|a|an)\b', '', app_name).strip()
+                    app_name = self._articles.sub('', app_name).strip()
                     # Get first few words (likely app name)
                     app_words = app_name.split()[:3]
                     app_name = ' '.join(app_words)
@@ -371,22 +460,18 @@ class EntityExtractor:
         
         Args:
             text: Input text
-            
+        
         Returns:
             List of extracted URLs
         """
-        url_pattern = r'https?://[^\s]+'
-        matches = re.finditer(url_pattern, text)
-        
-        urls = []
-        for match in matches:
-            urls.append({
+        return [
+            {
                 'value': match.group(0),
                 'text': match.group(0),
                 'type': 'url'
-            })
-        
-        return urls
+            }
+            for match in self._url.finditer(text)
+        ]
 
     def extract_email(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -394,46 +479,40 @@ class EntityExtractor:
         
         Args:
             text: Input text
-            
+        
         Returns:
             List of extracted emails
         """
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        matches = re.finditer(email_pattern, text)
+        # Every address contains "@" - skip the regex scan otherwise
+        if '@' not in text:
+            return []
         
-        emails = []
-        for match in matches:
-            emails.append({
+        return [
+            {
                 'value': match.group(0),
                 'text': match.group(0),
                 'type': 'email'
-            })
-        
-        return emails
+            }
+            for match in self._email.finditer(text)
+        ]
 
-    def extract_all(self, text: str) -> Dict[str, Any]:
+    def extract_all(self, text: str, kinds: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
         Extract all entity types from text.
         
         Args:
             text: Input text
-            
+            kinds: Entity kinds to extract (see KINDS); default: all
+        
         Returns:
             Dictionary with all extracted entities
         """
-        entities = {
-            'time': self.extract_time(text),
-            'date': self.extract_date(text),
-            'duration': self.extract_duration(text),
-            'numbers': self.extract_numbers(text),
-            'percentage': self.extract_percentage(text),
-            'app_name': self.extract_app_name(text),
-            'urls': self.extract_url(text),
-            'emails': self.extract_email(text)
-        }
-        
-        # Remove None values
-        entities = {k: v for k, v in entities.items() if v}
+        text_lower = text.lower()
+        entities = {}
+        for kind in self.KINDS if kinds is None else kinds:
+            value = self._extractors[kind](text, text_lower)
+            # Remove None values
+            if value:
+                entities[kind] = value
         
         return entities
-
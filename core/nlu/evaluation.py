@@ -0,0 +1,288 @@
+"""
+NLU evaluation helpers.
+
+Generates a labelled corpus from the intent pattern table, scores intent
+and entity accuracy, times the NLU stages and compares the numbers with
+a stored baseline. Shared by benchmarks/nlu_suite.py and its test.
+
+Each pattern is wrapped in paraphrase templates ("can you {command}
+please"); patterns of intents that take an argument get an entity slot
+filled in ("set volume to" + "70 percent"), with the entity the
+classifier should extract from it.
+"""
+
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .intents import IntentClassifier, IntentType
+
+
+# Carrier phrases around a command
+TEMPLATES = [
+    "{command}",
+    "please {command}",
+    "hey jarvis {command}",
+    "can you {command}",
+    "{command} please",
+    "jarvis {command} now",
+]
+
+# Per intent: (slot text, expected entity type, expected value) - an
+# entity type of None means nothing is checked for that slot
+SLOTS: Dict[IntentType, List[Tuple[str, Optional[str], Any]]] = {
+    IntentType.VOLUME_SET: [
+        ("20", "volume_level", 20), ("to 35", "volume_level", 35),
+        ("70 percent", "volume_level", 70), ("90%", "volume_level", 90),
+    ],
+    IntentType.OPEN_APP: [
+        ("chrome", "app_name", "chrome"), ("spotify", "app_name", "spotify"),
+        ("notepad", "app_name", "notepad"), ("visual studio code", "app_name", "visual studio code"),
+    ],
+    IntentType.CLOSE_APP: [
+        ("chrome", "app_name", "chrome"), ("spotify", "app_name", "spotify"),
+        ("notepad", "app_name", "notepad"),
+    ],
+    IntentType.FOCUS_WINDOW: [
+        ("chrome", "app_name", "chrome"), ("firefox", "app_name", "firefox"),
+    ],
+    IntentType.SET_TIMER: [
+        ("5 minutes", "duration", 300), ("for 90 seconds", "duration", 90),
+        ("for 2 hours", "duration", 7200),
+    ],
+    IntentType.SET_ALARM: [
+        ("at 7am", "time", 7), ("for 6:30 pm", "time", 18),
+    ],
+    IntentType.CREATE_REMINDER: [
+        ("to call mom at 5pm", "time", 17), ("to stretch in 10 minutes", "duration", 600),
+        ("to buy milk", None, None),
+    ],
+    IntentType.CREATE_EVENT: [
+        ("lunch with sarah at 1pm", "time", 13), ("team sync tomorrow at 3pm", "time", 15),
+    ],
+    IntentType.SEARCH_WEB: [
+        ("python tutorials", None, None), ("cheap flights to tokyo", None, None),
+    ],
+    IntentType.OPEN_URL: [
+        ("github.com", "url", "github.com"), ("example.org", "url", "example.org"),
+    ],
+    IntentType.ASK_QUESTION: [
+        ("the capital of france", None, None), ("quantum computing", None, None),
+    ],
+    IntentType.REMEMBER_FACT: [
+        ("that my car is in row 4", None, None), ("my locker is 12", None, None),
+    ],
+    IntentType.FORGET_FACT: [
+        ("my wifi password", None, None),
+    ],
+}
+
+
+@dataclass
+class LabelledUtterance:
+    """
+    One corpus entry.
+
+    Attributes:
+        text: Utterance
+        intent: Expected intent
+        entity: Expected (entity type, value), if the slot carries one
+    """
+    text: str
+    intent: IntentType
+    entity: Optional[Tuple[str, Any]] = None
+
+
+def fill_slot(pattern: str, slot: str) -> str:
+    """Append a slot to a pattern without doubling a shared word ("volume to" + "to 35")."""
+    pattern_words, slot_words = pattern.split(), slot.split()
+    if pattern_words and slot_words and pattern_words[-1] == slot_words[0]:
+        slot_words = slot_words[1:]
+    return " ".join(pattern_words + slot_words)
+
+
+def build_corpus(
+    patterns: Dict[IntentType, List[str]],
+    seed: int = 0
+) -> List[LabelledUtterance]:
+    """
+    Labelled utterances from a pattern table.
+
+    Patterns listed under several intents are skipped (their label is
+    ambiguous by construction).
+
+    Args:
+        patterns: Intent -> patterns (IntentClassifier.patterns)
+        seed: Slot and template choice seed
+
+    Returns:
+        One utterance per pattern and template
+    """
+    rng = random.Random(seed)
+    owners: Dict[str, set] = {}
+    for intent_type, intent_patterns in patterns.items():
+        for pattern in intent_patterns:
+            owners.setdefault(pattern, set()).add(intent_type)
+
+    corpus = []
+    for intent_type, intent_patterns in patterns.items():
+        for pattern in intent_patterns:
+            if len(owners[pattern]) > 1:
+                continue
+            for template in TEMPLATES:
+                command, entity = pattern, None
+                if intent_type in SLOTS:
+                    slot, entity_type, value = rng.choice(SLOTS[intent_type])
+                    command = fill_slot(pattern, slot)
+                    entity = (entity_type, value) if entity_type else None
+                corpus.append(LabelledUtterance(template.format(command=command), intent_type, entity))
+    return corpus
+
+
+def entity_value(value: Any) -> Any:
+    """Comparable entity value (extracted times are compared by hour)."""
+    if isinstance(value, dict) and "hour" in value:
+        return value["hour"]
+    return value
+
+
+def score(classifier: IntentClassifier, corpus: List[LabelledUtterance]) -> Dict[str, Any]:
+    """
+    Intent and entity accuracy of a classifier on a corpus.
+
+    Args:
+        classifier: Classifier under test
+        corpus: Labelled utterances
+
+    Returns:
+        Top-1 intent accuracy, entity accuracy (over utterances with an
+        expected entity and the right intent), per-intent accuracy and
+        a sample of misclassified utterances
+    """
+    correct, entity_total, entity_correct = 0, 0, 0
+    per_intent: Dict[str, List[int]] = {}
+    errors = []
+    for utterance in corpus:
+        intent = classifier.classify(utterance.text)
+        hit = intent.type == utterance.intent
+        correct += hit
+        counts = per_intent.setdefault(utterance.intent.value, [0, 0])
+        counts[0] += hit
+        counts[1] += 1
+        if not hit:
+            errors.append((utterance.text, utterance.intent.value, intent.type.value))
+        elif utterance.entity:
+            entity_total += 1
+            entity_type, value = utterance.entity
+            entity_correct += any(
+                e.type == entity_type and entity_value(e.value) == value
+                for e in intent.entities
+            )
+
+    return {
+        "utterances": len(corpus),
+        "intent_top1": correct / len(corpus),
+        "entities": entity_correct / entity_total if entity_total else 1.0,
+        "per_intent": {name: hits / total for name, (hits, total) in sorted(per_intent.items())},
+        "errors": errors[:25],
+    }
+
+
+def latency(
+    fn: Callable[[str], object],
+    texts: List[str],
+    repeats: int = 3,
+    warmup: int = 1
+) -> Dict[str, float]:
+    """
+    Per-call latency percentiles.
+
+    Untimed warm-up passes go first, so lazily built indexes and cold
+    CPU caches don't land in the timings.
+
+    Args:
+        fn: Function under test
+        texts: Inputs
+        repeats: Timed passes over the inputs
+        warmup: Untimed passes before timing
+
+    Returns:
+        p50/p95/p99 in microseconds
+    """
+    for _ in range(warmup):
+        for text in texts:
+            fn(text)
+
+    timings = []
+    for _ in range(repeats):
+        for text in texts:
+            start_time = time.perf_counter()
+            fn(text)
+            timings.append((time.perf_counter() - start_time) * 1e6)
+    timings = np.array(timings)
+    return {
+        "p50_us": float(np.percentile(timings, 50)),
+        "p95_us": float(np.percentile(timings, 95)),
+        "p99_us": float(np.percentile(timings, 99)),
+    }
+
+
+@dataclass
+class Tolerances:
+    """
+    How far results may fall behind the baseline.
+
+    Attributes:
+        accuracy: Max absolute accuracy drop
+        latency: Max relative latency increase (1.0 = twice as slow)
+        percentiles: Latency percentiles that are gated (p99 is too noisy)
+    """
+    accuracy: float = 0.01
+    latency: float = 1.0
+    percentiles: Tuple[str, ...] = field(default=("p50_us", "p95_us"))
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerances: Optional[Tolerances] = None
+) -> List[str]:
+    """
+    Regressions of benchmark results against a baseline.
+
+    Latencies are only compared when both runs used the same spaCy
+    model (a blank pipeline skips NER entirely).
+
+    Args:
+        results: Results of this run
+        baseline: Stored results
+        tolerances: Allowed differences
+
+    Returns:
+        One message per regression (empty if none)
+    """
+    tolerances = tolerances or Tolerances()
+    regressions = []
+
+    for metric in ("intent_top1", "entities"):
+        current = results["accuracy"][metric]
+        reference = baseline["accuracy"][metric]
+        if current < reference - tolerances.accuracy:
+            regressions.append(f"accuracy.{metric}: {current:.2%} < baseline {reference:.2%}")
+
+    if results.get("spacy_model") != baseline.get("spacy_model"):
+        return regressions
+
+    for stage, stats in baseline["latency"].items():
+        for percentile in tolerances.percentiles:
+            current = results["latency"][stage][percentile]
+            limit = stats[percentile] * (1 + tolerances.latency)
+            if current > limit:
+                regressions.append(
+                    f"latency.{stage}.{percentile}: {current:.1f}us > {limit:.1f}us "
+                    f"(baseline {stats[percentile]:.1f}us)"
+                )
+    return regressions
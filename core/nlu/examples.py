@@ -0,0 +1,185 @@
+"""
+Example utterances for training the fast intent classifier.
+
+Natural phrasings the keyword patterns miss or only partly cover. The
+pattern table itself is added to the training data; these teach the
+model the surrounding wording. UNKNOWN examples are out-of-domain chatter
+the model should not force into a command.
+"""
+
+from typing import Dict, List
+
+from .intents import IntentType
+
+
+INTENT_EXAMPLES: Dict[IntentType, List[str]] = {
+    IntentType.VOLUME_UP: [
+        "make it louder", "turn the sound up", "can you turn the volume up a bit",
+        "pump up the volume", "bump the volume", "i can't hear it", "more volume",
+        "increase the sound", "raise the volume please", "volume higher",
+    ],
+    IntentType.VOLUME_DOWN: [
+        "make it quieter", "turn the sound down", "it's too loud", "lower the sound",
+        "bring the volume down", "less volume", "volume lower", "decrease the sound",
+        "not so loud", "reduce the sound a bit",
+    ],
+    IntentType.VOLUME_SET: [
+        "put the volume at 30", "volume 50 percent", "make the volume 70",
+        "set the sound to 40", "change the volume to twenty", "sound level 60",
+        "put volume on 80 percent", "volume to half",
+    ],
+    IntentType.MUTE: [
+        "mute the sound", "kill the sound", "no sound", "turn the audio off",
+        "mute everything", "silence the speakers", "mute the computer",
+    ],
+    IntentType.UNMUTE: [
+        "bring the sound back", "turn the audio back on", "unmute the speakers",
+        "sound back on", "restore the sound", "turn audio on",
+    ],
+    IntentType.OPEN_APP: [
+        "open up spotify", "fire up chrome", "can you open notepad", "launch the calculator",
+        "start word", "bring up excel", "run visual studio code", "open the browser",
+        "get me the terminal", "load up discord",
+    ],
+    IntentType.CLOSE_APP: [
+        "close chrome", "quit spotify", "shut notepad", "exit the calculator",
+        "kill the browser", "close down word", "get rid of this app", "terminate discord",
+    ],
+    IntentType.FOCUS_WINDOW: [
+        "switch over to chrome", "go to the spotify window", "focus the browser",
+        "bring chrome to the front", "show me notepad", "jump to excel",
+    ],
+    IntentType.MINIMIZE_WINDOW: [
+        "minimize this", "hide this window", "minimise the window", "shrink the window",
+        "put this window away", "minimize chrome",
+    ],
+    IntentType.MAXIMIZE_WINDOW: [
+        "maximize this", "make this full screen", "maximise the window",
+        "make the window bigger", "go full screen", "enlarge the window",
+    ],
+    IntentType.CREATE_REMINDER: [
+        "remind me to call mom at 5pm", "remind me about the meeting", "set a reminder to buy milk",
+        "don't let me forget to water the plants", "remind me in 10 minutes to stretch",
+        "create a reminder for tomorrow", "i need a reminder to pay rent",
+    ],
+    IntentType.LIST_REMINDERS: [
+        "what are my reminders", "do i have any reminders", "read my reminders",
+        "show me all my reminders", "list my reminders", "any reminders today",
+    ],
+    IntentType.CANCEL_REMINDER: [
+        "cancel my reminder", "delete the reminder", "remove my last reminder",
+        "get rid of that reminder", "drop the reminder about milk",
+    ],
+    IntentType.SET_TIMER: [
+        "set a timer for 10 minutes", "timer 5 minutes", "start a 20 minute timer",
+        "count down 30 seconds", "give me a 3 minute timer", "time 15 minutes",
+        "set a ten minute timer", "start counting down from one minute",
+    ],
+    IntentType.SET_ALARM: [
+        "set an alarm for 7am", "wake me up at 6", "alarm tomorrow morning at 8",
+        "set alarm 6:30", "wake me up in an hour", "i need an alarm at 9",
+    ],
+    IntentType.CREATE_EVENT: [
+        "schedule a meeting with bob tomorrow", "add lunch with sarah to my calendar",
+        "book a call with the team at 3pm", "create a meeting on friday",
+        "put dentist appointment on my calendar", "set up a meeting with alice",
+        "new calendar event tomorrow at noon",
+    ],
+    IntentType.LIST_EVENTS: [
+        "what's on my calendar today", "what meetings do i have", "show my schedule",
+        "what's my schedule tomorrow", "any events this week", "read my calendar",
+        "what do i have today",
+    ],
+    IntentType.CANCEL_EVENT: [
+        "cancel my meeting with bob", "delete the event tomorrow", "cancel the 3pm meeting",
+        "remove lunch from my calendar", "call off the meeting",
+    ],
+    IntentType.SEARCH_WEB: [
+        "search the web for pasta recipes", "look up the population of france",
+        "google how to tie a tie", "find me information on black holes",
+        "search for cheap flights", "look for python tutorials online",
+        "can you search for the news",
+    ],
+    IntentType.OPEN_URL: [
+        "go to youtube.com", "open github.com", "navigate to google.com",
+        "visit wikipedia.org", "open the website reddit.com", "take me to amazon.com",
+    ],
+    IntentType.ASK_QUESTION: [
+        "what is quantum computing", "who is the president of france", "where is mount everest",
+        "explain photosynthesis", "tell me about the roman empire", "how do airplanes fly",
+        "what is the capital of spain", "define entropy",
+    ],
+    IntentType.GET_TIME: [
+        "what's the time", "what time is it now", "do you know the time",
+        "got the time", "time now", "tell me what time it is", "what's the time right now",
+        "current time please",
+    ],
+    IntentType.GET_DATE: [
+        "what's today's date", "what day is today", "which day is it",
+        "what is the date", "today's date please", "what's the date today",
+        "tell me today's date",
+    ],
+    IntentType.GET_WEATHER: [
+        "how's the weather today", "is it going to rain", "what's the temperature outside",
+        "weather in paris", "do i need an umbrella", "is it cold outside",
+        "what's the forecast for tomorrow", "how hot is it",
+    ],
+    IntentType.REMEMBER_FACT: [
+        "remember that my car is in row 4", "remember my wifi password is banana",
+        "note that the meeting moved", "keep in mind that bob likes tea",
+        "save this my locker is 12", "store that my flight is at noon",
+    ],
+    IntentType.RECALL_FACT: [
+        "where did i park", "what did i tell you about bob", "do you remember my locker",
+        "what was my wifi password", "recall what i said about the meeting",
+        "what did i ask you to remember",
+    ],
+    IntentType.FORGET_FACT: [
+        "forget my wifi password", "forget what i told you", "delete that memory",
+        "erase what i said about bob", "remove that note",
+    ],
+    IntentType.GET_SYSTEM_INFO: [
+        "how is my computer doing", "show me the system information", "computer specs",
+        "what are my system stats", "system report", "how's the pc running",
+    ],
+    IntentType.GET_BATTERY: [
+        "how much battery do i have", "battery left", "what's the battery at",
+        "am i running low on battery", "how much charge is left", "battery check",
+        "is my laptop charged",
+    ],
+    IntentType.PLAY_MEDIA: [
+        "play some music", "play my playlist", "put on some jazz", "resume the music",
+        "start the song", "play spotify", "continue playing",
+    ],
+    IntentType.PAUSE_MEDIA: [
+        "pause the music", "pause it", "stop the song for a second", "hold the music",
+        "pause playback", "pause the video",
+    ],
+    IntentType.NEXT_TRACK: [
+        "next song please", "skip this song", "skip this track", "play the next one",
+        "next one", "skip it",
+    ],
+    IntentType.PREVIOUS_TRACK: [
+        "previous song", "play the last song again", "go back a track",
+        "play the previous one", "back one song",
+    ],
+    IntentType.HELP: [
+        "what can you do", "what can i say", "how do i use you", "show me what you can do",
+        "what commands do you know", "i need help", "what are your features",
+    ],
+    IntentType.STOP: [
+        "stop", "stop it", "stop talking", "never mind", "forget about it", "that's enough",
+    ],
+    IntentType.CANCEL: [
+        "cancel that", "abort", "undo that", "cancel the last command", "scratch that",
+    ],
+    IntentType.THANK_YOU: [
+        "thanks a lot", "thank you so much", "cheers", "much appreciated", "nice job thanks",
+        "thanks jarvis",
+    ],
+    IntentType.UNKNOWN: [
+        "hello there", "i like turtles", "the quick brown fox", "banana bread",
+        "my cat is sleeping", "blue green yellow", "once upon a time", "hmm",
+        "yes", "no", "okay", "lorem ipsum dolor", "it is what it is", "la la la",
+    ],
+}
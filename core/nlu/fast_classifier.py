@@ -0,0 +1,330 @@
+"""
+Fast intent classifier.
+
+A spaCy-free linear model over hashed character n-grams, trained with
+NumPy from the intent pattern table plus example utterances and stored
+as a compact .npz artifact. Prediction is one sparse dot product, well
+under a millisecond, and tolerates rephrasings the substring patterns
+miss ("can you turn the sound up").
+"""
+
+import sys
+import json
+import time
+import zlib
+import random
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.metrics import get_metrics_collector
+
+
+# Hashed feature space (weights are n_features x labels, stored as float16)
+N_FEATURES = 2 ** 14
+
+# Character n-gram sizes (plus word unigrams and bigrams)
+NGRAM_SIZES = (2, 3, 4)
+
+# Bumped whenever features or training change, so old artifacts retrain
+FORMAT_VERSION = 1
+
+# Carrier phrases for augmenting training utterances
+PREFIXES = ["please", "jarvis", "hey jarvis", "can you", "could you", "i want to", "now"]
+SUFFIXES = ["please", "now", "for me", "jarvis", "thanks"]
+
+
+def hash_features(text: str, n_features: int = N_FEATURES) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hashed n-gram features of a text.
+
+    Args:
+        text: Input text
+        n_features: Size of the hashed feature space
+
+    Returns:
+        Tuple of (feature indices, L2-normalized values)
+    """
+    words = text.lower().split()
+    padded = (" " + " ".join(words) + " ").encode("utf-8")
+    crc32 = zlib.crc32
+
+    hashes = [
+        crc32(padded[i:i + n])
+        for n in NGRAM_SIZES
+        for i in range(len(padded) - n + 1)
+    ]
+    # Whole words and word pairs, salted apart from the character n-grams
+    hashes += [crc32(b"w:" + word.encode("utf-8")) for word in words]
+    hashes += [
+        crc32(b"b:" + f"{first} {second}".encode("utf-8"))
+        for first, second in zip(words, words[1:])
+    ]
+
+    indices, counts = np.unique(np.array(hashes, dtype=np.int64) % n_features, return_counts=True)
+    values = counts.astype(np.float32)
+    values /= np.sqrt(np.dot(values, values))
+    return indices, values
+
+
+def training_fingerprint(examples: Dict[str, List[str]], n_features: int) -> str:
+    """Stable hash of everything a trained model depends on."""
+    payload = json.dumps(
+        {"version": FORMAT_VERSION, "n_features": n_features, "examples": examples},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class FastIntentClassifier:
+    """
+    Softmax linear model over hashed character n-grams.
+
+    Features:
+    - No tokenizer or model download: features are CRC32-hashed
+      character 2-4-grams plus word unigrams/bigrams
+    - Trained in seconds from the pattern table and example corpus
+    - Stored as float16 weights in a compressed .npz (a few hundred KB)
+    - Retrained automatically when its training data changes
+    """
+
+    def __init__(
+        self,
+        weights: np.ndarray,
+        bias: np.ndarray,
+        labels: List[str],
+        n_features: int = N_FEATURES,
+        fingerprint: str = ""
+    ):
+        """
+        Wrap trained parameters.
+
+        Args:
+            weights: n_features x labels weight matrix
+            bias: Per-label bias
+            labels: Label names (intent values)
+            n_features: Hashed feature space size
+            fingerprint: training_fingerprint() of the training data
+        """
+        self.weights = weights.astype(np.float32)
+        self.bias = bias.astype(np.float32)
+        self.labels = list(labels)
+        self.n_features = n_features
+        self.fingerprint = fingerprint
+        self.metrics = get_metrics_collector()
+
+    @classmethod
+    def train(
+        cls,
+        examples: Dict[str, List[str]],
+        n_features: int = N_FEATURES,
+        epochs: int = 150,
+        learning_rate: float = 0.05,
+        l2: float = 1e-5,
+        augment: int = 2,
+        seed: int = 0
+    ) -> "FastIntentClassifier":
+        """
+        Train a model.
+
+        Args:
+            examples: Label -> utterances
+            n_features: Hashed feature space size
+            epochs: Full-batch Adam steps
+            learning_rate: Adam step size
+            l2: Weight decay
+            augment: Extra copies of each utterance wrapped in carrier
+                phrases ("can you ... please")
+            seed: Augmentation seed
+
+        Returns:
+            Trained classifier
+        """
+        start_time = time.perf_counter()
+        rng = random.Random(seed)
+        labels = list(examples)
+
+        texts, targets = [], []
+        for label_id, label in enumerate(labels):
+            for text in examples[label]:
+                texts.append(text)
+                targets.append(label_id)
+                for _ in range(augment):
+                    prefix = rng.choice(PREFIXES) if rng.random() < 0.7 else ""
+                    suffix = rng.choice(SUFFIXES) if rng.random() < 0.4 else ""
+                    texts.append(f"{prefix} {text} {suffix}")
+                    targets.append(label_id)
+
+        from scipy.sparse import csr_matrix
+
+        # Sparse design matrix over the feature columns seen in training
+        # (all other weights stay zero)
+        features = [hash_features(text, n_features) for text in texts]
+        cols = np.concatenate([indices for indices, _ in features])
+        used_cols, local_cols = np.unique(cols, return_inverse=True)
+        x = csr_matrix(
+            (
+                np.concatenate([values for _, values in features]),
+                local_cols,
+                np.cumsum([0] + [len(indices) for indices, _ in features]),
+            ),
+            shape=(len(texts), len(used_cols)),
+        )
+        x_t = x.T.tocsr()
+
+        n, k = len(texts), len(labels)
+        y = np.zeros((n, k), dtype=np.float32)
+        y[np.arange(n), targets] = 1.0
+
+        w = np.zeros((len(used_cols), k), dtype=np.float32)
+        b = np.zeros(k, dtype=np.float32)
+        moments = [np.zeros_like(w), np.zeros_like(w), np.zeros_like(b), np.zeros_like(b)]
+        beta1, beta2, eps = 0.9, 0.999, 1e-8
+
+        for step in range(1, epochs + 1):
+            logits = x @ w + b
+            logits -= logits.max(axis=1, keepdims=True)
+            probs = np.exp(logits)
+            probs /= probs.sum(axis=1, keepdims=True)
+
+            delta = (probs - y) / n
+            grad_w = x_t @ delta + l2 * w
+            grad_b = delta.sum(axis=0)
+
+            for param, grad, m, v in ((w, grad_w, moments[0], moments[1]), (b, grad_b, moments[2], moments[3])):
+                m *= beta1
+                m += (1 - beta1) * grad
+                v *= beta2
+                v += (1 - beta2) * grad * grad
+                param -= learning_rate * (m / (1 - beta1 ** step)) / (np.sqrt(v / (1 - beta2 ** step)) + eps)
+
+        weights = np.zeros((n_features, k), dtype=np.float32)
+        weights[used_cols] = w
+        accuracy = float((probs.argmax(axis=1) == np.array(targets)).mean())
+        logger.info(
+            f"Trained fast intent classifier: {len(labels)} labels, {n} utterances, "
+            f"train accuracy {accuracy:.1%} in {time.perf_counter() - start_time:.1f}s"
+        )
+        return cls(weights, b, labels, n_features, training_fingerprint(examples, n_features))
+
+    def save(self, path: str) -> None:
+        """
+        Write the model as a compressed .npz artifact.
+
+        Args:
+            path: Target file
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            weights=self.weights.astype(np.float16),
+            bias=self.bias,
+            labels=np.array(self.labels),
+            n_features=np.array(self.n_features),
+            fingerprint=np.array(self.fingerprint),
+        )
+        logger.info(f"Saved fast intent classifier to {path} ({Path(path).stat().st_size / 1e6:.1f} MB)")
+
+    @classmethod
+    def load(cls, path: str) -> "FastIntentClassifier":
+        """
+        Read a model saved with save().
+
+        Args:
+            path: .npz artifact
+
+        Returns:
+            Classifier
+        """
+        with np.load(path) as data:
+            return cls(
+                data["weights"],
+                data["bias"],
+                [str(label) for label in data["labels"]],
+                int(data["n_features"]),
+                str(data["fingerprint"]),
+            )
+
+    @classmethod
+    def load_or_train(
+        cls,
+        path: Optional[str],
+        examples: Dict[str, List[str]],
+        n_features: int = N_FEATURES
+    ) -> "FastIntentClassifier":
+        """
+        Load the artifact if it was trained on these examples, else
+        train (and save) a new one.
+
+        Args:
+            path: .npz artifact (None: train without saving)
+            examples: Label -> utterances
+            n_features: Hashed feature space size
+
+        Returns:
+            Classifier
+        """
+        fingerprint = training_fingerprint(examples, n_features)
+        if path and Path(path).exists():
+            try:
+                model = cls.load(path)
+                if model.fingerprint == fingerprint:
+                    logger.info(f"Loaded fast intent classifier from {path}")
+                    return model
+                logger.info("Fast intent classifier training data changed, retraining")
+            except Exception as e:
+                logger.warning(f"Failed to load fast intent classifier from {path}: {e}")
+
+        model = cls.train(examples, n_features)
+        if path:
+            try:
+                model.save(path)
+            except OSError as e:
+                logger.warning(f"Failed to save fast intent classifier to {path}: {e}")
+        return model
+
+    def predict_proba(self, text: str) -> np.ndarray:
+        """
+        Label probabilities for a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Probability per label (same order as self.labels)
+        """
+        indices, values = hash_features(text, self.n_features)
+        logits = values @ self.weights[indices] + self.bias
+        logits -= logits.max()
+        probs = np.exp(logits)
+        return probs / probs.sum()
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        """
+        Most likely label for a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Tuple of (label, probability)
+        """
+        start_time = time.perf_counter()
+        probs = self.predict_proba(text)
+        best = int(probs.argmax())
+        self.metrics.record_value("nlu.fast_ms", (time.perf_counter() - start_time) * 1000)
+        return self.labels[best], float(probs[best])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Model size."""
+        return {
+            "labels": len(self.labels),
+            "n_features": self.n_features,
+            "nonzero_rows": int(np.count_nonzero(np.any(self.weights != 0, axis=1))),
+            "fingerprint": self.fingerprint,
+        }
@@ -0,0 +1,225 @@
+"""
+Typo-tolerant pattern matching.
+
+STT near misses ("turn up the volum") fail the exact substring patterns.
+FuzzyMatcher corrects unknown words to their nearest pattern vocabulary
+word through a SymSpell-style deletion index, then matches the corrected
+text with the exact automaton. A lookup costs the same however many
+patterns there are.
+"""
+
+from itertools import combinations
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from .matcher import PatternMatcher
+
+
+# Confidence multiplier per corrected word
+CORRECTION_PENALTY = 0.9
+
+# Words shorter than this are never corrected ("to" vs "do" is not a typo)
+MIN_WORD_LENGTH = 4
+
+# Endings that make another form of the same word ("command" vs
+# "commands"), not a typo of it
+INFLECTIONS = ("s", "es", "ed", "ing")
+
+
+def is_inflection(word: str, other: str) -> bool:
+    """Whether one word is the other plus an inflectional ending."""
+    short, long = sorted((word, other), key=len)
+    return any(long == short + ending for ending in INFLECTIONS)
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent
+    transpositions), with early exit.
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Distances above this are not computed exactly
+
+    Returns:
+        Distance, or max_distance + 1 if it exceeds max_distance
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return previous[-1] if previous[-1] <= max_distance else max_distance + 1
+
+
+def deletes(word: str, max_distance: int) -> Set[str]:
+    """
+    Every string obtained by deleting up to max_distance characters.
+
+    Args:
+        word: Input word
+        max_distance: Max deletions
+
+    Returns:
+        Set of variants (including word itself)
+    """
+    variants = {word}
+    for count in range(1, min(max_distance, len(word)) + 1):
+        for positions in combinations(range(len(word)), count):
+            variants.add("".join(c for i, c in enumerate(word) if i not in positions))
+    return variants
+
+
+class DeletionIndex:
+    """
+    SymSpell-style index for nearest-word lookup.
+
+    Every vocabulary word is stored under all its deletion variants; a
+    query's own deletion variants then find every word within the edit
+    distance in a handful of dictionary lookups.
+    """
+
+    def __init__(self, words: Dict[str, int], max_distance: int = 2):
+        """
+        Build the index.
+
+        Args:
+            words: Vocabulary word -> frequency (ties go to frequent words)
+            max_distance: Largest supported lookup distance
+        """
+        self.words = dict(words)
+        self.max_distance = max_distance
+        self.index: Dict[str, List[str]] = {}
+        for word in self.words:
+            for variant in deletes(word, max_distance):
+                self.index.setdefault(variant, []).append(word)
+
+    def lookup(
+        self,
+        word: str,
+        max_distance: int,
+        same_first_letter: bool = False
+    ) -> Optional[Tuple[str, int]]:
+        """
+        Nearest vocabulary word.
+
+        Args:
+            word: Query word
+            max_distance: Max edit distance (<= the index's)
+            same_first_letter: Only consider words starting like the query
+
+        Returns:
+            Tuple of (word, distance), or None if nothing is close enough
+        """
+        if word in self.words:
+            return word, 0
+
+        max_distance = min(max_distance, self.max_distance)
+        candidates = set()
+        for variant in deletes(word, max_distance):
+            candidates.update(self.index.get(variant, ()))
+
+        best = None
+        for candidate in candidates:
+            if same_first_letter and candidate[0] != word[0]:
+                continue
+            distance = edit_distance(word, candidate, max_distance)
+            if distance > max_distance:
+                continue
+            key = (distance, -self.words[candidate], candidate)
+            if best is None or key < best:
+                best = key
+        if best is None:
+            return None
+        return best[2], best[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index size."""
+        return {
+            "words": len(self.words),
+            "entries": len(self.index),
+        }
+
+
+class FuzzyMatcher:
+    """
+    Exact pattern automaton behind a word-level spelling corrector.
+
+    Features:
+    - Vocabulary built from the words of every pattern
+    - Only unknown words of MIN_WORD_LENGTH+ characters are corrected:
+      one edit up to 5 characters, two beyond, first letter kept (so
+      real words like "call" don't become "all")
+    - Known words (e.g. from example utterances) and other inflections
+      of a vocabulary word are real words, never corrected ("lunch" is
+      not "launch", "command" not "commands")
+    - Confidence reduced by CORRECTION_PENALTY per corrected word
+    """
+
+    def __init__(self, matcher: PatternMatcher, known_words: Iterable[str] = ()):
+        """
+        Build the correction index for a pattern automaton.
+
+        Args:
+            matcher: Exact matcher over the pattern table
+            known_words: Real words outside the patterns to leave alone
+        """
+        self.matcher = matcher
+        self.known_words = frozenset(known_words)
+        vocabulary: Dict[str, int] = {}
+        for pattern_id, pattern in enumerate(matcher.pattern_strings):
+            for word in pattern.split():
+                vocabulary[word] = vocabulary.get(word, 0) + len(matcher.pattern_labels[pattern_id])
+        self.index = DeletionIndex(vocabulary, max_distance=2)
+
+    def correct(self, text: str) -> Tuple[str, int]:
+        """
+        Replace near-miss words by vocabulary words.
+
+        Args:
+            text: Lowercase input
+
+        Returns:
+            Tuple of (corrected text, number of corrected words)
+        """
+        words = text.split()
+        corrections = 0
+        for i, word in enumerate(words):
+            if len(word) < MIN_WORD_LENGTH or word in self.index.words or word in self.known_words:
+                continue
+            found = self.index.lookup(word, 1 if len(word) <= 5 else 2, same_first_letter=True)
+            if found is not None and not is_inflection(word, found[0]):
+                words[i] = found[0]
+                corrections += 1
+        return " ".join(words), corrections
+
+    def best(self, text: str) -> Tuple[Optional[Hashable], float]:
+        """
+        Best-scoring label for a text after spelling correction.
+
+        Args:
+            text: Lowercase input
+
+        Returns:
+            Tuple of (label or None, confidence); (None, 0.0) when no
+            word needed correcting
+        """
+        corrected, corrections = self.correct(text)
+        if not corrections:
+            return None, 0.0
+        label, confidence = self.matcher.best(corrected)
+        return label, confidence * CORRECTION_PENALTY ** corrections
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Correction index size."""
+        return self.index.get_stats()
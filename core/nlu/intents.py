@@ -3,13 +3,33 @@ Intent classification and entity extraction using spaCy.
 Maps natural language to structured commands.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from enum import Enum
+from itertools import islice
+from pathlib import Path
+import json
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import time
 import spacy
 from loguru import logger
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.metrics import get_metrics_collector
 from .entity_extractor import EntityExtractor
+from .fuzzy import FuzzyMatcher
+from .matcher import PatternMatcher
+
+
+# spaCy components intents never read (only doc.ents is used)
+UNUSED_SPACY_COMPONENTS = ["tagger", "parser", "lemmatizer", "attribute_ruler", "senter", "morphologizer"]
 
 
 class IntentType(Enum):
@@ -239,11 +259,14 @@ class Intent:
         confidence: Confidence score
         entities: List of extracted entities
         raw_text: Original user input
+        span: Character span of raw_text within the whole utterance
+            (set by classify_multi)
     """
     type: IntentType
     confidence: float
     entities: List[Entity]
     raw_text: str
+    span: Optional[Tuple[int, int]] = None
 
 
 class IntentClassifier:
@@ -251,19 +274,167 @@ class IntentClassifier:
     Intent classification using spaCy and pattern matching.
     Uses a hybrid approach: patterns for high-confidence matches,
     ML for ambiguous cases.
+    
+    The intent is resolved from patterns first; spaCy (NER only) runs
+    afterwards, and only for intents whose handlers read named entities.
     """
+    
+    # Intents whose skills use spaCy's named entities (people, places,
+    # organisations, events) - everything else skips the spaCy pass
+    NER_INTENTS = {
+        IntentType.CREATE_EVENT, IntentType.LIST_EVENTS, IntentType.CANCEL_EVENT,
+        IntentType.SETUP_MEETING, IntentType.SEARCH_WEB, IntentType.GOOGLE_IT,
+        IntentType.OPEN_URL, IntentType.ASK_QUESTION, IntentType.GET_WEATHER,
+        IntentType.WEATHER_FORECAST, IntentType.REMEMBER_FACT, IntentType.RECALL_FACT,
+        IntentType.SEND_EMAIL, IntentType.SEND_MESSAGE, IntentType.CALL_CONTACT,
+        IntentType.GET_DIRECTIONS, IntentType.UNKNOWN,
+    }
+    
+    # Entity types computed from the current time (relative dates from
+    # EntityExtractor.extract_date) - intents carrying them are not cached
+    TIME_DEPENDENT_ENTITIES = {"date"}
+    
+    # EntityExtractor kinds each intent's entities are built from -
+    # intents not listed here need no extraction at all
+    EXTRACTION_PLAN = {
+        IntentType.VOLUME_SET: ("percentage", "numbers"),
+        IntentType.OPEN_APP: ("app_name",),
+        IntentType.CLOSE_APP: ("app_name",),
+        IntentType.FOCUS_WINDOW: ("app_name",),
+        IntentType.CREATE_REMINDER: ("time", "duration"),
+        IntentType.SET_TIMER: ("time", "duration"),
+        IntentType.SET_ALARM: ("time", "duration"),
+        IntentType.CREATE_EVENT: ("date", "time"),
+        IntentType.LIST_EVENTS: ("date", "time"),
+        IntentType.OPEN_URL: ("urls",),
+    }
+
+    # Where one command may end and the next begin ("..., and then ...")
+    CONJUNCTIONS = re.compile(
+        r"\s*(?:[,;]\s*)?\b(?:and then|and also|and|then|after that|also|plus)\b\s*|\s*[,;]\s*",
+        re.IGNORECASE,
+    )
+    
+    # Min confidence for a piece after a conjunction to count as its own
+    # command (short commands like "pause the music" score ~0.43)
+    SPLIT_CONFIDENCE = 0.4
+
+    # Optional spaCy-free fast path (FastIntentClassifier), consulted when
+    # the patterns score below confidence_threshold
+    fast_classifier = None
+    confidence_threshold = 0.5
+    _nlp = None
+    
+    # Spelling-corrected pattern matching below confidence_threshold
+    fuzzy_matching = True
+    _fuzzy: Optional[FuzzyMatcher] = None
 
-    def __init__(self, model_name: str = "en_core_web_sm"):
+    def __init__(
+        self,
+        model_name: str = "en_core_web_sm",
+        custom_patterns: Optional[str] = None,
+        cache_size: Optional[int] = None,
+        fast_classifier: Optional[bool] = None,
+        nlp: Optional["spacy.language.Language"] = None
+    ):
         """
         Initialize intent classifier.
         
         Args:
             model_name: spaCy model name
+            custom_patterns: YAML/JSON file of extra patterns
+                ({intent_value: [patterns]}); default: nlu.custom_patterns
+                from the config
+            cache_size: Max cached utterances (0 disables); default:
+                nlu.cache_size from the config
+            fast_classifier: Use the n-gram fast classifier (spaCy is then
+                loaded on first use only); default:
+                nlu.fast_classifier.enabled from the config
+            nlp: Already loaded spaCy pipeline to use instead of loading
+                model_name (e.g. spacy.blank("en"))
+        """
+        self.model_name = model_name
+        
+        config = None
+        try:
+            from core.config import get_config
+            config = get_config()
+        except Exception as e:
+            logger.debug(f"No NLU config: {e}")
+        
+        def setting(key, default):
+            return config.get(key, default) if config is not None else default
+        
+        if custom_patterns is None:
+            custom_patterns = setting("nlu.custom_patterns", None)
+        if cache_size is None:
+            cache_size = setting("nlu.cache_size", 256)
+        if fast_classifier is None:
+            fast_classifier = setting("nlu.fast_classifier.enabled", False)
+        self.confidence_threshold = setting("nlu.confidence_threshold", 0.5)
+        self.fuzzy_matching = setting("nlu.fuzzy_matching", True)
+        
+        # Without the fast path spaCy loads now, as it always has
+        if nlp is not None:
+            self.nlp = nlp
+        elif not fast_classifier:
+            self.nlp = self._load_model(model_name)
+        
+        # Define intent patterns (simple rule-based for MVP)
+        self.patterns = self._init_patterns()
+        self.patterns_version = 0  # Bumped whenever patterns change
+        
+        # Pattern automaton, rebuilt when the pattern table changes
+        self._matcher: Optional[PatternMatcher] = None
+        self._matcher_key: Optional[tuple] = None
+        
+        if custom_patterns:
+            self.load_custom_patterns(custom_patterns)
+        
+        if fast_classifier:
+            from .fast_classifier import FastIntentClassifier
+            self.fast_classifier = FastIntentClassifier.load_or_train(
+                setting("nlu.fast_classifier.model_path", "models/nlu/fast_intent.npz"),
+                self.training_examples()
+            )
+        
+        self._init_cache(cache_size)
+        
+        # Initialize entity extractor
+        self.entity_extractor = EntityExtractor()
+        
+        # Per-stage timings of the last classify() call (ms)
+        self.metrics = get_metrics_collector()
+        self.last_timings: Dict[str, float] = {}
+        
+        logger.info("IntentClassifier initialized")
+
+    @property
+    def nlp(self) -> "spacy.language.Language":
+        """spaCy pipeline (loaded on first use when the fast path is on)."""
+        if self._nlp is None:
+            self._nlp = self._load_model(self.model_name)
+        return self._nlp
+
+    @nlp.setter
+    def nlp(self, nlp) -> None:
+        self._nlp = nlp
+
+    def _load_model(self, model_name: str) -> "spacy.language.Language":
+        """
+        Load the spaCy model, falling back to the PyInstaller bundle.
+        
+        Args:
+            model_name: spaCy model name
+            
+        Returns:
+            spaCy pipeline
         """
         try:
             # Try loading the model
-            self.nlp = spacy.load(model_name)
-            logger.info(f"Loaded spaCy model: {model_name}")
+            nlp = self._load_spacy(model_name)
+            logger.info(f"Loaded spaCy model: {model_name} {nlp.pipe_names}")
+            return nlp
         except OSError:
             # Fallback: Try to find the model in the bundled data
             import sys
@@ -276,8 +447,9 @@ class IntentClassifier:
                 
                 if os.path.exists(model_path):
                     logger.info(f"Loading spaCy model from bundle: {model_path}")
-                    self.nlp = spacy.load(model_path)
+                    nlp = self._load_spacy(model_path)
                     logger.info(f"Loaded spaCy model from bundle: {model_name}")
+                    return nlp
                 else:
                     logger.warning(
                         f"spaCy model '{model_name}' not found in bundle. "
@@ -290,14 +462,26 @@ class IntentClassifier:
                     f"Run: python -m spacy download {model_name}"
                 )
                 raise
+
+    @staticmethod
+    def _load_spacy(model: str) -> "spacy.language.Language":
+        """
+        Load a spaCy pipeline with only the components intents use.
         
-        # Define intent patterns (simple rule-based for MVP)
-        self.patterns = self._init_patterns()
-        
-        # Initialize entity extractor
-        self.entity_extractor = EntityExtractor()
+        Args:
+            model: Model name or path
+            
+        Returns:
+            spaCy pipeline (tokenizer + NER)
+        """
+        nlp = spacy.load(model, exclude=UNUSED_SPACY_COMPONENTS)
         
-        logger.info("IntentClassifier initialized")
+        # A shared tok2vec is only needed if NER listens to it
+        if "tok2vec" in nlp.pipe_names:
+            listeners = getattr(nlp.get_pipe("tok2vec"), "listening_components", [])
+            if not listeners:
+                nlp.remove_pipe("tok2vec")
+        return nlp
 
     def _init_patterns(self) -> Dict[IntentType, List[str]]:
         """
@@ -473,25 +657,117 @@ class IntentClassifier:
             ]
         }
 
+    def _init_cache(self, size: int) -> None:
+        """
+        Set up the utterance -> Intent LRU cache.
+        
+        Args:
+            size: Max cached utterances (0 disables)
+        """
+        self.cache_size = max(0, int(size))
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache: "OrderedDict[str, Intent]" = OrderedDict()
+        # Pattern matcher and settings the cached intents were resolved with
+        self._cache_state: Optional[tuple] = None
+        self._cache_lock = threading.Lock()
+
     def classify(self, text: str) -> Intent:
         """
         Classify user input into an intent with entities.
         
+        Repeated utterances are answered from an LRU cache keyed by the
+        lowercased, whitespace-normalized text.
+        
         Args:
             text: User input text
             
         Returns:
             Intent object
         """
-        text_lower = text.lower().strip()
-        doc = self.nlp(text)
+        if self.cache_size == 0:
+            return self._classify_uncached(text)
+        
+        start_time = time.perf_counter()
+        normalized = " ".join(text.split())
+        key = normalized.lower()
+        
+        with self._cache_lock:
+            # Pattern or resolution setting changes invalidate everything
+            state = (self.matcher, self.fast_classifier, self.confidence_threshold, self.fuzzy_matching)
+            if state != self._cache_state:
+                self._cache.clear()
+                self._cache_state = state
+            
+            cached = self._cache.get(key)
+            # spaCy NER and URLs are case-sensitive: those intents only
+            # hit on the same text
+            if cached is not None and (
+                cached.type not in self.NER_INTENTS
+                or " ".join(cached.raw_text.split()) == normalized
+            ):
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+            else:
+                cached = None
+                self.cache_misses += 1
+        
+        if cached is not None:
+            self.metrics.increment("nlu.cache_hits")
+            self.last_timings = {}
+            self._record_stage("total", start_time)
+            return replace(cached, entities=list(cached.entities), raw_text=text)
+        
+        self.metrics.increment("nlu.cache_misses")
+        intent = self._classify_uncached(text)
+        
+        # Relative dates are computed from now(), so they would go stale
+        if not any(e.type in self.TIME_DEPENDENT_ENTITIES for e in intent.entities):
+            with self._cache_lock:
+                self._cache[key] = replace(intent, entities=list(intent.entities))
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return intent
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Utterance cache statistics."""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "size": len(self._cache),
+            "max_size": self.cache_size,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+        }
+
+    def clear_cache(self) -> None:
+        """Drop all cached utterances."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _classify_uncached(self, text: str) -> Intent:
+        """
+        Classify user input without the utterance cache.
+        
+        Args:
+            text: User input text
+            
+        Returns:
+            Intent object
+        """
+        start_time = time.perf_counter()
+        self.last_timings = {}
         
         # Pattern matching for intent
-        intent_type, confidence = self._match_intent(text_lower)
+        text_lower = text.lower().strip()
+        intent_type, confidence = self._resolve_intent(text_lower, *self._match_intent(text_lower))
+        self._record_stage("match", start_time)
         
         # Extract entities
-        entities = self._extract_entities(doc, intent_type)
+        entities = self._extract_entities(text, intent_type)
         
+        self._record_stage("total", start_time)
         return Intent(
             type=intent_type,
             confidence=confidence,
@@ -499,6 +775,254 @@ class IntentClassifier:
             raw_text=text
         )
 
+    def classify_multi(self, text: str) -> List[Intent]:
+        """
+        Classify an utterance that may hold several commands ("set a timer
+        for 5 minutes and turn the volume down").
+        
+        The text is split at conjunctions and commas, but a piece only
+        starts a new command if it classifies as an intent on its own with
+        SPLIT_CONFIDENCE - anything else stays with the command before it,
+        so "remind me to buy salt and pepper" remains one reminder.
+        
+        Args:
+            text: User input text
+            
+        Returns:
+            Intents in spoken order, each with its span in text (a single
+            intent, possibly UNKNOWN, when nothing splits). last_timings
+            covers every classify() call made for the utterance.
+        """
+        start_time = time.perf_counter()
+        timings: Dict[str, float] = {}
+        
+        def classify(piece: str) -> Intent:
+            intent = self.classify(piece)
+            for stage, elapsed_ms in self.last_timings.items():
+                if stage != "total":
+                    timings[stage] = timings.get(stage, 0.0) + elapsed_ms
+            return intent
+        
+        pieces, start = [], 0
+        for conjunction in self.CONJUNCTIONS.finditer(text):
+            if conjunction.start() > start:
+                pieces.append((start, conjunction.start()))
+            start = max(start, conjunction.end())
+        if start < len(text.rstrip()):
+            pieces.append((start, len(text.rstrip())))
+        
+        if len(pieces) <= 1:
+            return [replace(self.classify(text), span=(0, len(text)))]
+        
+        segments: List[Intent] = []
+        for piece_start, piece_end in pieces:
+            intent = classify(text[piece_start:piece_end])
+            is_command = (
+                intent.type != IntentType.UNKNOWN
+                and intent.confidence >= self.SPLIT_CONFIDENCE
+            )
+            if segments and not is_command:
+                # Continuation of the previous command
+                piece_start = segments.pop().span[0]
+                intent = classify(text[piece_start:piece_end])
+            segments.append(replace(intent, span=(piece_start, piece_end)))
+        
+        known = [intent for intent in segments if intent.type != IntentType.UNKNOWN]
+        if not known:
+            known = [replace(classify(text), span=(0, len(text)))]
+        
+        timings["total"] = (time.perf_counter() - start_time) * 1000
+        self.last_timings = timings
+        
+        # Entity spans are relative to each piece: shift them to the utterance
+        for intent in known:
+            offset = intent.span[0]
+            intent.entities = [
+                replace(entity, span=(entity.span[0] + offset, entity.span[1] + offset))
+                if entity.span else entity
+                for entity in intent.entities
+            ]
+        return known
+
+    def classify_many(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 256,
+        n_process: int = 1
+    ) -> Iterator[Intent]:
+        """
+        Classify a stream of inputs, e.g. a replayed transcript log.
+        
+        Texts are read lazily in batches; each batch is matched in one
+        go and only its NER-intent texts go through nlp.pipe. With
+        n_process > 1 batches are classified in worker processes, with
+        at most two batches per worker in flight, so memory stays
+        bounded however long the input is.
+        
+        Args:
+            texts: Input texts (any iterable, consumed lazily)
+            batch_size: Texts per batch
+            n_process: Worker processes (1 = in this process, -1 = all cores)
+            
+        Yields:
+            Intent per text, in input order
+        """
+        texts = iter(texts)
+        batches = iter(lambda: list(islice(texts, batch_size)), [])
+        if n_process == -1:
+            n_process = os.cpu_count() or 1
+        
+        if n_process <= 1:
+            for batch in batches:
+                yield from self._classify_batch(batch, batch_size)
+            return
+        
+        # Spawn: workers load their own spaCy model and get the current
+        # pattern table (including runtime additions)
+        executor = ProcessPoolExecutor(
+            max_workers=n_process,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.model_name, self.patterns),
+        )
+        pending = deque()
+        try:
+            for batch in batches:
+                pending.append(executor.submit(_classify_batch_in_worker, batch, batch_size))
+                if len(pending) >= 2 * n_process:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _classify_batch(self, texts: List[str], batch_size: int) -> List[Intent]:
+        """
+        Classify one batch of texts.
+        
+        Args:
+            texts: Input texts
+            batch_size: nlp.pipe batch size
+            
+        Returns:
+            Intent per text, in order
+        """
+        lowered = [text.lower().strip() for text in texts]
+        types = [
+            self._resolve_intent(text_lower, intent_type or IntentType.UNKNOWN, confidence)
+            for text_lower, (intent_type, confidence) in zip(lowered, self.matcher.best_many(lowered))
+        ]
+        
+        # One pipe over the texts whose intent reads named entities
+        ner_indices = [i for i, (intent_type, _) in enumerate(types) if intent_type in self.NER_INTENTS]
+        docs = dict(zip(
+            ner_indices,
+            self.nlp.pipe((texts[i] for i in ner_indices), batch_size=batch_size)
+        ))
+        
+        return [
+            Intent(
+                type=intent_type,
+                confidence=confidence,
+                entities=self._extract_entities(text, intent_type, docs.get(i)),
+                raw_text=text
+            )
+            for i, (text, (intent_type, confidence)) in enumerate(zip(texts, types))
+        ]
+
+    def _record_stage(self, stage: str, start_time: float) -> float:
+        """
+        Record the time since start_time as an NLU stage timing.
+        
+        Args:
+            stage: Stage name ("match", "ner", "extract", "total")
+            start_time: perf_counter() at the start of the stage
+            
+        Returns:
+            perf_counter() now (start of the next stage)
+        """
+        now = time.perf_counter()
+        elapsed_ms = (now - start_time) * 1000
+        self.last_timings[stage] = elapsed_ms
+        self.metrics.record_value(f"nlu.{stage}_ms", elapsed_ms)
+        return now
+
+    def _resolve_intent(
+        self,
+        text: str,
+        intent_type: IntentType,
+        confidence: float
+    ) -> Tuple[IntentType, float]:
+        """
+        Resolve what the exact patterns are unsure of.
+        
+        Below confidence_threshold, spelling-corrected patterns are tried
+        first, then the fast classifier (if enabled). A corrected match
+        only replaces a pattern match when it reaches confidence_threshold.
+        
+        Args:
+            text: Lowercase user input
+            intent_type: Pattern match
+            confidence: Pattern match confidence
+            
+        Returns:
+            Tuple of (intent_type, confidence) - the pattern match unless
+            a later stage scores higher
+        """
+        if confidence >= self.confidence_threshold:
+            return intent_type, confidence
+        
+        if self.fuzzy_matching:
+            fuzzy_type, fuzzy_confidence = self.fuzzy_matcher.best(text)
+            if fuzzy_type is not None and fuzzy_confidence > confidence and (
+                intent_type == IntentType.UNKNOWN
+                or fuzzy_confidence >= self.confidence_threshold
+            ):
+                self.metrics.increment("nlu.fuzzy_decisions")
+                intent_type, confidence = fuzzy_type, fuzzy_confidence
+                if confidence >= self.confidence_threshold:
+                    return intent_type, confidence
+        
+        if self.fast_classifier is None:
+            return intent_type, confidence
+        
+        label, probability = self.fast_classifier.predict(text)
+        if probability >= self.confidence_threshold and probability > confidence:
+            self.metrics.increment("nlu.fast_decisions")
+            return IntentType(label), probability
+        return intent_type, confidence
+
+    @staticmethod
+    def known_words() -> Set[str]:
+        """
+        Real words the spelling correction leaves alone even though no
+        pattern uses them: English stop words and the words of the
+        example utterances.
+        """
+        from spacy.lang.en.stop_words import STOP_WORDS
+        from .examples import INTENT_EXAMPLES
+        
+        words = set(STOP_WORDS)
+        for utterances in INTENT_EXAMPLES.values():
+            for utterance in utterances:
+                words.update(utterance.lower().split())
+        return words
+
+    def training_examples(self) -> Dict[str, List[str]]:
+        """
+        Training data for the fast classifier.
+        
+        Returns:
+            Intent value -> patterns plus example utterances
+        """
+        from .examples import INTENT_EXAMPLES
+        
+        examples: Dict[str, List[str]] = {}
+        for table in (self.patterns, INTENT_EXAMPLES):
+            for intent_type, utterances in table.items():
+                examples.setdefault(intent_type.value, []).extend(utterances)
+        return examples
+
     def _match_intent(self, text: str) -> Tuple[IntentType, float]:
         """
         Match text against intent patterns.
@@ -509,61 +1033,75 @@ class IntentClassifier:
         Returns:
             Tuple of (intent_type, confidence)
         """
-        # Priority queue for intent matching
-        matches = []
-        
-        for intent_type, patterns in self.patterns.items():
-            for pattern in patterns:
-                if pattern in text:
-                    # Calculate confidence based on pattern length
-                    confidence = len(pattern) / max(len(text), len(pattern))
-                    
-                    # Bonus for exact match
-                    if pattern == text:
-                        confidence = 1.0
-                    # Bonus for word boundary match
-                    elif f" {pattern} " in f" {text} " or text.startswith(pattern + " ") or text.endswith(" " + pattern):
-                        confidence *= 1.3
-                    
-                    confidence = min(confidence, 1.0)  # Cap at 1.0
-                    matches.append((confidence, intent_type))
-        
-        if not matches:
+        # Confidence: covered fraction of the text, 1.0 for an exact
+        # match, x1.3 on word boundaries (see matcher.score_pattern)
+        intent_type, confidence = self.matcher.best(text)
+        if intent_type is None:
             return IntentType.UNKNOWN, 0.0
-        
-        # Return highest confidence match
-        matches.sort(key=lambda x: x[0], reverse=True)
-        return matches[0][1], matches[0][0]
+        return intent_type, confidence
+    
+    @property
+    def matcher(self) -> PatternMatcher:
+        """Pattern automaton for the current pattern table."""
+        # Cheap fingerprint, so direct edits of self.patterns are noticed too
+        key = (
+            self.patterns_version,
+            id(self.patterns),
+            tuple(len(patterns) for patterns in self.patterns.values()),
+        )
+        if self._matcher is None or key != self._matcher_key:
+            self._matcher = PatternMatcher(self.patterns)
+            self._matcher_key = key
+            logger.debug(f"Built intent pattern automaton: {self._matcher.get_stats()}")
+        return self._matcher
+
+    @property
+    def fuzzy_matcher(self) -> FuzzyMatcher:
+        """Spelling-correcting matcher over the current pattern automaton."""
+        matcher = self.matcher
+        if self._fuzzy is None or self._fuzzy.matcher is not matcher:
+            self._fuzzy = FuzzyMatcher(matcher, self.known_words())
+            logger.debug(f"Built fuzzy pattern index: {self._fuzzy.get_stats()}")
+        return self._fuzzy
 
     def _extract_entities(
         self,
-        doc: spacy.tokens.Doc,
-        intent_type: IntentType
+        text: str,
+        intent_type: IntentType,
+        doc: Optional[Any] = None
     ) -> List[Entity]:
         """
         Extract entities based on intent type.
         
         Args:
-            doc: spaCy document
+            text: User input text
             intent_type: Classified intent
+            doc: Already parsed spaCy doc of text (from nlp.pipe)
             
         Returns:
             List of entities
         """
         entities = []
-        text = doc.text
+        stage_start = time.perf_counter()
         
-        # Extract named entities from spaCy
-        for ent in doc.ents:
-            entities.append(Entity(
-                type=ent.label_,
-                value=ent.text,
-                confidence=1.0,
-                span=(ent.start_char, ent.end_char)
-            ))
+        # Extract named entities from spaCy (only where they are used)
+        if intent_type in self.NER_INTENTS:
+            parsed = doc is None
+            if parsed:
+                doc = self.nlp(text)
+            for ent in doc.ents:
+                entities.append(Entity(
+                    type=ent.label_,
+                    value=ent.text,
+                    confidence=1.0,
+                    span=(ent.start_char, ent.end_char)
+                ))
+            if parsed:
+                stage_start = self._record_stage("ner", stage_start)
         
-        # Use enhanced entity extractor for specific extractions
-        extracted = self.entity_extractor.extract_all(text)
+        # Use enhanced entity extractor, only for the kinds this intent reads
+        plan = self.EXTRACTION_PLAN.get(intent_type)
+        extracted = self.entity_extractor.extract_all(text, kinds=plan) if plan else {}
         
         # Intent-specific entity extraction
         if intent_type == IntentType.VOLUME_SET:
@@ -645,6 +1183,7 @@ class IntentClassifier:
                         confidence=1.0
                     ))
         
+        self._record_stage("extract", stage_start)
         return entities
 
     def add_pattern(self, intent_type: IntentType, pattern: str) -> None:
@@ -658,8 +1197,64 @@ class IntentClassifier:
         if intent_type not in self.patterns:
             self.patterns[intent_type] = []
         self.patterns[intent_type].append(pattern.lower())
+        self.patterns_version += 1
         logger.debug(f"Added pattern '{pattern}' for {intent_type.value}")
 
+    def load_custom_patterns(self, path: str) -> int:
+        """
+        Add patterns from a YAML or JSON file.
+        
+        The file maps intent values to pattern lists, e.g.
+        {"open_app": ["fire up"], "get_time": ["got the time"]}.
+        
+        Args:
+            path: Pattern file
+            
+        Returns:
+            Number of patterns added
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                if Path(path).suffix.lower() == ".json":
+                    data = json.load(f)
+                else:
+                    import yaml
+                    data = yaml.safe_load(f)
+        except Exception as e:
+            logger.error(f"Failed to load custom patterns from {path}: {e}")
+            return 0
+        
+        added = 0
+        for intent_value, patterns in (data or {}).items():
+            try:
+                intent_type = IntentType(intent_value)
+            except ValueError:
+                logger.warning(f"Unknown intent in custom patterns: {intent_value}")
+                continue
+            for pattern in patterns or []:
+                self.add_pattern(intent_type, str(pattern))
+                added += 1
+        
+        logger.info(f"Loaded {added} custom patterns from {path}")
+        return added
+
+
+# Per-process classifier for IntentClassifier.classify_many workers
+_worker_classifier: Optional[IntentClassifier] = None
+
+
+def _init_worker(model_name: str, patterns: Dict[IntentType, List[str]]):
+    """Load the classifier once per pool process."""
+    global _worker_classifier
+    # "" skips the config's custom patterns - the table passed in has them
+    _worker_classifier = IntentClassifier(model_name, custom_patterns="")
+    _worker_classifier.patterns = patterns
+
+
+def _classify_batch_in_worker(texts: List[str], batch_size: int) -> List[Intent]:
+    """Classify one batch in a pool process."""
+    return _worker_classifier._classify_batch(texts, batch_size)
+
 
 class PriorityIntentQueue:
     """
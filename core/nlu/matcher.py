@@ -0,0 +1,245 @@
+"""
+Intent pattern matcher.
+
+Compiles every intent pattern into one Aho-Corasick automaton so an
+utterance is matched against the whole pattern table in a single pass,
+with the same confidence scoring as the original per-pattern scan.
+"""
+
+from collections import deque
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+# Confidence multiplier for a pattern matched on word (space) boundaries
+WORD_BOUNDARY_BONUS = 1.3
+
+
+def score_pattern(pattern_len: int, text_len: int, bounded: bool) -> float:
+    """
+    Confidence for a pattern found in a text.
+
+    Args:
+        pattern_len: Length of the pattern
+        text_len: Length of the text
+        bounded: Whether some occurrence is delimited by spaces/text edges
+
+    Returns:
+        Confidence (exact match 1.0, otherwise the covered fraction of
+        the text, boosted for word-boundary matches, capped at 1.0)
+    """
+    if pattern_len == text_len:
+        return 1.0
+    confidence = pattern_len / text_len
+    if bounded:
+        confidence *= WORD_BOUNDARY_BONUS
+    return min(confidence, 1.0)
+
+
+def linear_match(
+    patterns: Dict[Hashable, List[str]],
+    text: str
+) -> Tuple[Optional[Hashable], float]:
+    """
+    Reference matcher: test every pattern with a substring search.
+
+    This is the original IntentClassifier algorithm, kept to check the
+    automaton against and to benchmark it.
+
+    Args:
+        patterns: Label -> patterns
+        text: Lowercase input
+
+    Returns:
+        Tuple of (best label or None, confidence)
+    """
+    matches = []
+    for label, label_patterns in patterns.items():
+        for pattern in label_patterns:
+            if pattern in text:
+                confidence = len(pattern) / max(len(text), len(pattern))
+                if pattern == text:
+                    confidence = 1.0
+                elif f" {pattern} " in f" {text} " or text.startswith(pattern + " ") or text.endswith(" " + pattern):
+                    confidence *= WORD_BOUNDARY_BONUS
+                confidence = min(confidence, 1.0)
+                matches.append((confidence, label))
+
+    if not matches:
+        return None, 0.0
+
+    matches.sort(key=lambda x: x[0], reverse=True)
+    return matches[0][1], matches[0][0]
+
+
+class PatternMatcher:
+    """
+    Aho-Corasick automaton over a label -> patterns table.
+
+    Features:
+    - Built once per pattern table; one pass over the text finds every
+      occurrence of every pattern
+    - Word-boundary flag tracked per pattern during the pass
+    - Duplicate patterns shared between labels, ties resolved by table
+      order exactly like the original scan
+    """
+
+    def __init__(self, patterns: Dict[Hashable, List[str]]):
+        """
+        Build the automaton.
+
+        Args:
+            patterns: Label -> lowercase patterns (iteration order is
+                the tie-break order)
+        """
+        self.pattern_strings: List[str] = []
+        self.pattern_labels: List[List[Tuple[int, Hashable]]] = []  # (table order, label)
+        index: Dict[str, int] = {}
+
+        order = 0
+        for label, label_patterns in patterns.items():
+            for pattern in label_patterns:
+                if not pattern:
+                    continue
+                if pattern not in index:
+                    index[pattern] = len(self.pattern_strings)
+                    self.pattern_strings.append(pattern)
+                    self.pattern_labels.append([])
+                self.pattern_labels[index[pattern]].append((order, label))
+                order += 1
+
+        self._build()
+
+    def _build(self):
+        """Build goto, failure and dictionary-suffix links."""
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(self.pattern_strings):
+            node = 0
+            for char in pattern:
+                next_node = goto[node].get(char)
+                if next_node is None:
+                    next_node = len(goto)
+                    goto[node][char] = next_node
+                    goto.append({})
+                    out.append([])
+                node = next_node
+            out[node].append(pattern_id)
+
+        fail = [0] * len(goto)
+        dict_link = [0] * len(goto)  # Nearest proper suffix node with output (0 = none)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(char, 0)
+                fail[child] = target if target != child else 0
+                dict_link[child] = fail[child] if out[fail[child]] else dict_link[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._dict_link = dict_link
+        self._lengths = [len(p) for p in self.pattern_strings]
+
+    def find(self, text: str) -> Dict[int, bool]:
+        """
+        Find every pattern occurring in a text.
+
+        Args:
+            text: Lowercase input
+
+        Returns:
+            Pattern id -> whether some occurrence is on word boundaries
+        """
+        goto, fail, out, dict_link, lengths = (
+            self._goto, self._fail, self._out, self._dict_link, self._lengths
+        )
+        found: Dict[int, bool] = {}
+        last = len(text) - 1
+        state = 0
+
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            node = state if out[state] else dict_link[state]
+            while node:
+                for pattern_id in out[node]:
+                    if found.get(pattern_id):
+                        continue
+                    start = i - lengths[pattern_id] + 1
+                    found[pattern_id] = (
+                        (start == 0 or text[start - 1] == " ")
+                        and (i == last or text[i + 1] == " ")
+                    )
+                node = dict_link[node]
+
+        return found
+
+    def candidates(self, text: str) -> List[Tuple[float, Hashable, str]]:
+        """
+        Score every matching (label, pattern) pair.
+
+        Args:
+            text: Lowercase input
+
+        Returns:
+            (confidence, label, pattern) tuples, best first (ties in
+            table order)
+        """
+        scored = []
+        for pattern_id, bounded in self.find(text).items():
+            confidence = score_pattern(self._lengths[pattern_id], len(text), bounded)
+            for order, label in self.pattern_labels[pattern_id]:
+                scored.append((-confidence, order, label, self.pattern_strings[pattern_id]))
+        scored.sort(key=lambda x: (x[0], x[1]))
+        return [(-neg, label, pattern) for neg, _, label, pattern in scored]
+
+    def best(self, text: str) -> Tuple[Optional[Hashable], float]:
+        """
+        Best-scoring label for a text.
+
+        Args:
+            text: Lowercase input
+
+        Returns:
+            Tuple of (label or None, confidence)
+        """
+        best_key: Optional[Tuple[float, int]] = None
+        best_label = None
+        for pattern_id, bounded in self.find(text).items():
+            confidence = score_pattern(self._lengths[pattern_id], len(text), bounded)
+            order, label = self.pattern_labels[pattern_id][0]
+            key = (-confidence, order)
+            if best_key is None or key < best_key:
+                best_key, best_label = key, label
+
+        if best_key is None:
+            return None, 0.0
+        return best_label, -best_key[0]
+
+    def best_many(self, texts: Iterable[str]) -> List[Tuple[Optional[Hashable], float]]:
+        """
+        Best-scoring label for each of several texts.
+
+        Args:
+            texts: Lowercase inputs
+
+        Returns:
+            (label or None, confidence) per text, in input order
+        """
+        best = self.best
+        return [best(text) for text in texts]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Automaton size."""
+        return {
+            "patterns": len(self.pattern_strings),
+            "states": len(self._goto),
+        }
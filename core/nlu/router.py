@@ -3,13 +3,58 @@ Command routing from intents to skill execution.
 Implements function calling and skill dispatch.
 """
 
-from typing import Dict, Callable, Any, Optional
+import asyncio
+import inspect
+from typing import Dict, Callable, Any, Hashable, List, Optional
 from dataclasses import dataclass
 from loguru import logger
 
 from .intents import Intent, IntentType
 
 
+# Intents whose handlers only read state - safe to run before the user
+# has finished speaking, and to run alongside any other intent
+READ_ONLY_INTENTS = frozenset({
+    IntentType.GET_TIME,
+    IntentType.GET_DATE,
+    IntentType.GET_WEATHER,
+    IntentType.GET_SYSTEM_INFO,
+    IntentType.GET_BATTERY,
+    IntentType.LIST_REMINDERS,
+    IntentType.LIST_EVENTS,
+    IntentType.RECALL_FACT,
+    IntentType.HELP,
+})
+
+# What each intent acts on - intents on the same resource conflict (order
+# matters: "mute and then unmute"), intents not listed conflict with nothing
+INTENT_RESOURCES: Dict[IntentType, str] = {
+    **dict.fromkeys([
+        IntentType.VOLUME_UP, IntentType.VOLUME_DOWN, IntentType.VOLUME_SET,
+        IntentType.MUTE, IntentType.UNMUTE,
+    ], "volume"),
+    **dict.fromkeys([
+        IntentType.OPEN_APP, IntentType.CLOSE_APP, IntentType.FOCUS_WINDOW,
+        IntentType.MINIMIZE_WINDOW, IntentType.MAXIMIZE_WINDOW,
+    ], "windows"),
+    **dict.fromkeys([
+        IntentType.CREATE_REMINDER, IntentType.LIST_REMINDERS, IntentType.CANCEL_REMINDER,
+        IntentType.SET_TIMER, IntentType.SET_ALARM,
+    ], "reminders"),
+    **dict.fromkeys([
+        IntentType.CREATE_EVENT, IntentType.LIST_EVENTS, IntentType.CANCEL_EVENT,
+    ], "calendar"),
+    **dict.fromkeys([
+        IntentType.REMEMBER_FACT, IntentType.RECALL_FACT, IntentType.FORGET_FACT,
+    ], "memory"),
+    **dict.fromkeys([
+        IntentType.PLAY_MEDIA, IntentType.PAUSE_MEDIA, IntentType.NEXT_TRACK,
+        IntentType.PREVIOUS_TRACK,
+    ], "media"),
+    **dict.fromkeys([IntentType.SEARCH_WEB, IntentType.OPEN_URL], "browser"),
+}
+
+
 @dataclass
 class SkillResult:
     """
@@ -25,6 +70,29 @@ class SkillResult:
     data: Optional[Any] = None
 
 
+def combine_results(results: List[SkillResult]) -> SkillResult:
+    """
+    Combine the results of several intents from one utterance.
+    
+    Args:
+        results: Results in spoken order
+        
+    Returns:
+        One result: success if all succeeded, the messages joined in
+        spoken order, and the individual results in data["results"]
+    """
+    messages = []
+    for result in results:
+        message = (result.message or "").strip()
+        if message:
+            messages.append(message if message[-1] in ".!?" else message + ".")
+    return SkillResult(
+        success=all(result.success for result in results),
+        message=" ".join(messages),
+        data={"results": results}
+    )
+
+
 class CommandRouter:
     """
     Routes classified intents to appropriate skill handlers.
@@ -34,6 +102,8 @@ class CommandRouter:
     def __init__(self):
         """Initialize command router."""
         self.handlers: Dict[IntentType, Callable] = {}
+        self.warmups: Dict[IntentType, Callable] = {}
+        self.warmup_discards: Dict[IntentType, Callable] = {}
         self.middleware: list = []
         logger.info("CommandRouter initialized")
 
@@ -52,6 +122,64 @@ class CommandRouter:
         self.handlers[intent_type] = handler
         logger.debug(f"Registered handler for {intent_type.value}")
 
+    def register_warmup(
+        self,
+        intent_type: IntentType,
+        warmup: Callable[[Intent], None],
+        discard: Optional[Callable[[Intent], None]] = None
+    ) -> None:
+        """
+        Register a warm-up for an intent type, run when the intent is
+        likely but not yet confirmed (e.g. open a browser context).
+        
+        Args:
+            intent_type: Intent type to warm up
+            warmup: Warm-up function (must not have visible side effects)
+            discard: Called when the intent turns out not to be the one
+                spoken, to drop what the warm-up prepared
+        """
+        self.warmups[intent_type] = warmup
+        if discard is not None:
+            self.warmup_discards[intent_type] = discard
+        logger.debug(f"Registered warm-up for {intent_type.value}")
+
+    def warm_up(self, intent: Intent) -> bool:
+        """
+        Run the warm-up registered for an intent's type.
+        
+        Args:
+            intent: Likely intent
+            
+        Returns:
+            True if a warm-up ran successfully
+        """
+        warmup = self.warmups.get(intent.type)
+        if warmup is None:
+            return False
+        
+        try:
+            warmup(intent)
+            return True
+        except Exception as e:
+            logger.error(f"Warm-up error: {e}")
+            return False
+
+    def discard_warm_up(self, intent: Intent) -> None:
+        """
+        Run the discard registered for an intent's type, if any.
+        
+        Args:
+            intent: Intent that was warmed up but not confirmed
+        """
+        discard = self.warmup_discards.get(intent.type)
+        if discard is None:
+            return
+        
+        try:
+            discard(intent)
+        except Exception as e:
+            logger.error(f"Warm-up discard error: {e}")
+
     def register_middleware(self, middleware: Callable[[Intent], Intent]) -> None:
         """
         Register middleware to process intents before routing.
@@ -69,6 +197,52 @@ class CommandRouter:
         Args:
             intent: Classified intent
             
+        Returns:
+            Skill execution result
+        """
+        return await self._dispatch(intent)
+
+    async def route_many(self, intents: List[Intent]) -> SkillResult:
+        """
+        Route several intents from one utterance (see
+        IntentClassifier.classify_multi) and combine their replies.
+        
+        Intents on different resources (INTENT_RESOURCES) run concurrently,
+        each handler on a worker thread; intents on the same resource run
+        one after another in spoken order.
+        
+        Args:
+            intents: Classified intents in spoken order
+            
+        Returns:
+            One result: success if all succeeded, the messages joined in
+            spoken order, and the individual results in data["results"]
+        """
+        if len(intents) == 1:
+            return await self.route(intents[0])
+        
+        lanes: Dict[Hashable, List[int]] = {}
+        for i, intent in enumerate(intents):
+            lanes.setdefault(INTENT_RESOURCES.get(intent.type, ("intent", i)), []).append(i)
+        
+        results: List[Optional[SkillResult]] = [None] * len(intents)
+        
+        async def run_lane(indices: List[int]) -> None:
+            for i in indices:
+                results[i] = await self._dispatch(intents[i], in_thread=True)
+        
+        await asyncio.gather(*(run_lane(indices) for indices in lanes.values()))
+        return combine_results(results)
+
+    async def _dispatch(self, intent: Intent, in_thread: bool = False) -> SkillResult:
+        """
+        Apply middleware and run the intent's handler.
+        
+        Args:
+            intent: Classified intent
+            in_thread: Run a synchronous handler on a worker thread so
+                other intents can proceed meanwhile
+            
         Returns:
             Skill execution result
         """
@@ -91,7 +265,13 @@ class CommandRouter:
         try:
             handler = self.handlers[intent.type]
             logger.debug(f"Routing to handler: {intent.type.value}")
-            result = handler(intent)
+            if in_thread and not inspect.iscoroutinefunction(handler):
+                result = await asyncio.to_thread(handler, intent)
+            else:
+                result = handler(intent)
+            if inspect.isawaitable(result):
+                # Async skills (e.g. WebSkills.handle_intent)
+                result = await result
             return result
         except Exception as e:
             logger.error(f"Handler error: {e}")
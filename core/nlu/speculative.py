@@ -0,0 +1,316 @@
+"""
+Speculative intent resolution on streaming partial transcripts.
+
+Partials arrive while the user is still speaking. Once the same confident
+intent comes out of several consecutive partials it is treated as stable:
+read-only intents ("what time is it") are executed right away unless
+their skill has a warm-up, and other intents get their skill warmed up.
+The final transcript then either confirms the speculation, whose result
+is returned without running the skill again, or discards it.
+"""
+
+import sys
+import time
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.metrics import get_metrics_collector
+
+from .intents import Intent, IntentType
+from .router import READ_ONLY_INTENTS, CommandRouter, SkillResult, combine_results
+
+
+def intent_key(intent: Intent) -> Hashable:
+    """
+    What must agree between a speculative and a final intent.
+
+    Relative dates ("tomorrow") resolve against the clock, so they are
+    compared to the minute.
+    """
+    entities = []
+    for entity in intent.entities:
+        value = entity.value
+        if isinstance(value, datetime):
+            value = value.replace(second=0, microsecond=0)
+        entities.append((entity.type, repr(value)))
+    return intent.type, tuple(sorted(entities))
+
+
+@dataclass
+class Speculation:
+    """
+    Work started for a stable partial intent.
+
+    Attributes:
+        intent: Intent classified from the partial
+        key: intent_key() of the intent
+        started_at: perf_counter() time the work was queued
+        future: Background execution or warm-up
+        executed: True if the intent was executed, False if only warmed up
+    """
+    intent: Intent
+    key: Hashable
+    started_at: float
+    future: Future
+    executed: bool
+
+    def matches(self, intent: Intent, key: Hashable) -> bool:
+        """
+        Whether this speculation holds for an intent.
+
+        A warm-up only depends on the intent type, a result also on the
+        entities.
+        """
+        if self.executed:
+            return key == self.key
+        return intent.type == self.intent.type
+
+
+class SpeculativeIntentResolver:
+    """
+    Classifies partial transcripts and acts on stable intents early.
+
+    Features:
+    - An intent is stable after stable_partials consecutive partials
+      agree on it (type and entities) with min_confidence or more
+    - Intents with a warm-up registered on the router are warmed up on a
+      background thread; other READ_ONLY_INTENTS are executed there
+    - A warm-up that is not confirmed runs the router's discard for it
+    - resolve() reuses a speculative result when the final intent agrees
+      and it is at most max_age_s old
+    - Latency saved (skill or warm-up time spent before the final
+      transcript) is recorded per intent type as
+      nlu.speculation_saved_ms.<intent>
+    """
+
+    def __init__(
+        self,
+        classifier,
+        router: CommandRouter,
+        stable_partials: int = 2,
+        min_confidence: float = 0.7,
+        max_age_s: float = 2.0
+    ):
+        """
+        Initialize the resolver.
+
+        Args:
+            classifier: IntentClassifier for partials and finals
+            router: CommandRouter that executes and warms up skills
+            stable_partials: Consecutive agreeing partials before acting
+            min_confidence: Min partial confidence to act on
+            max_age_s: Oldest speculative result still served (results
+                like the time go stale)
+        """
+        self.classifier = classifier
+        self.router = router
+        self.stable_partials = stable_partials
+        self.min_confidence = min_confidence
+        self.max_age_s = max_age_s
+        self.metrics = get_metrics_collector()
+
+        # One worker: speculation must never compete with the real command
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="speculate")
+        self._lock = threading.Lock()
+        self._last_key: Optional[Hashable] = None
+        self._streak = 0
+        self._speculation: Optional[Speculation] = None
+
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def reset(self) -> None:
+        """Forget the current utterance (call when a new one starts)."""
+        with self._lock:
+            speculation = self._speculation
+            self._last_key = None
+            self._streak = 0
+            self._speculation = None
+        if speculation is not None:
+            self._drop(speculation)
+
+    def on_partial(self, text: str) -> Intent:
+        """
+        Classify a partial transcript and speculate once it is stable.
+
+        Args:
+            text: Partial transcript
+
+        Returns:
+            Intent classified from the partial
+        """
+        intent = self.classifier.classify(text)
+        key = intent_key(intent)
+
+        with self._lock:
+            self._streak = self._streak + 1 if key == self._last_key else 1
+            self._last_key = key
+
+            if (
+                intent.type == IntentType.UNKNOWN
+                or intent.confidence < self.min_confidence
+                or self._streak < self.stable_partials
+                or (self._speculation is not None and self._speculation.matches(intent, key))
+            ):
+                return intent
+
+            # A warm-up is cheaper than the skill and safe to throw away
+            executed = (
+                intent.type in READ_ONLY_INTENTS
+                and intent.type in self.router.handlers
+                and intent.type not in self.router.warmups
+            )
+            if self._speculation is not None:
+                self._drop(self._speculation)
+            self._speculation = Speculation(
+                intent,
+                key,
+                time.perf_counter(),
+                self._executor.submit(self._execute if executed else self._warm_up, intent),
+                executed,
+            )
+            action = "executing" if executed else "warming up"
+
+        self._count(intent.type, "started")
+        logger.debug(f"Speculatively {action} {intent.type.value} from partial '{text}'")
+        return intent
+
+    def _execute(self, intent: Intent) -> Tuple[Optional[SkillResult], float, float]:
+        """Run a speculative intent; returns (result, start, end)."""
+        start_time = time.perf_counter()
+        result = asyncio.run(self.router.route(intent))
+        return result, start_time, time.perf_counter()
+
+    def _warm_up(self, intent: Intent) -> Tuple[Optional[SkillResult], float, float]:
+        """Warm up an intent's skill; returns (None, start, end)."""
+        start_time = time.perf_counter()
+        if not self.router.warm_up(intent):
+            return None, start_time, start_time
+        return None, start_time, time.perf_counter()
+
+    def _drop(self, speculation: Speculation) -> None:
+        """Cancel a speculation and discard what its warm-up prepared."""
+        speculation.future.cancel()
+        if not speculation.executed:
+            # Queued behind the warm-up on the single worker, so it runs
+            # after anything the warm-up stored
+            self._executor.submit(self.router.discard_warm_up, speculation.intent)
+
+    def resolve(self, text: str) -> Tuple[Intent, Optional[SkillResult]]:
+        """
+        Classify the final transcript and settle the speculation.
+
+        Args:
+            text: Final transcript
+
+        Returns:
+            Tuple of (final intent, speculative result or None). A None
+            result means the intent still has to be routed.
+        """
+        intent = self.classifier.classify(text)
+        return intent, self.resolve_intent(intent)
+
+    def resolve_intent(self, intent: Intent) -> Optional[SkillResult]:
+        """
+        Settle the speculation against an intent already classified from
+        the final transcript (e.g. the first of classify_multi()).
+
+        Args:
+            intent: Final intent
+
+        Returns:
+            Speculative result, or None if the intent still has to be
+            routed
+        """
+        with self._lock:
+            speculation = self._speculation
+            self._last_key = None
+            self._streak = 0
+            self._speculation = None
+
+        if speculation is None:
+            return None
+
+        resolved_at = time.perf_counter()
+        name = speculation.intent.type
+        stale = speculation.executed and resolved_at - speculation.started_at > self.max_age_s
+        if not speculation.matches(intent, intent_key(intent)) or stale:
+            self._drop(speculation)
+            self._count(name, "discarded")
+            logger.debug(f"Discarded speculative {name.value}")
+            return None
+
+        try:
+            # A warm-up still in progress is not waited for - the skill
+            # waits on whatever it initialises itself
+            if not speculation.executed and not speculation.future.done():
+                start_time, end_time, result = speculation.started_at, resolved_at, None
+            else:
+                result, start_time, end_time = speculation.future.result()
+        except Exception as e:
+            logger.error(f"Speculative execution failed: {e}")
+            self._count(name, "discarded")
+            return None
+
+        # Skill or warm-up time spent before the final transcript arrived
+        saved_ms = max(0.0, min(end_time, resolved_at) - start_time) * 1000
+        self._count(name, "confirmed")
+        self.stats[name.value]["saved_ms"] += saved_ms
+        self.metrics.record_value(f"nlu.speculation_saved_ms.{name.value}", saved_ms)
+        logger.debug(f"Confirmed speculative {name.value} ({saved_ms:.0f}ms saved)")
+        return result
+
+    async def route_many(self, intents: List[Intent]) -> SkillResult:
+        """
+        Route the intents of a final transcript (see
+        IntentClassifier.classify_multi), reusing the speculative result
+        for the first one when it agrees.
+
+        Partials only ever speculate on the start of the utterance, so the
+        remaining intents always go through CommandRouter.route_many().
+
+        Args:
+            intents: Intents of the final transcript in spoken order
+
+        Returns:
+            Combined result as from CommandRouter.route_many()
+        """
+        first = self.resolve_intent(intents[0])
+        if first is None:
+            return await self.router.route_many(intents)
+        if len(intents) == 1:
+            return first
+
+        rest = await self.router.route_many(intents[1:])
+        results = rest.data["results"] if len(intents) > 2 else [rest]
+        return combine_results([first] + results)
+
+    def _count(self, intent_type: IntentType, outcome: str) -> None:
+        """Count a speculation outcome for an intent type."""
+        stats = self.stats.setdefault(
+            intent_type.value, {"started": 0, "confirmed": 0, "discarded": 0, "saved_ms": 0.0}
+        )
+        stats[outcome] += 1
+        self.metrics.increment(f"nlu.speculation_{outcome}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-intent speculation outcomes and average latency saved."""
+        return {
+            name: {
+                **stats,
+                "avg_saved_ms": stats["saved_ms"] / stats["confirmed"] if stats["confirmed"] else 0.0,
+            }
+            for name, stats in self.stats.items()
+        }
+
+    def close(self) -> None:
+        """Stop the speculation worker."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,361 @@
+"""
+Command vocabulary for STT biasing.
+
+Collects the phrases the NLU already understands (intent patterns,
+bookmark and website names, app names) and turns them into a decoding
+prompt or hotword list for the speech-to-text backends.
+"""
+
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.metrics import get_metrics_collector
+
+
+# Words that carry no biasing value on their own
+STOPWORDS = {
+    "a", "an", "the", "to", "of", "in", "on", "at", "for", "is", "it",
+    "my", "me", "i", "you", "what", "whats", "what's", "how", "and", "or",
+    "this", "that", "up", "down", "with", "be", "do", "can", "please",
+}
+
+# Priorities: higher goes first into the prompt
+PRIORITY_NAMES = 2    # Bookmarks, websites, apps - rare words the model misses
+PRIORITY_COMMANDS = 1  # Intent patterns
+
+
+@dataclass
+class VocabularySource:
+    """A provider of biasing phrases with an optional change counter."""
+
+    name: str
+    phrases_fn: Callable[[], Iterable[str]]
+    version_fn: Optional[Callable[[], Any]] = None
+    priority: int = PRIORITY_COMMANDS
+    version: Any = None
+    phrases: List[str] = field(default_factory=list)
+    loaded: bool = False
+
+
+class CommandVocabulary:
+    """
+    Hotword/prompt builder fed from NLU command sources.
+
+    Features:
+    - Sources registered once, re-read only when their version changes
+    - Prompt text within a character budget (names first, then commands)
+    - Ranked hotword list of content words
+    - Cached outputs until a source changes
+    """
+
+    # Common desktop apps users ask to open/close/focus
+    DEFAULT_APP_NAMES = [
+        "chrome", "firefox", "edge", "safari", "notepad", "calculator",
+        "spotify", "discord", "slack", "zoom", "teams", "outlook", "word",
+        "excel", "powerpoint", "vs code", "terminal", "file explorer",
+        "settings", "task manager",
+    ]
+
+    def __init__(self, max_prompt_chars: int = 400, max_hotwords: int = 50):
+        """
+        Initialize vocabulary.
+
+        Args:
+            max_prompt_chars: Prompt budget (Whisper keeps ~224 prompt tokens)
+            max_hotwords: Maximum number of hotwords
+        """
+        self.max_prompt_chars = max_prompt_chars
+        self.max_hotwords = max_hotwords
+        self.metrics = get_metrics_collector()
+
+        self._lock = Lock()
+        self._sources: Dict[str, VocabularySource] = {}
+        self._prompt: Optional[str] = None
+        self._hotwords: Optional[str] = None
+        self.version = 0
+        self.rebuilds = 0
+
+    def add_source(
+        self,
+        name: str,
+        phrases_fn: Callable[[], Iterable[str]],
+        version_fn: Optional[Callable[[], Any]] = None,
+        priority: int = PRIORITY_COMMANDS,
+    ):
+        """
+        Register (or replace) a phrase source.
+
+        Args:
+            name: Source name
+            phrases_fn: Returns the source's phrases
+            version_fn: Returns a value that changes whenever the phrases
+                change (None = static source, read once)
+            priority: Prompt ordering priority (higher first)
+        """
+        with self._lock:
+            self._sources[name] = VocabularySource(
+                name=name,
+                phrases_fn=phrases_fn,
+                version_fn=version_fn,
+                priority=priority,
+            )
+            self._invalidate()
+
+    def add_classifier(self, classifier):
+        """
+        Use an IntentClassifier's patterns as a source.
+
+        Args:
+            classifier: IntentClassifier instance
+        """
+        self.add_source(
+            "intents",
+            lambda: [p for patterns in classifier.patterns.values() for p in patterns],
+            lambda: getattr(classifier, "patterns_version", 0),
+            priority=PRIORITY_COMMANDS,
+        )
+
+    def add_web_skills(self, web_skills):
+        """
+        Use WebQuickSkills bookmark and website names as a source.
+
+        Args:
+            web_skills: WebQuickSkills instance
+        """
+        self.add_source(
+            "websites",
+            lambda: list(web_skills.bookmarks) + list(web_skills.WEBSITE_MAP),
+            lambda: getattr(web_skills, "bookmarks_version", 0),
+            priority=PRIORITY_NAMES,
+        )
+
+    def add_app_names(self, app_names: Optional[Iterable[str]] = None):
+        """
+        Add app names as a static source.
+
+        Args:
+            app_names: App names (default: DEFAULT_APP_NAMES)
+        """
+        names = list(app_names) if app_names is not None else list(self.DEFAULT_APP_NAMES)
+        self.add_source("apps", lambda: names, priority=PRIORITY_NAMES)
+
+    def refresh(self) -> bool:
+        """
+        Re-read sources whose version changed.
+
+        Returns:
+            True if the vocabulary changed
+        """
+        with self._lock:
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> bool:
+        """Refresh changed sources (caller holds the lock)."""
+        changed = False
+
+        for source in self._sources.values():
+            version = source.version_fn() if source.version_fn else None
+            if source.loaded and version == source.version:
+                continue
+
+            try:
+                source.phrases = self._normalize(source.phrases_fn())
+            except Exception as e:
+                logger.warning(f"Failed to read vocabulary source '{source.name}': {e}")
+                continue
+
+            source.version = version
+            source.loaded = True
+            changed = True
+            self.rebuilds += 1
+            self.metrics.increment("stt.vocabulary.rebuilds")
+            logger.debug(
+                f"Vocabulary source '{source.name}' rebuilt: "
+                f"{len(source.phrases)} phrases"
+            )
+
+        if changed:
+            self._invalidate()
+        return changed
+
+    def _invalidate(self):
+        """Drop cached outputs (caller holds the lock)."""
+        self._prompt = None
+        self._hotwords = None
+        self.version += 1
+
+    @staticmethod
+    def _normalize(phrases: Iterable[str]) -> List[str]:
+        """Lowercase, strip punctuation and de-duplicate phrases."""
+        seen = set()
+        result = []
+        for phrase in phrases:
+            phrase = re.sub(r"[^\w\s']", " ", str(phrase).lower())
+            phrase = " ".join(phrase.split())
+            if phrase and phrase not in seen:
+                seen.add(phrase)
+                result.append(phrase)
+        return result
+
+    def _ordered_sources(self) -> List[VocabularySource]:
+        """Sources by priority (stable for equal priorities)."""
+        return sorted(self._sources.values(), key=lambda s: -s.priority)
+
+    def get_phrases(self) -> List[str]:
+        """
+        Get all phrases, highest priority first.
+
+        Returns:
+            List of normalized phrases
+        """
+        with self._lock:
+            self._refresh_locked()
+            phrases = []
+            for source in self._ordered_sources():
+                phrases.extend(source.phrases)
+            return phrases
+
+    def get_prompt(self) -> str:
+        """
+        Get decoding prompt text.
+
+        Names are added first. Command phrases follow, picking greedily the
+        phrase that adds the most common new words per character, until
+        the budget is used.
+
+        Returns:
+            Comma-separated phrase list (empty if no sources)
+        """
+        with self._lock:
+            self._refresh_locked()
+            if self._prompt is None:
+                self._prompt = self._build_prompt()
+            return self._prompt
+
+    def _build_prompt(self) -> str:
+        """Build prompt text within the character budget."""
+        covered = set()
+        parts = []
+        length = 0
+
+        for source in self._ordered_sources():
+            counts = Counter(
+                word for phrase in source.phrases for word in _content_words(phrase)
+            )
+
+            def gain(phrase: str) -> float:
+                # Frequency-weighted new words per prompt character
+                new_words = set(_content_words(phrase)) - covered
+                return sum(counts[w] for w in new_words) / len(phrase)
+
+            remaining = list(source.phrases)
+            while remaining:
+                best = max(remaining, key=gain)
+                if gain(best) == 0:
+                    break
+                remaining.remove(best)
+
+                added = len(best) + (2 if parts else 0)
+                if length + added > self.max_prompt_chars:
+                    continue
+
+                parts.append(best)
+                covered.update(_content_words(best))
+                length += added
+
+        return ", ".join(parts)
+
+    def get_hotwords(self) -> str:
+        """
+        Get hotword list.
+
+        Words are ranked by source priority, then by how many phrases
+        use them.
+
+        Returns:
+            Space-separated hotwords (empty if no sources)
+        """
+        with self._lock:
+            self._refresh_locked()
+            if self._hotwords is None:
+                self._hotwords = self._build_hotwords()
+            return self._hotwords
+
+    def _build_hotwords(self) -> str:
+        """Build ranked hotword string."""
+        ranks: Dict[str, tuple] = {}
+
+        for source in self._sources.values():
+            counts = Counter(
+                word for phrase in source.phrases for word in _content_words(phrase)
+            )
+            for word, count in counts.items():
+                rank = (source.priority, count)
+                if rank > ranks.get(word, (-1, 0)):
+                    ranks[word] = rank
+
+        ordered = sorted(ranks, key=lambda w: ranks[w], reverse=True)
+        return " ".join(ordered[:self.max_hotwords])
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get vocabulary statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        with self._lock:
+            return {
+                "version": self.version,
+                "sources": {
+                    name: len(source.phrases)
+                    for name, source in self._sources.items()
+                },
+                "rebuilds": self.rebuilds,
+            }
+
+
+def _content_words(phrase: str) -> List[str]:
+    """Words of a phrase worth biasing towards."""
+    return [w for w in phrase.split() if w not in STOPWORDS and len(w) > 1]
+
+
+def build_command_vocabulary(
+    classifier=None,
+    web_skills=None,
+    app_names: Optional[Iterable[str]] = None,
+    max_prompt_chars: int = 400,
+    max_hotwords: int = 50,
+) -> CommandVocabulary:
+    """
+    Build a vocabulary from the standard command sources.
+
+    Args:
+        classifier: IntentClassifier (optional)
+        web_skills: WebQuickSkills (optional)
+        app_names: App names (default: CommandVocabulary.DEFAULT_APP_NAMES)
+        max_prompt_chars: Prompt budget
+        max_hotwords: Maximum number of hotwords
+
+    Returns:
+        CommandVocabulary instance
+    """
+    vocabulary = CommandVocabulary(
+        max_prompt_chars=max_prompt_chars,
+        max_hotwords=max_hotwords,
+    )
+    if classifier is not None:
+        vocabulary.add_classifier(classifier)
+    if web_skills is not None:
+        vocabulary.add_web_skills(web_skills)
+    vocabulary.add_app_names(app_names)
+    return vocabulary
@@ -3,8 +3,9 @@ Google Calendar integration skills.
 Provides event creation, reading, and management.
 """
 
+import time
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from loguru import logger
 
 from ..nlu.intents import Intent, IntentType
@@ -17,6 +18,9 @@ class CalendarSkills:
     Requires Google Calendar API credentials.
     """
 
+    # Oldest prefetched event list a confirmed speculation is answered from
+    PREFETCH_MAX_AGE_S = 5.0
+
     def __init__(self, credentials_file: str = "credentials.json"):
         """
         Initialize calendar skills.
@@ -26,6 +30,7 @@ class CalendarSkills:
         """
         self.credentials_file = credentials_file
         self.service = None
+        self._prefetched_events: Optional[Tuple[float, int, SkillResult]] = None
         self._initialize_service()
         logger.info("CalendarSkills initialized")
 
@@ -129,6 +134,7 @@ class CalendarSkills:
                 body=event
             ).execute()
 
+            self._prefetched_events = None
             logger.info(f"Created calendar event: {summary}")
             return SkillResult(
                 success=True,
@@ -142,12 +148,14 @@ class CalendarSkills:
                 message=f"Failed to create event: {str(e)}"
             )
 
-    def list_upcoming_events(self, max_results: int = 10) -> SkillResult:
+    def list_upcoming_events(self, max_results: int = 10, prefetched: bool = False) -> SkillResult:
         """
         List upcoming calendar events.
         
         Args:
             max_results: Maximum number of events to return
+            prefetched: Answer from the list warm_up() fetched, if it is
+                at most PREFETCH_MAX_AGE_S old (used once)
             
         Returns:
             Skill result with events data
@@ -158,6 +166,12 @@ class CalendarSkills:
                 message="Calendar service not available"
             )
 
+        if prefetched and self._prefetched_events:
+            fetched_at, fetched_max, result = self._prefetched_events
+            self._prefetched_events = None
+            if fetched_max == max_results and time.monotonic() - fetched_at < self.PREFETCH_MAX_AGE_S:
+                return result
+
         try:
             now = datetime.utcnow().isoformat() + 'Z'
             events_result = self.service.events().list(
@@ -200,6 +214,30 @@ class CalendarSkills:
                 message=f"Failed to list events: {str(e)}"
             )
 
+    def warm_up(self, intent: Intent) -> None:
+        """
+        Prepare for a likely event listing before it is confirmed.
+        
+        Fetches the upcoming events; handle_intent() answers the confirmed
+        LIST_EVENTS from them once.
+        
+        Args:
+            intent: Likely intent
+        """
+        if intent.type == IntentType.LIST_EVENTS:
+            result = self.list_upcoming_events()
+            if result.success:
+                self._prefetched_events = (time.monotonic(), 10, result)
+
+    def discard_warm_up(self, intent: Intent) -> None:
+        """
+        Drop what warm_up() fetched for a speculation that didn't hold.
+        
+        Args:
+            intent: Intent that was warmed up
+        """
+        self._prefetched_events = None
+
     def handle_intent(self, intent: Intent) -> SkillResult:
         """
         Handle calendar-related intents.
@@ -210,6 +248,12 @@ class CalendarSkills:
         Returns:
             Skill result
         """
+        if intent.type == IntentType.LIST_EVENTS:
+            return self.list_upcoming_events(prefetched=True)
+
+        # Anything else may change the calendar under a prefetched list
+        self._prefetched_events = None
+
         if intent.type == IntentType.CREATE_EVENT:
             # Parse event details from entities
             # This is simplified - production would use proper datetime parsing
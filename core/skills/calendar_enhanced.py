@@ -396,6 +396,7 @@ class EnhancedCalendarSkills(CalendarSkills):
                 calendarId='primary',
                 body=event
             ).execute()
+            self._prefetched_events = None
             
             message = f"Created event '{event_data['summary']}' at {event_data['start_time'].strftime('%I:%M %p on %B %d')}"
             
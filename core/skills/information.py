@@ -5,6 +5,7 @@ Provides quick information responses.
 
 from datetime import datetime
 from typing import Optional
+import time
 import platform
 import psutil
 from loguru import logger
@@ -19,10 +20,35 @@ class InformationSkills:
     Provides time, date, weather, system info, etc.
     """
 
+    # Shortest CPU sampling window psutil reports meaningfully
+    MIN_CPU_SAMPLE_S = 0.1
+
     def __init__(self):
         """Initialize information skills."""
+        self._cpu_sample_started: Optional[float] = None
         logger.info("InformationSkills initialized")
 
+    def warm_up(self, intent: Intent) -> None:
+        """
+        Prepare for a likely intent before it is confirmed.
+        
+        Starts the CPU usage sample so get_system_info() needn't block
+        for a second measuring it.
+        
+        Args:
+            intent: Likely intent
+        """
+        if intent.type == IntentType.GET_SYSTEM_INFO:
+            psutil.cpu_percent(interval=None)
+            self._cpu_sample_started = time.monotonic()
+
+    def _cpu_percent(self) -> float:
+        """CPU usage since warm_up(), or over a fresh one-second sample."""
+        started, self._cpu_sample_started = self._cpu_sample_started, None
+        if started is not None and time.monotonic() - started >= self.MIN_CPU_SAMPLE_S:
+            return psutil.cpu_percent(interval=None)
+        return psutil.cpu_percent(interval=1)
+
     def get_time(self) -> SkillResult:
         """
         Get current time.
@@ -69,7 +95,7 @@ class InformationSkills:
                 "machine": platform.machine(),
                 "processor": platform.processor(),
                 "cpu_count": psutil.cpu_count(),
-                "cpu_percent": psutil.cpu_percent(interval=1),
+                "cpu_percent": self._cpu_percent(),
                 "memory_total": psutil.virtual_memory().total // (1024 ** 3),  # GB
                 "memory_used": psutil.virtual_memory().used // (1024 ** 3),  # GB
                 "memory_percent": psutil.virtual_memory().percent
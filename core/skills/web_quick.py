@@ -73,6 +73,7 @@ class WebQuickSkills:
         self.bookmarks_file = bookmarks_file
         self.bookmarks_file.parent.mkdir(parents=True, exist_ok=True)
         self.bookmarks: Dict[str, str] = {}
+        self.bookmarks_version = 0  # Bumped on every load/save
         self.load_bookmarks()
         
         logger.info("WebQuickSkills initialized")
@@ -85,6 +86,7 @@ class WebQuickSkills:
         try:
             with open(self.bookmarks_file, 'r') as f:
                 self.bookmarks = json.load(f)
+            self.bookmarks_version += 1
             logger.info(f"Loaded {len(self.bookmarks)} bookmarks")
         except Exception as e:
             logger.warning(f"Failed to load bookmarks: {e}")
@@ -92,6 +94,8 @@ class WebQuickSkills:
     
     def save_bookmarks(self):
         """Save bookmarks to file."""
+        # In-memory bookmarks changed even if the write below fails
+        self.bookmarks_version += 1
         try:
             with open(self.bookmarks_file, 'w') as f:
                 json.dump(self.bookmarks, f, indent=2)
@@ -84,6 +84,10 @@ class PiperTTS:
             logger.error(f"TTS failed: {e}")
             return None
 
+    def warmup(self) -> None:
+        """Synthesize a short phrase without playing it (loads the voice model)."""
+        self.speak("Ready.", play_audio=False)
+
     def _run_piper(self, text: str, output_file: str) -> None:
         """
         Run Piper binary to generate speech.
@@ -0,0 +1,232 @@
+"""
+Background model preloading and warm-up.
+
+Loads slow components (STT, VAD, TTS) in background threads at startup
+and runs a short dummy inference through each, so the UI can accept
+typed commands immediately and the first spoken command doesn't pay for
+model loading or lazy initialization.
+"""
+
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Thread, Event, Lock
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.metrics import get_metrics_collector
+
+
+@dataclass
+class WarmupComponent:
+    """A component being loaded in the background."""
+
+    name: str
+    loader: Callable[[], Any]
+    warm: bool = True
+    ready: Event = field(default_factory=Event)
+    instance: Any = None
+    error: Optional[str] = None
+    load_ms: float = 0.0
+    warmup_ms: float = 0.0
+
+
+class ModelWarmup:
+    """
+    Loads and warms components in background threads.
+
+    Features:
+    - One loader thread per component
+    - Warm-up via the component's warmup() method, if it has one
+    - Per-component readiness (non-blocking checks or timed waits)
+    - Load/warm-up timings and time-to-first-command metrics
+    """
+
+    def __init__(self, metrics_prefix: str = "startup"):
+        """
+        Initialize warm-up coordinator.
+
+        Args:
+            metrics_prefix: Prefix for reported metric names
+        """
+        self.metrics_prefix = metrics_prefix
+        self.metrics = get_metrics_collector()
+
+        # Startup reference point for readiness/first-command timings
+        self.started_at = time.perf_counter()
+        self.first_command_ms: Optional[float] = None
+
+        self._components: Dict[str, WarmupComponent] = {}
+        self._callbacks: List[Callable[[str, Any], None]] = []
+        self._lock = Lock()
+
+    def add(self, name: str, loader: Callable[[], Any], warm: bool = True):
+        """
+        Register a component.
+
+        Args:
+            name: Component name (e.g. "stt", "vad", "tts")
+            loader: Creates the component (may return None if unavailable)
+            warm: Call the component's warmup() method after loading
+        """
+        self._components[name] = WarmupComponent(name=name, loader=loader, warm=warm)
+
+    def on_ready(self, callback: Callable[[str, Any], None]):
+        """
+        Register a readiness callback.
+
+        Called from the loader thread with (name, instance); instance is
+        None if loading failed.
+
+        Args:
+            callback: Function to call
+        """
+        self._callbacks.append(callback)
+
+    def start(self):
+        """Start loading all registered components."""
+        for component in self._components.values():
+            Thread(
+                target=self._load,
+                args=(component,),
+                name=f"warmup-{component.name}",
+                daemon=True,
+            ).start()
+
+        logger.info(f"Warming up in background: {', '.join(self._components)}")
+
+    def _load(self, component: WarmupComponent):
+        """Load and warm one component (runs in its own thread)."""
+        try:
+            start_time = time.perf_counter()
+            instance = component.loader()
+            component.load_ms = (time.perf_counter() - start_time) * 1000
+
+            if instance is not None and component.warm and hasattr(instance, "warmup"):
+                start_time = time.perf_counter()
+                if instance.warmup() is False:
+                    component.error = "warm-up failed"  # Still usable, but cold
+                component.warmup_ms = (time.perf_counter() - start_time) * 1000
+
+            component.instance = instance
+            if instance is None:
+                component.error = "not available"
+
+        except Exception as e:
+            logger.error(f"Failed to load {component.name}: {e}")
+            component.error = str(e)
+
+        ready_ms = (time.perf_counter() - self.started_at) * 1000
+        prefix = f"{self.metrics_prefix}.{component.name}"
+        self.metrics.record_value(f"{prefix}.load_ms", component.load_ms)
+        self.metrics.record_value(f"{prefix}.warmup_ms", component.warmup_ms)
+        self.metrics.record_value(f"{prefix}.ready_ms", ready_ms)
+
+        logger.info(
+            f"{component.name} ready in {ready_ms:.0f}ms "
+            f"(load: {component.load_ms:.0f}ms, warm-up: {component.warmup_ms:.0f}ms)"
+            + (f" - {component.error}" if component.error else "")
+        )
+        component.ready.set()
+
+        for callback in self._callbacks:
+            try:
+                callback(component.name, component.instance)
+            except Exception as e:
+                logger.error(f"Error in warm-up callback: {e}")
+
+    def is_ready(self, name: str) -> bool:
+        """
+        Check if a component finished loading (successfully or not).
+
+        Args:
+            name: Component name
+
+        Returns:
+            True if loading finished
+        """
+        component = self._components.get(name)
+        return component is not None and component.ready.is_set()
+
+    def wait(self, name: str, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a component to finish loading.
+
+        Args:
+            name: Component name
+            timeout: Maximum wait in seconds (None = forever)
+
+        Returns:
+            True if loading finished within the timeout
+        """
+        component = self._components.get(name)
+        return component is not None and component.ready.wait(timeout)
+
+    def get(self, name: str, timeout: Optional[float] = 0.0) -> Any:
+        """
+        Get a loaded component.
+
+        Args:
+            name: Component name
+            timeout: Time to wait for loading (0 = don't wait, None = forever)
+
+        Returns:
+            Component instance, or None if not ready or unavailable
+        """
+        if not self.wait(name, timeout):
+            return None
+        return self._components[name].instance
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every component to finish loading.
+
+        Args:
+            timeout: Maximum total wait in seconds (None = forever)
+
+        Returns:
+            True if all components finished within the timeout
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        for component in self._components.values():
+            remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            if not component.ready.wait(remaining):
+                return False
+        return True
+
+    def mark_first_command(self):
+        """Record time from startup to the first handled command (once)."""
+        with self._lock:
+            if self.first_command_ms is not None:
+                return
+            self.first_command_ms = (time.perf_counter() - self.started_at) * 1000
+
+        self.metrics.record_value(
+            f"{self.metrics_prefix}.time_to_first_command_ms", self.first_command_ms
+        )
+        logger.info(f"Time to first command: {self.first_command_ms:.0f}ms")
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get loading status of all components.
+
+        Returns:
+            Dictionary with per-component status
+        """
+        return {
+            "components": {
+                name: {
+                    "ready": component.ready.is_set(),
+                    "available": component.instance is not None,
+                    "error": component.error,
+                    "load_ms": component.load_ms,
+                    "warmup_ms": component.warmup_ms,
+                }
+                for name, component in self._components.items()
+            },
+            "time_to_first_command_ms": self.first_command_ms,
+        }
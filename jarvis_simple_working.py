@@ -16,6 +16,7 @@ from PySide6.QtWidgets import *
 from PySide6.QtCore import *
 from PySide6.QtGui import *
 import asyncio
+import time
 import logging
 
 sys.path.insert(0, str(Path(__file__).parent))
@@ -25,12 +26,17 @@ from core.skills.information import InformationSkills
 from core.skills.system import SystemSkills
 from core.skills.reminders import ReminderSkills
 from core.nlu.router import CommandRouter
+from core.nlu.vocabulary import build_command_vocabulary
+from core.warmup import ModelWarmup
+from core.config.config_manager import get_config
+from core.metrics import PipelineMetrics, get_metrics_collector
 
 # Voice
 try:
     import sounddevice as sd
     import numpy as np
     from core.audio.stt_faster_whisper import create_faster_whisper
+    from core.audio.stt_backend import STTBackendManager
     from simple_tts import SimpleTTS
     VOICE_OK = True
 except:
@@ -50,6 +56,23 @@ class SimpleJarvisUI(QMainWindow):
         print("INITIALIZING SIMPLE JARVIS...")
         print("="*60)
         
+        # Voice engines load in the background so typed commands work right away
+        self.warmup = ModelWarmup()
+        if VOICE_OK:
+            print("Loading voice engines in background...")
+            # Model/threads come from settings (written by core.audio.stt_tuner)
+            stt_config = get_config().get("stt.faster_whisper", {"model_size": "tiny"})
+            if get_config().get("stt.policy", "single") == "race":
+                # Fast and accurate model against a deadline (stt.race)
+                race_config = get_config().get("stt.race", {})
+                self.warmup.add("stt", lambda: STTBackendManager(
+                    policy="race", race=race_config, faster_whisper=stt_config
+                ))
+            else:
+                self.warmup.add("stt", lambda: create_faster_whisper(**stt_config))
+            self.warmup.add("tts", SimpleTTS)
+            self.warmup.start()
+        
         # Backend
         print("Loading NLU...")
         self.classifier = IntentClassifier()
@@ -71,22 +94,49 @@ class SimpleJarvisUI(QMainWindow):
         for i in [IntentType.SET_TIMER, IntentType.LIST_REMINDERS]:
             self.router.register_handler(i, self.reminders.handle_intent)
         
-        # Voice
+        # Voice (filled in by _check_voice_ready once warmed up)
         self.stt = None
         self.tts = None
         self.recording = False
         
-        if VOICE_OK:
-            print("Loading voice engines...")
-            self.stt = create_faster_whisper(model_size="tiny")
-            self.tts = SimpleTTS()
-            print("[OK] Voice ready!")
-        
         print("Building UI...")
         self.setup_ui()
+        
+        if VOICE_OK:
+            self.voice_btn.setEnabled(False)
+            self.voice_btn.setText("🎙️ Loading...")
+            self.ready_timer = QTimer(self)
+            self.ready_timer.timeout.connect(self._check_voice_ready)
+            self.ready_timer.start(200)
+        
         print("[OK] JARVIS READY!")
         print("="*60)
     
+    def _check_voice_ready(self):
+        """Pick up voice engines as they finish warming up (UI thread)."""
+        if self.stt is None and self.warmup.is_ready("stt"):
+            self.stt = self.warmup.get("stt")
+            if self.stt:
+                # Bias the tiny model towards the commands we understand
+                biasing = get_config().get("stt.biasing", {})
+                if biasing.get("enabled", True):
+                    vocabulary = build_command_vocabulary(
+                        self.classifier,
+                        app_names=biasing.get("app_names"),
+                        max_prompt_chars=biasing.get("max_prompt_chars", 400),
+                        max_hotwords=biasing.get("max_hotwords", 50),
+                    )
+                    self.stt.set_vocabulary(vocabulary, biasing.get("mode", "prompt"))
+                print("[OK] Voice input ready!")
+            self.voice_btn.setEnabled(True)
+            self.voice_btn.setText("🎙️ Voice")
+        
+        if self.tts is None and self.warmup.is_ready("tts"):
+            self.tts = self.warmup.get("tts")
+        
+        if self.warmup.is_ready("stt") and self.warmup.is_ready("tts"):
+            self.ready_timer.stop()
+    
     def setup_ui(self):
         """Setup UI."""
         self.setWindowTitle("Jarvis - Simple & Working")
@@ -260,6 +310,10 @@ class SimpleJarvisUI(QMainWindow):
     
     def voice_click(self):
         """Voice button clicked."""
+        if VOICE_OK and not self.warmup.is_ready("stt"):
+            self.add_msg("Jarvis", "Voice is still loading, please type for now")
+            return
+        
         if not VOICE_OK or not self.stt:
             self.add_msg("Jarvis", "Voice not available")
             return
@@ -368,19 +422,27 @@ class SimpleJarvisUI(QMainWindow):
         try:
             # Classify
             print("  1. Classifying...")
-            intent = self.classifier.classify(command)
-            print(f"  2. Intent: {intent.type}")
+            intents = self.classifier.classify_multi(command)
+            print(f"  2. Intent: {', '.join(str(intent.type) for intent in intents)}")
             
             # Route
             print("  3. Routing...")
-            result = asyncio.run(self.router.route(intent))
+            action_start = time.perf_counter()
+            result = asyncio.run(self.router.route_many(intents))
             print(f"  4. Result: {result.message}")
             
+            get_metrics_collector().record_metrics(PipelineMetrics(
+                nlu_time=self.classifier.last_timings.get("total", 0.0),
+                nlu_stages=dict(self.classifier.last_timings),
+                action_time=(time.perf_counter() - action_start) * 1000,
+            ))
+            
             # Show
             if result and result.message:
                 self.status.setText("● Speaking...")
                 self.status.setStyleSheet("color: #3B82F6;")
                 self.add_msg("Jarvis", result.message)
+                self.warmup.mark_first_command()
                 
                 # Force UI update
                 QApplication.processEvents()
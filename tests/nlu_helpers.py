@@ -0,0 +1,27 @@
+"""
+Shared helpers for the NLU tests.
+"""
+
+import spacy
+
+from core.nlu.intents import IntentClassifier
+
+
+def make_classifier(nlp=None, cache_size: int = 0) -> IntentClassifier:
+    """
+    IntentClassifier with the built-in patterns and no downloaded spaCy
+    model.
+
+    Args:
+        nlp: spaCy pipeline stand-in (default: spacy.blank("en"))
+        cache_size: Max cached utterances (0 disables)
+
+    Returns:
+        Classifier without custom patterns or the fast path
+    """
+    return IntentClassifier(
+        nlp=nlp if nlp is not None else spacy.blank("en"),
+        custom_patterns="",
+        cache_size=cache_size,
+        fast_classifier=False,
+    )
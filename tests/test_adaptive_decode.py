@@ -0,0 +1,137 @@
+"""
+Test script for adaptive (greedy-first) faster-whisper decoding.
+Tests the beam-cost seed from warm-up, each fallback reason and the
+saving/fallback-cost metrics, with a stubbed decoder.
+"""
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from loguru import logger
+
+from core.audio.stt_faster_whisper import FasterWhisperSTT
+from core.metrics import MetricsCollector
+
+
+GOOD = {"avg_logprob": -0.2, "no_speech_prob": 0.1, "compression_ratio": 1.5}
+
+AUDIO = np.zeros(32000, dtype=np.float32)  # 2 s
+
+
+class StubbedSTT(FasterWhisperSTT):
+    """FasterWhisperSTT whose decoder returns canned segments."""
+
+    def __init__(self, greedy_segment: dict, greedy_s: float = 0.01, beam_s: float = 0.05):
+        self.language = "en"
+        self.beam_size = 5
+        self.best_of = 5
+        self.vad_filter = True
+        self.trust_upstream_vad = False
+        self.adaptive_decode = True
+        self.fallback_log_prob_threshold = -1.0
+        self.fallback_no_speech_threshold = 0.6
+        self.fallback_compression_ratio_threshold = 2.4
+        self.vocabulary = None
+        self.bias_mode = "prompt"
+        self.metrics = MetricsCollector()
+        self._beam_ms_per_second = None
+
+        self.greedy_segment = greedy_segment
+        self.greedy_s = greedy_s
+        self.beam_s = beam_s
+        self.calls = []
+
+    def _decode(self, audio_data, language=None, should_cancel=None, **options):
+        beam = options["beam_size"] > 1
+        self.calls.append("beam" if beam else "greedy")
+        time.sleep(self.beam_s * len(audio_data) / 16000 if beam else self.greedy_s)
+        fields = GOOD if beam else self.greedy_segment
+        segment = SimpleNamespace(text="beam" if beam else "greedy", **fields)
+        return [segment], SimpleNamespace(language="en", language_probability=1.0)
+
+
+def test_warmup_seeds_beam_cost():
+    """Warm-up times a beam decode, so the first greedy decode reports a saving."""
+    logger.info("=" * 60)
+    logger.info("Testing Adaptive Decoding")
+    logger.info("=" * 60)
+
+    stt = StubbedSTT(GOOD)
+    stt.warmup(duration_s=1.0)
+    assert stt.calls == ["beam"]
+    assert 40 <= stt._beam_ms_per_second < 200
+
+    assert stt.transcribe(AUDIO) == "greedy"
+    assert stt.calls == ["beam", "greedy"]
+
+    stats = stt.get_adaptive_stats()
+    logger.info(f"Saved per decode: {stats['latency_saved_ms']}")
+    assert stats["decodes"] == 1 and stats["fallbacks"] == 0
+    assert stats["latency_saved_ms"]["count"] == 1
+    assert stats["latency_saved_ms"]["avg"] > 50  # ~100ms beam vs ~10ms greedy
+    assert stats["fallback_cost_ms"] == {}
+    return True
+
+
+def test_fallback_reasons():
+    """Each unreliable-segment signal triggers a beam re-decode."""
+    for reason, value in (
+        ("avg_logprob", -1.5),
+        ("no_speech_prob", 0.9),
+        ("compression_ratio", 3.0),
+    ):
+        stt = StubbedSTT({**GOOD, reason: value})
+        stt.warmup(duration_s=1.0)
+        assert stt.transcribe(AUDIO) == "beam", reason
+        assert stt.calls == ["beam", "greedy", "beam"]
+
+        stats = stt.get_adaptive_stats()
+        assert stats["fallbacks"] == 1 and stats["fallback_reasons"][reason] == 1
+        # A fallback costs the greedy pass and saves nothing
+        assert stats["latency_saved_ms"] == {}
+        assert stats["fallback_cost_ms"]["count"] == 1
+        assert stats["fallback_cost_ms"]["avg"] > 0
+    return True
+
+
+def test_cancelled_fallback():
+    """No beam re-decode once the result is no longer wanted."""
+    stt = StubbedSTT({**GOOD, "avg_logprob": -2.0})
+    assert stt.transcribe(AUDIO, should_cancel=lambda: True) == ""
+    assert stt.calls == ["greedy"]
+
+    # Without a warm-up there is no beam cost to report savings against
+    stt = StubbedSTT(GOOD)
+    stt.transcribe(AUDIO)
+    assert stt.get_adaptive_stats()["latency_saved_ms"] == {}
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Warm-up seeds beam cost": test_warmup_seeds_beam_cost(),
+        "Fallback reasons": test_fallback_reasons(),
+        "Cancelled fallback": test_cancelled_fallback(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Test script for batch intent classification.
+Tests agreement with classify(), ordering, lazy consumption and
+multi-process classification.
+"""
+
+import sys
+import tempfile
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import spacy
+from loguru import logger
+
+from core.nlu.intents import IntentClassifier, IntentType
+from tests.nlu_helpers import make_classifier
+
+
+class CountingNLP:
+    """spaCy stand-in that counts parsed texts."""
+
+    def __init__(self):
+        self.nlp = spacy.blank("en")
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        return self.nlp(text)
+
+    def pipe(self, texts, batch_size=None):
+        for doc in self.nlp.pipe(texts, batch_size=batch_size):
+            self.calls += 1
+            yield doc
+
+
+PHRASES = [
+    "turn up the volume", "set volume to 50", "open chrome", "remind me to call mom at 5pm",
+    "set a timer for 5 minutes", "what time is it", "schedule meeting with bob tomorrow",
+    "search for python tutorials", "go to github.com", "check battery", "hello there",
+    "what's the weather in paris",
+]
+
+
+def summary(intent):
+    """Comparable view of an intent (relative dates compared by day)."""
+    entities = [
+        (e.type, e.value.date() if isinstance(e.value, datetime) else e.value, e.span)
+        for e in intent.entities
+    ]
+    return intent.type, round(intent.confidence, 6), entities, intent.raw_text
+
+
+def test_matches_classify():
+    """Same intents as one-at-a-time classify(), in input order."""
+    logger.info("=" * 60)
+    logger.info("Testing Batch Intent Classification")
+    logger.info("=" * 60)
+
+    classifier = make_classifier(CountingNLP())
+    texts = PHRASES * 25
+    expected = [summary(classifier.classify(text)) for text in texts]
+
+    classifier.nlp.calls = 0
+    results = [summary(intent) for intent in classifier.classify_many(texts, batch_size=16)]
+    assert results == expected
+
+    # nlp.pipe parsed only the NER-intent texts
+    ner_texts = sum(1 for text in texts if classifier._match_intent(text.lower())[0] in classifier.NER_INTENTS)
+    logger.info(f"{len(texts)} texts, {classifier.nlp.calls} parsed by spaCy")
+    assert classifier.nlp.calls == ner_texts < len(texts)
+    return True
+
+
+def test_lazy_stream():
+    """An endless input is consumed one batch at a time."""
+    classifier = make_classifier(CountingNLP())
+    consumed = []
+
+    def endless():
+        while True:
+            consumed.append(1)
+            yield PHRASES[len(consumed) % len(PHRASES)]
+
+    first = list(islice(classifier.classify_many(endless(), batch_size=10), 5))
+    assert len(first) == 5
+    assert len(consumed) <= 11
+    return True
+
+
+def test_multi_process():
+    """Worker processes give the same results, including runtime patterns."""
+    with tempfile.TemporaryDirectory() as tmp:
+        spacy.blank("en").to_disk(tmp)
+        classifier = IntentClassifier(tmp, custom_patterns="")
+        classifier.add_pattern(IntentType.VOLUME_UP, "pump it up")
+
+        texts = (PHRASES + ["pump it up"]) * 20
+        expected = [summary(classifier.classify(text)) for text in texts]
+        results = [summary(intent) for intent in classifier.classify_many(texts, batch_size=8, n_process=2)]
+
+    assert results == expected
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Matches classify": test_matches_classify(),
+        "Lazy stream": test_lazy_stream(),
+        "Multi-process": test_multi_process(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
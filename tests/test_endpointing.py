@@ -0,0 +1,116 @@
+"""
+Test script for adaptive endpointing.
+Tests silence timeouts, partial-driven stretching/early commit and caps.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from core.audio.endpointing import AdaptiveEndpointer, EndpointReason, sounds_incomplete
+
+FRAME = 480  # 30 ms at 16 kHz
+
+
+def run(endpointer, probabilities):
+    """Feed frames until an endpoint; return (reason, frames consumed)."""
+    for i, prob in enumerate(probabilities, 1):
+        reason = endpointer.process_frame(prob, FRAME)
+        if reason:
+            return reason, i
+    return None, len(probabilities)
+
+
+def speech_then_silence(speech_frames=30, silence_frames=200):
+    return [0.9] * speech_frames + [0.05] * silence_frames
+
+
+def test_base_timeout():
+    """Plain speech ends after the base timeout; mid-range probabilities hold state."""
+    logger.info("=" * 60)
+    logger.info("Testing Adaptive Endpointing")
+    logger.info("=" * 60)
+
+    endpointer = AdaptiveEndpointer(base_timeout_ms=600)
+    reason, frames = run(endpointer, speech_then_silence())
+    assert reason == EndpointReason.SILENCE
+    assert frames == 30 + 20  # 600 ms of 30 ms frames
+
+    # Probabilities between the thresholds don't count as silence
+    endpointer.reset()
+    reason, frames = run(endpointer, [0.9] * 10 + [0.4] * 30 + [0.05] * 100)
+    assert frames == 10 + 30 + 20
+    return True
+
+
+def test_partials():
+    """Incomplete partials stretch the timeout; complete commands commit early."""
+    endpointer = AdaptiveEndpointer(base_timeout_ms=600, extended_timeout_ms=1500, early_commit_ms=210)
+
+    endpointer.on_partial("set a timer for", confidence=0.9, is_command=True)
+    reason, frames = run(endpointer, speech_then_silence())
+    assert reason == EndpointReason.SILENCE and frames == 30 + 50
+
+    endpointer.reset()
+    endpointer.on_partial("what time is it", confidence=0.95, is_command=True, audio_ms=900)
+    reason, frames = run(endpointer, speech_then_silence())
+    assert reason == EndpointReason.EARLY_COMMIT and frames == 30 + 7
+
+    # A partial decoded from audio that stops before the speech did can't commit early
+    endpointer.reset()
+    endpointer.on_partial("what time is it", confidence=0.95, is_command=True, audio_ms=500)
+    reason, _ = run(endpointer, speech_then_silence())
+    assert reason == EndpointReason.SILENCE
+
+    # Low confidence -> normal timeout
+    endpointer.reset()
+    endpointer.on_partial("open the pod bay doors", confidence=0.3, is_command=True)
+    reason, frames = run(endpointer, speech_then_silence())
+    assert reason == EndpointReason.SILENCE and frames == 30 + 20
+
+    assert sounds_incomplete("remind me to")
+    assert sounds_incomplete("open")
+    assert not sounds_incomplete("open chrome.")
+    return True
+
+
+def test_caps():
+    """No speech and never-ending noise both terminate."""
+    endpointer = AdaptiveEndpointer(no_speech_timeout_ms=900, max_utterance_s=3.0)
+    reason, frames = run(endpointer, [0.05] * 200)
+    assert reason == EndpointReason.NO_SPEECH and frames == 30
+
+    endpointer.reset()
+    reason, frames = run(endpointer, [0.9] * 200)
+    assert reason == EndpointReason.MAX_DURATION and frames == 100
+
+    logger.info(f"Stats: {endpointer.get_statistics()['reasons']}")
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Base timeout": test_base_timeout(),
+        "Partials": test_partials(),
+        "Caps": test_caps(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
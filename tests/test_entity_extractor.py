@@ -0,0 +1,135 @@
+"""
+Test script for the precompiled entity extractor.
+Fuzzes every extractor against the original implementation and checks
+that intent-scoped extraction yields the same entities.
+"""
+
+import sys
+import random
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from core.nlu.entity_extractor import EntityExtractor
+from core.nlu.intents import Entity
+from tests.entity_reference import ReferenceEntityExtractor
+from tests.nlu_helpers import make_classifier
+
+
+VOCAB = [
+    "5", "12", "7", "30", "123", "0", ":", "am", "pm", "AM", "%", "percent", "at", "o'clock",
+    "oclock", "next", "in", "day", "days", "week", "weeks", "month", "months", "today",
+    "Tonight", "tomorrow", "yesterday", "monday", "Friday", "sunday", "second", "seconds",
+    "sec", "secs", "min", "minutes", "hour", "hours", "hr", "hrs", "one", "two", "ten",
+    "fifty", "hundred", "someone", "often", "open", "launch", "start", "run", "focus",
+    "switch to", "show", "the", "a", "an", "chrome", "Visual Studio", "https://Example.com/A",
+    "bob@mail.com", "x@y", "set", "volume", "remind", "me", "schedule", "list events",
+    "timer", "go to",
+]
+
+REFERENCE_DATE = datetime(2026, 3, 4, 10, 30)
+
+
+def random_texts(count: int, seed: int = 3):
+    """Random utterances built from entity-bearing fragments."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        parts = [rng.choice(VOCAB) for _ in range(rng.randint(1, 8))]
+        texts.append("".join(part + rng.choice([" ", " ", " ", "", ":", "  "]) for part in parts))
+    return texts
+
+
+def day_precision(value):
+    """Replace datetimes (computed from now()) by their date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, dict):
+        return {k: day_precision(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [day_precision(v) for v in value]
+    if isinstance(value, Entity):
+        return value.type, day_precision(value.value), value.confidence, value.span
+    return value
+
+
+def test_matches_reference():
+    """Every extractor returns exactly what the original did."""
+    logger.info("=" * 60)
+    logger.info("Testing Precompiled Entity Extractor")
+    logger.info("=" * 60)
+
+    new, old = EntityExtractor(), ReferenceEntityExtractor()
+    texts = random_texts(5000) + [
+        "set volume to 50", "set volume to 75 percent", "remind me in 5 minutes",
+        "set timer for 2 hours", "meeting tomorrow at 3pm", "alarm at 7:30 am",
+        "open chrome", "send email to john@example.com", "go to https://google.com",
+        "in 2 weeks on friday at 12:00 pm", "5 sec 3 min 2 hr 1 day", "",
+    ]
+
+    for text in texts:
+        assert new.extract_time(text) == old.extract_time(text), text
+        assert new.extract_date(text, REFERENCE_DATE) == old.extract_date(text, REFERENCE_DATE), text
+        assert new.extract_duration(text) == old.extract_duration(text), text
+        assert new.extract_numbers(text) == old.extract_numbers(text), text
+        assert new.extract_percentage(text) == old.extract_percentage(text), text
+        assert new.extract_app_name(text) == old.extract_app_name(text), text
+        assert new.extract_url(text) == old.extract_url(text), text
+        assert new.extract_email(text) == old.extract_email(text), text
+        assert day_precision(new.extract_all(text)) == day_precision(old.extract_all(text)), text
+
+    logger.info(f"{len(texts)} texts agree")
+    return True
+
+
+class FullPlan(dict):
+    """Extraction plan that runs every extractor for every intent."""
+
+    def get(self, key, default=None):
+        return EntityExtractor.KINDS
+
+
+def test_extraction_plan():
+    """Intent-scoped extraction builds the same entities as extracting everything."""
+    classifier = make_classifier()
+
+    planned = 0
+    for text in random_texts(2000, seed=11):
+        intent_type, _ = classifier._match_intent(text.lower().strip())
+        scoped = classifier._extract_entities(text, intent_type)
+        classifier.EXTRACTION_PLAN = FullPlan()
+        full = classifier._extract_entities(text, intent_type)
+        del classifier.EXTRACTION_PLAN
+        assert day_precision(scoped) == day_precision(full), text
+        planned += bool(classifier.EXTRACTION_PLAN.get(intent_type))
+
+    logger.info(f"{planned} texts with intents that extract entities")
+    assert planned > 200
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Matches reference": test_matches_reference(),
+        "Extraction plan": test_extraction_plan(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
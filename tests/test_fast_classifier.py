@@ -0,0 +1,133 @@
+"""
+Test script for the fast n-gram intent classifier.
+Tests near-miss phrasings, the hybrid with the pattern matcher, artifact
+round trips and lazy spaCy loading.
+"""
+
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import spacy
+from loguru import logger
+
+from core.nlu.fast_classifier import FastIntentClassifier, hash_features
+from core.nlu.intents import IntentClassifier, IntentType
+from tests.nlu_helpers import make_classifier
+
+
+def make_fast_classifier() -> IntentClassifier:
+    """IntentClassifier with the fast path trained in memory."""
+    classifier = make_classifier()
+    classifier.fast_classifier = FastIntentClassifier.train(classifier.training_examples())
+    return classifier
+
+
+def test_near_misses():
+    """Rephrasings the substring patterns miss are classified."""
+    logger.info("=" * 60)
+    logger.info("Testing Fast Intent Classifier")
+    logger.info("=" * 60)
+
+    classifier = make_fast_classifier()
+    cases = [
+        ("could you make the music a bit louder", IntentType.VOLUME_UP),
+        ("turn the volume down a bit", IntentType.VOLUME_DOWN),
+        ("how much battery is left", IntentType.GET_BATTERY),
+        ("wats the time", IntentType.GET_TIME),
+        ("fire up the terminal", IntentType.OPEN_APP),
+    ]
+    for text, expected in cases:
+        pattern_type, _ = classifier._match_intent(text)
+        intent = classifier.classify(text)
+        logger.info(f"'{text}': patterns {pattern_type.value} -> {intent.type.value} ({intent.confidence:.2f})")
+        assert intent.type == expected, text
+
+    # Confident pattern matches are left alone
+    assert classifier.classify("what time is it").confidence == 1.0
+    return True
+
+
+def test_latency_and_features():
+    """Prediction is sub-millisecond; features are deterministic."""
+    model = make_fast_classifier().fast_classifier
+    indices, values = hash_features("turn up the volume")
+    assert np.isclose(np.linalg.norm(values), 1.0)
+    assert np.array_equal(indices, hash_features("  Turn up  the volume ")[0])
+
+    model.predict("warm up")
+    start = time.perf_counter()
+    for _ in range(200):
+        model.predict("can you turn the volume up a bit please")
+    per_call_ms = (time.perf_counter() - start) * 1000 / 200
+    logger.info(f"Predict: {per_call_ms * 1000:.0f}us per call")
+    assert per_call_ms < 1.0
+    return True
+
+
+def test_artifact_round_trip():
+    """Saved models predict the same; changed training data retrains."""
+    classifier = make_classifier()
+    examples = classifier.training_examples()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "fast_intent.npz")
+        model = FastIntentClassifier.load_or_train(path, examples)
+        loaded = FastIntentClassifier.load_or_train(path, examples)
+        assert loaded.fingerprint == model.fingerprint
+        for text in ["sound up", "close the calculator app", "banana bread"]:
+            assert loaded.predict(text)[0] == model.predict(text)[0]
+            assert abs(loaded.predict(text)[1] - model.predict(text)[1]) < 1e-2
+
+        examples["get_time"].append("got the hour")
+        retrained = FastIntentClassifier.load_or_train(path, examples)
+        assert retrained.fingerprint != model.fingerprint
+        assert FastIntentClassifier.load(path).fingerprint == retrained.fingerprint
+    return True
+
+
+def test_lazy_spacy():
+    """spaCy loads only when an intent needs named entities."""
+    with tempfile.TemporaryDirectory() as tmp:
+        spacy.blank("en").to_disk(tmp)
+        classifier = make_fast_classifier()
+        classifier.model_name = tmp
+        classifier.nlp = None  # Loaded from model_name on first use
+
+        classifier.classify("turn the volume up")
+        classifier.classify("set volume to 40")
+        assert classifier._nlp is None
+
+        classifier.classify("schedule a meeting with bob")
+        assert classifier._nlp is not None
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Near misses": test_near_misses(),
+        "Latency and features": test_latency_and_features(),
+        "Artifact round trip": test_artifact_round_trip(),
+        "Lazy spaCy": test_lazy_spacy(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
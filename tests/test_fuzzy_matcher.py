@@ -0,0 +1,188 @@
+"""
+Test script for typo-tolerant pattern matching.
+Tests the edit distance and deletion index against brute force, STT
+near misses and that the exact matcher still decides when confident.
+"""
+
+import sys
+import time
+import random
+import string
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from core.nlu.fuzzy import DeletionIndex, FuzzyMatcher, edit_distance
+from core.nlu.intents import IntentType
+from tests.nlu_helpers import make_classifier
+
+
+def reference_distance(a: str, b: str) -> int:
+    """Unbounded optimal string alignment distance."""
+    d = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(len(a) + 1):
+        d[i][0] = i
+    for j in range(len(b) + 1):
+        d[0][j] = j
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[len(a)][len(b)]
+
+
+def random_word(rng: random.Random) -> str:
+    """Short word over a small alphabet (many near neighbours)."""
+    return "".join(rng.choice("abcdeor") for _ in range(rng.randint(1, 7)))
+
+
+def test_matches_brute_force():
+    """Distance and nearest-word lookup agree with exhaustive search."""
+    logger.info("=" * 60)
+    logger.info("Testing Fuzzy Pattern Matching")
+    logger.info("=" * 60)
+
+    rng = random.Random(5)
+    for _ in range(3000):
+        a, b = random_word(rng), random_word(rng)
+        exact = reference_distance(a, b)
+        assert edit_distance(a, b, 2) == min(exact, 3), (a, b)
+
+    vocabulary = {random_word(rng): rng.randint(1, 3) for _ in range(300)}
+    index = DeletionIndex(vocabulary, max_distance=2)
+    for _ in range(300):
+        query = random_word(rng)
+        distances = [(reference_distance(query, word), -count, word) for word, count in vocabulary.items()]
+        for max_distance in (1, 2):
+            within = [row for row in distances if row[0] <= max_distance]
+            expected = min(within) if within else None
+            found = index.lookup(query, max_distance)
+            assert found == ((expected[2], expected[0]) if expected else None), query
+    return True
+
+
+def test_near_misses():
+    """STT near misses resolve to the intended intent."""
+    classifier = make_classifier()
+    cases = [
+        ("turn up the volum", IntentType.VOLUME_UP),
+        ("lsit reminders", IntentType.LIST_REMINDERS),
+        ("wether today", IntentType.GET_WEATHER),
+        ("show my remniders", IntentType.LIST_REMINDERS),
+    ]
+    for text, expected in cases:
+        exact_type, _ = classifier._match_intent(text)
+        resolved_type, confidence = classifier._resolve_intent(text, *classifier._match_intent(text))
+        logger.info(f"'{text}': exact {exact_type.value} -> {resolved_type.value} ({confidence:.2f})")
+        assert resolved_type == expected, text
+
+    # Real words are not bent into pattern words
+    assert classifier.fuzzy_matcher.correct("remind me to call mom") == ("remind me to call mom", 0)
+    assert classifier.fuzzy_matcher.correct("hello there")[1] == 0
+    return True
+
+
+def test_exact_first():
+    """The fuzzy stage only runs below the confidence threshold."""
+    classifier = make_classifier()
+    calls = []
+    fuzzy = classifier.fuzzy_matcher
+    original_best = fuzzy.best
+    fuzzy.best = lambda text: calls.append(text) or original_best(text)
+
+    for text in ["what time is it", "check battery", "turn up the volume"]:
+        classifier._resolve_intent(text, *classifier._match_intent(text))
+    assert calls == []
+
+    classifier._resolve_intent("turn up the volum", *classifier._match_intent("turn up the volum"))
+    assert calls == ["turn up the volum"]
+
+    # Pattern edits rebuild the index with the automaton
+    classifier.add_pattern(IntentType.GET_BATTERY, "juice level")
+    assert classifier.fuzzy_matcher is not fuzzy
+    assert classifier._resolve_intent("juice levle", IntentType.UNKNOWN, 0.0)[0] == IntentType.GET_BATTERY
+    return True
+
+
+def test_real_words_kept():
+    """Real words missing from the patterns don't flip a classification."""
+    classifier = make_classifier()
+    cases = [
+        ("add lunch with sarah to my calendar", IntentType.UNKNOWN),
+        ("remove lunch from my calendar", IntentType.UNKNOWN),
+        ("book lunch with sarah", IntentType.CREATE_EVENT),
+        ("cancel the last command", IntentType.CANCEL),
+        ("store my locker is 12", IntentType.REMEMBER_FACT),
+    ]
+    for text, expected in cases:
+        assert classifier.fuzzy_matcher.correct(text)[1] == 0, text
+        assert classifier.classify(text).type == expected, text
+
+    # Other forms of a pattern word are not typos of it
+    fuzzy = FuzzyMatcher(classifier.matcher)
+    assert fuzzy.correct("cancel the last command") == ("cancel the last command", 0)
+    assert fuzzy.correct("add lunch")[0] == "add launch"
+    return True
+
+
+def test_fuzzy_needs_threshold():
+    """A corrected match only overrides a pattern match at the threshold."""
+    classifier = make_classifier()
+    fuzzy = classifier.fuzzy_matcher
+    for guess, expected in (
+        ((IntentType.HELP, 0.39), IntentType.CANCEL),
+        ((IntentType.HELP, 0.6), IntentType.HELP),
+    ):
+        fuzzy.best = lambda text: guess
+        assert classifier._resolve_intent("text", IntentType.CANCEL, 0.34)[0] == expected
+        assert classifier._resolve_intent("text", IntentType.UNKNOWN, 0.0)[0] == IntentType.HELP
+    return True
+
+
+def test_lookup_cost():
+    """Lookup time does not grow with the vocabulary."""
+    rng = random.Random(9)
+    queries = ["".join(rng.choice(string.ascii_lowercase) for _ in range(7)) for _ in range(300)]
+    timings = {}
+    for size in (200, 20000):
+        words = {"".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9))): 1 for _ in range(size)}
+        index = DeletionIndex(words, max_distance=2)
+        start = time.perf_counter()
+        for query in queries:
+            index.lookup(query, 2)
+        timings[size] = (time.perf_counter() - start) / len(queries) * 1e6
+    logger.info(f"Lookup: {timings[200]:.0f}us at 200 words, {timings[20000]:.0f}us at 20000 words")
+    assert timings[20000] < timings[200] * 5
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Matches brute force": test_matches_brute_force(),
+        "Near misses": test_near_misses(),
+        "Exact first": test_exact_first(),
+        "Real words kept": test_real_words_kept(),
+        "Fuzzy needs threshold": test_fuzzy_needs_threshold(),
+        "Lookup cost": test_lookup_cost(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Test script for incremental push-to-talk decoding.
+Tests word commitment, transcript assembly, bounded post-release work and
+the full-audio fallback when incremental decoding fails.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from loguru import logger
+
+from core.audio.stt_incremental import IncrementalDecoder, agreed_prefix
+from core.audio.stt_words import TimedWord
+from core.audio.voice_manager import VoiceManager
+
+SR = 16000
+WORD_S = 0.4  # One word every 400ms, 300ms long
+
+
+class FakeDecoder:
+    """
+    Decoder for synthetic audio whose samples hold their absolute time.
+
+    Word k spans [0.4k, 0.4k + 0.3) and is recognized once fully inside
+    the decoded audio.
+    """
+
+    def __init__(self):
+        self.decoded_s = []
+
+    def __call__(self, audio, prompt=""):
+        self.decoded_s.append(len(audio) / SR)
+        start_s = float(audio[0])
+        end_s = start_s + len(audio) / SR
+        time.sleep(0.002 * len(audio) / SR)  # Cost grows with audio length
+
+        words = []
+        k = int(np.ceil(start_s / WORD_S - 1e-6))
+        while k * WORD_S + 0.3 <= end_s:
+            words.append(TimedWord(k * WORD_S - start_s, k * WORD_S + 0.3 - start_s, f"w{k}"))
+            k += 1
+        return words
+
+
+def speak(decoder: IncrementalDecoder, seconds: float):
+    """Feed synthetic audio in 100ms chunks, faster than real time."""
+    chunk = SR // 10
+    for i in range(int(seconds * 10)):
+        samples = np.arange(i * chunk, (i + 1) * chunk, dtype=np.float64) / SR
+        decoder.add_audio(samples.astype(np.float32))
+        time.sleep(0.01)
+
+
+def run_utterance(seconds: float):
+    """Record and finish one utterance, returning (text, decoder fn)."""
+    fake = FakeDecoder()
+    decoder = IncrementalDecoder(
+        fake, interval_ms=20, min_decode_ms=500, holdback_ms=400,
+        metrics_prefix=f"test.incremental.{seconds}",
+    )
+    decoder.start()
+    speak(decoder, seconds)
+    text = decoder.finish()
+    return text, fake
+
+
+def test_agreed_prefix():
+    """Agreement compares normalized words."""
+    logger.info("=" * 60)
+    logger.info("Testing Incremental Decoder")
+    logger.info("=" * 60)
+
+    a = [TimedWord(0, 0.3, " Open"), TimedWord(0.4, 0.7, "the"), TimedWord(0.8, 1.1, "door")]
+    b = [TimedWord(0, 0.3, "open"), TimedWord(0.4, 0.7, "the"), TimedWord(0.8, 1.1, "drawer")]
+    assert agreed_prefix(a, b) == 2
+    assert agreed_prefix([], b) == 0
+    return True
+
+
+def test_full_transcript():
+    """Committed words and the final tail form the whole utterance."""
+    text, fake = run_utterance(4.0)
+    expected = " ".join(f"w{k}" for k in range(10))
+    logger.info(f"Transcript: '{text}' ({len(fake.decoded_s)} decodes)")
+    assert text == expected, text
+    return True
+
+
+def test_tail_independent_of_length():
+    """Audio decoded after release stays short for long utterances."""
+    _, short = run_utterance(3.0)
+    text, long = run_utterance(12.0)
+
+    assert text.split() == [f"w{k}" for k in range(30)]
+    logger.info(
+        f"Tail decoded after release: {short.decoded_s[-1]:.2f}s (3s utterance), "
+        f"{long.decoded_s[-1]:.2f}s (12s utterance)"
+    )
+    assert long.decoded_s[-1] < 1.5
+    assert max(long.decoded_s) < 7.0, "Every decode must stay bounded"
+    return True
+
+
+class FakeRecorder:
+    """Input manager stand-in returning a fixed recording."""
+
+    def __init__(self, audio):
+        self.audio = audio
+        self.on_audio = None
+
+    def stop_recording(self):
+        return self.audio
+
+
+class FakeSTT:
+    """Full-audio STT stand-in."""
+
+    def __init__(self, text):
+        self.text = text
+        self.calls = 0
+
+    def transcribe(self, audio):
+        self.calls += 1
+        return self.text
+
+
+def test_fallback_to_full_audio():
+    """A failed or empty incremental result falls back to a full decode."""
+    def failing_decode(audio, prompt=""):
+        raise RuntimeError("decoder crashed")
+
+    decoder = IncrementalDecoder(failing_decode, interval_ms=20, min_decode_ms=500)
+    decoder.start()
+    speak(decoder, 1.0)
+    try:
+        decoder.finish()
+        assert False, "finish() must raise when the tail decode fails"
+    except RuntimeError:
+        pass
+
+    audio = np.zeros(SR, dtype=np.float32)
+    for incremental in (
+        IncrementalDecoder(failing_decode),  # Tail decode fails
+        IncrementalDecoder(lambda audio, prompt="": []),  # Heard nothing
+    ):
+        manager = VoiceManager.__new__(VoiceManager)
+        manager.input_manager = FakeRecorder(audio)
+        manager.stt_manager = FakeSTT("open chrome")
+        manager.decoder = incremental
+        incremental.start()
+        incremental.add_audio(audio)
+        assert manager.stop_listening() == "open chrome"
+        assert manager.stt_manager.calls == 1
+
+    manager.stt_manager = FakeSTT("")
+    manager.decoder = None
+    assert manager.stop_listening() is None
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Agreement": test_agreed_prefix(),
+        "Full transcript": test_full_transcript(),
+        "Bounded tail": test_tail_independent_of_length(),
+        "Full-audio fallback": test_fallback_to_full_audio(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
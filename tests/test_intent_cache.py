@@ -0,0 +1,125 @@
+"""
+Test script for the utterance -> intent LRU cache.
+Tests hits on normalized text, LRU eviction, time-dependent entities
+and invalidation on pattern and setting changes.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import spacy
+from loguru import logger
+
+from core.nlu.fast_classifier import FastIntentClassifier
+from core.nlu.intents import IntentType
+from tests.nlu_helpers import make_classifier
+
+
+class CountingNLP:
+    """spaCy stand-in that counts calls."""
+
+    def __init__(self):
+        self.nlp = spacy.blank("en")
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        return self.nlp(text)
+
+
+def test_hits():
+    """Repeats hit the cache regardless of case and spacing."""
+    logger.info("=" * 60)
+    logger.info("Testing Intent Cache")
+    logger.info("=" * 60)
+
+    classifier = make_classifier(CountingNLP(), cache_size=4)
+    first = classifier.classify("set volume to 50")
+    again = classifier.classify("  Set volume  TO 50 ")
+
+    logger.info(f"Cache: {classifier.get_cache_stats()}")
+    assert classifier.cache_hits == 1 and classifier.cache_misses == 1
+    assert again.type == first.type == IntentType.VOLUME_SET
+    assert again.entities == first.entities
+    assert again.raw_text == "  Set volume  TO 50 "
+
+    # Callers editing a result don't corrupt the cache
+    again.entities.clear()
+    assert classifier.classify("set volume to 50").entities == first.entities
+    return True
+
+
+def test_case_sensitive_intents():
+    """NER intents are only reused for the same text (spaCy is case-sensitive)."""
+    classifier = make_classifier(CountingNLP(), cache_size=4)
+    classifier.classify("search for Python tutorials")
+    classifier.classify("search for Python tutorials")
+    assert classifier.nlp.calls == 1
+
+    classifier.classify("search for python tutorials")
+    assert classifier.nlp.calls == 2
+    assert classifier.cache_hits == 1
+    return True
+
+
+def test_time_dependent_not_cached():
+    """Relative dates are recomputed on every call."""
+    classifier = make_classifier(CountingNLP(), cache_size=4)
+    first = classifier.classify("list events tomorrow")
+    second = classifier.classify("list events tomorrow")
+
+    dates = [next(e.value for e in i.entities if e.type == "date") for i in (first, second)]
+    assert classifier.cache_hits == 0
+    assert dates[1] > dates[0]
+    return True
+
+
+def test_eviction_and_invalidation():
+    """Least recently used entries go first; pattern edits clear the cache."""
+    classifier = make_classifier(CountingNLP(), cache_size=2)
+    for text in ["check battery", "system info", "check battery", "what time is it"]:
+        classifier.classify(text)
+    assert set(classifier._cache) == {"check battery", "what time is it"}
+
+    classifier.add_pattern(IntentType.GET_BATTERY, "juice left")
+    assert classifier.classify("check battery").type == IntentType.GET_BATTERY
+    assert classifier.get_cache_stats()["size"] == 1
+    assert classifier.classify("juice left").type == IntentType.GET_BATTERY
+
+    # So do changes to how intents are resolved
+    fast = FastIntentClassifier.train(classifier.training_examples())
+    for setting, value in (("fuzzy_matching", False), ("confidence_threshold", 0.9), ("fast_classifier", fast)):
+        classifier.classify("check battery")
+        setattr(classifier, setting, value)
+        misses = classifier.cache_misses
+        classifier.classify("check battery")
+        assert classifier.cache_misses == misses + 1, setting
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Cache hits": test_hits(),
+        "Case-sensitive intents": test_case_sensitive_intents(),
+        "Time-dependent entities": test_time_dependent_not_cached(),
+        "Eviction and invalidation": test_eviction_and_invalidation(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
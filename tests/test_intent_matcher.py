@@ -0,0 +1,104 @@
+"""
+Test script for the Aho-Corasick intent pattern matcher.
+Tests agreement with the original substring scan, custom pattern
+loading and automatic rebuilds.
+"""
+
+import sys
+import json
+import random
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from core.nlu.intents import IntentClassifier, IntentType
+from core.nlu.matcher import PatternMatcher, linear_match
+from tests.nlu_helpers import make_classifier
+
+
+PHRASES = [
+    "turn up the volume", "louder", "set volume to 50", "mute", "unmute",
+    "open chrome", "close notepad", "switch to firefox", "remind me to call mom",
+    "set a timer for 5 minutes", "what time is it", "what's the date",
+    "check battery", "system info", "search for python tutorials",
+    "go to github.com", "play some music", "go back", "thanks jarvis",
+    "timers", "reopen the window", "hello there", "", "stop", "schedule a call",
+]
+
+
+def test_matches_linear_scan():
+    """Same intent and confidence as the original scan on real and random text."""
+    logger.info("=" * 60)
+    logger.info("Testing Intent Pattern Matcher")
+    logger.info("=" * 60)
+
+    patterns = IntentClassifier._init_patterns(None)
+    matcher = PatternMatcher(patterns)
+    logger.info(f"Automaton: {matcher.get_stats()}")
+
+    rng = random.Random(7)
+    words = sorted({w for p in sum(patterns.values(), []) for w in p.split()}) + ["a", "x", "the"]
+    phrases = PHRASES + [
+        " ".join(rng.choice(words) for _ in range(rng.randint(1, 6))) for _ in range(2000)
+    ]
+    # Fragments glued without spaces exercise the word-boundary rules
+    phrases += ["".join(rng.choice(words) for _ in range(2)) for _ in range(500)]
+
+    for text in phrases:
+        assert matcher.best(text) == linear_match(patterns, text), text
+    return True
+
+
+def test_candidates_ranked():
+    """All matching patterns are returned, best first."""
+    matcher = PatternMatcher({"a": ["set timer", "timer"], "b": ["timer"]})
+    candidates = matcher.candidates("set timer")
+    assert candidates[0] == (1.0, "a", "set timer")
+    assert [label for _, label, _ in candidates[1:]] == ["a", "b"]
+    return True
+
+
+def test_rebuild_and_custom_patterns():
+    """Added, edited and file-loaded patterns take effect immediately."""
+    classifier = make_classifier()
+    assert classifier._match_intent("fire up spotify")[0] == IntentType.UNKNOWN
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "patterns.json"
+        path.write_text(json.dumps({"open_app": ["Fire up"], "no_such_intent": ["x"]}))
+        assert classifier.load_custom_patterns(str(path)) == 1
+
+    assert classifier._match_intent("fire up spotify")[0] == IntentType.OPEN_APP
+
+    # Direct edits of the table (without add_pattern) are picked up as well
+    classifier.patterns[IntentType.GET_TIME].append("got the time")
+    assert classifier._match_intent("got the time")[0] == IntentType.GET_TIME
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Matches linear scan": test_matches_linear_scan(),
+        "Ranked candidates": test_candidates_ranked(),
+        "Rebuild and custom patterns": test_rebuild_and_custom_patterns(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
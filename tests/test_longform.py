@@ -0,0 +1,106 @@
+"""
+Test script for long-form transcription.
+Tests silence-based chunking, overlap merging and the streaming window fix.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from loguru import logger
+
+from core.audio.stt_longform import detect_speech, plan_chunks, merge_chunk_words
+from core.audio.stt_words import TimedWord, trim_text_overlap
+from core.audio.stt_offline import StreamingWhisperSTT
+
+SR = 16000
+
+
+def test_chunk_planning():
+    """Regions pack up to the limit at silences; long regions split with overlap."""
+    logger.info("=" * 60)
+    logger.info("Testing Long-Form Transcription")
+    logger.info("=" * 60)
+
+    speech = [(0, 10 * SR), (12 * SR, 25 * SR), (27 * SR, 40 * SR), (41 * SR, 111 * SR)]
+    chunks = plan_chunks(speech, SR, max_chunk_s=30.0, overlap_s=1.0)
+    logger.info(f"Chunks (s): {[(s / SR, e / SR) for s, e in chunks]}")
+
+    assert chunks[0] == (0, 25 * SR)          # Two regions packed, cut at a silence
+    assert chunks[1] == (27 * SR, 40 * SR)    # Next region wouldn't fit with the long one
+    assert chunks[2] == (41 * SR, 71 * SR)    # 70 s region split into 30 s windows...
+    assert chunks[3][0] == 70 * SR            # ...overlapping by 1 s
+    assert chunks[-1][1] == 111 * SR
+    assert all(e - s <= 30 * SR for s, e in chunks)
+    return True
+
+
+def test_merge_and_detection():
+    """Overlap words are taken once; energy fallback finds speech regions."""
+    chunks = [(0, 30 * SR), (29 * SR, 45 * SR)]
+    words = [
+        [TimedWord(28.0, 28.4, " set"), TimedWord(28.9, 29.3, " a")],
+        [TimedWord(28.95, 29.3, " a"), TimedWord(29.6, 30.0, " timer")],
+    ]
+    merged = merge_chunk_words(chunks, words, SR)
+    assert "".join(w.text for w in merged).strip() == "set a timer"
+
+    # 8 kHz skips Silero and uses the energy detector
+    rate = 8000
+    rng = np.random.default_rng(0)
+    audio = rng.normal(0, 0.001, 6 * rate).astype(np.float32)
+    audio[rate:2 * rate] += rng.normal(0, 0.2, rate).astype(np.float32)
+    audio[4 * rate:5 * rate] += rng.normal(0, 0.2, rate).astype(np.float32)
+    regions = detect_speech(audio, rate, min_silence_ms=500)
+    logger.info(f"Regions (s): {[(s / rate, e / rate) for s, e in regions]}")
+    assert len(regions) == 2
+    return True
+
+
+def test_streaming_windows():
+    """Fixed-window streaming covers the tail and drops repeated words."""
+    class FakeWhisper:
+        def __init__(self):
+            self.calls = []
+
+        def transcribe(self, chunk, sample_rate):
+            self.calls.append(len(chunk))
+            texts = ["turn on the", "on the lights", "the lights in the", "in the kitchen"]
+            return texts[len(self.calls) - 1]
+
+    whisper = FakeWhisper()
+    stream = StreamingWhisperSTT(whisper, chunk_duration=3.0, overlap=0.5)
+    transcripts = stream.transcribe_stream(np.zeros(int(6.5 * SR), dtype=np.float32))
+
+    # Windows at 0, 1.5, 3.0 s, plus a 2 s tail window at 4.5 s
+    assert whisper.calls == [3 * SR, 3 * SR, 3 * SR, 2 * SR]
+    assert " ".join(transcripts) == "turn on the lights in the kitchen"
+    assert trim_text_overlap("open the", "The door") == "door"
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Chunk planning": test_chunk_planning(),
+        "Merge and detection": test_merge_and_detection(),
+        "Streaming windows": test_streaming_windows(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
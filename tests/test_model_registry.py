@@ -0,0 +1,111 @@
+"""
+Test script for the offline model registry.
+Tests one-time checksum verification, tamper detection and prefetch.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+import core.models.registry as registry_module
+from core.models.registry import ModelRegistry, ModelNotFoundError, ChecksumMismatchError
+
+
+def count_hashes():
+    """Wrap the hasher to count how many files get hashed."""
+    calls = []
+    original = registry_module._sha256
+
+    def counting(path):
+        calls.append(path)
+        return original(path)
+
+    registry_module._sha256 = counting
+    return calls, original
+
+
+def test_verify_once_and_tamper():
+    """Files are hashed once; changed content fails verification."""
+    logger.info("=" * 60)
+    logger.info("Testing Model Registry")
+    logger.info("=" * 60)
+
+    with tempfile.TemporaryDirectory() as cache:
+        registry = ModelRegistry(cache)
+        try:
+            registry.resolve("whisper-cpp-base.en")
+            assert False, "missing model must not resolve"
+        except ModelNotFoundError:
+            pass
+
+        model = registry.path("whisper-cpp-base.en")
+        model.write_bytes(os.urandom(64 * 1024))
+
+        calls, original = count_hashes()
+        try:
+            assert registry.resolve("whisper-cpp-base.en") == model
+            assert len(calls) == 1
+
+            # New registry instance (next launch) trusts the recorded hash
+            assert ModelRegistry(cache).verify("whisper-cpp-base.en")
+            assert len(calls) == 1
+        finally:
+            registry_module._sha256 = original
+
+        # Same size, different content and mtime -> mismatch
+        model.write_bytes(os.urandom(64 * 1024))
+        os.utime(model, ns=(1, 1))
+        try:
+            ModelRegistry(cache).resolve("whisper-cpp-base.en")
+            assert False, "tampered model must not resolve"
+        except ChecksumMismatchError:
+            pass
+    return True
+
+
+def test_directory_models_and_prefetch():
+    """Directory models verify every file; prefetch touches all bytes."""
+    with tempfile.TemporaryDirectory() as cache:
+        registry = ModelRegistry(cache)
+        model_dir = registry.path("faster-whisper-tiny")
+        model_dir.mkdir(parents=True)
+        (model_dir / "model.bin").write_bytes(os.urandom(200_000))
+        (model_dir / "config.json").write_text("{}")
+
+        assert registry.find("faster-whisper-tiny") == model_dir
+        assert registry.prefetch("faster-whisper-tiny") == 200_002
+
+        status = registry.get_status()["faster-whisper-tiny"]
+        logger.info(f"Status: {status}")
+        assert status["installed"] and status["verified"]
+        assert registry.find("faster-whisper-base") is None
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Verify once / tamper": test_verify_once_and_tamper(),
+        "Directory models / prefetch": test_directory_models_and_prefetch(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
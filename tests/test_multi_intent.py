@@ -0,0 +1,174 @@
+"""
+Test script for multi-intent utterances.
+Tests conjunction splitting with spans, stage timings across pieces and
+concurrent dispatch of the resulting intents.
+"""
+
+import sys
+import time
+import asyncio
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from core.nlu.intents import Intent, IntentType
+from core.nlu.router import CommandRouter, SkillResult
+from tests.nlu_helpers import make_classifier
+
+
+def split(classifier, text):
+    """(intent, spanned text) pairs of an utterance."""
+    return [
+        (intent.type, text[intent.span[0]:intent.span[1]])
+        for intent in classifier.classify_multi(text)
+    ]
+
+
+def test_split():
+    """Commands joined by conjunctions come back in order with spans."""
+    logger.info("=" * 60)
+    logger.info("Testing Multi-Intent Utterances")
+    logger.info("=" * 60)
+
+    classifier = make_classifier()
+    text = "Set a timer for 5 minutes and turn the volume down"
+    intents = classifier.classify_multi(text)
+    logger.info(f"{text!r} -> {[(i.type.value, i.span) for i in intents]}")
+    assert split(classifier, text) == [
+        (IntentType.SET_TIMER, "Set a timer for 5 minutes"),
+        (IntentType.VOLUME_DOWN, "turn the volume down"),
+    ]
+    assert intents[0].entities[0].type == "duration" and intents[0].entities[0].value == 300
+
+    assert split(classifier, "what time is it, and what's the battery at") == [
+        (IntentType.GET_TIME, "what time is it"),
+        (IntentType.GET_BATTERY, "what's the battery at"),
+    ]
+    assert split(classifier, "search for salt and pepper then pause the music") == [
+        (IntentType.SEARCH_WEB, "search for salt and pepper"),
+        (IntentType.PAUSE_MEDIA, "pause the music"),
+    ]
+    return True
+
+
+def test_no_split():
+    """Conjunctions inside one command don't split it."""
+    classifier = make_classifier()
+    for text in ["remind me to buy salt and pepper", "turn up the volume", "hello and goodbye"]:
+        intents = classifier.classify_multi(text)
+        assert len(intents) == 1, text
+        assert intents[0].span == (0, len(text))
+        assert intents[0].type == classifier.classify(text).type
+
+    # Chatter around a command is dropped
+    assert split(classifier, "hello and turn up the volume") == [
+        (IntentType.VOLUME_UP, "turn up the volume"),
+    ]
+    return True
+
+
+def test_timings():
+    """last_timings covers every piece of a split utterance."""
+    classifier = make_classifier()
+    calls = []
+    classify = classifier.classify
+
+    def recording_classify(text):
+        intent = classify(text)
+        calls.append(dict(classifier.last_timings))
+        return intent
+
+    classifier.classify = recording_classify
+    classifier.classify_multi("set a timer for 5 minutes and turn the volume down")
+    timings = classifier.last_timings
+    logger.info(f"{len(calls)} classify() calls: { {k: round(v, 3) for k, v in timings.items()} }")
+    assert len(calls) >= 2
+    for stage in ("match", "extract"):
+        assert abs(timings[stage] - sum(call.get(stage, 0.0) for call in calls)) < 1e-9
+    assert timings["total"] >= sum(call["total"] for call in calls)
+    return True
+
+
+class Skills:
+    """Skill stand-in that records start/end times per intent."""
+
+    def __init__(self, delay_s: float = 0.2):
+        self.delay_s = delay_s
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def handle_intent(self, intent):
+        start = time.perf_counter()
+        time.sleep(self.delay_s)
+        with self.lock:
+            self.calls.append((intent.type, start, time.perf_counter()))
+        return SkillResult(success=True, message=f"Done {intent.type.value}")
+
+    async def handle_async(self, intent):
+        await asyncio.sleep(self.delay_s)
+        return SkillResult(success=True, message="Searched!")
+
+
+def make_intent(intent_type):
+    """Intent of a type, as classify() would return it."""
+    return Intent(type=intent_type, confidence=1.0, entities=[], raw_text=intent_type.value)
+
+
+def test_route_many():
+    """Independent intents run concurrently, conflicting ones in order."""
+    skills = Skills()
+    router = CommandRouter()
+    for intent_type in (IntentType.SET_TIMER, IntentType.GET_TIME, IntentType.MUTE, IntentType.UNMUTE):
+        router.register_handler(intent_type, skills.handle_intent)
+    router.register_handler(IntentType.SEARCH_WEB, skills.handle_async)
+
+    intents = [make_intent(t) for t in (IntentType.SET_TIMER, IntentType.MUTE, IntentType.GET_TIME, IntentType.UNMUTE)]
+    start = time.perf_counter()
+    result = asyncio.run(router.route_many(intents))
+    elapsed = time.perf_counter() - start
+    logger.info(f"4 intents (2 on one resource) in {elapsed * 1000:.0f}ms: {result.message}")
+
+    # Mute and unmute share the volume: two handler runs back to back
+    assert 0.4 <= elapsed < 0.75  # 0.8 if run one by one
+    calls = {intent_type: (start, end) for intent_type, start, end in skills.calls}
+    assert calls[IntentType.MUTE][1] <= calls[IntentType.UNMUTE][0]
+    assert calls[IntentType.SET_TIMER][0] < calls[IntentType.MUTE][1]
+
+    assert result.success
+    assert result.message == "Done set_timer. Done mute. Done get_time. Done unmute."
+    assert [r.message for r in result.data["results"]][1] == "Done mute"
+
+    # Async handlers and unknown intents are combined too
+    result = asyncio.run(router.route_many([make_intent(IntentType.SEARCH_WEB), make_intent(IntentType.HELP)]))
+    assert not result.success
+    assert result.message.startswith("Searched! I don't know how to handle")
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Split": test_split(),
+        "No split": test_no_split(),
+        "Timings": test_timings(),
+        "Route many": test_route_many(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Test script for the NLU benchmark suite.
+Tests the generated corpus, accuracy against the stored baseline and
+the regression gate.
+"""
+
+import sys
+import copy
+import json
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from core.nlu.evaluation import Tolerances, build_corpus, compare, fill_slot, score
+from core.nlu.intents import IntentClassifier, IntentType
+from tests.nlu_helpers import make_classifier
+
+
+BASELINE = Path(__file__).parent.parent / "benchmarks" / "baselines" / "nlu_suite.json"
+
+
+def test_corpus():
+    """Every intent is covered, deterministically, with entity slots."""
+    logger.info("=" * 60)
+    logger.info("Testing NLU Benchmark Suite")
+    logger.info("=" * 60)
+
+    patterns = IntentClassifier._init_patterns(None)
+    corpus = build_corpus(patterns)
+    assert [u.text for u in corpus] == [u.text for u in build_corpus(patterns)]
+    assert {u.intent for u in corpus} == set(patterns)
+
+    # "go to" is both FOCUS_WINDOW and OPEN_URL: never labelled
+    assert not any(u.text.startswith("go to") for u in corpus)
+
+    volume = [u for u in corpus if u.intent == IntentType.VOLUME_SET]
+    assert all(u.entity and u.entity[0] == "volume_level" for u in volume)
+    assert fill_slot("volume to", "to 35") == "volume to 35"
+    logger.info(f"{len(corpus)} utterances, e.g. {volume[0].text!r} -> {volume[0].entity}")
+    return True
+
+
+def test_accuracy_baseline():
+    """Accuracy has not regressed from the stored baseline."""
+    results = {"accuracy": score(make_classifier(), build_corpus(IntentClassifier._init_patterns(None)))}
+    baseline = json.loads(BASELINE.read_text())
+    logger.info(
+        f"Intent top-1 {results['accuracy']['intent_top1']:.2%} "
+        f"(baseline {baseline['accuracy']['intent_top1']:.2%})"
+    )
+    assert compare(results, baseline, Tolerances(percentiles=())) == []
+    return True
+
+
+def test_gate():
+    """Accuracy drops and slowdowns beyond the tolerances are reported."""
+    baseline = json.loads(BASELINE.read_text())
+    assert compare(baseline, baseline) == []
+
+    results = copy.deepcopy(baseline)
+    results["accuracy"]["intent_top1"] -= 0.05
+    results["latency"]["match_intent"]["p95_us"] *= 3
+    results["latency"]["classify"]["p99_us"] *= 3  # p99 is not gated
+    regressions = compare(results, baseline)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("accuracy.intent_top1")
+    assert regressions[1].startswith("latency.match_intent.p95_us")
+
+    # Latency from another spaCy model is not comparable
+    results["spacy_model"] = "en_core_web_sm"
+    assert len(compare(results, baseline)) == 1
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Corpus": test_corpus(),
+        "Accuracy baseline": test_accuracy_baseline(),
+        "Gate": test_gate(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
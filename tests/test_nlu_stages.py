@@ -0,0 +1,114 @@
+"""
+Test script for the slim spaCy pipeline and lazy NER.
+Tests component exclusion, NER only for entity-hungry intents and
+per-stage timings.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import spacy
+from loguru import logger
+
+from core.metrics import MetricsCollector, PipelineMetrics, get_metrics_collector
+from core.nlu.intents import IntentClassifier, IntentType
+from tests.nlu_helpers import make_classifier
+
+
+class CountingNLP:
+    """spaCy stand-in that counts calls."""
+
+    def __init__(self):
+        self.nlp = spacy.blank("en")
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        return self.nlp(text)
+
+
+def test_slim_pipeline():
+    """Only NER is kept from a full pipeline."""
+    logger.info("=" * 60)
+    logger.info("Testing Slim NLU Pipeline")
+    logger.info("=" * 60)
+
+    nlp = spacy.blank("en")
+    for name in ["tok2vec", "tagger", "parser", "ner"]:
+        nlp.add_pipe(name)
+    nlp.get_pipe("ner").add_label("PERSON")
+    nlp.get_pipe("tagger").add_label("NN")
+    nlp.initialize()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        nlp.to_disk(tmp)
+        slim = IntentClassifier._load_spacy(tmp)
+
+    logger.info(f"Components: {nlp.pipe_names} -> {slim.pipe_names}")
+    assert slim.pipe_names == ["ner"]
+    return True
+
+
+def test_lazy_ner():
+    """spaCy runs only for intents that read named entities."""
+    classifier = make_classifier(CountingNLP())
+
+    for text in ["what time is it", "turn up the volume", "check battery", "set volume to 50"]:
+        intent = classifier.classify(text)
+        assert intent.type != IntentType.UNKNOWN
+        assert "ner" not in classifier.last_timings
+    assert classifier.nlp.calls == 0
+
+    classifier.classify("schedule meeting with bob")
+    assert classifier.nlp.calls == 1
+    assert "ner" in classifier.last_timings
+    return True
+
+
+def test_stage_timings():
+    """Stages add up to (at most) the total and reach the metrics collector."""
+    classifier = make_classifier(CountingNLP())
+    intent = classifier.classify("set volume to 50")
+
+    timings = classifier.last_timings
+    logger.info(f"Timings: { {k: round(v, 3) for k, v in timings.items()} }")
+    assert intent.entities[0].type == "volume_level"
+    assert set(timings) == {"match", "extract", "total"}
+    assert timings["match"] + timings["extract"] <= timings["total"] + 1e-6
+    assert get_metrics_collector().get_value_stats("nlu.match_ms")["count"] >= 1
+
+    # Stages only some commands report average over those commands
+    collector = MetricsCollector()
+    collector.record_metrics(PipelineMetrics(nlu_stages={"match": 1.0, "ner": 6.0}))
+    collector.record_metrics(PipelineMetrics(nlu_stages={"match": 3.0}))
+    collector.record_metrics(PipelineMetrics())
+    assert collector.get_nlu_stage_averages() == {"match": 2.0, "ner": 6.0}
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Slim pipeline": test_slim_pipeline(),
+        "Lazy NER": test_lazy_ner(),
+        "Stage timings": test_stage_timings(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
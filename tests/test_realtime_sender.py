@@ -0,0 +1,126 @@
+"""
+Test script for the Realtime STT audio sender.
+Tests resampling, frame coalescing and reconnect-with-resume against
+the local stand-in server.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from loguru import logger
+
+from core.audio.stt_realtime_sender import PCM16Resampler, RealtimeAudioSender
+from core.audio.stt_realtime_standin import RealtimeStandInServer
+
+
+def tone(seconds: float, sample_rate: int = 16000) -> np.ndarray:
+    """440 Hz test tone."""
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    """Poll until condition() is true."""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def test_resampler():
+    """16 kHz float -> 24 kHz PCM16, independent of chunking."""
+    logger.info("=" * 60)
+    logger.info("Testing Realtime Audio Sender")
+    logger.info("=" * 60)
+
+    audio = tone(1.0)
+    whole = np.frombuffer(bytes(PCM16Resampler().process(audio)), dtype=np.int16)
+
+    resampler = PCM16Resampler()
+    chunked = np.concatenate([
+        np.frombuffer(bytes(resampler.process(audio[i:i + 480])), dtype=np.int16)
+        for i in range(0, len(audio), 480)
+    ])
+
+    assert np.array_equal(whole, chunked)
+    assert abs(len(whole) - 24000) <= 1
+    expected = 0.5 * np.sin(2 * np.pi * 440 * np.arange(len(whole)) / 24000)
+    assert np.abs(whole / 32767 - expected).max() < 0.01
+    return True
+
+
+def test_coalescing_and_transcript():
+    """30 ms pushes are sent as 100 ms messages; commit returns a transcript."""
+    server = RealtimeStandInServer()
+    server.start()
+    sender = RealtimeAudioSender(server.url, session={"turn_detection": None})
+    assert sender.start(timeout=2.0)
+
+    audio = tone(1.0)
+    for i in range(0, len(audio), 480):  # 30 ms capture frames
+        sender.push(audio[i:i + 480])
+    assert wait_for(lambda: len(server.append_times) == 9)  # 900 ms sent, 100 ms pending
+
+    text = sender.transcribe(np.zeros(0, dtype=np.float32), timeout=2.0)
+    logger.info(f"Transcript: '{text}' ({sender.get_statistics()['frames_sent']} frames)")
+    assert text == "1000 ms of audio"
+    assert server.sessions == [{"turn_detection": None}]
+
+    sender.stop()
+    server.stop()
+    return True
+
+
+def test_reconnect_resumes_utterance():
+    """After a dropped connection the uncommitted audio is replayed."""
+    server = RealtimeStandInServer()
+    server.start()
+    sender = RealtimeAudioSender(server.url, session={"turn_detection": None}, reconnect_delays=(0.05,))
+    assert sender.start(timeout=2.0)
+
+    sender.push(tone(0.5))
+    assert wait_for(lambda: len(server.append_times) == 4)  # Last 100 ms still pending
+
+    server.drop_connections()
+    assert wait_for(lambda: server.connections == 2 and sender.connected.is_set())
+
+    text = sender.transcribe(tone(0.5), timeout=2.0)
+    logger.info(f"Transcript after reconnect: '{text}'")
+    assert text == "1000 ms of audio"
+    assert sender.get_statistics()["reconnects"] == 1
+    assert len(server.sessions) == 2
+
+    sender.stop()
+    server.stop()
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Resampler": test_resampler(),
+        "Coalescing": test_coalescing_and_transcript(),
+        "Reconnect": test_reconnect_resumes_utterance(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
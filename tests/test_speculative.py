@@ -0,0 +1,275 @@
+"""
+Test script for speculative intent resolution on partial transcripts.
+Tests speculative execution, confirmation, discarding and skill warm-up,
+including the calendar prefetch.
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from core.nlu.intents import Intent, IntentType
+from core.nlu.router import CommandRouter, SkillResult
+from core.nlu.speculative import SpeculativeIntentResolver
+from core.skills.calendar import CalendarSkills
+from tests.nlu_helpers import make_classifier
+
+
+class Skills:
+    """Skill stand-in that records what ran."""
+
+    def __init__(self, delay_s: float = 0.05):
+        self.delay_s = delay_s
+        self.executed = []
+        self.warmed = []
+
+    def handle_intent(self, intent):
+        time.sleep(self.delay_s)
+        self.executed.append(intent.type)
+        return SkillResult(success=True, message=f"done {intent.type.value}")
+
+    def warm_up(self, intent):
+        time.sleep(self.delay_s)
+        self.warmed.append(intent.type)
+
+
+def make_resolver(**kwargs):
+    """Resolver over a router with a time handler and a volume warm-up."""
+    skills = Skills()
+    router = CommandRouter()
+    for intent_type in (IntentType.GET_TIME, IntentType.VOLUME_UP, IntentType.SET_TIMER, IntentType.MUTE):
+        router.register_handler(intent_type, skills.handle_intent)
+    router.register_warmup(IntentType.VOLUME_UP, skills.warm_up)
+    return SpeculativeIntentResolver(make_classifier(), router, **kwargs), skills
+
+
+def test_confirmed_speculation():
+    """A stable read-only intent runs once, before the final transcript."""
+    logger.info("=" * 60)
+    logger.info("Testing Speculative Intent Resolution")
+    logger.info("=" * 60)
+
+    resolver, skills = make_resolver()
+    for partial in ["what", "what time", "what time is"]:
+        resolver.on_partial(partial)
+    time.sleep(0.1)
+
+    intent, result = resolver.resolve("what time is it")
+    assert intent.type == IntentType.GET_TIME
+    assert result is not None and result.message == "done get_time"
+    assert skills.executed == [IntentType.GET_TIME]
+
+    stats = resolver.get_stats()["get_time"]
+    logger.info(f"Speculation stats: {stats}")
+    assert stats["confirmed"] == 1 and stats["avg_saved_ms"] >= 40
+    return True
+
+
+def test_needs_stable_partials():
+    """A single confident partial is not enough to act on."""
+    resolver, skills = make_resolver()
+    resolver.on_partial("what time")
+    intent, result = resolver.resolve("what time is it")
+    assert result is None and skills.executed == []
+
+    # Nor is an unknown one
+    for partial in ["hello", "hello there"]:
+        resolver.on_partial(partial)
+    assert resolver.resolve("hello there")[1] is None
+    return True
+
+
+def test_discarded_speculation():
+    """A final transcript with another intent discards the result."""
+    resolver, skills = make_resolver()
+    for partial in ["what time", "what time is"]:
+        resolver.on_partial(partial)
+
+    intent, result = resolver.resolve("set a timer for 5 minutes")
+    assert result is None
+    assert resolver.get_stats()["get_time"]["discarded"] == 1
+
+    # Stale results are discarded too
+    resolver, skills = make_resolver(max_age_s=0.0)
+    for partial in ["what time", "what time is"]:
+        resolver.on_partial(partial)
+    time.sleep(0.1)
+    assert resolver.resolve("what time is it")[1] is None
+    return True
+
+
+def test_warm_up():
+    """Intents with side effects are only warmed up, once."""
+    resolver, skills = make_resolver()
+    for partial in ["turn up the", "turn up the volume", "turn up the volume a"]:
+        resolver.on_partial(partial)
+    time.sleep(0.1)
+
+    intent, result = resolver.resolve("turn up the volume a bit")
+    assert intent.type == IntentType.VOLUME_UP
+    assert result is None
+    assert skills.warmed == [IntentType.VOLUME_UP] and skills.executed == []
+    assert resolver.get_stats()["volume_up"]["confirmed"] == 1
+
+    # Nothing is registered for timers: no work, result still routed normally
+    for partial in ["set a timer", "set a timer for"]:
+        resolver.on_partial(partial)
+    assert resolver.resolve("set a timer for 5 minutes")[1] is None
+    assert skills.executed == []
+    return True
+
+
+def test_warm_up_over_execution():
+    """A read-only intent with a warm-up is warmed up, not executed."""
+    resolver, skills = make_resolver()
+    resolver.router.register_warmup(IntentType.GET_TIME, skills.warm_up)
+    for partial in ["what time", "what time is"]:
+        resolver.on_partial(partial)
+    time.sleep(0.1)
+
+    assert resolver.resolve("what time is it")[1] is None
+    assert skills.warmed == [IntentType.GET_TIME] and skills.executed == []
+    return True
+
+
+def test_multi_intent_final():
+    """Only the first command of the final transcript reuses the speculation."""
+    resolver, skills = make_resolver()
+    for partial in ["what time", "what time is"]:
+        resolver.on_partial(partial)
+    time.sleep(0.1)
+
+    intents = resolver.classifier.classify_multi("what time is it and mute")
+    result = asyncio.run(resolver.route_many(intents))
+    logger.info(f"Multi-intent final: {result.message}")
+    assert skills.executed == [IntentType.GET_TIME, IntentType.MUTE]
+    assert result.success and result.message == "done get_time. done mute."
+    assert resolver.get_stats()["get_time"]["confirmed"] == 1
+
+    # Three commands, the first not speculated on: all routed
+    intents = resolver.classifier.classify_multi("turn up the volume and what time is it and mute")
+    result = asyncio.run(resolver.route_many(intents))
+    assert len(result.data["results"]) == 3
+    assert skills.executed[2:] == [IntentType.VOLUME_UP, IntentType.GET_TIME, IntentType.MUTE]
+
+    # Speculated first command with two more behind it
+    for partial in ["what time", "what time is"]:
+        resolver.on_partial(partial)
+    time.sleep(0.1)
+    intents = resolver.classifier.classify_multi("what time is it and turn up the volume and mute")
+    result = asyncio.run(resolver.route_many(intents))
+    assert result.message == "done get_time. done volume_up. done mute."
+    assert skills.executed.count(IntentType.GET_TIME) == 3
+    return True
+
+
+class CalendarAPI:
+    """Google Calendar service stand-in that counts event listings."""
+
+    def __init__(self):
+        self.lists = 0
+        self.items = [{"summary": "Standup", "start": {"dateTime": "09:00"}}]
+
+    def events(self):
+        return self
+
+    def list(self, **kwargs):
+        self.lists += 1
+        return self
+
+    def insert(self, **kwargs):
+        self.items = self.items + [{"summary": "New", "start": {"dateTime": "10:00"}}]
+        return self
+
+    def execute(self):
+        return {"items": list(self.items), "id": "new"}
+
+
+def make_calendar_resolver():
+    """Resolver over a router wired to CalendarSkills like the assistant."""
+    calendar = CalendarSkills.__new__(CalendarSkills)
+    calendar.credentials_file = None
+    calendar.service = CalendarAPI()
+    calendar._prefetched_events = None
+
+    router = CommandRouter()
+    for intent_type in (IntentType.CREATE_EVENT, IntentType.LIST_EVENTS, IntentType.CANCEL_EVENT):
+        router.register_handler(intent_type, calendar.handle_intent)
+    router.register_warmup(IntentType.LIST_EVENTS, calendar.warm_up, calendar.discard_warm_up)
+    return SpeculativeIntentResolver(make_classifier(), router), calendar
+
+
+def list_events(resolver, final: str):
+    """Speak a calendar question and route the final transcript."""
+    for partial in ["what's on my calendar", "what's on my calendar for"]:
+        resolver.on_partial(partial)
+    time.sleep(0.1)
+    intent, result = resolver.resolve(final)
+    assert result is None
+    time.sleep(0.05)  # let a discard run
+    return intent
+
+
+def test_calendar_prefetch():
+    """Prefetched events only answer the confirmed speculation, once."""
+    resolver, calendar = make_calendar_resolver()
+    api = calendar.service
+
+    intent = list_events(resolver, "what's on my calendar for today")
+    assert intent.type == IntentType.LIST_EVENTS and api.lists == 1
+    result = calendar.handle_intent(intent)
+    assert result.data["events"][0]["summary"] == "Standup" and api.lists == 1
+
+    # Plain listings always ask the API
+    calendar.handle_intent(intent)
+    calendar.list_upcoming_events()
+    assert api.lists == 3
+
+    # A discarded speculation drops the prefetch
+    list_events(resolver, "show my reminders")
+    assert api.lists == 4 and calendar._prefetched_events is None
+
+    # Creating or cancelling an event invalidates it
+    for intent_type in (IntentType.CREATE_EVENT, IntentType.CANCEL_EVENT):
+        list_events(resolver, "what's on my calendar for today")
+        calendar.handle_intent(Intent(type=intent_type, confidence=1.0, entities=[], raw_text=""))
+        assert calendar._prefetched_events is None
+        lists = api.lists
+        calendar.handle_intent(intent)
+        assert api.lists == lists + 1
+    assert len(calendar.handle_intent(intent).data["events"]) == 2
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Confirmed speculation": test_confirmed_speculation(),
+        "Needs stable partials": test_needs_stable_partials(),
+        "Discarded speculation": test_discarded_speculation(),
+        "Warm-up": test_warm_up(),
+        "Warm-up over execution": test_warm_up_over_execution(),
+        "Multi-intent final": test_multi_intent_final(),
+        "Calendar prefetch": test_calendar_prefetch(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Test script for speech segment tracking.
+Tests that only voiced regions of an utterance reach STT.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from loguru import logger
+
+from core.audio.audio_buffer import SpeechSegmentTracker, collect_speech
+
+
+def test_segment_tracking():
+    """Short pauses merge, long pauses split segments."""
+    logger.info("=" * 60)
+    logger.info("Testing Speech Segment Tracking")
+    logger.info("=" * 60)
+
+    tracker = SpeechSegmentTracker(sample_rate=16000, merge_gap_ms=300)
+    pattern = [False] * 10 + [True] * 20 + [False] * 5 + [True] * 10 + [False] * 40 + [True] * 5
+    for is_speech in pattern:
+        tracker.add_frame(480, is_speech)
+
+    segments = tracker.get_segments()
+    logger.info(f"Segments: {segments}")
+
+    # 150 ms pause merged, 1.2 s pause kept
+    assert segments == [(10 * 480, 45 * 480), (85 * 480, 90 * 480)]
+    return True
+
+
+def test_collect_speech():
+    """Leading/trailing silence is dropped and long pauses are shortened."""
+    sample_rate = 16000
+    audio = np.zeros(5 * sample_rate, dtype=np.float32)
+    segments = [(sample_rate, 2 * sample_rate), (4 * sample_rate, int(4.5 * sample_rate))]
+
+    compacted, offsets = collect_speech(audio, segments, sample_rate, pad_ms=200)
+    logger.info(f"Compacted {len(audio)} -> {len(compacted)} samples, offsets={offsets}")
+
+    pad = int(0.2 * sample_rate)
+    assert len(compacted) == (sample_rate + 2 * pad) + (sample_rate // 2 + 2 * pad)
+    assert offsets[0] == (0, sample_rate + 2 * pad)
+    assert offsets[1][1] == len(compacted)
+
+    # Single segment is returned without copying
+    single, _ = collect_speech(audio, segments[:1], sample_rate)
+    assert np.shares_memory(single, audio)
+
+    # No speech -> nothing to decode
+    empty, _ = collect_speech(audio, [], sample_rate)
+    assert len(empty) == 0
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Segment tracking": test_segment_tracking(),
+        "Collect speech": test_collect_speech(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
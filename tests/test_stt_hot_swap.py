@@ -0,0 +1,249 @@
+"""
+Test script for hot-swapping STT backends.
+Tests background loading, warm-up gating, release of the old backend
+and the race policy from config.
+"""
+
+import os
+import sys
+import time
+import tempfile
+from pathlib import Path
+from threading import Thread
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from loguru import logger
+
+from core.audio.stt_backend import STTBackendManager, STTBackendType
+from core.audio.stt_faster_whisper import FasterWhisperSTT
+from core.audio.stt_offline import WhisperSTT
+from core.audio.stt_race import RacingSTTBackend
+
+
+class FakeBackend:
+    """Backend with configurable load time, decode time and warm-up outcome."""
+
+    def __init__(self, text: str, decode_s: float = 0.0, warmup_ok: bool = True):
+        self.text = text
+        self.decode_s = decode_s
+        self.warmup_ok = warmup_ok
+        self.released = False
+        self.biasing = None
+
+    def set_vocabulary(self, vocabulary, bias_mode=None):
+        self.biasing = (vocabulary, bias_mode)
+
+    def warmup(self):
+        return self.warmup_ok
+
+    def transcribe(self, audio_data, sample_rate=16000, language=None):
+        assert not self.released, "transcribed on a released backend"
+        time.sleep(self.decode_s)
+        return self.text
+
+    def transcribe_stream(self, audio_chunk, sample_rate=16000):
+        return self.text
+
+    def get_backend_info(self):
+        return {"backend": self.text}
+
+    def is_available(self):
+        return True
+
+    def shutdown(self):
+        self.released = True
+
+
+class FakeManager(STTBackendManager):
+    """Manager that builds fake backends, slowly."""
+
+    def __init__(self, backends: dict, load_s: float = 0.0, **kwargs):
+        self.fake_backends = backends
+        self.load_s = load_s
+        super().__init__(STTBackendType.FASTER_WHISPER, **kwargs)
+
+    def _create_backend(self, backend_type, config=None):
+        if backend_type != STTBackendType.FASTER_WHISPER:
+            time.sleep(self.load_s)
+        return self.fake_backends[backend_type]
+
+
+AUDIO = np.zeros(1600, dtype=np.float32)
+
+
+def test_switch_does_not_block():
+    """The old backend keeps serving while the new one loads."""
+    logger.info("=" * 60)
+    logger.info("Testing STT Backend Hot-Swap")
+    logger.info("=" * 60)
+
+    old = FakeBackend("old")
+    new = FakeBackend("new")
+    manager = FakeManager(
+        {STTBackendType.FASTER_WHISPER: old, STTBackendType.WHISPER_CPP: new},
+        load_s=0.3,
+    )
+
+    start_time = time.perf_counter()
+    assert manager.switch_backend(STTBackendType.WHISPER_CPP)
+    assert time.perf_counter() - start_time < 0.05, "switch_backend() must not block"
+    assert manager.is_switching()
+    assert manager.transcribe(AUDIO) == "old"
+    assert manager.get_backend_info()["pending"] == "whisper_cpp"
+
+    assert manager.wait_for_switch(timeout=2.0)
+    assert manager.transcribe(AUDIO) == "new"
+    assert manager.default_backend_type == STTBackendType.WHISPER_CPP
+    assert old.released
+    logger.info(f"Info: {manager.get_backend_info()}")
+    return True
+
+
+def test_old_backend_outlives_in_flight_jobs():
+    """A swapped-out backend is released only after its decodes finish."""
+    old = FakeBackend("old", decode_s=0.3)
+    new = FakeBackend("new")
+    manager = FakeManager(
+        {STTBackendType.FASTER_WHISPER: old, STTBackendType.WHISPER_CPP: new}
+    )
+
+    results = []
+    worker = Thread(target=lambda: results.append(manager.transcribe(AUDIO)))
+    worker.start()
+    time.sleep(0.05)
+
+    assert manager.switch_backend(STTBackendType.WHISPER_CPP, wait=True, timeout=2.0)
+    assert not old.released, "old backend released while still decoding"
+    assert manager.transcribe(AUDIO) == "new"
+
+    worker.join(timeout=2.0)
+    assert results == ["old"]
+    assert old.released
+    return True
+
+
+def test_failed_warmup_keeps_old_backend():
+    """A backend that fails warm-up is never swapped in."""
+    old = FakeBackend("old")
+    broken = FakeBackend("broken", warmup_ok=False)
+    manager = FakeManager(
+        {STTBackendType.FASTER_WHISPER: old, STTBackendType.WHISPER_CPP: broken}
+    )
+
+    assert not manager.switch_backend(STTBackendType.WHISPER_CPP, wait=True, timeout=2.0)
+    assert manager.transcribe(AUDIO) == "old"
+    assert manager.default_backend_type == STTBackendType.FASTER_WHISPER
+    assert not old.released
+    assert manager.get_backend_info()["failed_switches"] == 1
+    return True
+
+
+def test_failed_warmup_real_backends():
+    """Real backends that report a failed warm-up are not swapped in."""
+    old = FakeBackend("old")
+
+    # whisper.cpp binary that exits with an error
+    with tempfile.TemporaryDirectory() as tmp:
+        binary = Path(tmp) / "main"
+        binary.write_text("#!/bin/sh\nexit 3\n")
+        os.chmod(binary, 0o755)
+        model = Path(tmp) / "ggml-base.en.bin"
+        model.write_bytes(b"")
+        whisper_cpp = WhisperSTT(model_path=str(model), whisper_bin=str(binary))
+        assert whisper_cpp.is_available() and whisper_cpp.warmup() is False
+
+        manager = FakeManager(
+            {STTBackendType.FASTER_WHISPER: old, STTBackendType.WHISPER_CPP: whisper_cpp}
+        )
+        assert not manager.switch_backend(STTBackendType.WHISPER_CPP, wait=True, timeout=5.0)
+        assert manager.transcribe(AUDIO) == "old"
+
+    # faster-whisper model whose decode fails
+    def failing_decode(*args, **kwargs):
+        raise RuntimeError("CUDA out of memory")
+
+    faster_whisper = FasterWhisperSTT.__new__(FasterWhisperSTT)
+    faster_whisper.beam_size = faster_whisper.best_of = 5
+    faster_whisper._decode = failing_decode
+    assert faster_whisper.warmup() is False
+
+    manager = FakeManager({STTBackendType.FASTER_WHISPER: old})
+    manager.default_backend_type = STTBackendType.WHISPER_CPP  # Serving "old"
+    manager.fake_backends[STTBackendType.FASTER_WHISPER] = faster_whisper
+    assert not manager.switch_backend(STTBackendType.FASTER_WHISPER, wait=True, timeout=2.0)
+    assert manager.transcribe(AUDIO) == "old"
+    assert manager.get_backend_info()["failed_switches"] == 1
+    return True
+
+
+def test_bias_mode_survives_swap():
+    """The configured biasing mode reaches swapped-in and racing backends."""
+    old = FakeBackend("old")
+    new = FakeBackend("new")
+    manager = FakeManager(
+        {STTBackendType.FASTER_WHISPER: old, STTBackendType.WHISPER_CPP: new}
+    )
+    vocabulary = object()
+    manager.set_vocabulary(vocabulary, "hotwords")
+    assert old.biasing == (vocabulary, "hotwords")
+
+    assert manager.switch_backend(STTBackendType.WHISPER_CPP, wait=True, timeout=2.0)
+    assert new.biasing == (vocabulary, "hotwords")
+
+    fast = FakeBackend("fast")
+    manager.fake_backends[STTBackendType.FASTER_WHISPER] = fast
+    assert manager.enable_racing(accurate={"backend": "whisper_cpp"})
+    assert fast.biasing == (vocabulary, "hotwords")
+    return True
+
+
+def test_race_policy_from_config():
+    """The stt.policy/stt.race settings build a racing backend."""
+    fast = FakeBackend("fast")
+    accurate = FakeBackend("accurate")
+    race = {
+        "fast": {"backend": "faster_whisper", "model_size": "tiny"},
+        "accurate": {"backend": "whisper_cpp"},
+        "deadline_ms": 500,
+    }
+    manager = FakeManager(
+        {STTBackendType.FASTER_WHISPER: fast, STTBackendType.WHISPER_CPP: accurate},
+        policy="race",
+        race=race,
+    )
+
+    assert isinstance(manager.current_backend, RacingSTTBackend)
+    assert manager.current_backend.deadline_ms == 500
+    assert manager.transcribe(AUDIO) == "accurate"
+    assert race["fast"]["backend"] == "faster_whisper", "config section modified"
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Non-blocking switch": test_switch_does_not_block(),
+        "In-flight jobs": test_old_backend_outlives_in_flight_jobs(),
+        "Failed warm-up": test_failed_warmup_keeps_old_backend(),
+        "Failed warm-up (real backends)": test_failed_warmup_real_backends(),
+        "Bias mode survives swap": test_bias_mode_survives_swap(),
+        "Race policy": test_race_policy_from_config(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
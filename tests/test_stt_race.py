@@ -0,0 +1,131 @@
+"""
+Test script for deadline-based STT backend racing.
+Tests winner selection, deadline fallback and loser cancellation.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from loguru import logger
+
+from core.audio.stt_race import RacingSTTBackend
+
+
+class FakeBackend:
+    """Backend with a fixed delay and transcript."""
+
+    supports_cancellation = True
+
+    def __init__(self, text: str, delay_s: float):
+        self.text = text
+        self.delay_s = delay_s
+        self.cancelled = 0
+
+    def transcribe(self, audio_data, sample_rate=16000, language=None, should_cancel=None):
+        deadline = time.perf_counter() + self.delay_s
+        while time.perf_counter() < deadline:
+            if should_cancel and should_cancel():
+                self.cancelled += 1
+                return ""
+            time.sleep(0.005)
+        return self.text
+
+    def transcribe_stream(self, audio_chunk, sample_rate=16000):
+        return self.text
+
+    def get_backend_info(self):
+        return {}
+
+    def is_available(self):
+        return True
+
+
+AUDIO = np.zeros(16000, dtype=np.float32)
+
+
+def test_accurate_within_deadline():
+    """Accurate result wins when it beats the deadline."""
+    logger.info("=" * 60)
+    logger.info("Testing STT Backend Racing")
+    logger.info("=" * 60)
+
+    racer = RacingSTTBackend(
+        FakeBackend("open crome", 0.02),
+        FakeBackend("open chrome", 0.1),
+        deadline_ms=500,
+        fast_name="t1", accurate_name="a1",
+    )
+    assert racer.transcribe(AUDIO) == "open chrome"
+
+    stats = racer.get_race_stats()
+    logger.info(f"Stats: {stats}")
+    assert stats["a1"]["wins"] == 1 and stats["a1"]["deadline_hits"] == 1
+    racer.shutdown()
+    return True
+
+
+def test_deadline_miss_cancels_accurate():
+    """Fast result is returned at the deadline and the accurate decode is cancelled."""
+    accurate = FakeBackend("set a timer", 2.0)
+    racer = RacingSTTBackend(
+        FakeBackend("set a time", 0.02),
+        accurate,
+        deadline_ms=150,
+        fast_name="t2", accurate_name="a2",
+    )
+
+    start_time = time.perf_counter()
+    text = racer.transcribe(AUDIO)
+    elapsed = time.perf_counter() - start_time
+    time.sleep(0.05)
+
+    logger.info(f"Deadline fallback in {elapsed * 1000:.0f}ms: '{text}'")
+    assert text == "set a time"
+    assert elapsed < 0.4
+    assert accurate.cancelled == 1
+    assert racer.get_race_stats()["a2"]["deadline_misses"] == 1
+    racer.shutdown()
+    return True
+
+
+def test_agreement_credits_fast():
+    """When both agree, the fast backend gets the win."""
+    racer = RacingSTTBackend(
+        FakeBackend("What time is it?", 0.01),
+        FakeBackend("what time is it", 0.05),
+        deadline_ms=500,
+        fast_name="t3", accurate_name="a3",
+    )
+    assert racer.transcribe(AUDIO) == "What time is it?"
+    assert racer.get_race_stats()["t3"]["wins"] == 1
+    racer.shutdown()
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Accurate within deadline": test_accurate_within_deadline(),
+        "Deadline miss": test_deadline_miss_cancels_accurate(),
+        "Agreement": test_agreement_credits_fast(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Test script for STT job scheduling.
+Tests latest-wins coalescing of partial transcription requests and
+non-blocking cancellation.
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from loguru import logger
+
+from core.audio.stt_partial import PartialResultStreamer
+from core.audio.stt_scheduler import LatestWinsScheduler
+
+
+def test_latest_wins_coalescing():
+    """Only the newest snapshot is decoded when the worker frees up."""
+    logger.info("=" * 60)
+    logger.info("Testing Latest-Wins Scheduler")
+    logger.info("=" * 60)
+
+    decoded = []
+
+    def slow_decode(audio, should_cancel):
+        time.sleep(0.1)
+        if not should_cancel():
+            decoded.append(len(audio))
+
+    scheduler = LatestWinsScheduler(slow_decode, partial_interval_ms=0)
+    scheduler.start()
+
+    # First snapshot occupies the worker, the rest pile up behind it
+    for n in range(1, 6):
+        scheduler.submit(np.zeros(n * 160, dtype=np.float32))
+        time.sleep(0.01)
+
+    time.sleep(0.4)
+    scheduler.stop()
+
+    stats = scheduler.get_statistics()
+    logger.info(f"Decoded sizes: {decoded}")
+    logger.info(f"Statistics: {stats}")
+
+    assert decoded[-1] == 5 * 160, "newest snapshot must be decoded last"
+    assert len(decoded) == 2
+    assert stats["skipped"] == 3
+    return True
+
+
+def test_cancel_in_flight():
+    """Cancelling drops the pending request and abandons the running one."""
+    decoded = []
+
+    def slow_decode(audio, should_cancel):
+        time.sleep(0.1)
+        if not should_cancel():
+            decoded.append(len(audio))
+
+    scheduler = LatestWinsScheduler(slow_decode, partial_interval_ms=0)
+    scheduler.start()
+
+    scheduler.submit(np.zeros(160, dtype=np.float32))
+    time.sleep(0.02)
+    scheduler.submit(np.zeros(320, dtype=np.float32))
+    scheduler.cancel()
+
+    time.sleep(0.3)
+    scheduler.stop()
+
+    logger.info(f"Statistics: {scheduler.get_statistics()}")
+
+    assert decoded == []
+    assert scheduler.get_statistics()["cancelled"] == 2
+    return True
+
+
+def test_cadence():
+    """Decode starts are spaced by the configured partial interval."""
+    starts = []
+
+    def decode(audio, should_cancel):
+        starts.append(time.perf_counter())
+
+    scheduler = LatestWinsScheduler(decode, partial_interval_ms=100)
+    scheduler.start()
+
+    deadline = time.perf_counter() + 0.45
+    while time.perf_counter() < deadline:
+        scheduler.submit(np.zeros(160, dtype=np.float32))
+        time.sleep(0.01)
+    scheduler.stop()
+
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    logger.info(f"Decode gaps: {[f'{g * 1000:.0f}ms' for g in gaps]}")
+
+    assert all(gap >= 0.09 for gap in gaps)
+    return True
+
+
+def test_cancel_does_not_block():
+    """Streamer cancel returns while a decode runs; a restart gets one worker."""
+    decoded = []
+
+    class SlowBackend:
+        def transcribe(self, audio, sample_rate=16000):
+            time.sleep(0.5)
+            decoded.append(len(audio))
+            return "set a timer"
+
+    streamer = PartialResultStreamer(SlowBackend(), min_chunk_duration_ms=0, partial_interval_ms=0)
+    partials = []
+    streamer.set_callbacks(on_partial_result=partials.append)
+    workers = threading.active_count()
+
+    streamer.start_streaming()
+    streamer.add_audio_chunk(np.zeros(1600, dtype=np.float32))
+    time.sleep(0.05)  # Decode in flight
+
+    start = time.perf_counter()
+    streamer.cancel()
+    elapsed = time.perf_counter() - start
+    logger.info(f"cancel() returned in {elapsed * 1000:.1f}ms")
+    assert elapsed < 0.05
+
+    # Next utterance starts while the old decode is still running
+    streamer.start_streaming()
+    time.sleep(0.7)
+    assert decoded == [1600] and partials == [], "stale partial delivered"
+    assert threading.active_count() == workers + 1, "old worker still running"
+
+    streamer.add_audio_chunk(np.zeros(3200, dtype=np.float32))
+    time.sleep(0.7)
+    assert [p.audio_ms for p in partials] == [200.0]
+    streamer.cancel()
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Latest-wins coalescing": test_latest_wins_coalescing(),
+        "Cancel in-flight": test_cancel_in_flight(),
+        "Cadence": test_cadence(),
+        "Non-blocking cancel": test_cancel_does_not_block(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
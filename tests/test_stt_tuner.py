@@ -0,0 +1,115 @@
+"""
+Test script for the STT auto-tuner.
+Tests configuration grid, selection against a latency target, WER scoring
+and writing the result into the settings file.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import yaml
+from loguru import logger
+
+from core.audio.stt_eval import word_errors, word_error_rate
+from core.audio.stt_tuner import TuningResult, candidate_configs, select_config, write_config
+
+
+def result(model, wer, p95, error=None):
+    return TuningResult(
+        model_size=model, compute_type="int8", cpu_threads=4, num_workers=1,
+        wer=wer, latency_p95_ms=p95, error=error,
+    )
+
+
+def test_selection():
+    """Most accurate config within the target wins; fastest if none fit."""
+    logger.info("=" * 60)
+    logger.info("Testing STT Auto-Tuner")
+    logger.info("=" * 60)
+
+    results = [
+        result("tiny", 0.12, 300),
+        result("base", 0.06, 700),
+        result("small", 0.03, 1800),
+        result("medium", 0.0, 0, error="out of memory"),
+    ]
+    assert select_config(results, 1000).model_size == "base"
+    assert select_config(results, 2000).model_size == "small"
+    assert select_config(results, 100).model_size == "tiny"
+    assert select_config(results[3:], 1000) is None
+
+    # Equal accuracy -> lower latency
+    tie = [result("base", 0.05, 900), result("base", 0.05, 600)]
+    assert select_config(tie, 1000).latency_p95_ms == 600
+    return True
+
+
+def test_grid_and_scoring():
+    """Grid covers every combination; WER counts word edits."""
+    grid = candidate_configs(["tiny", "base"], "cpu", threads=[2, 4], workers=[1, 2])
+    assert len(grid) == 2 * 3 * 2 * 2
+    assert set(grid[0].config()) == {
+        "model_size", "device", "compute_type", "cpu_threads", "num_workers"
+    }
+
+    assert word_errors("Open Chrome.", "open chrome") == (0, 2)
+    assert word_errors("set a timer", "set the time") == (2, 3)
+    assert abs(word_error_rate(["open chrome", "what time is it"],
+                               ["open crome", "what time is it"]) - 1 / 6) < 1e-9
+    return True
+
+
+def test_write_config():
+    """Only the stt.faster_whisper keys change; comments survive."""
+    settings = Path(__file__).parent.parent / "config" / "settings.example.yaml"
+    original = settings.read_text(encoding="utf-8")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "settings.yaml"
+        path.write_text(original, encoding="utf-8")
+        write_config(result("base", 0.05, 600), str(path))
+        written = path.read_text(encoding="utf-8")
+
+    changed = [
+        (old, new) for old, new in zip(original.splitlines(), written.splitlines()) if old != new
+    ]
+    logger.info(f"Changed lines: {changed}")
+    assert len(written.splitlines()) == len(original.splitlines())
+    assert ('    model_size: "tiny"', '    model_size: "base"') in changed
+    assert ("    cpu_threads: 0  # 0 = CTranslate2 default",
+            "    cpu_threads: 4  # 0 = CTranslate2 default") in changed
+
+    config = yaml.safe_load(written)
+    assert config["stt"]["faster_whisper"]["model_size"] == "base"
+    assert config["stt"]["faster_whisper"]["adaptive_decode"] is False
+    config["stt"]["faster_whisper"].update(model_size="tiny", device="auto", cpu_threads=0)
+    assert config == yaml.safe_load(original)
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Selection": test_selection(),
+        "Grid and scoring": test_grid_and_scoring(),
+        "Write config": test_write_config(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
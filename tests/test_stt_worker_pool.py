@@ -0,0 +1,175 @@
+"""
+Test script for the bounded STT worker pool.
+Tests overflow policies, per-job cancellation, ordered delivery and
+speech segment pass-through.
+"""
+
+import sys
+import time
+from pathlib import Path
+from threading import Event
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from loguru import logger
+
+from core.audio.stt_worker_pool import STTWorkerPool, JobStatus
+
+
+def utterance(value: float, samples: int = 1600) -> np.ndarray:
+    """Audio whose first sample identifies the utterance."""
+    return np.full(samples, value, dtype=np.float32)
+
+
+class SlowSTT:
+    """Transcribes to the utterance id after a delay that can be held open."""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.release = Event()
+        self.release.set()
+        self.cancelled = []
+
+    def __call__(self, audio, should_cancel):
+        key = int(audio[0])
+        self.release.wait(2.0)
+        deadline = time.perf_counter() + self.delays.get(key, 0.01)
+        while time.perf_counter() < deadline:
+            if should_cancel():
+                self.cancelled.append(key)
+                return ""
+            time.sleep(0.002)
+        return f"utterance {key}" + (f" +{len(audio) // 1600 - 1}" if len(audio) > 1600 else "")
+
+
+def run_pool(stt, **kwargs):
+    """Create and start a pool that records delivered transcripts."""
+    delivered = []
+    idle = Event()
+    pool = STTWorkerPool(
+        stt, lambda job: delivered.append(job.transcript),
+        on_idle=idle.set, **kwargs
+    )
+    pool.start()
+    return pool, delivered, idle
+
+
+def test_ordered_delivery():
+    """Results arrive in submission order even when workers finish out of order."""
+    logger.info("=" * 60)
+    logger.info("Testing STT Worker Pool")
+    logger.info("=" * 60)
+
+    stt = SlowSTT(delays={1: 0.2, 2: 0.01, 3: 0.05})
+    pool, delivered, idle = run_pool(stt, num_workers=3, max_queue=4)
+    for i in (1, 2, 3):
+        pool.submit(utterance(i))
+
+    assert idle.wait(2.0)
+    logger.info(f"Delivered: {delivered}")
+    assert delivered == ["utterance 1", "utterance 2", "utterance 3"]
+    pool.stop()
+    return True
+
+
+def test_overflow_policies():
+    """drop_oldest, reject and merge behave as documented."""
+    results = {}
+    for policy in ("drop_oldest", "reject", "merge"):
+        stt = SlowSTT()
+        stt.release.clear()  # Hold the first decode so later ones queue up
+        pool, delivered, idle = run_pool(
+            stt, num_workers=1, max_queue=2, policy=policy, merge_gap_ms=0
+        )
+
+        pool.submit(utterance(1))
+        time.sleep(0.05)  # Let the worker pick up job 1
+        accepted = [pool.submit(utterance(i)) is not None for i in (2, 3, 4)]
+
+        stt.release.set()
+        assert idle.wait(2.0)
+        results[policy] = delivered
+        logger.info(f"{policy}: accepted={accepted}, delivered={delivered}")
+        if policy == "reject":
+            assert accepted == [True, True, False]
+        pool.stop()
+
+    assert results["drop_oldest"] == ["utterance 1", "utterance 3", "utterance 4"]
+    assert results["reject"] == ["utterance 1", "utterance 2", "utterance 3"]
+    assert results["merge"] == ["utterance 1", "utterance 2", "utterance 3 +1"]
+    return True
+
+
+def test_cancellation():
+    """Cancelling a running job stops the decode; later results still arrive."""
+    stt = SlowSTT(delays={1: 1.0})
+    pool, delivered, idle = run_pool(stt, num_workers=1, max_queue=4)
+
+    running = pool.submit(utterance(1))
+    queued = pool.submit(utterance(2))
+    kept = pool.submit(utterance(3))
+    time.sleep(0.05)
+
+    pool.cancel(queued)
+    pool.cancel(running)
+    assert idle.wait(2.0)
+
+    assert stt.cancelled == [1]
+    assert delivered == ["utterance 3"]
+    assert running.status == JobStatus.CANCELLED and kept.status == JobStatus.DONE
+    assert pool.get_statistics()["cancelled"] == 2
+    pool.stop()
+    return True
+
+
+def test_speech_segments():
+    """Voiced regions reach transcribe_fn and follow merged audio."""
+    calls = []
+    release = Event()
+
+    def stt(audio, should_cancel, speech_segments=None):
+        release.wait(2.0)
+        calls.append(speech_segments)
+        return "ok"
+
+    pool, delivered, idle = run_pool(
+        stt, num_workers=1, max_queue=1, policy="merge", merge_gap_ms=100
+    )
+    pool.submit(utterance(1))  # No segments: called as before
+    time.sleep(0.05)
+    pool.submit(utterance(2), [(100, 1500)])
+    merged = pool.submit(utterance(3), [(0, 800)])
+    assert merged.speech_segments == [(100, 1500), (3200, 4000)]
+
+    release.set()
+    assert idle.wait(2.0)
+    assert calls == [None, [(100, 1500), (3200, 4000)]]
+    pool.stop()
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Ordered delivery": test_ordered_delivery(),
+        "Overflow policies": test_overflow_policies(),
+        "Cancellation": test_cancellation(),
+        "Speech segments": test_speech_segments(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Test script for the STT command vocabulary.
+Tests prompt/hotword building and incremental rebuilds.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from core.nlu.vocabulary import CommandVocabulary, build_command_vocabulary
+
+
+def make_sources():
+    """Minimal stand-ins for IntentClassifier and WebQuickSkills."""
+    classifier = SimpleNamespace(
+        patterns={
+            "volume_up": ["volume up", "turn up the volume", "louder"],
+            "set_timer": ["set a timer", "timer for"],
+        },
+        patterns_version=0,
+    )
+    web_skills = SimpleNamespace(
+        bookmarks={"team wiki": "https://wiki.example.com"},
+        WEBSITE_MAP={"github": "https://www.github.com"},
+        bookmarks_version=0,
+    )
+    return classifier, web_skills
+
+
+def test_prompt_and_hotwords():
+    """Names come first and every command word is covered."""
+    logger.info("=" * 60)
+    logger.info("Testing Command Vocabulary")
+    logger.info("=" * 60)
+
+    classifier, web_skills = make_sources()
+    vocabulary = build_command_vocabulary(classifier, web_skills, app_names=["spotify"])
+
+    prompt = vocabulary.get_prompt()
+    hotwords = vocabulary.get_hotwords().split()
+    logger.info(f"Prompt: {prompt}")
+    logger.info(f"Hotwords: {hotwords}")
+
+    assert prompt.startswith("team wiki") or prompt.startswith("github")
+    for word in ["volume", "louder", "timer", "spotify", "github"]:
+        assert word in prompt
+        assert word in hotwords
+    assert "the" not in hotwords
+    return True
+
+
+def test_prompt_budget():
+    """Prompt never exceeds the character budget."""
+    classifier, web_skills = make_sources()
+    vocabulary = build_command_vocabulary(classifier, web_skills, max_prompt_chars=30)
+
+    prompt = vocabulary.get_prompt()
+    logger.info(f"Budgeted prompt ({len(prompt)} chars): {prompt}")
+
+    assert 0 < len(prompt) <= 30
+    return True
+
+
+def test_incremental_rebuild():
+    """Only sources whose version changed are re-read."""
+    classifier, web_skills = make_sources()
+    reads = {"intents": 0}
+
+    def intent_phrases():
+        reads["intents"] += 1
+        return [p for patterns in classifier.patterns.values() for p in patterns]
+
+    vocabulary = CommandVocabulary()
+    vocabulary.add_source("intents", intent_phrases, lambda: classifier.patterns_version)
+    vocabulary.add_web_skills(web_skills)
+
+    vocabulary.get_prompt()
+    vocabulary.get_prompt()
+    assert reads["intents"] == 1, "unchanged source must not be re-read"
+
+    # New bookmark: only the websites source is rebuilt
+    web_skills.bookmarks["payroll"] = "https://payroll.example.com"
+    web_skills.bookmarks_version += 1
+    assert "payroll" in vocabulary.get_prompt()
+    assert reads["intents"] == 1
+
+    # New pattern
+    classifier.patterns["volume_up"].append("pump it up")
+    classifier.patterns_version += 1
+    assert "pump" in vocabulary.get_hotwords()
+    assert reads["intents"] == 2
+
+    logger.info(f"Statistics: {vocabulary.get_statistics()}")
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Prompt and hotwords": test_prompt_and_hotwords(),
+        "Prompt budget": test_prompt_budget(),
+        "Incremental rebuild": test_incremental_rebuild(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
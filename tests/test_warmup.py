@@ -0,0 +1,97 @@
+"""
+Test script for background model warm-up.
+Tests readiness reporting and warm-up calls.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from core.warmup import ModelWarmup
+
+
+class FakeModel:
+    """Slow-loading component with a warmup() hook."""
+
+    def __init__(self, load_s: float):
+        time.sleep(load_s)
+        self.warmed = False
+
+    def warmup(self):
+        self.warmed = True
+
+
+def test_background_loading():
+    """Components load in parallel without blocking the caller."""
+    logger.info("=" * 60)
+    logger.info("Testing Model Warm-up")
+    logger.info("=" * 60)
+
+    warmup = ModelWarmup()
+    warmup.add("stt", lambda: FakeModel(0.3))
+    warmup.add("tts", lambda: FakeModel(0.1))
+
+    start_time = time.perf_counter()
+    warmup.start()
+    assert time.perf_counter() - start_time < 0.05, "start() must not block"
+    assert not warmup.is_ready("stt")
+    assert warmup.get("stt") is None, "get() without timeout must not wait"
+
+    assert warmup.wait("tts", timeout=1.0)
+    assert not warmup.is_ready("stt")
+
+    stt = warmup.get("stt", timeout=1.0)
+    assert stt is not None and stt.warmed
+    assert warmup.wait_all(timeout=1.0)
+
+    logger.info(f"Status: {warmup.get_status()}")
+    return True
+
+
+def test_failed_loader_and_first_command():
+    """A failing loader still reports ready; first command is timed once."""
+    def broken():
+        raise RuntimeError("model missing")
+
+    warmup = ModelWarmup()
+    warmup.add("vad", broken)
+    warmup.start()
+
+    assert warmup.wait("vad", timeout=1.0)
+    assert warmup.get("vad") is None
+    assert warmup.get_status()["components"]["vad"]["error"] == "model missing"
+
+    warmup.mark_first_command()
+    first = warmup.first_command_ms
+    time.sleep(0.01)
+    warmup.mark_first_command()
+    assert warmup.first_command_ms == first
+    return True
+
+
+def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, format="<level>{message}</level>", level="INFO")
+
+    results = {
+        "Background loading": test_background_loading(),
+        "Failed loader / first command": test_failed_loader_and_first_command(),
+    }
+
+    logger.info("")
+    logger.info("=" * 60)
+    for name, ok in results.items():
+        logger.info(f"{name}: {'✅ PASS' if ok else '❌ FAIL'}")
+    logger.info("=" * 60)
+
+    sys.exit(0 if all(results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()